@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Allocation benchmark for Oakheart Tales' enemy and event pools.
+
+Plays a long headless game (the simulate.py greedy policy, restarting after each
+death or win) twice: once with the pools disabled (every encounter and event
+allocates) and once with them enabled. A no-op listener stays subscribed so events
+are dispatched the way a UI would see them. Reports how many Enemy and GameEvent
+objects had to be constructed, and tracemalloc's peak traced memory for each run.
+
+Run: python3 alloc_bench.py --turns 10000 --seed 7
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from engine.game import GameState
+from engine.game.enemy import ENEMY_POOL
+from engine.game.event import EVENT_POOL
+from engine.game.pool import POOL_LIMIT
+from json_loader import JsonLoader
+from simulate import GreedyPolicy, new_headless_game
+
+
+def run(turns: int, seed: int, enemies: list, tileset: dict, pooled: bool) -> dict:
+    for pool in (ENEMY_POOL, EVENT_POOL):
+        pool.limit = POOL_LIMIT if pooled else 0
+        pool.free = []
+        pool.created = pool.reused = 0
+    rng = random.Random(seed)
+    tracemalloc.start()
+    start = time.perf_counter()
+    played = 0
+    game_seed = seed
+    while played < turns:
+        game = new_headless_game(7, tileset, enemies, seed=game_seed)
+        game.event_manager.muted = False
+        game.event_manager.subscribe(lambda event: None)
+        policy = GreedyPolicy(rng)
+        while played < turns and game.state != GameState.GAME_OVER and game.player.level < 5:
+            game.execute_action(policy.choose(game))
+            played += 1
+        game_seed += 1
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "elapsed": elapsed,
+        "peak_kib": peak / 1024.0,
+        "enemies": ENEMY_POOL.stats(),
+        "events": EVENT_POOL.stats(),
+    }
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Compare allocations with the object pools off and on.")
+    parser.add_argument("--turns", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--enemies", default="data/enemies.json")
+    parser.add_argument("--tileset", default="data/tileset.json")
+    args = parser.parse_args(argv[1:])
+
+    loader = JsonLoader()
+    enemies = loader.load(args.enemies)
+    tileset = loader.load(args.tileset)
+    for label, pooled in (("no pools", False), ("pooled", True)):
+        r = run(args.turns, args.seed, enemies, tileset, pooled)
+        e, v = r["enemies"], r["events"]
+        print(f"{label:>8}: {args.turns} turns in {r['elapsed']:.2f}s | "
+              f"Enemy built {e['created']} reused {e['reused']} | "
+              f"GameEvent built {v['created']} reused {v['reused']} | "
+              f"peak {r['peak_kib']:.0f} KiB "
+              f"({(e['created'] + v['created']) * 1000.0 / args.turns:.1f} objects per 1k turns)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -1,10 +1,10 @@
 # combat_start_screens.py
-import sys
-import time
 import re
 import html
 from typing import Iterable, Optional, List, Dict
 
+from engine.plugins.animation import Timeline, AnimationScheduler, play
+
 # ========= ANSI + Layout Helpers (ANSI-safe) =========
 ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')  # CSI ... final letter
 
@@ -45,9 +45,8 @@ def center_line(s: str, w: int) -> str:
     return (" " * (pad // 2)) + s + (" " * (pad - pad // 2))
 
 
-def clear_screen():
-    sys.stdout.write("\033[2J\033[H")
-    sys.stdout.flush()
+def clear_screen(tl: Timeline):
+    tl.write("\033[2J\033[H")
 
 
 def clamp(n, lo, hi):
@@ -103,14 +102,13 @@ def draw_panel(title: str, lines: List[str], width: int,
     return [top] + body + [bottom]
 
 
-def print_block(lines: Iterable[str]):
-    for ln in lines:
-        sys.stdout.write(ln + "\n")
-    sys.stdout.flush()
+def print_block(tl: Timeline, lines: Iterable[str]):
+    tl.write("".join(ln + "\n" for ln in lines))
 
 
 # ========= Generic Animation Engine =========
 def animate(
+        tl: Timeline,
         text: str,
         style: str = "typewriter",
         color_code: Optional[str] = C.BR_WHITE,
@@ -120,6 +118,8 @@ def animate(
         pad: int = 0
 ):
     """
+    Add `text` to the timeline `tl` in one of the styles below and return `tl`.
+
     Styles:
       - typewriter : prints characters one-by-one
       - blink      : toggles visibility
@@ -134,45 +134,29 @@ def animate(
 
     if style == "typewriter":
         for ch in base:
-            sys.stdout.write(ch)
-            sys.stdout.flush()
-            time.sleep(speed)
-        sys.stdout.write("\n");
-        sys.stdout.flush()
+            tl.write(ch, speed)
+        tl.write("\n")
 
     elif style == "blink":
         for _ in range(clamp(loops, 1, 50)):
-            sys.stdout.write(base + "\r");
-            sys.stdout.flush()
-            time.sleep(speed * 6)
-            sys.stdout.write(" " * visible_len(base) + "\r");
-            sys.stdout.flush()
-            time.sleep(speed * 6)
-        sys.stdout.write(base + "\n");
-        sys.stdout.flush()
+            tl.write(base + "\r", speed * 6, replace=True)
+            tl.write(" " * visible_len(base) + "\r", speed * 6, replace=True)
+        tl.write(base + "\n")
 
     elif style == "pulse":
         plain = strip_ansi(base)
         for _ in range(clamp(loops, 1, 50)):
-            sys.stdout.write(color(plain, C.DIM, color_code) + "\r");
-            sys.stdout.flush()
-            time.sleep(speed * 3)
-            sys.stdout.write(color(plain, C.BOLD, color_code) + "\r");
-            sys.stdout.flush()
-            time.sleep(speed * 3)
-        sys.stdout.write(color(plain, color_code) + "\n");
-        sys.stdout.flush()
+            tl.write(color(plain, C.DIM, color_code) + "\r", speed * 3, replace=True)
+            tl.write(color(plain, C.BOLD, color_code) + "\r", speed * 3, replace=True)
+        tl.write(color(plain, color_code) + "\n")
 
     elif style == "slide_in":
         plain = strip_ansi(base)
         target = center_line(plain, w)
         for i in range(w):
             frame = (" " * i) + plain
-            sys.stdout.write(color(pad_line_vis(frame, w), color_code) + "\r")
-            sys.stdout.flush()
-            time.sleep(speed)
-        sys.stdout.write(color(target, color_code) + "\n");
-        sys.stdout.flush()
+            tl.write(color(pad_line_vis(frame, w), color_code) + "\r", speed, replace=True)
+        tl.write(color(target, color_code) + "\n")
 
     elif style == "reveal_box":
         plain = strip_ansi(base)
@@ -186,9 +170,7 @@ def animate(
         ]
         left_pad = max(0, (w - (inner_w + 2)) // 2)
         for idx, ln in enumerate(lines):
-            sys.stdout.write(" " * left_pad + color(ln, color_code) + "\n")
-            sys.stdout.flush()
-            time.sleep(speed * (1.5 if idx == 0 else 0.5))
+            tl.write(" " * left_pad + color(ln, color_code) + "\n", speed * (1.5 if idx == 0 else 0.5))
 
     elif style == "marquee":
         plain = strip_ansi(base)
@@ -197,11 +179,8 @@ def animate(
         for _ in range(clamp(loops, 1, 50)):
             for i in range(len(span)):
                 vis = span[i:i + w]
-                sys.stdout.write(color(pad_line_vis(vis, w), color_code) + "\r")
-                sys.stdout.flush()
-                time.sleep(speed)
-        sys.stdout.write("\n");
-        sys.stdout.flush()
+                tl.write(color(pad_line_vis(vis, w), color_code) + "\r", speed, replace=True)
+        tl.write("\n")
 
     elif style == "flicker":
         plain = strip_ansi(base)
@@ -209,15 +188,12 @@ def animate(
         for _ in range(clamp(loops, 1, 40)):
             bright = random.random() < 0.65
             code = C.BR_YELLOW if bright else C.YELLOW
-            sys.stdout.write(color(plain, code) + "\r");
-            sys.stdout.flush()
-            time.sleep(speed)
-        sys.stdout.write(color(plain, C.BR_YELLOW) + "\n");
-        sys.stdout.flush()
+            tl.write(color(plain, code) + "\r", speed, replace=True)
+        tl.write(color(plain, C.BR_YELLOW) + "\n")
 
     else:
-        sys.stdout.write(base + "\n");
-        sys.stdout.flush()
+        tl.write(base + "\n")
+    return tl
 
 
 # ========= Bars / Stat Formatting =========
@@ -255,7 +231,7 @@ def tint_ascii_lines(lines: List[str], tint: str = C.BR_GREEN) -> List[str]:
 
 
 # ========= Combat Start Screen =========
-def combat_start_screen(payload: Dict, width: int = 90):
+def combat_start_screen(tl: Timeline, payload: Dict, width: int = 90):
     """
     Payload example (ENTERED_COMBAT):
     {
@@ -270,7 +246,7 @@ def combat_start_screen(payload: Dict, width: int = 90):
         "enemy_defense": 2
     }
     """
-    clear_screen()
+    clear_screen(tl)
 
     enemy_name = payload.get("enemy_name", "Unknown")
     location = payload.get("location", "Unknown")
@@ -286,21 +262,21 @@ def combat_start_screen(payload: Dict, width: int = 90):
         center_line(color(f"Location: {location}", C.GRAY), width - 2),
         center_line(color(f"Enemy: {enemy_name} (Lv {lvl})", C.BR_WHITE), width - 2),
     ]
-    print_block(draw_panel("Combat Start", header, width, title_color=(C.BOLD, C.BR_RED)))
+    print_block(tl, draw_panel("Combat Start", header, width, title_color=(C.BOLD, C.BR_RED)))
 
     # Dramatic intro box
-    animate("Prepare yourself...", style="reveal_box", color_code=C.BR_YELLOW, speed=0.03, width=width)
-    sys.stdout.write("\a")  # subtle bell (may be ignored by some terminals)
+    animate(tl, "Prepare yourself...", style="reveal_box", color_code=C.BR_YELLOW, speed=0.03, width=width)
+    tl.write("\a")  # subtle bell (may be ignored by some terminals)
 
     # Enemy ASCII art
     art_lines = normalize_ascii_art(payload.get("enemy_ascii_art", ""))
     art_lines = tint_ascii_lines(art_lines, tint=C.BR_GREEN)
     art_centered = [center_line(ln, width - 2) for ln in art_lines]
-    print_block(draw_panel("Foe", art_centered, width, title_color=(C.BOLD, C.BR_GREEN)))
+    print_block(tl, draw_panel("Foe", art_centered, width, title_color=(C.BOLD, C.BR_GREEN)))
 
     # Alert scan effect (a quick red sweep line under art)
     scan_text = center_line("▼ scanning...", width - 2)
-    animate(scan_text, style="marquee", color_code=C.BR_RED, speed=0.01, width=width, loops=1, pad=8)
+    animate(tl, scan_text, style="marquee", color_code=C.BR_RED, speed=0.01, width=width, loops=1, pad=8)
 
     # Stats panel
     stats_lines = [
@@ -308,21 +284,28 @@ def combat_start_screen(payload: Dict, width: int = 90):
         format_stat_line("Attack", atk, color_code=C.BR_YELLOW, width=width),
         format_stat_line("Defense", df, color_code=C.BR_CYAN, width=width),
     ]
-    print_block(draw_panel("Enemy Stats", stats_lines, width, title_color=(C.BOLD, C.BR_GREEN)))
+    print_block(tl, draw_panel("Enemy Stats", stats_lines, width, title_color=(C.BOLD, C.BR_GREEN)))
 
 
 # ========= Dispatcher from your event manager =========
-def show_combat_start_event(payload: dict, width: int = 90):
+def show_combat_start_event(payload: dict, width: int = 90, scheduler: AnimationScheduler = None):
     """
-    Call this from your ENTERED_COMBAT event listener.
+    Call this from your ENTERED_COMBAT event listener. With a `scheduler` the screen is
+    queued for the UI loop to tick; without one it plays right away (blocking).
     """
-    combat_start_screen(payload, width=width)
+    play(combat_start_timeline(payload, width=width), scheduler)
+
+
+def combat_start_timeline(payload: dict, width: int = 90) -> Timeline:
+    tl = Timeline()
+    combat_start_screen(tl, payload, width=width)
+    return tl
 
 
 # ========= Optional: simple blocking key wait =========
 def wait_keypress(prompt: str = "", color_code: Optional[str] = C.BR_WHITE):
     if prompt:
-        animate(prompt, style="typewriter", color_code=color_code, speed=0.02)
+        play(animate(Timeline(), prompt, style="typewriter", color_code=color_code, speed=0.02))
     try:
         input()
     except KeyboardInterrupt:
@@ -1,11 +1,12 @@
 
 # rest_screens.py
-import sys
 import time
 import re
 import random
 from typing import Iterable, Optional, List
 
+from engine.plugins.animation import Timeline, AnimationScheduler, play
+
 # ========= ANSI + Layout Helpers (ANSI-safe) =========
 ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')  # CSI ... final letter
 
@@ -41,9 +42,8 @@ def center_line(s: str, w: int) -> str:
     pad = w - vl
     return (" " * (pad // 2)) + s + (" " * (pad - pad // 2))
 
-def clear_screen():
-    sys.stdout.write("\033[2J\033[H")
-    sys.stdout.flush()
+def clear_screen(tl: Timeline):
+    tl.write("\033[2J\033[H")
 
 def clamp(n, lo, hi):
     return max(lo, min(hi, n))
@@ -93,13 +93,12 @@ def draw_panel(title: str, lines: List[str], width: int,
     bottom = "└" + ("─" * inner_w) + "┘"
     return [top] + body + [bottom]
 
-def print_block(lines: Iterable[str]):
-    for ln in lines:
-        sys.stdout.write(ln + "\n")
-    sys.stdout.flush()
+def print_block(tl: Timeline, lines: Iterable[str]):
+    tl.write("".join(ln + "\n" for ln in lines))
 
 # ========= Generic Animation Engine =========
 def animate(
+        tl: Timeline,
         text: str,
         style: str = "typewriter",
         color_code: Optional[str] = C.BR_WHITE,
@@ -109,6 +108,8 @@ def animate(
         pad: int = 0
 ):
     """
+    Add `text` to the timeline `tl` in one of the styles below and return `tl`.
+
     Styles:
       - typewriter : prints characters one-by-one
       - blink      : toggles visibility
@@ -122,37 +123,29 @@ def animate(
 
     if style == "typewriter":
         for ch in base:
-            sys.stdout.write(ch)
-            sys.stdout.flush()
-            time.sleep(speed)
-        sys.stdout.write("\n"); sys.stdout.flush()
+            tl.write(ch, speed)
+        tl.write("\n")
 
     elif style == "blink":
         for _ in range(clamp(loops, 1, 50)):
-            sys.stdout.write(base + "\r"); sys.stdout.flush()
-            time.sleep(speed * 6)
-            sys.stdout.write(" " * visible_len(base) + "\r"); sys.stdout.flush()
-            time.sleep(speed * 6)
-        sys.stdout.write(base + "\n"); sys.stdout.flush()
+            tl.write(base + "\r", speed * 6, replace=True)
+            tl.write(" " * visible_len(base) + "\r", speed * 6, replace=True)
+        tl.write(base + "\n")
 
     elif style == "pulse":
         plain = strip_ansi(base)
         for _ in range(clamp(loops, 1, 50)):
-            sys.stdout.write(color(plain, C.DIM, color_code) + "\r"); sys.stdout.flush()
-            time.sleep(speed * 3)
-            sys.stdout.write(color(plain, C.BOLD, color_code) + "\r"); sys.stdout.flush()
-            time.sleep(speed * 3)
-        sys.stdout.write(color(plain, color_code) + "\n"); sys.stdout.flush()
+            tl.write(color(plain, C.DIM, color_code) + "\r", speed * 3, replace=True)
+            tl.write(color(plain, C.BOLD, color_code) + "\r", speed * 3, replace=True)
+        tl.write(color(plain, color_code) + "\n")
 
     elif style == "slide_in":
         plain = strip_ansi(base)
         target = center_line(plain, w)
         for i in range(w):
             frame = (" " * i) + plain
-            sys.stdout.write(color(pad_line_vis(frame, w), color_code) + "\r")
-            sys.stdout.flush()
-            time.sleep(speed)
-        sys.stdout.write(color(target, color_code) + "\n"); sys.stdout.flush()
+            tl.write(color(pad_line_vis(frame, w), color_code) + "\r", speed, replace=True)
+        tl.write(color(target, color_code) + "\n")
 
     elif style == "reveal_box":
         plain = strip_ansi(base)
@@ -166,9 +159,7 @@ def animate(
             ]
         left_pad = max(0, (w - (inner_w + 2)) // 2)
         for idx, ln in enumerate(lines):
-            sys.stdout.write(" " * left_pad + color(ln, color_code) + "\n")
-            sys.stdout.flush()
-            time.sleep(speed * (1.5 if idx == 0 else 0.5))
+            tl.write(" " * left_pad + color(ln, color_code) + "\n", speed * (1.5 if idx == 0 else 0.5))
 
     elif style == "flicker":
         # subtle visibility flicker (like candle/campfire)
@@ -176,12 +167,13 @@ def animate(
         for _ in range(clamp(loops, 1, 40)):
             bright = random.random() < 0.65
             code = C.BR_YELLOW if bright else C.YELLOW
-            sys.stdout.write(color(plain, code) + "\r"); sys.stdout.flush()
-            time.sleep(speed)
-        sys.stdout.write(color(plain, C.BR_YELLOW) + "\n"); sys.stdout.flush()
+            tl.write(color(plain, code) + "\r", speed, replace=True)
+        tl.write(color(plain, C.BR_YELLOW) + "\n")
 
     else:
-        sys.stdout.write(base + "\n"); sys.stdout.flush()
+        tl.write(base + "\n")
+    return tl
+
 
 # ========= ASCII Art (centered) =========
 def campfire_art(width: int) -> List[str]:
@@ -209,8 +201,8 @@ def moon_art(width: int) -> List[str]:
     return [center_line(line, width - 2) for line in art]
 
 # ========= Rest Screens =========
-def village_rest_screen(healed: int, received_potion: bool, width: int = 90):
-    clear_screen()
+def village_rest_screen(tl: Timeline, healed: int, received_potion: bool, width: int = 90):
+    clear_screen(tl)
 
     # Calm header
     header = [
@@ -221,58 +213,64 @@ def village_rest_screen(healed: int, received_potion: bool, width: int = 90):
             C.BR_YELLOW if received_potion else C.GRAY
         ), width - 2),
     ]
-    print_block(draw_panel("Rest", header, width, title_color=(C.BOLD, C.BR_GREEN)))
+    print_block(tl, draw_panel("Rest", header, width, title_color=(C.BOLD, C.BR_GREEN)))
 
     # Moon + campfire vibe
-    print_block(draw_panel("Night Sky", moon_art(width), width, title_color=(C.BOLD, C.BR_GREEN)))
+    print_block(tl, draw_panel("Night Sky", moon_art(width), width, title_color=(C.BOLD, C.BR_GREEN)))
     # Flicker campfire for ambience
     camp = draw_panel("Hearth", [*campfire_art(width)], width, title_color=(C.BOLD, C.BR_GREEN))
     for ln in camp:
         # flicker each line slightly
         bright = random.random() < 0.7
         code = C.BR_YELLOW if bright else C.YELLOW
-        sys.stdout.write(color(ln, code) + "\n")
-        sys.stdout.flush()
-        time.sleep(0.03)
+        tl.write(color(ln, code) + "\n", 0.03)
 
     # Gentle messages
-    animate("Zzz...", style="pulse", color_code=C.GRAY, speed=0.08, loops=3, width=width)
-    animate("Body and spirit mended.", style="typewriter", color_code=C.BR_GREEN, speed=0.02)
+    animate(tl, "Zzz...", style="pulse", color_code=C.GRAY, speed=0.08, loops=3, width=width)
+    animate(tl, "Body and spirit mended.", style="typewriter", color_code=C.BR_GREEN, speed=0.02)
     if received_potion:
-        animate("+1 Potion added to your satchel.", style="typewriter", color_code=C.BR_YELLOW, speed=0.02)
+        animate(tl, "+1 Potion added to your satchel.", style="typewriter", color_code=C.BR_YELLOW, speed=0.02)
 
-def wild_rest_screen(healed: int, width: int = 90):
-    clear_screen()
+def wild_rest_screen(tl: Timeline, healed: int, width: int = 90):
+    clear_screen(tl)
 
     header = [
         center_line(color("You rest cautiously.", C.BR_WHITE), width - 2),
         center_line(color(f"HP restored: +{healed}", C.BR_GREEN), width - 2),
         center_line(color("The wild is quiet... for now.", C.GRAY), width - 2),
     ]
-    print_block(draw_panel("Rest (Wilderness)", header, width, title_color=(C.BOLD, C.BR_GREEN)))
+    print_block(tl, draw_panel("Rest (Wilderness)", header, width, title_color=(C.BOLD, C.BR_GREEN)))
 
     # Low-key campfire flicker
     flicker_text = center_line("A small fire crackles softly.", width - 2)
-    animate(flicker_text, style="flicker", color_code=C.YELLOW, speed=0.05, loops=15, width=width)
+    animate(tl, flicker_text, style="flicker", color_code=C.YELLOW, speed=0.05, loops=15, width=width)
 
-    animate("Zzz...", style="pulse", color_code=C.GRAY, speed=0.08, loops=2, width=width)
-    animate("You rise alert and recovered.", style="typewriter", color_code=C.BR_WHITE, speed=0.02)
+    animate(tl, "Zzz...", style="pulse", color_code=C.GRAY, speed=0.08, loops=2, width=width)
+    animate(tl, "You rise alert and recovered.", style="typewriter", color_code=C.BR_WHITE, speed=0.02)
 
-def rest_interrupted_screen(enemy_name: str, width: int = 90):
-    clear_screen()
+def rest_interrupted_screen(tl: Timeline, enemy_name: str, width: int = 90):
+    clear_screen(tl)
 
     # Sudden red alert
-    print_block(draw_panel("Alert", [
+    print_block(tl, draw_panel("Alert", [
         center_line(color("AMBUSH!", C.BOLD, C.BR_RED), width - 2),
         center_line(color(f"{enemy_name} attacks while you sleep!", C.BR_WHITE), width - 2),
     ], width, title_color=(C.BOLD, C.BR_RED)))
 
-    animate("Armor scrambles on. Weapons drawn.", style="typewriter", color_code=C.BR_YELLOW, speed=0.02)
-    animate(">>> Entering combat... <<<", style="reveal_box", color_code=C.BR_RED, speed=0.03, width=width)
+    animate(tl, "Armor scrambles on. Weapons drawn.", style="typewriter", color_code=C.BR_YELLOW, speed=0.02)
+    animate(tl, ">>> Entering combat... <<<", style="reveal_box", color_code=C.BR_RED, speed=0.03, width=width)
     # hand control back to your combat intro / loop
 
 # ========= Dispatcher from your REST events =========
-def show_rest_event(payload: dict, width: int = 90):
+def show_rest_event(payload: dict, width: int = 90, scheduler: AnimationScheduler = None):
+    """
+    Plays rest_event_timeline(): queued on `scheduler` for the UI loop to tick, or right
+    away (blocking) without one.
+    """
+    play(rest_event_timeline(payload, width=width), scheduler)
+
+
+def rest_event_timeline(payload: dict, width: int = 90) -> Timeline:
     """
     Handles RESTED payloads like:
       Village: {"healed": int, "received_potion": bool, "type": "village_rest"}
@@ -281,23 +279,25 @@ def show_rest_event(payload: dict, width: int = 90):
     And REST_INTERRUPTED payloads like:
       {"position": (x,y), "enemy_name": "Wolf"}
     """
+    tl = Timeline()
     t = payload.get("type")
     if t == "village_rest":
         healed = int(payload.get("healed", 0))
         received = bool(payload.get("received_potion", False))
-        village_rest_screen(healed, received, width=width)
+        village_rest_screen(tl, healed, received, width=width)
     elif t == "wild_rest":
         healed = int(payload.get("healed", 0))
-        wild_rest_screen(healed, width=width)
+        wild_rest_screen(tl, healed, width=width)
     else:
         # REST_INTERRUPTED (no 'type' in your snippet)
         enemy = payload.get("enemy_name", "Unknown")
-        rest_interrupted_screen(enemy, width=width)
+        rest_interrupted_screen(tl, enemy, width=width)
+    return tl
 
 # ========= Optional: simple key wait =========
 def wait_keypress(prompt: str = "", color_code: Optional[str] = C.BR_WHITE):
     if prompt:
-        animate(prompt, style="typewriter", color_code=code, speed=0.02)
+        play(animate(Timeline(), prompt, style="typewriter", color_code=color_code, speed=0.02))
     try:
         input()
     except KeyboardInterrupt:
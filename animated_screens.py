@@ -1,10 +1,10 @@
 
 # animated_screens.py
-import sys
-import time
 import re
 from typing import Iterable, Optional, Tuple, Callable, List
 
+from engine.plugins.animation import Timeline, AnimationScheduler, play
+
 # ========= ANSI + Layout Helpers (ANSI-safe) =========
 ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')  # CSI ... final letter
 
@@ -42,9 +42,8 @@ def center_line(s: str, w: int) -> str:
     pad = w - vl
     return (" " * (pad // 2)) + s + (" " * (pad - pad // 2))
 
-def clear_screen():
-    sys.stdout.write("\033[2J\033[H")
-    sys.stdout.flush()
+def clear_screen(tl: Timeline):
+    tl.write("\033[2J\033[H")
 
 def clamp(n, lo, hi):
     return max(lo, min(hi, n))
@@ -94,13 +93,12 @@ def draw_panel(title: str, lines: List[str], width: int, title_color=(C.BOLD, C.
     bottom = "└" + ("─" * inner_w) + "┘"
     return [top] + body + [bottom]
 
-def print_block(lines: Iterable[str]):
-    for ln in lines:
-        sys.stdout.write(ln + "\n")
-    sys.stdout.flush()
+def print_block(tl: Timeline, lines: Iterable[str]):
+    tl.write("".join(ln + "\n" for ln in lines))
 
 # ========= Generic Animation Engine =========
 def animate(
+        tl: Timeline,
         text: str,
         style: str = "typewriter",
         color_code: Optional[str] = C.BR_WHITE,
@@ -110,7 +108,7 @@ def animate(
         pad: int = 0
 ):
     """
-    Render animated text in various styles.
+    Render animated text in various styles onto the timeline `tl` (returned).
 
     Styles:
       - typewriter : prints characters one-by-one
@@ -133,22 +131,14 @@ def animate(
 
     if style == "typewriter":
         for ch in s:
-            sys.stdout.write(ch)
-            sys.stdout.flush()
-            time.sleep(speed)
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+            tl.write(ch, speed)
+        tl.write("\n")
 
     elif style == "blink":
         for _ in range(clamp(loops, 1, 50)):
-            sys.stdout.write(s + "\r")
-            sys.stdout.flush()
-            time.sleep(speed * 6)
-            sys.stdout.write(" " * visible_len(s) + "\r")
-            sys.stdout.flush()
-            time.sleep(speed * 6)
-        sys.stdout.write(s + "\n")
-        sys.stdout.flush()
+            tl.write(s + "\r", speed * 6, replace=True)
+            tl.write(" " * visible_len(s) + "\r", speed * 6, replace=True)
+        tl.write(s + "\n")
 
     elif style == "marquee":
         padding = " " * pad
@@ -158,11 +148,8 @@ def animate(
         for _ in range(clamp(loops, 1, 200)):
             for i in range(len(span)):
                 vis = span[i:i + w]
-                sys.stdout.write(color(pad_line_vis(vis, w), color_code) + "\r")
-                sys.stdout.flush()
-                time.sleep(speed)
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+                tl.write(color(pad_line_vis(vis, w), color_code) + "\r", speed, replace=True)
+        tl.write("\n")
 
     elif style == "slide_in":
         # slide from left into centered position
@@ -170,22 +157,14 @@ def animate(
         for i in range(w):
             frame = (" " * i) + strip_ansi(s)
             frame = pad_line_vis(frame, w)
-            sys.stdout.write(color(frame, color_code) + "\r")
-            sys.stdout.flush()
-            time.sleep(speed)
-        sys.stdout.write(color(target, color_code) + "\n")
-        sys.stdout.flush()
+            tl.write(color(frame, color_code) + "\r", speed, replace=True)
+        tl.write(color(target, color_code) + "\n")
 
     elif style == "pulse":
         for _ in range(clamp(loops, 1, 50)):
-            sys.stdout.write(color(strip_ansi(s), C.DIM, color_code) + "\r")
-            sys.stdout.flush()
-            time.sleep(speed * 3)
-            sys.stdout.write(color(strip_ansi(s), C.BOLD, color_code) + "\r")
-            sys.stdout.flush()
-            time.sleep(speed * 3)
-        sys.stdout.write(color(strip_ansi(s), color_code) + "\n")
-        sys.stdout.flush()
+            tl.write(color(strip_ansi(s), C.DIM, color_code) + "\r", speed * 3, replace=True)
+            tl.write(color(strip_ansi(s), C.BOLD, color_code) + "\r", speed * 3, replace=True)
+        tl.write(color(strip_ansi(s), color_code) + "\n")
 
     elif style == "reveal_box":
         # draw a centered box around the text, then populate text
@@ -200,63 +179,71 @@ def animate(
             ]
         left_pad = max(0, (w - (inner_w + 2)) // 2)
         for idx, ln in enumerate(lines):
-            sys.stdout.write(" " * left_pad + color(ln, color_code) + "\n")
-            sys.stdout.flush()
-            time.sleep(speed * (1.5 if idx == 0 else 0.5))
+            tl.write(" " * left_pad + color(ln, color_code) + "\n", speed * (1.5 if idx == 0 else 0.5))
     else:
         # default: just print
-        sys.stdout.write(s + "\n")
-        sys.stdout.flush()
+        tl.write(s + "\n")
+    return tl
+
 
 # ========= High-level Screens =========
-def victory_screen(enemy_name: str, gold: int, xp: int, width: int = 90):
-    clear_screen()
+def victory_screen(tl: Timeline, enemy_name: str, gold: int, xp: int, width: int = 90):
+    clear_screen(tl)
 
     # Title panel
     title_lines = [
         center_line(color("VICTORY ACHIEVED", C.BOLD, C.BR_GREEN), width - 2),
         center_line(color(f"You defeated {enemy_name}!", C.BR_WHITE), width - 2),
     ]
-    print_block(draw_panel("Battle End", title_lines, width))
+    print_block(tl, draw_panel("Battle End", title_lines, width))
 
     # Animated summary stats
-    time.sleep(0.3)
-    animate("Rewards:", style="typewriter", color_code=C.BR_YELLOW, speed=0.02)
-    animate(f"Gold Looted: {gold}", style="typewriter", color_code=C.BR_GREEN, speed=0.02)
-    animate(f"XP Gained: {xp}", style="typewriter", color_code=C.BR_CYAN, speed=0.02)
+    tl.pause(0.3)
+    animate(tl, "Rewards:", style="typewriter", color_code=C.BR_YELLOW, speed=0.02)
+    animate(tl, f"Gold Looted: {gold}", style="typewriter", color_code=C.BR_GREEN, speed=0.02)
+    animate(tl, f"XP Gained: {xp}", style="typewriter", color_code=C.BR_CYAN, speed=0.02)
 
     # Flair: pulse and marquee line
-    animate("Well fought, hero!", style="pulse", color_code=C.BR_WHITE, speed=0.05, loops=4)
-    animate(">>> Press any key to continue <<<", style="marquee", color_code=C.BR_YELLOW, speed=0.01, width=width, loops=1, pad=10)
+    animate(tl, "Well fought, hero!", style="pulse", color_code=C.BR_WHITE, speed=0.05, loops=4)
+    animate(tl, ">>> Press any key to continue <<<", style="marquee", color_code=C.BR_YELLOW, speed=0.01, width=width, loops=1, pad=10)
 
-def level_up_screen(new_level: int, width: int = 90):
-    clear_screen()
+def level_up_screen(tl: Timeline, new_level: int, width: int = 90):
+    clear_screen(tl)
 
     # Explosion of stars using slide_in + pulse
-    animate("★ ★ ★ ★ ★", style="slide_in", color_code=C.BR_YELLOW, speed=0.01, width=width)
-    animate("LEVEL UP!", style="reveal_box", color_code=C.BR_GREEN, speed=0.03, width=width)
-    animate(f"You are now Level {new_level}!", style="typewriter", color_code=C.BR_CYAN, speed=0.02)
+    animate(tl, "★ ★ ★ ★ ★", style="slide_in", color_code=C.BR_YELLOW, speed=0.01, width=width)
+    animate(tl, "LEVEL UP!", style="reveal_box", color_code=C.BR_GREEN, speed=0.03, width=width)
+    animate(tl, f"You are now Level {new_level}!", style="typewriter", color_code=C.BR_CYAN, speed=0.02)
 
     # Flavor text
-    animate("Your power surges through you...", style="pulse", color_code=C.BR_WHITE, speed=0.05, loops=3)
-    animate("New abilities unlocked!", style="typewriter", color_code=C.BR_MAGENTA, speed=0.02)
+    animate(tl, "Your power surges through you...", style="pulse", color_code=C.BR_WHITE, speed=0.05, loops=3)
+    animate(tl, "New abilities unlocked!", style="typewriter", color_code=C.BR_MAGENTA, speed=0.02)
 
-def game_over_screen(width: int = 90):
-    clear_screen()
+def game_over_screen(tl: Timeline, width: int = 90):
+    clear_screen(tl)
 
     # Dark themed panel + slow reveal
     top = [
         center_line(color("GAME OVER", C.BOLD, C.BR_RED), width - 2),
         center_line(color("Your tale ends here... for now.", C.GRAY), width - 2),
     ]
-    print_block(draw_panel("Fate Sealed", top, width))
+    print_block(tl, draw_panel("Fate Sealed", top, width))
 
     # Animated lament
-    animate("You fought bravely.", style="typewriter", color_code=C.BR_WHITE, speed=0.03)
-    animate("But courage alone could not prevail.", style="typewriter", color_code=C.GRAY, speed=0.03)
+    animate(tl, "You fought bravely.", style="typewriter", color_code=C.BR_WHITE, speed=0.03)
+    animate(tl, "But courage alone could not prevail.", style="typewriter", color_code=C.GRAY, speed=0.03)
 
 # ========= Dispatcher from your event payload =========
-def show_battle_result(event_payload: dict, player_new_level: Optional[int] = None, width: int = 90):
+def show_battle_result(event_payload: dict, player_new_level: Optional[int] = None, width: int = 90,
+                       scheduler: AnimationScheduler = None):
+    """
+    Plays battle_result_timeline(): queued on `scheduler` for the UI loop to tick, or
+    right away (blocking) without one.
+    """
+    play(battle_result_timeline(event_payload, player_new_level, width), scheduler)
+
+
+def battle_result_timeline(event_payload: dict, player_new_level: Optional[int] = None, width: int = 90) -> Timeline:
     """
     Expects payload like:
     {
@@ -278,23 +265,32 @@ def show_battle_result(event_payload: dict, player_new_level: Optional[int] = No
     xp = int(event_payload.get("xp_gained", 0))
     leveled_up = bool(event_payload.get("leveled_up"))
 
+    tl = Timeline()
     if victory and not fled:
-        victory_screen(enemy_name, gold, xp, width=width)
+        victory_screen(tl, enemy_name, gold, xp, width=width)
         if leveled_up and player_new_level is not None:
             # brief pause before level up
-            time.sleep(0.6)
-            level_up_screen(player_new_level, width=width)
+            tl.pause(0.6)
+            level_up_screen(tl, player_new_level, width=width)
     elif fled:
-        clear_screen()
-        animate("You retreated to fight another day.", style="typewriter", color_code=C.BR_YELLOW, speed=0.03)
+        clear_screen(tl)
+        animate(tl, "You retreated to fight another day.", style="typewriter", color_code=C.BR_YELLOW, speed=0.03)
 
     else:
-        game_over_screen(width=width)
+        game_over_screen(tl, width=width)
+    return tl
+
+# ========= Key waits =========
+def keypress_prompt(tl: Timeline, prompt: str = "", color_code: Optional[str] = C.BR_WHITE) -> Timeline:
+    """Type `prompt` and hold the timeline until the scheduler is resumed by a key press."""
+    if prompt:
+        animate(tl, prompt, style="typewriter", color_code=color_code, speed=0.02)
+    return tl.wait_key()
+
 
-# ========= Optional: non-blocking key wait (simple) =========
 def wait_keypress(prompt: str = "", color_code: Optional[str] = C.BR_WHITE):
     if prompt:
-        animate(prompt, style="typewriter", color_code=color_code, speed=0.02)
+        play(animate(Timeline(), prompt, style="typewriter", color_code=color_code, speed=0.02))
     try:
         # Basic fallback; replace with your input system if needed
         input()
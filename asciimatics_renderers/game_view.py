@@ -8,8 +8,15 @@ from engine.game.ascii_renderer import render_room
 
 # NEW IMPORT: Combat Renderer from the original file's structure
 from engine.plugins.combat_renderer_2d import ASCIICombatRenderer #
+from engine.plugins.metrics import METRICS, hud_lines
 from asciimatics.widgets import Frame, Layout, Label, TextBox, ListBox, Widget, PopUpDialog
 
+# Profiling HUD toggle (` or F2); it replaces the log box while shown. asciimatics diffs its
+# own screen buffer, so there is no output byte count here.
+HUD_KEYS = (ord('`'), Screen.KEY_F2)
+HUD_METRICS = ("frame", "update", "dispatch", "render")
+
+
 class GameView(Frame):
     """
     The main game UI frame, holding all components:
@@ -168,6 +175,7 @@ class GameView(Frame):
 
     def update(self, frame_no):
         """Called every frame to update the content of the widgets."""
+        frame_start = METRICS.clock()
 
         # If a pop-up is displayed, skip the rest of the rendering/logic update
         if self._check_and_show_popups(frame_no):
@@ -252,9 +260,16 @@ class GameView(Frame):
         self._action_list.options = action_options
 
         # 4. Update Log
-        self._log_box.value = self._result_desc if self._result_desc else "\n".join(self.logs)
+        if METRICS.enabled:
+            self._log_box.value = "\n".join(hud_lines(METRICS, HUD_METRICS, hotkey="` / F2"))
+        else:
+            self._log_box.value = self._result_desc if self._result_desc else "\n".join(self.logs)
+        METRICS.add("update", (METRICS.clock() - frame_start) * 1000.0)
 
-        super().update(frame_no)
+        with METRICS.timer("render"):
+            super().update(frame_no)
+        METRICS.add("frame", (METRICS.clock() - frame_start) * 1000.0)
+        METRICS.end_frame()
 
     def process_event(self, event):
         """Handle keyboard events for action hotkeys and quitting."""
@@ -262,13 +277,17 @@ class GameView(Frame):
         if isinstance(event, KeyboardEvent):
             if event.key_code in (ord('q'), ord('Q')):
                 raise StopApplication("User quit")
+            if event.key_code in HUD_KEYS:
+                METRICS.enabled = not METRICS.enabled
+                return None
 
             try:
                 char = chr(event.key_code).lower()
             except ValueError:
                 char = ''
 
-            result = self._game.execute_action(char)
+            with METRICS.timer("update"):
+                result = self._game.execute_action(char)
             if "failed" in (result or "").lower() and "Traceback (most recent call last):" in (result or ""):
                 self._result_desc = result
             else:
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Collision microbenchmark for the 2D mode.
+
+Builds Room2D rooms from 15x8 up to 256x64, sprinkles extra floating platforms over
+them, and times the checks one physics tick makes: a falling-body landing scan per
+probe and a patrol step (wall, solid and drop-off test) per enemy. Each room is timed
+twice: probing the `platforms` set of (x, y) tuples the way Game2DPlugin used to, and
+indexing the room's CollisionMap. Both must agree on every answer.
+
+A second table fills a 256x64 room with crowds of enemies (rooms spawn 1-2 in play) and times the enemy part of
+Game2DPlugin.update: a player collision check every tick (from an empty cell, so nothing
+cuts the scan short) and a patrol step every ENEMY_EVERY ticks. First per enemy with
+attribute access and a full collision scan, as update used to, then through Room2D's
+step_enemies/enemy_at, which batch crowds of PATROL_MIN_ENEMIES or more through the room's
+EnemyPatrol states and spatial hash, including the sync that writes positions back to the
+enemies for the next frame. Both must leave every enemy in the same place.
+
+Run: python3 collision_bench.py --ticks 200 --bodies 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import List
+
+from engine.plugins.game2d import Room2D, LEDGE_LEFT, LEDGE_RIGHT
+
+SIZES = ((15, 8), (64, 16), (128, 32), (256, 64))
+CROWDS = (2, 10, 20, 100, 500, 2000)
+# Game2DPlugin.enemy_speed_divider: patrols move every this many ticks
+ENEMY_EVERY = 7
+
+
+def build_room(width: int, height: int, seed: int) -> Room2D:
+    rng = random.Random(seed)
+    room = Room2D(0, width, height, rng=rng)
+    for _ in range(width * height // 24):
+        x, y = rng.randint(1, width - 5), rng.randint(1, height - 3)
+        for dx in range(rng.randint(2, 5)):
+            room.platforms.add((x + dx, y))
+    room.rebuild_collision()
+    return room
+
+
+def make_bodies(room: Room2D, count: int, seed: int) -> List[tuple]:
+    """(x, y, fall, direction) for bodies scattered over the room."""
+    rng = random.Random(seed)
+    return [(rng.randint(0, room.width - 1), rng.randint(0, room.height - 2), rng.randint(1, 3), rng.choice((-1, 1)))
+            for _ in range(count)]
+
+
+def tick_with_set(room: Room2D, bodies: List[tuple]) -> list:
+    platforms, width, height = room.platforms, room.width, room.height
+    out = []
+    for (x, y, fall, direction) in bodies:
+        landed = -1
+        for y_check in range(y + 1, min(y + fall + 2, height)):
+            if (x, y_check) in platforms:
+                landed = y_check
+                break
+        next_x = x + direction
+        turn = (next_x <= 0 or next_x >= width - 1 or (next_x, y) in platforms
+                or (next_x, y + 1) not in platforms)
+        out.append((landed, turn))
+    return out
+
+
+def tick_with_map(room: Room2D, bodies: List[tuple]) -> list:
+    cmap = room.collision
+    ledge, floor, width, height = cmap.ledge, cmap.floor, room.width, room.height
+    out = []
+    for (x, y, fall, direction) in bodies:
+        i = y * width + x
+        # Same answer as cmap.landing_row(x, y + 1, y + fall + 2), inlined like a hot loop would
+        landed = floor[i + width]
+        if landed >= y + fall + 2 or landed >= height:
+            landed = -1
+        turn = ledge[i] & (LEDGE_LEFT if direction < 0 else LEDGE_RIGHT) != 0
+        out.append((landed, turn))
+    return out
+
+
+def enemy_tick_one_by_one(room: Room2D, tick: int, px: int, py: int):
+    ledge, width, height = room.collision.ledge, room.width, room.height
+    for enemy in (room.enemies if tick % ENEMY_EVERY == 0 else ()):
+        if hasattr(enemy, "x") and hasattr(enemy, "y") and hasattr(enemy, "direction"):
+            if not (0 <= enemy.x < width and 0 <= enemy.y < height):
+                continue
+            bits = ledge[enemy.y * width + enemy.x]
+            if bits & (LEDGE_LEFT if enemy.direction < 0 else LEDGE_RIGHT):
+                enemy.direction *= -1
+            if not bits & (LEDGE_LEFT if enemy.direction < 0 else LEDGE_RIGHT):
+                enemy.x += enemy.direction
+    for enemy in room.enemies:
+        if px == enemy.x and py == enemy.y:
+            return enemy
+    return None
+
+
+def enemy_tick_batched(room: Room2D, tick: int, px: int, py: int):
+    if tick % ENEMY_EVERY == 0:
+        room.step_enemies()
+    found = room.enemy_at(px, py)
+    # A frame reads the enemies after each tick (get_state, render_room)
+    room.sync_enemies()
+    return found
+
+
+def crowd_room(count: int, seed: int) -> Room2D:
+    room = build_room(256, 64, seed)
+    room.spawn_enemies([{"name": "Goblin"}], 1, max_enemies=1)
+    template = room.enemies[0]
+    for _ in range(count - 1):
+        room.enemies.append(template.__class__(template.name, template.ascii, 1, 10, 10, 1, 1, 1, 1,
+                                               room.rng.choice((-1, 1))))
+    room.place_enemies()
+    return room
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Compare set-of-tuple and CollisionMap collision checks.")
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--bodies", type=int, default=200, help="Falling/patrolling bodies checked per tick")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv[1:])
+
+    for (width, height) in SIZES:
+        room = build_room(width, height, args.seed)
+        bodies = make_bodies(room, args.bodies, args.seed)
+        if tick_with_set(room, bodies) != tick_with_map(room, bodies):
+            print(f"{width}x{height}: collision results differ", file=sys.stderr)
+            return 1
+        timings = []
+        for fn in (tick_with_set, tick_with_map):
+            start = time.perf_counter()
+            for _ in range(args.ticks):
+                fn(room, bodies)
+            timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        room.rebuild_collision()
+        rebuild = time.perf_counter() - start
+        checks = args.ticks * args.bodies
+        print(f"{width:>3}x{height:<2}: set {timings[0] * 1e9 / checks:7.0f} ns/body | "
+              f"map {timings[1] * 1e9 / checks:7.0f} ns/body | x{timings[0] / max(1e-9, timings[1]):.1f} | "
+              f"rebuild {rebuild * 1e3:.2f} ms")
+
+    for count in CROWDS:
+        timings = []
+        ends = []
+        for fn in (enemy_tick_one_by_one, enemy_tick_batched):
+            room = crowd_room(count, args.seed)
+            start = time.perf_counter()
+            for tick in range(args.ticks):
+                fn(room, tick, 0, 0)
+            timings.append(time.perf_counter() - start)
+            ends.append([(e.x, e.y, e.direction) for e in room.enemies])
+        if ends[0] != ends[1]:
+            print(f"{count} enemies: patrol results differ", file=sys.stderr)
+            return 1
+        print(f"{count:>5} enemies: one by one {timings[0] * 1e6 / args.ticks:8.1f} us/tick | "
+              f"batched {timings[1] * 1e6 / args.ticks:8.1f} us/tick | x{timings[0] / max(1e-9, timings[1]):.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
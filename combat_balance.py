@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo combat balance tables for Oakheart Tales.
+
+Simulates large numbers of player-vs-archetype fights using the same rules as
+Game.combat_attack / combat_cast / combat_potion and the constants in
+engine/game/combat.py, and reports win probability and expected fight length by
+player level, depth and spell loadout.
+
+Random numbers are drawn in large batches (random.choices with k=...) and consumed
+through C-level iterators, so the inner fight loop never calls random.randint.
+
+Run: python3 combat_balance.py --levels 1-8 --depths 0-6 --fights 2000 --out balance.csv
+"""
+
+import argparse
+import csv
+import random
+import sys
+import time
+from itertools import chain
+from typing import List, Iterator
+
+from engine.game.combat import SPELLS
+from engine.game.player import Player, xp_to_next_level
+from engine.game.weapon import Weapon
+from engine.game.armor import Armor
+from json_loader import JsonLoader
+
+# Fights that last longer than this count as losses (stalemate)
+MAX_FIGHT_TURNS = 100
+# Draws pulled from the RNG per refill
+DRAW_CHUNK = 8192
+
+# Player heals with a potion/Heal below these HP ratios (mirrors simulate.GreedyPolicy)
+POTION_BELOW = 0.35
+HEAL_BELOW = 0.4
+
+DEFAULT_LOADOUTS = ["", "Firebolt", "Firebolt+Heal", "Ice Shard+Guard Break", "Shock+Regen"]
+
+CSV_FIELDS = ["player_level", "depth", "loadout", "archetype", "fights", "win_prob",
+              "expected_turns", "expected_turns_win", "mean_hp_left", "mean_enemy_level"]
+
+
+def draw_stream(rng: random.Random, population: list) -> Iterator[int]:
+    """Endless iterator over values drawn from population in batches of DRAW_CHUNK."""
+    return chain.from_iterable(iter(lambda: rng.choices(population, k=DRAW_CHUNK), None))
+
+
+def player_at_level(level: int, weapon_bonus: int = 2, armor_bonus: int = 1, potions: int = 1) -> Player:
+    """The default new-game hero, levelled up through the normal Player.add_xp curve."""
+    p = Player(name="Hero", level=1, hp=20, max_hp=20, mp=10, max_mp=10, attack=5, defense=2,
+               potions=potions, known_spells=[], gold=0,
+               weapon=Weapon("Weapon", weapon_bonus), armor=Armor("Armor", armor_bonus))
+    while p.level < level:
+        p.add_xp(xp_to_next_level(p.level) - p.xp)
+    return p
+
+
+def parse_range(text: str) -> List[int]:
+    """'1-5' -> [1..5], '1,3,5' -> [1, 3, 5]."""
+    out: List[int] = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            lo, hi = part.split("-", 1)
+            out.extend(range(int(lo), int(hi) + 1))
+        else:
+            out.append(int(part))
+    return out
+
+
+def parse_loadout(spec: str) -> List[str]:
+    spells = [s.strip() for s in spec.split("+") if s.strip()]
+    unknown = [s for s in spells if s not in SPELLS]
+    if unknown:
+        raise ValueError(f"Unknown spell(s): {', '.join(unknown)}")
+    return spells
+
+
+class CombatBalancer:
+    """Runs batches of fights for one player build against archetypes from enemies.json."""
+
+    def __init__(self, enemy_archetypes: list, seed: int = None):
+        self.archetypes = [a for a in enemy_archetypes if isinstance(a, dict) and "name" in a]
+        self.rng = random.Random(seed)
+        rng = self.rng
+        # Batched draw streams, one per distribution used by the combat rules
+        self._dmg_roll = draw_stream(rng, [-1, 0, 1, 2]).__next__  # calc_damage roll
+        self._spell_roll = draw_stream(rng, [0, 1, 2]).__next__  # damage spell jitter
+        self._coin = draw_stream(rng, [0, 1]).__next__  # 50% potion dodge
+        self._lvl_offset = draw_stream(rng, [-1, 0, 0, 1]).__next__  # generate_enemy level jitter
+        self._hp_jitter = draw_stream(rng, [0, 1, 2, 3]).__next__
+        self._atk_jitter = draw_stream(rng, [0, 1, 2]).__next__
+
+    def available_archetypes(self, depth: int) -> list:
+        return self.archetypes[: min(3 + depth, len(self.archetypes))]
+
+    def fight_batch(self, player: Player, spells: List[str], archetype: dict, depth: int, fights: int) -> dict:
+        """Simulate `fights` independent fights and aggregate the outcomes."""
+        dmg_roll = self._dmg_roll
+        spell_roll = self._spell_roll
+        coin = self._coin
+        lvl_offset = self._lvl_offset
+        hp_jitter = self._hp_jitter
+        atk_jitter = self._atk_jitter
+
+        p_level = player.level
+        p_max_hp = player.max_hp
+        p_atk = player.total_attack
+        p_def = player.total_defense
+        p_max_mp = player.max_mp
+        p_potions = player.potions
+
+        # Resolve the loadout once: the best damage spell, plus support spells
+        dmg_spells = [s for s in spells if s not in ("Heal", "Regen", "Guard Break")]
+        dmg_spell = max(dmg_spells, key=lambda s: SPELLS[s]["pow"]) if dmg_spells else None
+        dmg_cost = SPELLS[dmg_spell]["mp"] if dmg_spell else 0
+        dmg_pow = SPELLS[dmg_spell]["pow"] + p_level // 2 if dmg_spell else 0
+        heal_cost = SPELLS["Heal"]["mp"] if "Heal" in spells else 0
+        heal_amt = SPELLS["Heal"]["pow"] + p_level
+        gb_cost = SPELLS["Guard Break"]["mp"] if "Guard Break" in spells else 0
+        gb_amt = SPELLS["Guard Break"]["pow"] + p_level // 4
+        regen_cost = SPELLS["Regen"]["mp"] if "Regen" in spells else 0
+        regen_amt = SPELLS["Regen"]["pow"]
+        potion_amt = 12 + p_level
+        potion_below = p_max_hp * POTION_BELOW
+        heal_below = p_max_hp * HEAL_BELOW
+
+        base_hp = archetype["base_hp"]
+        base_atk = archetype["base_attack"]
+        base_def = archetype["base_defense"]
+        level_cap = p_level + 3
+        depth_bonus = depth // 2
+
+        wins = 0
+        turns_total = 0
+        turns_win = 0
+        hp_left_total = 0
+        enemy_level_total = 0
+
+        for _ in range(fights):
+            # Enemy roll (same formulas as combat.generate_enemy)
+            e_lvl = max(1, min(level_cap, p_level + lvl_offset() + depth_bonus))
+            e_hp = base_hp + e_lvl * 3 + hp_jitter()
+            e_atk = base_atk + e_lvl + atk_jitter()
+            e_def = base_def + e_lvl // 3
+            enemy_level_total += e_lvl
+
+            hp = p_max_hp
+            mp = p_max_mp
+            potions = p_potions
+            def_down = 0
+            def_turns = 0
+            regen_turns = 0
+            turn = 0
+            won = False
+            while turn < MAX_FIGHT_TURNS:
+                turn += 1
+                enemy_acts = True
+                # --- Player turn ---
+                if hp < potion_below and potions > 0:
+                    potions -= 1
+                    hp = min(p_max_hp, hp + potion_amt)
+                    if coin():
+                        enemy_acts = False
+                elif heal_cost and hp < heal_below and mp >= heal_cost:
+                    mp -= heal_cost
+                    hp = min(p_max_hp, hp + heal_amt)
+                elif gb_cost and def_turns == 0 and mp >= gb_cost + dmg_cost:
+                    mp -= gb_cost
+                    def_down = gb_amt
+                    def_turns = 2
+                elif regen_cost and regen_turns == 0 and hp < p_max_hp and mp >= regen_cost + dmg_cost:
+                    mp -= regen_cost
+                    regen_turns = 3
+                elif dmg_spell and mp >= dmg_cost:
+                    mp -= dmg_cost
+                    dmg = dmg_pow + spell_roll() - e_def // 4
+                    e_hp -= dmg if dmg > 1 else 1
+                else:
+                    eff_def = e_def - def_down if def_turns > 0 else e_def
+                    if eff_def < 0:
+                        eff_def = 0
+                    dmg = p_atk - eff_def + dmg_roll()
+                    e_hp -= dmg if dmg > 1 else 1
+                if e_hp <= 0:
+                    won = True
+                    break
+                # --- Enemy turn ---
+                if enemy_acts:
+                    dmg = e_atk - p_def + dmg_roll()
+                    hp -= dmg if dmg > 1 else 1
+                    # Clamped before Regen heals, as combat_state._enemy_turn does
+                    if hp < 0:
+                        hp = 0
+                    if def_turns > 0:
+                        def_turns -= 1
+                        if def_turns == 0:
+                            def_down = 0
+                    if regen_turns > 0:
+                        regen_turns -= 1
+                        hp = min(p_max_hp, hp + regen_amt)
+                    if hp <= 0:
+                        break
+            turns_total += turn
+            if won:
+                wins += 1
+                turns_win += turn
+                hp_left_total += hp
+
+        return {
+            "fights": fights,
+            "win_prob": wins / fights if fights else 0.0,
+            "expected_turns": turns_total / fights if fights else 0.0,
+            "expected_turns_win": turns_win / wins if wins else 0.0,
+            "mean_hp_left": hp_left_total / wins if wins else 0.0,
+            "mean_enemy_level": enemy_level_total / fights if fights else 0.0,
+        }
+
+    def table(self, levels: List[int], depths: List[int], loadouts: List[str], fights: int,
+              per_archetype: bool = True) -> List[dict]:
+        """
+        Build rows for every (player level, depth, loadout). Each combination gets one row per
+        archetype reachable at that depth plus a '*' row that mixes them like generate_enemy does.
+        """
+        rows = []
+        for level in levels:
+            player = player_at_level(level)
+            for depth in depths:
+                available = self.available_archetypes(depth)
+                if not available:
+                    continue
+                for spec in loadouts:
+                    spells = parse_loadout(spec)
+                    label = spec or "none"
+                    mixed = {k: 0.0 for k in ("fights", "wins", "turns", "turns_win", "hp_left", "enemy_level")}
+                    share = max(1, fights // len(available))
+                    for archetype in available:
+                        res = self.fight_batch(player, spells, archetype, depth, fights if per_archetype else share)
+                        if per_archetype:
+                            rows.append(self._row(level, depth, label, archetype["name"], res))
+                        n = res["fights"]
+                        wins = res["win_prob"] * n
+                        mixed["fights"] += n
+                        mixed["wins"] += wins
+                        mixed["turns"] += res["expected_turns"] * n
+                        mixed["turns_win"] += res["expected_turns_win"] * wins
+                        mixed["hp_left"] += res["mean_hp_left"] * wins
+                        mixed["enemy_level"] += res["mean_enemy_level"] * n
+                    n = mixed["fights"]
+                    wins = mixed["wins"]
+                    rows.append(self._row(level, depth, label, "*", {
+                        "fights": int(n),
+                        "win_prob": wins / n if n else 0.0,
+                        "expected_turns": mixed["turns"] / n if n else 0.0,
+                        "expected_turns_win": mixed["turns_win"] / wins if wins else 0.0,
+                        "mean_hp_left": mixed["hp_left"] / wins if wins else 0.0,
+                        "mean_enemy_level": mixed["enemy_level"] / n if n else 0.0,
+                    }))
+        return rows
+
+    @staticmethod
+    def _row(level: int, depth: int, loadout: str, archetype: str, res: dict) -> dict:
+        return {
+            "player_level": level,
+            "depth": depth,
+            "loadout": loadout,
+            "archetype": archetype,
+            "fights": res["fights"],
+            "win_prob": round(res["win_prob"], 4),
+            "expected_turns": round(res["expected_turns"], 2),
+            "expected_turns_win": round(res["expected_turns_win"], 2),
+            "mean_hp_left": round(res["mean_hp_left"], 2),
+            "mean_enemy_level": round(res["mean_enemy_level"], 2),
+        }
+
+
+def write_csv(rows: List[dict], out) -> None:
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Emit Monte Carlo combat balance tables as CSV.")
+    parser.add_argument("--enemies", default="data/enemies.json")
+    parser.add_argument("--levels", default="1-5", help="Player levels, e.g. 1-5 or 1,3,5")
+    parser.add_argument("--depths", default="0-6", help="Depths (x + y of the tile, see depth_from_pos)")
+    parser.add_argument("--loadouts", default=";".join(DEFAULT_LOADOUTS),
+                        help="';' separated loadouts of '+' joined spells, empty for none")
+    parser.add_argument("--fights", type=int, default=1000, help="Fights per table cell")
+    parser.add_argument("--mixed-only", action="store_true", help="Only emit the '*' mixed-archetype rows")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", default="-", help="CSV path, '-' for stdout")
+    args = parser.parse_args(argv[1:])
+
+    balancer = CombatBalancer(JsonLoader().load(args.enemies), seed=args.seed)
+    start = time.perf_counter()
+    rows = balancer.table(parse_range(args.levels), parse_range(args.depths), args.loadouts.split(";"),
+                          args.fights, per_archetype=not args.mixed_only)
+    elapsed = time.perf_counter() - start
+    total = sum(r["fights"] for r in rows if r["archetype"] != "*" or args.mixed_only)
+
+    if args.out == "-":
+        write_csv(rows, sys.stdout)
+    else:
+        with open(args.out, "w", newline="", encoding="utf-8") as f:
+            write_csv(rows, f)
+    print(f"Simulated {total} fights in {elapsed:.2f}s ({total / elapsed * 60 / 1e6:.2f}M fights/min)"
+          if elapsed > 0 else f"Simulated {total} fights", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -188,6 +188,19 @@ class _Actions:
                 ok, reason = can_go(x + dx, y + dy)
                 actions.append(Action(aid, label, keys, cat, ok, reason))
 
+            # Multi-step travel along the safest path
+            village = getattr(w, "village", None)
+            at_village = village is not None and (x, y) == tuple(village)
+            known_shops = getattr(g, "shops", None) or set()
+            actions.extend(
+                [
+                    Action("travel_village", "Travel to Village", ["travel village", "home"], "travel",
+                           village is not None and not at_village, "Already here" if at_village else None),
+                    Action("travel_shop", "Travel to Merchant", ["travel shop", "merchant"], "travel",
+                           bool(known_shops), None if known_shops else "No merchant found yet"),
+                ]
+            )
+
             # Basic actions
             actions.extend(
                 [
@@ -209,6 +222,8 @@ class _Actions:
                 "move_s": lambda: g.move(0, 1, True),
                 "move_w": lambda: g.move(-1, 0, True),
                 "move_e": lambda: g.move(1, 0, True),
+                "travel_village": g.travel_village,
+                "travel_shop": g.travel_shop,
                 "look": g.look,
                 "map": g.map,
                 "stats": g.stats,
@@ -259,7 +274,8 @@ class _Actions:
         # Return simple dicts for portability/serialization
         return [a.to_dict() for a in actions]
 
-    def execute(self, action_id_or_key: str) -> str:
+    def resolve(self, action_id_or_key: str) -> str:
+        """Action id that a command maps to in the current state, or None if it's unknown."""
         if not action_id_or_key:
             return None
         key = action_id_or_key.strip().lower()
@@ -269,7 +285,11 @@ class _Actions:
         aid = key
         if aid not in self._exec_map:
             aid = self._key_to_id.get(key, key)
-        fn = self._exec_map.get(aid)
+        return aid if aid in self._exec_map else None
+
+    def execute(self, action_id_or_key: str) -> str:
+        aid = self.resolve(action_id_or_key)
+        fn = self._exec_map.get(aid) if aid else None
         if not fn:
             return None
         try:
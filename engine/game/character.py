@@ -52,31 +52,37 @@ class Character:
             output.append(f"You have a pleasant conversation with {self.name}.")
         return "\n".join(output)
 
+def make_characters(rng=None) -> list:
+    """The cast of wandering characters; their gifts are rolled from rng (or the global random)."""
+    rng = rng or random
+    return [
+        Character(
+            name="Eldrin the Wise",
+            role="wizard",
+            dialog="Greetings, traveler. Magic is the key to survival in these lands.",
+            spells=[rng.choice(list(SPELLS.keys()))]
+        ),
+        Character(
+            name="Mira the Brave",
+            role="helper",
+            dialog="Take this, it will help you on your journey!",
+            type="weapon",
+            item=rng.choice(weapon_pool())
+        ),
+        Character(
+            name="Thorn the Ranger",
+            role="helper",
+            dialog="Here, wear this armor to protect yourself.",
+            type="armor",
+            item=rng.choice(armor_pool())
+        ),
+        Character(
+            name="Old Man Willow",
+            role="villager",
+            dialog="The woods are dangerous at night. Stay safe, friend."
+        )
+    ]
+
+
 # Example list of characters
-CHARACTERS = [
-    Character(
-        name="Eldrin the Wise",
-        role="wizard",
-        dialog="Greetings, traveler. Magic is the key to survival in these lands.",
-        spells=[random.choice(list(SPELLS.keys()))]
-    ),
-    Character(
-        name="Mira the Brave",
-        role="helper",
-        dialog="Take this, it will help you on your journey!",
-        type="weapon",
-        item=random.choice(weapon_pool())
-    ),
-    Character(
-        name="Thorn the Ranger",
-        role="helper",
-        dialog="Here, wear this armor to protect yourself.",
-        type="armor",
-        item=random.choice(armor_pool())
-    ),
-    Character(
-        name="Old Man Willow",
-        role="villager",
-        dialog="The woods are dangerous at night. Stay safe, friend."
-    )
-]
\ No newline at end of file
+CHARACTERS = make_characters()
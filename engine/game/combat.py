@@ -1,5 +1,5 @@
 import random
-from .enemy import Enemy
+from .enemy import Enemy, ENEMY_POOL
 
 # Constants for magic numbers
 # Critical and graze chances
@@ -22,32 +22,147 @@ def depth_from_pos(x: int, y: int) -> int:
     return x + y
 
 
-def generate_enemy(enemy_archetypes: list, player_level: int, x: int, y: int) -> Enemy:
-    depth = depth_from_pos(x, y)
-    available = enemy_archetypes[: min(3 + depth, len(enemy_archetypes))]
-    archetype = random.choice(available)
-    lvl = max(1, min(player_level + 3, player_level + random.choice([-1, 0, 0, 1]) + depth // 2))
-    max_hp = archetype["base_hp"] + lvl * 3 + random.randint(0, 3)
-    atk = archetype["base_attack"] + lvl + random.randint(0, 2)
-    defense = archetype["base_defense"] + (lvl // 3)
-    xp_reward = archetype["xp_reward"] + lvl * 10 + random.randint(0, 10)
-    gold_reward = archetype["gold_reward"] + lvl * 3 + random.randint(0, 6)
-    return Enemy(
-        f"{archetype['name']} (Lv {lvl})",
-        archetype["ascii"],
-        lvl,
-        max_hp,
-        max_hp,
-        atk,
-        defense,
-        xp_reward,
-        gold_reward
-    )
-
-
-def calc_damage(attacker_atk: int, defender_def: int) -> int:
+# Player levels whose enemy tables are built eagerly when configurations load
+PRECOMPUTED_LEVELS = 20
+# generate_enemy level jitter around the player's level
+LEVEL_OFFSETS = [-1, 0, 0, 1]
+# Random stat bonuses (inclusive upper bounds): hp, attack, xp, gold
+HP_JITTER = 3
+ATK_JITTER = 2
+XP_JITTER = 10
+GOLD_JITTER = 6
+_JITTER_COMBOS = (HP_JITTER + 1) * (ATK_JITTER + 1) * (XP_JITTER + 1) * (GOLD_JITTER + 1)
+
+
+class EnemyStats:
+    """Fixed stats and random-bonus ranges of one archetype at one level."""
+
+    def __init__(self, archetype: dict, level: int):
+        self.name = f"{archetype['name']} (Lv {level})"
+        self.archetype = archetype["name"]
+        self.ascii = archetype["ascii"]
+        self.level = level
+        self.hp_min = archetype["base_hp"] + level * 3
+        self.attack_min = archetype["base_attack"] + level
+        self.defense = archetype["base_defense"] + (level // 3)
+        self.xp_min = archetype["xp_reward"] + level * 10
+        self.gold_min = archetype["gold_reward"] + level * 3
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "archetype": self.archetype,
+            "level": self.level,
+            "hp": [self.hp_min, self.hp_min + HP_JITTER],
+            "attack": [self.attack_min, self.attack_min + ATK_JITTER],
+            "defense": self.defense,
+            "xp_reward": [self.xp_min, self.xp_min + XP_JITTER],
+            "gold_reward": [self.gold_min, self.gold_min + GOLD_JITTER],
+        }
+
+
+class EnemyTable:
+    """
+    Encounter tables precomputed from the enemy archetypes.
+
+    For every (depth bucket, player level) the table keeps the flat list of equally likely
+    (archetype, level) outcomes of generate_enemy, so rolling an enemy is a lookup plus two
+    draws: one for the outcome and one for the combined stat bonuses. Depths past max_depth
+    behave identically (the roster and the level bonus are capped), so they share a bucket.
+    """
+
+    def __init__(self, enemy_archetypes: list):
+        self.archetypes = enemy_archetypes
+        self.max_depth = max(len(enemy_archetypes) - 3, 2 * (3 - min(LEVEL_OFFSETS)))
+        self._rows = {}
+        self._stats = {}
+
+    def precompute(self, max_level: int = PRECOMPUTED_LEVELS) -> "EnemyTable":
+        for depth in range(self.max_depth + 1):
+            for level in range(1, max_level + 1):
+                self.outcomes(depth, level)
+        return self
+
+    def depth_bucket(self, depth: int) -> int:
+        return max(0, min(depth, self.max_depth))
+
+    def stats(self, index: int, level: int) -> EnemyStats:
+        key = (index, level)
+        st = self._stats.get(key)
+        if st is None:
+            st = EnemyStats(self.archetypes[index], level)
+            self._stats[key] = st
+        return st
+
+    def outcomes(self, depth: int, player_level: int) -> list:
+        """Equally likely EnemyStats outcomes for an encounter at this depth and player level."""
+        depth = self.depth_bucket(depth)
+        key = (depth, player_level)
+        row = self._rows.get(key)
+        if row is None:
+            count = min(3 + depth, len(self.archetypes))
+            levels = [max(1, min(player_level + 3, player_level + off + depth // 2)) for off in LEVEL_OFFSETS]
+            row = [self.stats(i, lvl) for i in range(count) for lvl in levels]
+            self._rows[key] = row
+        return row
+
+    def roll(self, player_level: int, depth: int, rng=None) -> Enemy:
+        rng = rng or random
+        row = self.outcomes(depth, player_level)
+        if not row:
+            raise IndexError("No enemy archetypes loaded.")
+        st = row[rng.randrange(len(row))]
+        bonus = rng.randrange(_JITTER_COMBOS)
+        bonus, hp_bonus = divmod(bonus, HP_JITTER + 1)
+        bonus, atk_bonus = divmod(bonus, ATK_JITTER + 1)
+        gold_bonus, xp_bonus = divmod(bonus, XP_JITTER + 1)
+        max_hp = st.hp_min + hp_bonus
+        return ENEMY_POOL.acquire(
+            st.name,
+            st.ascii,
+            st.level,
+            max_hp,
+            max_hp,
+            st.attack_min + atk_bonus,
+            st.defense,
+            st.xp_min + xp_bonus,
+            st.gold_min + gold_bonus
+        )
+
+    def summary(self, depth: int, player_level: int) -> list:
+        """Per-outcome probabilities and stat ranges, for balance reports and threat displays."""
+        row = self.outcomes(depth, player_level)
+        merged = {}
+        for st in row:
+            entry = merged.get(st.name)
+            if entry is None:
+                entry = st.to_dict()
+                entry["probability"] = 0.0
+                merged[st.name] = entry
+            entry["probability"] += 1.0 / len(row)
+        return list(merged.values())
+
+    def expected_threat(self, depth: int, player_level: int) -> dict:
+        """Mean level, hp, attack and defense of the enemy met at this depth and player level."""
+        row = self.outcomes(depth, player_level)
+        n = float(len(row)) if row else 1.0
+        return {
+            "level": sum(st.level for st in row) / n,
+            "hp": sum(st.hp_min for st in row) / n + HP_JITTER / 2.0,
+            "attack": sum(st.attack_min for st in row) / n + ATK_JITTER / 2.0,
+            "defense": sum(st.defense for st in row) / n,
+        }
+
+
+def generate_enemy(enemy_archetypes: list, player_level: int, x: int, y: int, table: EnemyTable = None,
+                   rng=None) -> Enemy:
+    table = table or EnemyTable(enemy_archetypes)
+    return table.roll(player_level, depth_from_pos(x, y), rng)
+
+
+def calc_damage(attacker_atk: int, defender_def: int, rng=None) -> int:
     base = attacker_atk - defender_def
-    roll = random.randint(-1, 2)
+    roll = (rng or random).randint(-1, 2)
     return max(1, base + roll)
 
 
@@ -0,0 +1,237 @@
+# engine/game/combat_state.py
+from .combat import SPELLS, calc_damage
+from .util import _clamp_int, _enemy_defense_effect
+
+# Player actions accepted by step()
+ATTACK = "attack"
+CAST = "cast"
+POTION = "potion"
+FLEE = "flee"
+
+# Event kinds produced by step(); each event is a tuple (kind, value)
+HIT = "hit"  # player damaged the enemy
+SPELL_HIT = "spell_hit"  # damage spell landed
+HEAL = "heal"  # Heal spell, value = HP restored
+REGEN_CAST = "regen_cast"  # value = HP per turn
+GUARD_BREAK = "guard_break"  # value = defense removed
+OOM = "oom"  # not enough MP; nothing else happened
+UNKNOWN_SPELL = "unknown_spell"
+POTION_USED = "potion_used"  # value = HP restored
+POTION_FULL = "potion_full"  # at full health, potion kept
+NO_POTIONS = "no_potions"
+DODGE = "dodge"  # quick potion, enemy turn skipped
+FLED = "fled"
+FLEE_FAILED = "flee_failed"
+STUNNED = "stunned"  # value = stun turns left
+ENEMY_HIT = "enemy_hit"  # enemy damaged the player
+RECOVERED = "recovered"  # enemy defense debuff wore off
+REGEN = "regen"  # value = HP restored by regen
+VICTORY = "victory"
+DEFEAT = "defeat"
+
+# Outcomes
+ONGOING = ""
+WON = "won"
+LOST = "lost"
+ESCAPED = "fled"
+
+REGEN_TURNS = 3
+GUARD_BREAK_TURNS = 2
+POTION_HEAL = 12
+POTION_DODGE_CHANCE = 0.5
+FLEE_CHANCE = 0.5
+FLEE_CHANCE_HIGHER_LEVEL = 0.35
+
+
+class CombatState:
+    """
+    Everything one fight depends on, as plain numbers: the player's and the enemy's
+    combat stats plus the temporary effects (regen, stun, defense debuff). step()
+    advances it by one player action without touching a Game, so batch tools can run
+    many fights with nothing but a state and an RNG stream. Game keeps one per fight
+    and copies hp/mp/potions back onto the Player and Enemy after each step.
+    """
+    __slots__ = (
+        "player_hp", "player_max_hp", "player_mp", "player_attack", "player_defense", "player_level", "potions",
+        "enemy_hp", "enemy_max_hp", "enemy_attack", "enemy_defense", "enemy_level",
+        "regen_turns", "regen_amount", "stunned_turns", "def_down", "def_turns", "turn", "outcome",
+    )
+
+    def __init__(self, player_hp: int = 0, player_max_hp: int = 0, player_mp: int = 0, player_attack: int = 0,
+                 player_defense: int = 0, player_level: int = 1, potions: int = 0, enemy_hp: int = 0,
+                 enemy_max_hp: int = 0, enemy_attack: int = 0, enemy_defense: int = 0, enemy_level: int = 1):
+        self.player_hp = player_hp
+        self.player_max_hp = player_max_hp
+        self.player_mp = player_mp
+        self.player_attack = player_attack
+        self.player_defense = player_defense
+        self.player_level = player_level
+        self.potions = potions
+        self.enemy_hp = enemy_hp
+        self.enemy_max_hp = enemy_max_hp
+        self.enemy_attack = enemy_attack
+        self.enemy_defense = enemy_defense
+        self.enemy_level = enemy_level
+        self.regen_turns = 0
+        self.regen_amount = 0
+        self.stunned_turns = 0
+        self.def_down = 0
+        self.def_turns = 0
+        self.turn = 0
+        self.outcome = ONGOING
+
+    @staticmethod
+    def from_entities(player, enemy, effects: "CombatState" = None) -> "CombatState":
+        """State for player vs enemy; temporary effects are carried over from `effects` if given."""
+        st = CombatState(int(player.hp), int(player.max_hp), int(player.mp), int(player.total_attack),
+                         int(player.total_defense), int(player.level), int(player.potions), int(enemy.hp),
+                         int(enemy.max_hp), int(enemy.attack), int(enemy.defense), int(enemy.level))
+        if effects is not None:
+            st.regen_turns = effects.regen_turns
+            st.regen_amount = effects.regen_amount
+            st.stunned_turns = effects.stunned_turns
+            st.def_down = effects.def_down
+            st.def_turns = effects.def_turns
+            st.turn = effects.turn
+        return st
+
+    def apply(self, player, enemy) -> None:
+        """Write the resource fields back onto the Player and Enemy models."""
+        player.hp = self.player_hp
+        player.mp = self.player_mp
+        player.potions = self.potions
+        enemy.hp = self.enemy_hp
+
+    def copy(self) -> "CombatState":
+        st = CombatState()
+        for name in CombatState.__slots__:
+            setattr(st, name, getattr(self, name))
+        return st
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in CombatState.__slots__}
+
+    @staticmethod
+    def from_dict(d: dict) -> "CombatState":
+        st = CombatState()
+        for name in CombatState.__slots__:
+            if name in d:
+                setattr(st, name, d[name])
+        return st
+
+
+def _heal(st: CombatState, amount: int) -> int:
+    old = st.player_hp
+    st.player_hp = _clamp_int(st.player_hp + amount, 0, st.player_max_hp)
+    return st.player_hp - old
+
+
+def _enemy_turn(st: CombatState, rng, events: list) -> None:
+    if st.stunned_turns > 0:
+        st.stunned_turns -= 1
+        events.append((STUNNED, st.stunned_turns))
+    else:
+        dmg = max(1, calc_damage(st.enemy_attack, st.player_defense, rng))
+        st.player_hp = _clamp_int(st.player_hp - dmg, 0, st.player_max_hp)
+        events.append((ENEMY_HIT, dmg))
+    # Decay enemy defense debuff
+    if st.def_turns > 0:
+        st.def_turns -= 1
+        if st.def_turns == 0 and st.def_down > 0:
+            st.def_down = 0
+            events.append((RECOVERED, 0))
+    if st.regen_turns > 0 and st.regen_amount > 0:
+        healed = _heal(st, st.regen_amount)
+        st.regen_turns -= 1
+        events.append((REGEN, healed))
+    if st.player_hp <= 0:
+        st.outcome = LOST
+        events.append((DEFEAT, 0))
+
+
+def step(state: CombatState, action: str, rng, spell: str = None) -> tuple:
+    """
+    Apply one player action (ATTACK, CAST with `spell`, POTION or FLEE) and the enemy's
+    reply. Returns (new_state, events); `state` itself is left untouched. Consumes the
+    RNG in exactly the order Game's combat always has, so seeded games replay the same.
+    """
+    st = state.copy()
+    events: list = []
+    if st.outcome:
+        return st, events
+    st.turn += 1
+    if action == ATTACK:
+        eff_def = _enemy_defense_effect(st.enemy_defense, st.def_down, st.def_turns)
+        dmg = calc_damage(st.player_attack, eff_def, rng)
+        st.enemy_hp = _clamp_int(st.enemy_hp - dmg, 0, st.enemy_max_hp)
+        events.append((HIT, dmg))
+        if st.enemy_hp <= 0:
+            st.outcome = WON
+            events.append((VICTORY, 0))
+            return st, events
+    elif action == CAST:
+        if spell not in SPELLS:
+            st.turn -= 1
+            events.append((UNKNOWN_SPELL, 0))
+            return st, events
+        cost = int(SPELLS[spell]["mp"])
+        if st.player_mp < cost:
+            st.turn -= 1
+            events.append((OOM, cost))
+            return st, events
+        st.player_mp -= cost
+        power = int(SPELLS[spell]["pow"])
+        if spell == "Heal":
+            events.append((HEAL, _heal(st, power + st.player_level)))
+        elif spell == "Regen":
+            st.regen_turns = REGEN_TURNS
+            st.regen_amount = power
+            events.append((REGEN_CAST, power))
+        elif spell == "Guard Break":
+            st.def_down = power + (st.player_level // 4)
+            st.def_turns = GUARD_BREAK_TURNS
+            events.append((GUARD_BREAK, st.def_down))
+        else:
+            dmg = max(1, power + (st.player_level // 2) + rng.randint(0, 2) - (st.enemy_defense // 4))
+            st.enemy_hp = _clamp_int(st.enemy_hp - dmg, 0, st.enemy_max_hp)
+            events.append((SPELL_HIT, dmg))
+            if st.enemy_hp <= 0:
+                st.outcome = WON
+                events.append((VICTORY, 0))
+                return st, events
+    elif action == POTION:
+        if st.player_hp == st.player_max_hp:
+            events.append((POTION_FULL, 0))
+        elif st.potions <= 0:
+            events.append((NO_POTIONS, 0))
+        else:
+            st.potions -= 1
+            events.append((POTION_USED, _heal(st, POTION_HEAL + st.player_level)))
+        if rng.random() < POTION_DODGE_CHANCE:
+            events.append((DODGE, 0))
+            return st, events
+    elif action == FLEE:
+        chance = FLEE_CHANCE_HIGHER_LEVEL if st.enemy_level > st.player_level else FLEE_CHANCE
+        if rng.random() < chance:
+            st.outcome = ESCAPED
+            events.append((FLED, 0))
+            return st, events
+        events.append((FLEE_FAILED, 0))
+    else:
+        raise ValueError("Unknown combat action: %s" % action)
+    _enemy_turn(st, rng, events)
+    return st, events
+
+
+def run_fight(state: CombatState, choose, rng, max_turns: int = 100) -> tuple:
+    """
+    Play a whole fight: choose(state) returns (action, spell) each turn. Returns the final
+    state and the number of turns taken; a fight still going at max_turns stays ONGOING.
+    """
+    st = state
+    turns = 0
+    while not st.outcome and turns < max_turns:
+        action, spell = choose(st)
+        st, _ = step(st, action, rng, spell)
+        turns += 1
+    return st, turns
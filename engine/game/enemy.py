@@ -1,5 +1,8 @@
 # models/enemy.py
-class Enemy:
+from .pool import Poolable, ObjectPool
+
+
+class Enemy(Poolable):
     def __init__(
             self,
             name: str,
@@ -14,6 +17,10 @@ class Enemy:
             direction: int = 0,
             ascii_left: str = None,
     ):
+        self.reset(name, ascii, level, max_hp, hp, attack, defense, xp_reward, gold_reward, direction, ascii_left)
+
+    def reset(self, name: str, ascii: str, level: int, max_hp: int, hp: int, attack: int, defense: int,
+              xp_reward: int, gold_reward: int, direction: int = 0, ascii_left: str = None) -> None:
         self.name = name
         self.ascii = ascii
         self.ascii_left = ascii_left
@@ -59,3 +66,7 @@ class Enemy:
             direction=data.get("direction", 0),
             ascii_left=data.get("ascii_left", None)
         )
+
+
+# Encounters and 2D rooms churn through enemies; reuse them instead of allocating each time
+ENEMY_POOL = ObjectPool(Enemy)
@@ -1,4 +1,7 @@
-class GameEvent:
+from .pool import Poolable, ObjectPool
+
+
+class GameEvent(Poolable):
     FOUND_WEAPON = "found_weapon"
     PICKED_UP_WEAPON = "weapon_picked_up"
     PICKED_UP_ARMOR = "armor_picked_up"
@@ -36,6 +39,9 @@ class GameEvent:
     INFO = "info"
 
     def __init__(self, event_type: str, payload: dict = None):
+        self.reset(event_type, payload)
+
+    def reset(self, event_type: str, payload: dict = None) -> None:
         self.event_type = event_type
         self.payload = payload or {}
 
@@ -43,9 +49,20 @@ class GameEvent:
         return f"<GameEvent type={self.event_type} payload={self.payload}>"
 
 
+# Events dispatched through EventManager.fire are recycled once every listener has seen them
+EVENT_POOL = ObjectPool(GameEvent)
+
+
 class EventManager:
     def __init__(self):
         self.listeners = []
+        # Headless/simulation runs mute emission so no listener work is done per action
+        self.muted = False
+
+    @property
+    def active(self) -> bool:
+        """True when fired events reach someone; hot paths skip building payloads otherwise."""
+        return not self.muted and len(self.listeners) > 0
 
     def subscribe(self, listener: callable):
         self.listeners.append(listener)
@@ -55,5 +72,20 @@ class EventManager:
             self.listeners.remove(listener)
 
     def emit(self, event: GameEvent):
+        if self.muted:
+            return
         for listener in self.listeners:
             listener(event)
+
+    def fire(self, event_type: str, payload: dict = None) -> None:
+        """
+        emit() with a pooled GameEvent, which goes back to the pool after dispatch. Listeners
+        that keep the event call event.retain(). Nothing is allocated when muted or unobserved.
+        """
+        if self.muted or not self.listeners:
+            return
+        event = EVENT_POOL.acquire(event_type, payload)
+        try:
+            self.emit(event)
+        finally:
+            EVENT_POOL.release(event)
@@ -1,44 +1,52 @@
-import random
-
 from .event import EventManager, GameEvent
 from .player import Player as PlayerModel
-from .enemy import Enemy as EnemyModel
+from .enemy import Enemy as EnemyModel, ENEMY_POOL
 from .armor import Armor, armor_pool
 from .weapon import Weapon, weapon_pool
 from .player import Player, clamp, xp_to_next_level
 from .world import World, Tile
-from .combat import generate_enemy, SPELLS, calc_damage
+from .combat import generate_enemy, SPELLS, EnemyTable, depth_from_pos
 from .ascii_renderer import render_room
-from .util import _hp_line, _clamp_int, _enemy_defense_effect
 from .game_state import GameState
 from .action import _Actions
 from .game_log import GameLog
 from .shop import Shop
-from .character import Character, CHARACTERS
+from .character import Character, make_characters
+from .rng import RngService, RngStream
+from .pathfinding import PathCache, find_path
+from .visibility import Visibility
+from .combat_state import CombatState, step as combat_step
+from . import combat_state as cs
+from . import result as rs
+from .result import Result
+
+
+# Attempts per path step when weather keeps the player in place
+TRAVEL_STEP_TRIES = 3
 
 
 class Game:
-    def __init__(self, world: World, player: Player, x: int, y: int):
+    def __init__(self, world: World, player: Player, x: int, y: int, rng: RngService = None):
         self.world = world
         self.player = player
         self.x = x
         self.y = y
         # Track explored tiles as a set of (x, y)
         self.explored = set()  # type: ignore[var-annotated]
+        # Tiles seen from a distance (always includes the explored ones in sight)
+        self.seen = set()  # type: ignore[var-annotated]
+        self._vis = None
         self.shops = set()
         # Mark starting position as explored
         self._mark_explored(self.x, self.y)
+        self._look_around()
         # Actions interface for UIs
         self.actions = _Actions(self)
         # Game state & combat fields
         self.state: str = GameState.EXPLORING
         self.enemy = None  # type: ignore[assignment]
-        self._combat_log: list = []
-        self._player_regen_turns: int = 0
-        self._player_regen_amount: int = 0
-        self._enemy_stunned_turns: int = 0
-        self._enemy_def_down: int = 0
-        self._enemy_def_turns: int = 0
+        # Numbers and temporary effects of the current fight (see combat_state.py)
+        self.combat = None
         self.pending_move = None
         self.question = ""
         self.pending_weapon = None
@@ -54,10 +62,33 @@ class Game:
         self.data_loader = lambda: None
         self.ascii_loader = lambda: None
         self.enemy_archetypes = []
+        self.enemy_table = None
         self.event_manager = EventManager()
+        # All game randomness is drawn from here so a seed reproduces the whole run
+        self.rng = rng or RngService(world.seed)
+        # The cast depends only on the seed, so a restored game meets the same characters
+        self.characters = make_characters(RngStream(self.rng.seed, "characters"))
+        # Optional CommandJournal recording every executed action (see journal.py)
+        self.journal = None
+        self._paths = None
+        # Actions return formatted text; False returns Result records (see result.py) instead
+        self.text_results = True
 
     def load_configurations(self, enemies: str):
         self.enemy_archetypes = self.data_loader.load(enemies)
+        self.enemy_table = EnemyTable(self.enemy_archetypes).precompute()
+
+    def encounter_table(self) -> EnemyTable:
+        # Rebuilt lazily when enemy_archetypes is swapped without load_configurations
+        if self.enemy_table is None or self.enemy_table.archetypes is not self.enemy_archetypes:
+            self.enemy_table = EnemyTable(self.enemy_archetypes)
+        return self.enemy_table
+
+    def expected_threat(self, x: int = None, y: int = None) -> dict:
+        """Average enemy stats for an encounter on a tile (the current one by default)."""
+        x = self.x if x is None else x
+        y = self.y if y is None else y
+        return self.encounter_table().expected_threat(depth_from_pos(x, y), self.player.level)
 
     def current_tile(self) -> Tile:
         return self.world.get_tile(self.x, self.y)
@@ -68,7 +99,8 @@ class Game:
 
     @staticmethod
     def new_random(size: int, tileset: dict, seed: int = None, flat: bool = False) -> "Game":
-        w = World.generate_random(size, tileset, seed, flat)
+        rng = RngService(seed)
+        w = World.generate_random(size, tileset, rng.seed, flat, rng)
         # Start in center
         cx = w.width // 2
         cy = w.height // 2
@@ -91,7 +123,8 @@ class Game:
                 armor=Armor(name="Cloth Armor", defense_bonus=1)
             ),
             x=cx,
-            y=cy
+            y=cy,
+            rng=rng
         )
 
     def help_text(self) -> str:
@@ -103,17 +136,17 @@ class Game:
             enabled = "" if act.get("enabled", True) else " (disabled)"
             reason = f" — {act['reason']}" if not act.get("enabled", True) and act.get("reason") else ""
             lines.append(f"  - {label}{hotkeys}{enabled}{reason}")
-        self.event_manager.emit(GameEvent(GameEvent.INFO, {
+        self.event_manager.fire(GameEvent.INFO, {
             "information": "\n".join(lines),
             "type": "help_text"
-        }))
+        })
         return "\n".join(lines)
 
     def get_log(self) -> str:
-        self.event_manager.emit(GameEvent(GameEvent.INFO, {
+        self.event_manager.fire(GameEvent.INFO, {
             "information": str(self.log),
             "type": "game_log"
-        }))
+        })
         return f"{self.log}"
 
     def save_game(self, filename: str = None) -> str:
@@ -155,14 +188,14 @@ class Game:
                 if answer:
                     response = f"You chose to accept the offer from {character_name}."
                     if question_type == "weapon_find" and item:
-                        self.event_manager.emit(GameEvent(GameEvent.PICKED_UP_WEAPON, {"weapon": item.to_dict()}))
+                        self.event_manager.fire(GameEvent.PICKED_UP_WEAPON, {"weapon": item.to_dict()})
                     elif question_type == "armor_find" and item:
-                        self.event_manager.emit(GameEvent(GameEvent.PICKED_UP_ARMOR, {"armor": item.to_dict()}))
+                        self.event_manager.fire(GameEvent.PICKED_UP_ARMOR, {"armor": item.to_dict()})
                     elif question_type == "spell_learn":
-                        self.event_manager.emit(GameEvent(GameEvent.LEARNED_SPELL, {
+                        self.event_manager.fire(GameEvent.LEARNED_SPELL, {
                             "spell": self.pending_character_question.get("spell", "unknown"),
                             "character": character_name
-                        }))
+                        })
                 else:
                     response = f"You declined the offer from {character_name}."
             else:
@@ -176,11 +209,10 @@ class Game:
             if answer:
                 self.player.weapon = self.pending_weapon
                 response = f"You equip the {self.pending_weapon.name}."
-                self.event_manager.emit(
-                    GameEvent(GameEvent.PICKED_UP_WEAPON, {"weapon": self.pending_weapon.to_dict()}))
+                self.event_manager.fire(GameEvent.PICKED_UP_WEAPON, {"weapon": self.pending_weapon.to_dict()})
             else:
                 response = "You leave the weapon behind."
-                self.event_manager.emit(GameEvent(GameEvent.LEFT_WEAPON, {"weapon": self.pending_weapon.to_dict()}))
+                self.event_manager.fire(GameEvent.LEFT_WEAPON, {"weapon": self.pending_weapon.to_dict()})
             self.pending_weapon = None
             self.change_state(GameState.EXPLORING)
             return response
@@ -191,54 +223,70 @@ class Game:
         self._mark_explored(self.x, self.y)
         dest_tile = self.world.get_tile(nx, ny)
         cur_tile = self.current_tile()
-        cur_tile.rested = False  # reset rested status on leaving
-        self.event_manager.emit(GameEvent(GameEvent.MOVED, {
+        self.world.set_rested(self.x, self.y, False)  # reset rested status on leaving
+        self.event_manager.fire(GameEvent.MOVED, {
             "message": f"Player f{move_type} to ({nx},{ny}) - {dest_tile.name} from ({self.x},{self.y}){cur_tile.name}.",
             "to": (nx, ny),
             "from": (self.x, self.y),
             "tile_name": dest_tile.name
-        }))
+        })
         self.x, self.y = nx, ny
         # mark explored when arriving
         self._mark_explored(self.x, self.y)
+        self._look_around()
+
 
+    def _out(self, result: Result):
+        """What public actions hand back: the formatted text, or the Result itself."""
+        return result.text() if self.text_results else result
 
     def move(self, dx: int, dy: int, ask: bool) -> str:
-        self.log.add_entry(f"Attempting to move from ({self.x},{self.y}) by delta ({dx},{dy})")
-        self.event_manager.emit(GameEvent(GameEvent.ATTEMPT_MOVE, {"from": (self.x, self.y), "delta": (dx, dy)}))
+        return self._out(self._move(dx, dy, ask))
+
+    def _move(self, dx: int, dy: int, ask: bool) -> Result:
+        events = self.event_manager
+        observed = events.active
+        self.log.add_entry(Result(rs.MOVE_ATTEMPT, {"x": self.x, "y": self.y, "dx": dx, "dy": dy}))
+        if observed:
+            events.fire(GameEvent.ATTEMPT_MOVE, {"from": (self.x, self.y), "delta": (dx, dy)})
         nx = clamp(self.x + dx, 0, self.world.width - 1)
         ny = clamp(self.y + dy, 0, self.world.height - 1)
         if nx == self.x and ny == self.y:
-            self.event_manager.emit(GameEvent(GameEvent.CANT_MOVE, {
-                "message": "You can't go that way.",
-                "reason": "edge_of_world",
-                "from": (self.x, self.y),
-                "to": (nx, ny)}))
-            return "You can't go that way."
+            if observed:
+                events.fire(GameEvent.CANT_MOVE, {
+                    "message": "You can't go that way.",
+                    "reason": "edge_of_world",
+                    "from": (self.x, self.y),
+                    "to": (nx, ny)})
+            return Result(rs.MESSAGE, {"text": "You can't go that way."})
 
         cur_tile = self.current_tile()
 
         # Before moving, warn the player if the destination is very dangerous
         dest_tile = self.world.get_tile(nx, ny)
-        dest_tile.weather.change()
-        self.event_manager.emit(GameEvent(GameEvent.WEATHER_CHANGED, {
-            "message": f"The weather at {dest_tile.name} has changed to {dest_tile.weather.current}.",
-            "position": (nx, ny),
-            "weather": dest_tile.weather.current
-        }))
+        weather = self.world.weather
+        # Each move attempt is one tick of the weather clock
+        changed = weather.advance(self.rng.weather)
+        if observed and (weather.region(nx, ny) in changed or weather.code_at(nx, ny) != weather.code_at(self.x, self.y)):
+            events.fire(GameEvent.WEATHER_CHANGED, {
+                "message": f"The weather at {dest_tile.name} has changed to {dest_tile.weather.current}.",
+                "position": (nx, ny),
+                "weather": dest_tile.weather.current
+            })
         try:
             danger_threshold = 0.6  # warn for risky areas
             if (not dest_tile.safe and dest_tile.danger >= danger_threshold) and ask:
                 self.change_state(GameState.ASKING_QUESTION)
                 self.pending_move = (nx, ny)
-                self.event_manager.emit(GameEvent(GameEvent.DANGER_WARNING, {
-                    "position": (nx, ny),
-                    "danger": dest_tile.danger,
-                    "tile_name": dest_tile.name,
-                    "weather": dest_tile.weather.current
-                }))
+                if observed:
+                    self.event_manager.fire(GameEvent.DANGER_WARNING, {
+                        "position": (nx, ny),
+                        "danger": dest_tile.danger,
+                        "tile_name": dest_tile.name,
+                        "weather": dest_tile.weather.current
+                    })
                 self.question = f"Warning: '{dest_tile.name}' seems very dangerous (danger {dest_tile.danger:.2f}). Proceed? [y/N]"
-                return self.question
+                return Result(rs.MESSAGE, {"text": self.question})
         except Exception:
             # If anything goes wrong with prompting, just continue the move
             pass
@@ -246,75 +294,73 @@ class Game:
         self.change_state(GameState.EXPLORING)
 
         # Chance to get stuck if movement penalty applies (e\.g\. mud, swamp, etc\.)
-        weather_move_mod = self.current_tile().weather.effect().get("movement_penalty", 0)
-        if weather_move_mod > 0 and random.random() < min(0.5, 0.1 * weather_move_mod):
-            desc = f"f{self.current_tile().weather.stuck_message()} and can't move this turn!"
-            self.event_manager.emit((GameEvent(GameEvent.CANT_MOVE, {
-                "message": f"Player got stuck due to weather effects when trying to move to ({nx},{ny}) - {dest_tile.name}.",
-                "reason": "stuck_weather",
-                "from": (self.x, self.y),
-                "to": (nx, ny)
-            })))
+        weather_move_mod = weather.movement_penalty(self.x, self.y)
+        if weather_move_mod > 0 and self.rng.weather.random() < min(0.5, 0.1 * weather_move_mod):
+            desc = Result(rs.STUCK, {"message": self.current_tile().weather.stuck_message()}, sep="\n\n")
+            if observed:
+                events.fire(GameEvent.CANT_MOVE, {
+                    "message": f"Player got stuck due to weather effects when trying to move to ({nx},{ny}) - {dest_tile.name}.",
+                    "reason": "stuck_weather",
+                    "from": (self.x, self.y),
+                    "to": (nx, ny)
+                })
         else:
-            self.event_manager.emit(GameEvent(GameEvent.MOVED, {
-                "message": f"Player moved to ({nx},{ny}) - {dest_tile.name} from ({self.x},{self.y}){cur_tile.name}.",
-                "to": (nx, ny),
-                "from": (self.x, self.y),
-                "tile_name": dest_tile.name
-            }))
-            prev_tile = self.current_tile()
-            prev_tile.rested = False  # reset rested status on leaving
+            if observed:
+                events.fire(GameEvent.MOVED, {
+                    "message": f"Player moved to ({nx},{ny}) - {dest_tile.name} from ({self.x},{self.y}){cur_tile.name}.",
+                    "to": (nx, ny),
+                    "from": (self.x, self.y),
+                    "tile_name": dest_tile.name
+                })
+            self.world.set_rested(self.x, self.y, False)  # reset rested status on leaving
             self.x, self.y = nx, ny
             # mark explored when arriving
             self._mark_explored(self.x, self.y)
+            self._look_around()
             tile = self.current_tile()
             art = render_room(tile, self.ascii_loader) if self.ascii_tiles else ""
-            desc = f"{art}\nYou arrive at {tile.name}. {tile.description}"
+            desc = Result(rs.ARRIVED, {"x": self.x, "y": self.y, "tile": tile.name, "description": tile.description,
+                                       "art": art, "shop": bool(tile.shop)}, sep="\n\n")
             if tile.shop:
                 self.shops.add((self.x, self.y))
-                self.event_manager.emit(GameEvent(GameEvent.FOUND_SHOP, {
-                    "message": "Player found a shop!",
-                    "position": (self.x, self.y),
-                    "tile_name": tile.name
-                }))
-                desc += "\nYou see a merchant here (type shop to enter)."
+                if observed:
+                    events.fire(GameEvent.FOUND_SHOP, {
+                        "message": "Player found a shop!",
+                        "position": (self.x, self.y),
+                        "tile_name": tile.name
+                    })
 
         # Roll encounter -> switch to action-driven combat
         tile = self.current_tile()
-        weather_enc_mod = tile.weather.effect().get("encounter_rate", 0.0)
-        encounter_roll = random.random()
+        weather_enc_mod = self.world.weather.encounter_rate(self.x, self.y)
+        encounter_roll = self.rng.encounter.random()
         encounter_chance = tile.danger + weather_enc_mod
         character_chance = 0.15  # 15% chance to meet a character instead of enemy
-        desc = desc  # keep previous desc
         if not tile.safe and encounter_roll < encounter_chance:
-            if random.random() < character_chance:
-                character = random.choice(CHARACTERS)
+            if self.rng.encounter.random() < character_chance:
+                character = self.rng.encounter.choice(self.characters)
                 self.state = GameState.EXPLORING  # Stay in exploring state
                 # Interact with character
-                output = []
-                output.append(desc)
-                output.append("")
-                output.append(f"You encounter a character!")
-                output.append(character.interact(self.player))
+                met = Result(rs.CHARACTER, {"name": character.name, "text": character.interact(self.player), "ask": ""})
                 if (character.question):
                     self.change_state(GameState.ASKING_QUESTION)
                     self.question = character.question["ask"]
                     self.pending_character_question = character.question
-                    output.append(character.question["ask"] + " [y/N]")
-                return "\n".join(output)
+                    met.data["ask"] = character.question["ask"]
+                return desc.add(met)
             else:
-                enemy = generate_enemy(self.enemy_archetypes, self.player.level, self.x, self.y)
-                intro = self.enter_combat(enemy)
-                return desc + "\n\n" + intro
+                enemy = generate_enemy(self.enemy_archetypes, self.player.level, self.x, self.y, self.encounter_table(),
+                                       self.rng.encounter)
+                return desc.add(self._enter_combat(enemy))
         # Field find chance (can find gear lying around)
         try:
             found = self._maybe_field_find(tile)
             if found:
-                desc += "\n\n" + found
-                self.event_manager.emit(GameEvent(GameEvent.FOUND_WEAPON, {
+                desc.add(Result(rs.MESSAGE, {"text": found}))
+                events.fire(GameEvent.FOUND_WEAPON, {
                     "position": (self.x, self.y),
                     "weapon": self.pending_weapon.to_dict()
-                }))
+                })
         except Exception:
             pass
         return desc
@@ -330,15 +376,16 @@ class Game:
         else:
             self.pending_move = None
             self.change_state(GameState.EXPLORING)
-            self.event_manager.emit(GameEvent(GameEvent.CANT_MOVE, {
+            self.event_manager.fire(GameEvent.CANT_MOVE, {
                 "reason": "move_declined",
                 "from": (self.x, self.y)
-            }))
+            })
             return "You decide not to proceed there."
 
     def look(self) -> str:
         if self.state == GameState.COMBAT:
-            return self._combat_status()
+            status = self._combat_status()
+            return self._out(status) if status else ""
         if self.state == GameState.SHOP:
             return self.shop("")
         if self.state == GameState.ASKING_QUESTION:
@@ -360,10 +407,46 @@ class Game:
 
     def execute_action(self, action_id_or_key: str) -> str:
         """Execute an action by id or key; returns output text or None if unknown."""
+        journal = self.journal
+        if journal is not None:
+            aid = self.actions.resolve(action_id_or_key)
+            positions = self.rng.positions()
         log = self.actions.execute(action_id_or_key)
         self.log.add_entry(log)
+        if journal is not None and aid is not None:
+            journal.record(self, aid, positions)
         return log
 
+    def execute_batch(self, commands: list, stop_states: tuple = (GameState.COMBAT, GameState.GAME_OVER)) -> dict:
+        """
+        Execute several actions in one call (e.g. a movement path plus answers to questions).
+        Stops early when an action moves the game into one of stop_states, or ends the game,
+        so scripted clients can react. Returns per-command outputs and the final state.
+        """
+        results = []
+        stopped = None
+        for cmd in commands or []:
+            before = self.state
+            out = self.execute_action(cmd)
+            results.append({
+                "cmd": cmd,
+                "output": out,
+                "known": out is not None,
+                "state": self.state,
+            })
+            if self.ended:
+                stopped = "ended"
+                break
+            if self.state != before and self.state in stop_states:
+                stopped = self.state
+                break
+        return {
+            "results": results,
+            "executed": len(results),
+            "stopped": stopped,
+            "state": self.state,
+        }
+
     def _mark_explored(self, x: int, y: int) -> None:
         try:
             self.explored.add((int(x), int(y)))
@@ -371,6 +454,63 @@ class Game:
             # Be resilient to any odd inputs
             pass
 
+    def visibility(self) -> Visibility:
+        if self._vis is None or self._vis.world is not self.world:
+            self._vis = Visibility(self.world)
+        return self._vis
+
+    def _look_around(self) -> None:
+        self.seen.update(self.visibility().visible(self.x, self.y))
+
+    # --- Travel ---
+    def path_cache(self) -> PathCache:
+        if self._paths is None or self._paths.world is not self.world:
+            self._paths = PathCache(self.world)
+        return self._paths
+
+    def travel_to(self, tx: int, ty: int, label: str = None, path: list = None) -> str:
+        """
+        Walk to (tx, ty) along the cheapest path, one normal move per step. Stops as soon as
+        a move leaves the EXPLORING state (an encounter, a danger warning, a find).
+        """
+        label = label or f"({tx},{ty})"
+        if (self.x, self.y) == (tx, ty):
+            return self._out(Result(rs.ALREADY_THERE, {"label": label}))
+        if path is None:
+            path = find_path(self.world, (self.x, self.y), (tx, ty))
+        if not path:
+            return self._out(Result(rs.NO_ROUTE, {"label": label}))
+        steps = 0
+        out = None
+        for (nx, ny) in path:
+            # Weather can hold you in place for a turn; try each step a few times
+            for _ in range(TRAVEL_STEP_TRIES):
+                out = self._move(nx - self.x, ny - self.y, True)
+                if (self.x, self.y) == (nx, ny) or self.state != GameState.EXPLORING:
+                    break
+            moved = (self.x, self.y) == (nx, ny)
+            if moved:
+                steps += 1
+            if not moved or self.state != GameState.EXPLORING:
+                break
+        arrived = (self.x, self.y) == (tx, ty)
+        return self._out(Result(rs.TRAVEL, {"steps": steps, "label": label, "arrived": arrived, "x": tx, "y": ty}).add(out))
+
+    def travel_village(self) -> str:
+        vx, vy = self.world.village
+        path = self.path_cache().path_to("village", [(vx, vy)], (self.x, self.y))
+        return self.travel_to(vx, vy, "the village", path)
+
+    def travel_shop(self) -> str:
+        shops = sorted(self.shops)
+        if not shops:
+            return "You don't know of any merchants yet."
+        path = self.path_cache().path_to("shops", shops, (self.x, self.y))
+        if not path:
+            return self.travel_to(self.x, self.y, "the nearest merchant")
+        tx, ty = path[-1]
+        return self.travel_to(tx, ty, "the nearest merchant", path)
+
     def map(self) -> str:
         # Render a simple ASCII map of explored tiles
         rows = []
@@ -383,35 +523,50 @@ class Game:
                     ch = "."  # explored
                 elif (x, y) in self.shops:
                     ch = "$"  # shop
+                elif (x, y) in self.seen:
+                    ch = ","  # seen from a distance
                 else:
                     ch = "?"  # unexplored
                 line_chars.append(ch)
             rows.append("".join(line_chars))
-        title = f"Map ({self.world.width}x{self.world.height})\n@ you, . explored, $ shop, ? unknown\n"
+        title = f"Map ({self.world.width}x{self.world.height})\n@ you, . explored, $ shop, , seen, ? unknown\n"
         map = title + "\n" + "\n".join(rows)
-        self.event_manager.emit(GameEvent(GameEvent.INFO, {
+        self.event_manager.fire(GameEvent.INFO, {
             "information": map,
             "type": "map_render"
-        }))
+        })
         return map
 
     def stats(self) -> str:
         p = self.player
-        stats = (
-            f"Stats for {p.name}:\n"
-            f"Lv {p.level}\n"
-            f"XP: {p.xp}/{xp_to_next_level(p.level)} | Gold: {p.gold}\n"
-            f"HP: {p.hp}/{p.max_hp} | MP: {p.mp}/{p.max_mp} | ATK: {p.attack} | DEF: {p.defense} | Potions: {p.potions} | Spells: {len([s for s in p.known_spells if s in SPELLS])}"
-            f"\nWeapon: {p.weapon if p.weapon else 'None'}\nArmor: {p.armor if p.armor else 'None'}"
-            f"\nSpells Known: {', '.join(p.known_spells) if p.known_spells else 'None'}"
-            f"\nLocation: ({self.x},{self.y}) - {self.current_tile().name}"
-            f"\nState: {self.state}"
-        )
-        self.event_manager.emit(GameEvent(GameEvent.INFO, {
-            "information": stats,
-            "type": "player_stats"
-        }))
-        return stats
+        stats = Result(rs.STATS, {
+            "name": p.name,
+            "level": p.level,
+            "xp": p.xp,
+            "next_xp": xp_to_next_level(p.level),
+            "gold": p.gold,
+            "hp": p.hp,
+            "max_hp": p.max_hp,
+            "mp": p.mp,
+            "max_mp": p.max_mp,
+            "attack": p.attack,
+            "defense": p.defense,
+            "potions": p.potions,
+            "spells": len([s for s in p.known_spells if s in SPELLS]),
+            "weapon": p.weapon.to_dict() if p.weapon else None,
+            "armor": p.armor.to_dict() if p.armor else None,
+            "known_spells": list(p.known_spells),
+            "x": self.x,
+            "y": self.y,
+            "tile": self.current_tile().name,
+            "state": str(self.state),
+        })
+        if self.event_manager.active:
+            self.event_manager.fire(GameEvent.INFO, {
+                "information": stats.text(),
+                "type": "player_stats"
+            })
+        return self._out(stats)
 
     def spells(self) -> str:
         p = self.player
@@ -424,37 +579,37 @@ class Game:
             else:
                 lines.append(f" - {sp}: (Unknown spell details)")
         spells = "\n".join(lines)
-        self.event_manager.emit(GameEvent(GameEvent.INFO, {
+        self.event_manager.fire(GameEvent.INFO, {
             "information": spells,
             "type": "player_spells"
-        }))
+        })
         return spells
 
     def shop_exit(self) -> str:
         self.change_state(GameState.EXPLORING)
-        self.event_manager.emit(GameEvent(GameEvent.EXITED_SHOP, {
+        self.event_manager.fire(GameEvent.EXITED_SHOP, {
             "message": "Player exited the shop.",
             "position": (self.x, self.y),
             "tile_name": self.current_tile().name
-        }))
+        })
         return "You leave the shop.\n" + self.look()
 
     def shop_enter(self) -> str:
         tile = self.current_tile()
         if not getattr(tile, "shop", False):
             return "There is no shop here."
-        self.event_manager.emit(GameEvent(GameEvent.ENTERED_SHOP, {
+        self.event_manager.fire(GameEvent.ENTERED_SHOP, {
             "message": "Player entered the shop.",
             "position": (self.x, self.y),
             "tile_name": tile.name
-        }))
+        })
         return "You enter the shop!\n" + self.shop("")
 
     def shop(self, selection: str) -> str:
         tile = self.current_tile()
         if not getattr(tile, "shop", False):
             return "There is no shop here."
-        shop = Shop(self.player, self.event_manager)
+        shop = Shop(self.player, self.event_manager, self.rng.loot)
         if hasattr(tile, "shop_items") and tile.shop_items:
             shop.shop_items = tile.shop_items
         else:
@@ -466,56 +621,64 @@ class Game:
         return shop_response
 
     def rest(self) -> str:
+        return self._out(self._rest())
+
+    def _rest(self) -> Result:
         tile = self.current_tile()
+        observed = self.event_manager.active
         if hasattr(tile, "rested") and tile.rested:
-            self.event_manager.emit(GameEvent(GameEvent.CANT_REST, {
-                "message": "Player attempted to rest again at the same location. Can only rest once per location visit.",
-                "position": (self.x, self.y),
-                "tile_name": tile.name
-            }))
-            return "You have already rested here. Try moving to another location."
+            if observed:
+                self.event_manager.fire(GameEvent.CANT_REST, {
+                    "message": "Player attempted to rest again at the same location. Can only rest once per location visit.",
+                    "position": (self.x, self.y),
+                    "tile_name": tile.name
+                })
+            return Result(rs.REST_AGAIN)
         if tile.safe:
             healed = self.player.heal(8 + self.player.level * 2)
             # chance to receive a free potion in town occasionally
-            if random.random() < 0.15:
+            if self.rng.loot.random() < 0.15:
                 self.player.potions += 1
-                self.event_manager.emit(GameEvent(GameEvent.RESTED, {
-                    "message": "Player rested in village.",
+                if observed:
+                    self.event_manager.fire(GameEvent.RESTED, {
+                        "message": "Player rested in village.",
+                        "healed": healed,
+                        "received_potion": True,
+                        "type": "village_rest"
+                    })
+                self.world.set_rested(self.x, self.y, True)
+                return Result(rs.REST_VILLAGE, {"healed": healed, "potion": True})
+            if observed:
+                self.event_manager.fire(GameEvent.RESTED, {
+                    "message": f"You rest at the village and heal {healed} HP.",
                     "healed": healed,
-                    "received_potion": True,
+                    "received_potion": False,
                     "type": "village_rest"
-                }))
-                tile.rested = True
-                return f"You rest at the village and heal {healed} HP. The healer gifts you a potion."
-            self.event_manager.emit(GameEvent(GameEvent.RESTED, {
-                "message": f"You rest at the village and heal {healed} HP.",
-                "healed": healed,
-                "received_potion": False,
-                "type": "village_rest"
-            }))
-            tile.rested = True
-            return f"You rest at the village and heal {healed} HP."
+                })
+            self.world.set_rested(self.x, self.y, True)
+            return Result(rs.REST_VILLAGE, {"healed": healed, "potion": False})
         else:
             healed = self.player.heal(4 + self.player.level)
-            note = f"You rest cautiously and heal {healed} HP."
-            self.event_manager.emit(GameEvent(GameEvent.RESTED, {
-                "message": f"You rest cautiously and heal {healed} HP.",
-                "healed": healed,
-                "type": "wild_rest"
-            }))
+            note = Result(rs.REST_WILD, {"healed": healed, "ambushed": False}, sep="\n\n")
+            if observed:
+                self.event_manager.fire(GameEvent.RESTED, {
+                    "message": f"You rest cautiously and heal {healed} HP.",
+                    "healed": healed,
+                    "type": "wild_rest"
+                })
             # Resting in dangerous areas may trigger an ambush
-            if random.random() < min(0.2 + tile.danger / 2, 0.75):
-                enemy = generate_enemy(self.enemy_archetypes, self.player.level, self.x, self.y)
-                note += "\nYou are ambushed in your sleep!"
-                intro = self.enter_combat(enemy)
-                self.event_manager.emit(GameEvent(GameEvent.REST_INTERRUPTED, {
-                    "message": f"Rest interrupted by ambush from {enemy.name}.",
-                    "position": (self.x, self.y),
-                    "enemy_name": enemy.name
-                }))
-                tile.rested = True
-                return note + "\n\n" + intro
-            tile.rested = True
+            if self.rng.encounter.random() < min(0.2 + tile.danger / 2, 0.75):
+                enemy = generate_enemy(self.enemy_archetypes, self.player.level, self.x, self.y, self.encounter_table(),
+                                       self.rng.encounter)
+                note.data["ambushed"] = True
+                note.add(self._enter_combat(enemy))
+                if observed:
+                    self.event_manager.fire(GameEvent.REST_INTERRUPTED, {
+                        "message": f"Rest interrupted by ambush from {enemy.name}.",
+                        "position": (self.x, self.y),
+                        "enemy_name": enemy.name
+                    })
+            self.world.set_rested(self.x, self.y, True)
             return note
 
     def debug_pos(self) -> str:
@@ -549,18 +712,22 @@ class Game:
             "world": self.world.to_dict(),
             "pos": {"x": self.x, "y": self.y},
             "explored": [[x, y] for (x, y) in sorted(self.explored)],
+            "seen": [[x, y] for (x, y) in sorted(self.seen)],
+            "shops": [[x, y] for (x, y) in sorted(self.shops)],
+            "shop_items": dict(self.shop_items) if self.shop_items else None,
             "state": str(self.state),
+            "rng": self.rng.to_dict(),
             # Persist minimal combat snapshot if in combat
             "combat": (
                 {
-                    "enemy": self.enemy.to_4dict() if self.enemy else None,
-                    "regen_turns": self._player_regen_turns,
-                    "regen_amount": self._player_regen_amount,
-                    "enemy_stunned": self._enemy_stunned_turns,
-                    "enemy_def_down": self._enemy_def_down,
-                    "enemy_def_turns": self._enemy_def_turns,
+                    "enemy": self.enemy.to_dict() if self.enemy else None,
+                    "regen_turns": self.combat.regen_turns,
+                    "regen_amount": self.combat.regen_amount,
+                    "enemy_stunned": self.combat.stunned_turns,
+                    "enemy_def_down": self.combat.def_down,
+                    "enemy_def_turns": self.combat.def_turns,
                 }
-                if self.state == GameState.COMBAT
+                if self.state == GameState.COMBAT and self.combat is not None
                 else None
             ),
         }
@@ -596,7 +763,8 @@ class Game:
         pos = d.get("pos", {"x": 0, "y": 0})
         x = int(pos.get("x", 0))
         y = int(pos.get("y", 0))
-        g = Game(world=w, player=p, x=x, y=y)
+        rng = RngService.from_dict(d["rng"]) if isinstance(d.get("rng"), dict) else None
+        g = Game(world=w, player=p, x=x, y=y, rng=rng)
         # restore explored if present
         explored_list = d.get("explored") or []
         try:
@@ -610,6 +778,14 @@ class Game:
             pass
         # Ensure current tile is always considered explored
         g._mark_explored(g.x, g.y)
+        for item in d.get("seen") or []:
+            if isinstance(item, (list, tuple)) and len(item) == 2:
+                g.seen.add((int(item[0]), int(item[1])))
+        for item in d.get("shops") or []:
+            if isinstance(item, (list, tuple)) and len(item) == 2:
+                g.shops.add((int(item[0]), int(item[1])))
+        if d.get("shop_items"):
+            g.shop_items = dict(d["shop_items"])
         # Load state (backward-compatible)
         g.state = str(d.get("state") or GameState.EXPLORING)
         # Restore combat snapshot if present
@@ -622,11 +798,12 @@ class Game:
                     name=ed["name"], ascii=ed["ascii"], level=int(ed["level"]), max_hp=int(ed["max_hp"]),
                     hp=int(ed["hp"]), attack=int(ed["attack"]), defense=int(ed["defense"]),
                     xp_reward=int(ed["xp_reward"]), gold_reward=int(ed["gold_reward"]))
-                g._player_regen_turns = int(cmb.get("regen_turns", 0))
-                g._player_regen_amount = int(cmb.get("regen_amount", 0))
-                g._enemy_stunned_turns = int(cmb.get("enemy_stunned", 0))
-                g._enemy_def_down = int(cmb.get("enemy_def_down", 0))
-                g._enemy_def_turns = int(cmb.get("enemy_def_turns", 0))
+                g.combat = CombatState.from_entities(g.player, g.enemy)
+                g.combat.regen_turns = int(cmb.get("regen_turns", 0))
+                g.combat.regen_amount = int(cmb.get("regen_amount", 0))
+                g.combat.stunned_turns = int(cmb.get("enemy_stunned", 0))
+                g.combat.def_down = int(cmb.get("enemy_def_down", 0))
+                g.combat.def_turns = int(cmb.get("enemy_def_turns", 0))
         except Exception:
             pass
         return g
@@ -636,11 +813,15 @@ class Game:
         self.player = other.player
         self.x = other.x
         self.y = other.y
+        self.rng = other.rng
+        self.characters = other.characters
         # copy explored set
         try:
             self.explored = set(other.explored)
         except Exception:
             self.explored = {(self.x, self.y)}
+        self.seen = set(other.seen)
+        self._vis = None
         try:
             self.shops = set(other.shops)
         except Exception:
@@ -648,11 +829,7 @@ class Game:
         # copy state/combat snapshot
         self.state = other.state
         self.enemy = other.enemy
-        self._player_regen_turns = other._player_regen_turns
-        self._player_regen_amount = other._player_regen_amount
-        self._enemy_stunned_turns = other._enemy_stunned_turns
-        self._enemy_def_down = other._enemy_def_down
-        self._enemy_def_turns = other._enemy_def_turns
+        self.combat = other.combat
         self.available_actions()
 
     def change_state(self, state: str):
@@ -666,10 +843,10 @@ class Game:
     def _random_weapon_for_level(self) -> Weapon:
         pool = self._weapon_pool()
         # bias selection by player level
-        idx = min(len(pool) - 1, max(0, (self.player.level - 1) // 2 + random.randint(-1, 1)))
+        idx = min(len(pool) - 1, max(0, (self.player.level - 1) // 2 + self.rng.loot.randint(-1, 1)))
         # jitter around idx
         choices = pool[max(0, idx - 1): min(len(pool), idx + 2)] or pool
-        return random.choice(choices)
+        return self.rng.loot.choice(choices)
 
     def _offer_weapon_pickup(self, found: Weapon, source: str) -> str:
         cur = self.player.weapon
@@ -686,201 +863,247 @@ class Game:
         # Higher chance in dangerous areas; rarely in towns
         base = 0.03 if tile.safe else 0.10
         # Lower chance if visibility is bad for tile.effect()
-        visibility_mod = tile.weather.effect().get("visibility", 1.0)
-        if random.random() < base * visibility_mod:
+        visibility_mod = tile.weather.visibility()
+        if self.rng.loot.random() < base * visibility_mod:
             wpn = self._random_weapon_for_level()
             return self._offer_weapon_pickup(wpn, "the area")
         return ""
 
     def _maybe_offer_weapon(self, source) -> None:
         drop_chance = 0.25
-        if random.random() < drop_chance:
+        if self.rng.loot.random() < drop_chance:
             wpn = self._random_weapon_for_level()
             self._offer_weapon_pickup(wpn, source)
 
     # --- Combat entry/turns and actions ---
     def enter_combat(self, enemy) -> str:
+        return self._out(self._enter_combat(enemy))
+
+    def _enter_combat(self, enemy) -> Result:
         self.change_state(GameState.COMBAT)
         self.enemy = enemy
-        self._combat_log = []
-        # Reset temporary effects
-        self._enemy_stunned_turns = 0
-        self._enemy_def_down = 0
-        self._enemy_def_turns = 0
-        intro = f"A {enemy.name} appears! Prepare for battle."
-        self.event_manager.emit(GameEvent(GameEvent.ENTERED_COMBAT, {
-            "message": "Player has entered combat.",
-            "position": (self.x, self.y),
-            "location": self.current_tile().name,
-            "enemy_name": enemy.name,
-            "enemy_ascii_art": enemy.ascii,
-            "enemy_level": enemy.level,
-            "enemy_hp": enemy.hp,
-            "enemy_max_hp": enemy.max_hp,
-            "enemy_attack": enemy.attack,
-            "enemy_defense": enemy.defense
-        }))
-        return intro + "\n" + self._combat_status()
-
-    def _combat_status(self) -> str:
+        self.combat = CombatState.from_entities(self.player, enemy)
+        if self.event_manager.active:
+            self.event_manager.fire(GameEvent.ENTERED_COMBAT, {
+                "message": "Player has entered combat.",
+                "position": (self.x, self.y),
+                "location": self.current_tile().name,
+                "enemy_name": enemy.name,
+                "enemy_ascii_art": enemy.ascii,
+                "enemy_level": enemy.level,
+                "enemy_hp": enemy.hp,
+                "enemy_max_hp": enemy.max_hp,
+                "enemy_attack": enemy.attack,
+                "enemy_defense": enemy.defense
+            })
+        return Result(rs.COMBAT_START, {"enemy": enemy.name}).add(self._combat_status())
+
+    def _combat_status(self) -> Result:
         if not self.enemy:
-            return ""
+            return None
         e = self.enemy
-        lines = [
-            _hp_line("You", self.player.hp, self.player.max_hp) + f" | MP {self.player.mp}/{self.player.max_mp}",
-            _hp_line(e.name, e.hp, e.max_hp),
-            f"\n{e.ascii}\n",
-            f"[Enemy Stats] ATK: {e.attack} | DEF: {e.defense}"
-        ]
-        return "\n".join(lines)
+        p = self.player
+        return Result(rs.COMBAT_STATUS, {
+            "hp": p.hp,
+            "max_hp": p.max_hp,
+            "mp": p.mp,
+            "max_mp": p.max_mp,
+            "enemy": e.name,
+            "enemy_hp": e.hp,
+            "enemy_max_hp": e.max_hp,
+            "ascii": e.ascii,
+            "attack": e.attack,
+            "defense": e.defense,
+        })
 
-    def _end_combat(self, victory: bool) -> str:
-        out_lines: list = []
+    def _end_combat(self, victory: bool) -> Result:
+        out = Result(rs.COMBAT)
         if victory:
             e = self.enemy
             if e:
                 self.player.gold += max(0, int(e.gold_reward))
-                out_lines.append(f"You defeated {e.name}! You loot {e.gold_reward} gold.")
+                out = Result(cs.VICTORY, {"enemy": e.name, "gold": e.gold_reward, "xp": e.xp_reward})
                 # Award XP and level-up notes
                 cur_level = self.player.level
                 notes = self.player.add_xp(max(0, int(e.xp_reward)))
                 nex_level = self.player.level
-                out_lines.extend(notes)
-                self.event_manager.emit(GameEvent(GameEvent.EXITED_COMBAT, {
-                    "message": "Player won combat.",
-                    "position": (self.x, self.y),
-                    "location": self.current_tile().name,
-                    "victory": True,
-                    "fled": False,
-                    "enemy_name": e.name if e else "Unknown",
-                    "gold_looted": e.gold_reward if e else 0,
-                    "xp_gained": e.xp_reward if e else 0,
-                    "leveled_up": nex_level > cur_level
-                }))
+                for note in notes:
+                    out.add(Result(rs.MESSAGE, {"text": note}))
+                if self.event_manager.active:
+                    self.event_manager.fire(GameEvent.EXITED_COMBAT, {
+                        "message": "Player won combat.",
+                        "position": (self.x, self.y),
+                        "location": self.current_tile().name,
+                        "victory": True,
+                        "fled": False,
+                        "enemy_name": e.name if e else "Unknown",
+                        "gold_looted": e.gold_reward if e else 0,
+                        "xp_gained": e.xp_reward if e else 0,
+                        "leveled_up": nex_level > cur_level
+                    })
                 try:
                     self._maybe_offer_weapon(f"the fallen {e.name}")
                     if self.pending_weapon:
-                        self.event_manager.emit(GameEvent(GameEvent.FOUND_WEAPON, {
-                            "message": f"Player found weapon {self.pending_weapon} from defeated {e.name}.",
-                            "position": (self.x, self.y),
-                            "weapon": self.pending_weapon
-                        }))
+                        if self.event_manager.active:
+                            self.event_manager.fire(GameEvent.FOUND_WEAPON, {
+                                "message": f"Player found weapon {self.pending_weapon} from defeated {e.name}.",
+                                "position": (self.x, self.y),
+                                "weapon": self.pending_weapon
+                            })
                 except Exception:
                     pass
         else:
-            self.event_manager.emit(GameEvent(GameEvent.EXITED_COMBAT, {
-                "message": "Player was defeated in combat.",
-                "position": (self.x, self.y),
-                "location": self.current_tile().name,
-                "victory": False,
-                "fled": False,
-                "gold_looted": 0,
-                "xp_gained": 0,
-                "leveled_up": False,
-                "dead_player": self.player.name,
-                "enemy_name": self.enemy.name if self.enemy else "Unknown"
-            }))
-            out_lines.append("You were defeated...")
+            if self.event_manager.active:
+                self.event_manager.fire(GameEvent.EXITED_COMBAT, {
+                    "message": "Player was defeated in combat.",
+                    "position": (self.x, self.y),
+                    "location": self.current_tile().name,
+                    "victory": False,
+                    "fled": False,
+                    "gold_looted": 0,
+                    "xp_gained": 0,
+                    "leveled_up": False,
+                    "dead_player": self.player.name,
+                    "enemy_name": self.enemy.name if self.enemy else "Unknown"
+                })
+            out = Result(cs.DEFEAT, {"enemy": self.enemy.name if self.enemy else "Unknown"})
 
         # Clear combat state
+        ENEMY_POOL.release(self.enemy)
         self.enemy = None
-        self._player_regen_turns = 0
-        self._player_regen_amount = 0
-        self._enemy_stunned_turns = 0
-        self._enemy_def_down = 0
-        self._enemy_def_turns = 0
+        self.combat = None
 
         if not self.player.is_alive():
             self.change_state(GameState.GAME_OVER)
-            return "\n".join(out_lines)
+            return out
         elif self.pending_weapon:
             # If a weapon pickup is pending, stay in question state
             self.change_state(GameState.ASKING_QUESTION)
-            out_lines.append(self.question)
-            return "\n".join(out_lines)
+            return out.add(Result(rs.MESSAGE, {"text": self.question}))
         # Return to exploring
         self.change_state(GameState.EXPLORING)
-        return "\n".join(out_lines)
-
-    def _player_regen_tick(self) -> str:
-        if self._player_regen_turns > 0 and self._player_regen_amount > 0:
-            healed = self.player.heal(self._player_regen_amount)
-            self._player_regen_turns -= 1
-            self.event_manager.emit(GameEvent(GameEvent.REGEN, {
-                "message": f"Regen restores {healed} HP for player.",
-                "healed": healed,
-                "turns_left": self._player_regen_turns
-            }))
-            return f"Regen restores {healed} HP."
-        return None
+        return out
 
-    def _enemy_turn(self) -> list:
-        msgs: list = []
-        if not self.enemy:
-            return msgs
+    def _combat_step(self, action: str, spell: str = None) -> list:
+        """Advance the current fight by one CombatState step and copy the results back."""
+        st = CombatState.from_entities(self.player, self.enemy, self.combat)
+        st, events = combat_step(st, action, self.rng.combat, spell)
+        st.apply(self.player, self.enemy)
+        self.combat = st
+        return events
+
+    def _combat_result(self, events: list, spell: str = None) -> Result:
+        """A COMBAT result for one step's events plus the status, firing GameEvents in order."""
+        out = Result(rs.COMBAT)
+        observed = self.event_manager.active
         e = self.enemy
-        if self._enemy_stunned_turns > 0:
-            msgs.append(f"{e.name} is stunned and cannot act!")
-            self._enemy_stunned_turns -= 1
-            self.event_manager.emit(GameEvent(GameEvent.ENEMY_STUNNED, {
-                "message": f"{e.name} is stunned for {self._enemy_stunned_turns} more turns.",
-                "enemy_name": e.name,
-                "turns_left": self._enemy_stunned_turns
-            }))
-        else:
-            # Enemy attacks
-            dmg = calc_damage(int(e.attack), int(self.player.total_defense))
-            dmg = max(1, dmg)
-            self.player.hp = _clamp_int(self.player.hp - dmg, 0, self.player.max_hp)
-            msgs.append(f"{e.name} strikes you for {dmg} damage.")
-            self.event_manager.emit(GameEvent(GameEvent.ENEMY_ATTACKED, {
-                "message": f"{e.name} attacked player for {dmg} damage.",
-                "enemy_name": e.name,
-                "damage": dmg,
-                "player_hp": self.player.hp
-            }))
-        # Decay enemy defense debuff
-        if self._enemy_def_turns > 0:
-            self._enemy_def_turns -= 1
-            if self._enemy_def_turns == 0 and self._enemy_def_down > 0:
-                msgs.append("The enemy's defenses recover.")
-                self._enemy_def_down = 0
-                self.event_manager.emit(GameEvent(GameEvent.ENEMY_RECOVERED, {
+        for kind, value in events:
+            if kind == cs.VICTORY:
+                out.add(self._end_combat(True))
+                continue
+            if kind == cs.DEFEAT:
+                out.add(self._end_combat(False))
+                continue
+            out.add(Result(kind, {"enemy": e.name, "value": value, "spell": spell}))
+            if not observed:
+                continue
+            if kind == cs.HIT:
+                self.event_manager.fire(GameEvent.ATTACKED, {
+                    "message": f"Player attacked {e.name} for {value} damage.",
+                    "enemy_name": e.name,
+                    "damage": value,
+                    "enemy_hp": e.hp
+                })
+            elif kind == cs.SPELL_HIT:
+                self.event_manager.fire(GameEvent.CAST_SPELL, {
+                    "message": f"Player cast {spell} for {value} damage to {e.name}.",
+                    "spell": spell,
+                    "damage": value,
+                    "enemy_hp": e.hp,
+                    "player_mp": self.player.mp,
+                    "type": "damage"
+                })
+            elif kind == cs.HEAL:
+                self.event_manager.fire(GameEvent.CAST_SPELL, {
+                    "message": f"Player cast Heal to restore {value} HP.",
+                    "spell": spell,
+                    "healed": value,
+                    "player_hp": self.player.hp,
+                    "player_mp": self.player.mp,
+                    "type": "heal"
+                })
+            elif kind == cs.REGEN_CAST:
+                self.event_manager.fire(GameEvent.CAST_SPELL, {
+                    "message": f"Player cast Regen to recover {value} HP for {cs.REGEN_TURNS} turns.",
+                    "spell": spell,
+                    "regen_amount": value,
+                    "regen_turns": cs.REGEN_TURNS,
+                    "player_mp": self.player.mp,
+                    "type": "regen"
+                })
+            elif kind == cs.GUARD_BREAK:
+                self.event_manager.fire(GameEvent.CAST_SPELL, {
+                    "message": "Player cast Guard Break to debuff enemy defense.",
+                    "spell": spell,
+                    "defense_down": value,
+                    "defense_turns": cs.GUARD_BREAK_TURNS,
+                    "player_mp": self.player.mp,
+                    "type": "debuff"
+                })
+            elif kind == cs.POTION_USED:
+                self.event_manager.fire(GameEvent.USED_POTION, {
+                    "message": f"Player used a potion and healed {value} HP.",
+                    "used_in_combat": True,
+                    "healed": value,
+                    "potions_left": self.player.potions,
+                    "player_hp": self.player.hp
+                })
+            elif kind == cs.POTION_FULL:
+                self.event_manager.fire(GameEvent.USED_POTION, {
+                    "message": "Player tried to use a potion at full health and decided not to waste it.",
+                    "used_in_combat": False,
+                    "reason": "full_health",
+                    "potions_left": self.player.potions
+                })
+            elif kind == cs.NO_POTIONS:
+                self.event_manager.fire(GameEvent.USED_POTION, {
+                    "message": "Player tried to use a potion but had none.",
+                    "used_in_combat": False,
+                    "reason": "no_potions",
+                    "potions_left": self.player.potions
+                })
+            elif kind == cs.STUNNED:
+                self.event_manager.fire(GameEvent.ENEMY_STUNNED, {
+                    "message": f"{e.name} is stunned for {value} more turns.",
+                    "enemy_name": e.name,
+                    "turns_left": value
+                })
+            elif kind == cs.ENEMY_HIT:
+                self.event_manager.fire(GameEvent.ENEMY_ATTACKED, {
+                    "message": f"{e.name} attacked player for {value} damage.",
+                    "enemy_name": e.name,
+                    "damage": value,
+                    "player_hp": self.player.hp
+                })
+            elif kind == cs.RECOVERED:
+                self.event_manager.fire(GameEvent.ENEMY_RECOVERED, {
                     "message": "Enemy defense debuff has worn off.",
                     "enemy_name": e.name,
                     "effect": "defense_recovered"
-                }))
-        # Regen tick after enemy turn
-        reg = self._player_regen_tick()
-        if reg:
-            msgs.append(reg)
-        # Check death
-        if not self.player.is_alive():
-            msgs.append(self._end_combat(False))
-        return msgs
+                })
+            elif kind == cs.REGEN:
+                self.event_manager.fire(GameEvent.REGEN, {
+                    "message": f"Regen restores {value} HP for player.",
+                    "healed": value,
+                    "turns_left": self.combat.regen_turns
+                })
+        return out.add(self._combat_status())
 
     # --- Player combat actions ---
     def combat_attack(self) -> str:
         if self.state != GameState.COMBAT or not self.enemy:
             return "There's nothing to attack."
-        e = self.enemy
-        eff_def = _enemy_defense_effect(int(e.defense), self._enemy_def_down, self._enemy_def_turns)
-        dmg = calc_damage(int(self.player.total_attack), eff_def)
-        e.hp = _clamp_int(e.hp - dmg, 0, e.max_hp)
-        msgs = [f"You strike the {e.name} for {dmg} damage."]
-        self.event_manager.emit(GameEvent(GameEvent.ATTACKED, {
-            "message": f"Player attacked {e.name} for {dmg} damage.",
-            "enemy_name": e.name,
-            "damage": dmg,
-            "enemy_hp": e.hp
-        }))
-        if e.hp <= 0:
-            msgs.append(self._end_combat(True))
-            return "\n".join([m for m in msgs if m])
-        # Enemy responds
-        msgs.extend(self._enemy_turn())
-        msgs.append(self._combat_status())
-        return "\n".join([m for m in msgs if m])
+        return self._out(self._combat_result(self._combat_step(cs.ATTACK)))
 
     def cast_spell(self, spell: str) -> str:
         allowed_spells = ["Heal"]
@@ -890,13 +1113,13 @@ class Game:
             return "You don't know that spell."
         cost = int(SPELLS[spell]["mp"])
         if self.player.mp < cost:
-            self.event_manager.emit(GameEvent(GameEvent.OOM, {
+            self.event_manager.fire(GameEvent.OOM, {
                 "message": "Not enough MP to cast spell.",
                 "spell": spell,
                 "required_mp": cost,
                 "current_mp": self.player.mp,
                 "not_enough_mp": True
-            }))
+            })
             return "Not enough MP!"
         self.player.mp -= cost
         msgs: list = []
@@ -904,14 +1127,14 @@ class Game:
         if spell == "Heal":
             healed = self.player.heal(power + self.player.level)
             msgs.append(f"You cast Heal and restore {healed} HP.")
-            self.event_manager.emit(GameEvent(GameEvent.CAST_SPELL, {
+            self.event_manager.fire(GameEvent.CAST_SPELL, {
                 "message": f"Player cast Heal to restore {healed} HP.",
                 "spell": spell,
                 "healed": healed,
                 "player_hp": self.player.hp,
                 "player_mp": self.player.mp,
                 "type": "heal"
-            }))
+            })
         return "\n".join([m for m in msgs if m])
 
     def combat_cast(self, spell: str) -> str:
@@ -919,161 +1142,87 @@ class Game:
             return "You can't cast that now."
         if spell not in SPELLS:
             return "You don't know that spell."
-        cost = int(SPELLS[spell]["mp"])
-        if self.player.mp < cost:
-            self.event_manager.emit(GameEvent(GameEvent.OOM, {
+        events = self._combat_step(cs.CAST, spell)
+        if events and events[0][0] == cs.OOM:
+            self.event_manager.fire(GameEvent.OOM, {
                 "message": "Not enough MP to cast spell.",
                 "spell": spell,
-                "required_mp": cost,
+                "required_mp": events[0][1],
                 "current_mp": self.player.mp,
                 "not_enough_mp": True
-            }))
+            })
             return "Not enough MP!"
-        self.player.mp -= cost
-        e = self.enemy
-        msgs: list = []
-        power = int(SPELLS[spell]["pow"])
-        if spell == "Heal":
-            healed = self.player.heal(power + self.player.level)
-            msgs.append(f"You cast Heal and restore {healed} HP.")
-            self.event_manager.emit(GameEvent(GameEvent.CAST_SPELL, {
-                "message": f"Player cast Heal to restore {healed} HP.",
-                "spell": spell,
-                "healed": healed,
-                "player_hp": self.player.hp,
-                "player_mp": self.player.mp,
-                "type": "heal"
-            }))
-        elif spell == "Regen":
-            self._player_regen_turns = 3
-            self._player_regen_amount = power
-            msgs.append(f"You cast Regen. You'll recover {power} HP for {self._player_regen_turns} turns.")
-            self.event_manager.emit(GameEvent(GameEvent.CAST_SPELL, {
-                "message": f"Player cast Regen to recover {power} HP for {self._player_regen_turns} turns.",
-                "spell": spell,
-                "regen_amount": power,
-                "regen_turns": self._player_regen_turns,
-                "player_mp": self.player.mp,
-                "type": "regen"
-            }))
-        elif spell == "Guard Break":
-            self._enemy_def_down = power + (self.player.level // 4)
-            self._enemy_def_turns = 2
-            msgs.append("You cast Guard Break! The enemy's defenses falter.")
-            self.event_manager.emit(GameEvent(GameEvent.CAST_SPELL, {
-                "message": "Player cast Guard Break to debuff enemy defense.",
-                "spell": spell,
-                "defense_down": self._enemy_def_down,
-                "defense_turns": self._enemy_def_turns,
-                "player_mp": self.player.mp,
-                "type": "debuff"
-            }))
-        else:
-            # Damage spell
-            dmg = max(1, power + (self.player.level // 2) + random.randint(0, 2) - (int(e.defense) // 4))
-            e.hp = _clamp_int(e.hp - dmg, 0, e.max_hp)
-            msgs.append(f"You cast {spell}! It hits {e.name} for {dmg} damage.")
-            self.event_manager.emit(GameEvent(GameEvent.CAST_SPELL, {
-                "message": f"Player cast {spell} for {dmg} damage to {e.name}.",
-                "spell": spell,
-                "damage": dmg,
-                "enemy_hp": e.hp,
-                "player_mp": self.player.mp,
-                "type": "damage"
-            }))
-            if e.hp <= 0:
-                msgs.append(self._end_combat(True))
-                return "\n".join([m for m in msgs if m])
-        # Enemy turn
-        msgs.extend(self._enemy_turn())
-        msgs.append(self._combat_status())
-        return "\n".join([m for m in msgs if m])
+        return self._out(self._combat_result(events, spell))
 
     def use_potion(self) -> str:
         if self.player.hp == self.player.max_hp:
-            self.event_manager.emit(GameEvent(GameEvent.USED_POTION, {
+            self.event_manager.fire(GameEvent.USED_POTION, {
                 "message": "Player tried to use a potion at full health and decided not to waste it.",
                 "used_in_combat": False,
                 "reason": "full_health",
                 "potions_left": self.player.potions
-            }))
+            })
             return "You are already at full health, don't waste the potion!"
         if self.player.potions <= 0:
-            self.event_manager.emit(GameEvent(GameEvent.USED_POTION, {
+            self.event_manager.fire(GameEvent.USED_POTION, {
                 "message": "Player tried to use a potion but had none.",
                 "used_in_combat": False,
                 "reason": "no_potions",
                 "potions_left": self.player.potions
-            }))
+            })
             return "You have no potions."
         self.player.potions -= 1
         healed = self.player.heal(12 + self.player.level)
-        self.event_manager.emit(GameEvent(GameEvent.USED_POTION, {
+        self.event_manager.fire(GameEvent.USED_POTION, {
             "message": f"Player used a potion and healed {healed} HP.",
             "used_in_combat": False,
             "healed": healed,
             "potions_left": self.player.potions,
             "player_hp": self.player.hp
-        }))
+        })
         return f"You quaff a potion and recover {healed} HP."
 
     def combat_potion(self) -> str:
         if self.state != GameState.COMBAT:
-            self.event_manager.emit(GameEvent(GameEvent.USED_POTION, {
+            self.event_manager.fire(GameEvent.USED_POTION, {
                 "error": "Game tried to use a combat_potion outside of combat.",
                 "used_in_combat": False,
                 "reason": "not_in_combat",
                 "potions_left": self.player.potions
-            }))
+            })
             return "You don't need to use a potion now."
-        msgs = [self.use_potion()]
-        # 50% chance to skip enemy turn after potion use
-        if random.random() < 0.5:
-            msgs.append("You use a potion quickly and avoid an attack this turn!")
-        else:
-            msgs.extend(self._enemy_turn())
-        msgs.append(self._combat_status())
-        return "\n".join([m for m in msgs if m])
+        return self._out(self._combat_result(self._combat_step(cs.POTION)))
 
     def combat_flee(self) -> str:
         if self.state != GameState.COMBAT or not self.enemy:
             return "There is nothing to flee from."
-        # Base chance
-        chance = 0.5
-        try:
-            if self.enemy.level > self.player.level:
-                chance = 0.35
-        except Exception:
-            pass
-        if random.random() < chance:
+        events = self._combat_step(cs.FLEE)
+        if events and events[0][0] == cs.FLED:
             self.change_state(GameState.EXPLORING)
             enemy = self.enemy
             self.enemy = None
-            self._player_regen_turns = 0
-            self._player_regen_amount = 0
-            self._enemy_stunned_turns = 0
-            self._enemy_def_down = 0
-            self._enemy_def_turns = 0
-            self.event_manager.emit(GameEvent(GameEvent.EXITED_COMBAT, {
-                "message": "Player fled from combat.",
-                "position": (self.x, self.y),
-                "victory": False,
-                "fled": True,
-                "location": self.current_tile().name,
-                "gold_looted": 0,
-                "xp_gained": 0,
-                "leveled_up": False,
-                "enemy_name": enemy.name if enemy else "Unknown"
-            }))
-            return "You successfully flee back to safety."
-        else:
-            msgs = ["You fail to flee!"]
-            msgs.extend(self._enemy_turn())
-            msgs.append(self._combat_status())
-            self.event_manager.emit(GameEvent(GameEvent.FAILED_FLEE, {
+            self.combat = None
+            if self.event_manager.active:
+                self.event_manager.fire(GameEvent.EXITED_COMBAT, {
+                    "message": "Player fled from combat.",
+                    "position": (self.x, self.y),
+                    "victory": False,
+                    "fled": True,
+                    "location": self.current_tile().name,
+                    "gold_looted": 0,
+                    "xp_gained": 0,
+                    "leveled_up": False,
+                    "enemy_name": enemy.name if enemy else "Unknown"
+                })
+            ENEMY_POOL.release(enemy)
+            return self._out(Result(cs.FLED, {"enemy": enemy.name}))
+        enemy_name = self.enemy.name
+        out = self._combat_result(events)
+        if self.event_manager.active:
+            self.event_manager.fire(GameEvent.FAILED_FLEE, {
                 "message": "Player failed to flee from combat.",
-                "enemy_name": self.enemy.name if self.enemy else "Unknown",
+                "enemy_name": enemy_name,
                 "player": self.player.name,
                 "action": "Failed to leave combat."
-            }))
-            return "\n".join([m for m in msgs if m])
+            })
+        return self._out(out)
@@ -0,0 +1,34 @@
+# engine/game/heap.py
+# Minimal binary heap of (priority, value) pairs; heapq isn't available in the JS build
+
+
+def heap_push(heap: list, item) -> None:
+    heap.append(item)
+    i = len(heap) - 1
+    while i > 0:
+        parent = (i - 1) // 2
+        if heap[parent][0] <= item[0]:
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = item
+
+
+def heap_pop(heap: list):
+    top = heap[0]
+    last = heap.pop()
+    n = len(heap)
+    if n:
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if heap[child][0] >= last[0]:
+                break
+            heap[i] = heap[child]
+            i = child
+        heap[i] = last
+    return top
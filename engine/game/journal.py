@@ -0,0 +1,147 @@
+# engine/game/journal.py
+import json
+import os
+from typing import Callable, Optional
+
+from .game import Game
+from .game_state import GameState
+
+# Actions that talk to the outside world; they are recorded but not re-executed on replay
+REPLAY_SKIP = {"save_game"}
+# Actions that replace the world or RNG (new game / load); a snapshot is taken right after them
+RESNAPSHOT = {"start_new_game", "start_load_game", "game_over_load", "game_over_restart"}
+# Snapshots are only taken in states that Game.to_dict captures completely
+SNAPSHOT_STATES = (GameState.EXPLORING,)
+DEFAULT_SNAPSHOT_EVERY = 50
+
+
+class ReplayError(Exception):
+    """Raised when a replay diverges from what the journal recorded."""
+
+
+class CommandJournal:
+    """
+    Append-only record of a session: every executed action id with the RNG stream
+    positions it started from, plus periodic full snapshots. Any point in the session
+    can be rebuilt from the nearest earlier snapshot by re-executing the actions after it.
+
+    With a path, each entry is appended to a JSONL file as it happens, so saving is a
+    single line write and a crashed session can be recovered with CommandJournal.load().
+    """
+
+    def __init__(self, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY, path: str = None):
+        self.snapshot_every = snapshot_every
+        self.path = path
+        self.entries = []
+        self.snapshots = []
+        self._since_snapshot = 0
+        self._pending_snapshot = False
+        self._file = open(path, "a", encoding="utf-8") if path else None
+
+    def attach(self, game: Game) -> "CommandJournal":
+        """Start recording a game; takes the first snapshot if the journal is empty."""
+        game.journal = self
+        if not self.snapshots:
+            self.snapshot(game)
+        return self
+
+    def snapshot(self, game: Game) -> None:
+        snap = {"n": len(self.entries), "state": game.to_dict()}
+        self.snapshots.append(snap)
+        self._since_snapshot = 0
+        self._pending_snapshot = False
+        self._write({"snapshot": snap})
+
+    def record(self, game: Game, action: str, positions: dict) -> None:
+        entry = {"action": action, "rng": positions}
+        self.entries.append(entry)
+        self._write(entry)
+        self._since_snapshot += 1
+        if action in RESNAPSHOT:
+            self._pending_snapshot = True
+        if self._pending_snapshot or self._since_snapshot >= self.snapshot_every:
+            if game.state in SNAPSHOT_STATES:
+                self.snapshot(game)
+
+    def _write(self, record: dict) -> None:
+        if self._file is not None:
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def to_dict(self) -> dict:
+        return {
+            "snapshot_every": self.snapshot_every,
+            "snapshots": list(self.snapshots),
+            "entries": list(self.entries),
+        }
+
+    @staticmethod
+    def from_dict(d: dict) -> "CommandJournal":
+        j = CommandJournal(int(d.get("snapshot_every", DEFAULT_SNAPSHOT_EVERY)))
+        j.snapshots = list(d.get("snapshots") or [])
+        j.entries = list(d.get("entries") or [])
+        return j
+
+    @staticmethod
+    def load(path: str, snapshot_every: int = DEFAULT_SNAPSHOT_EVERY) -> Optional["CommandJournal"]:
+        """Read a JSONL journal; a truncated last line (crash mid-write) is ignored."""
+        if not os.path.exists(path):
+            return None
+        j = CommandJournal(snapshot_every)
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if "snapshot" in record:
+                    j.snapshots.append(record["snapshot"])
+                else:
+                    j.entries.append(record)
+        return j
+
+    def nearest_snapshot(self, upto: int) -> dict:
+        best = None
+        for snap in self.snapshots:
+            if snap["n"] <= upto:
+                best = snap
+        if best is None:
+            raise ReplayError("Journal has no snapshot at or before entry %d." % upto)
+        return best
+
+    def replay(self, upto: int = None, configure: Callable[[Game], None] = None, strict: bool = True) -> Game:
+        """
+        Rebuild the game as it was after the first `upto` entries (all by default).
+        `configure` is called on the restored game before any action runs, to set what a
+        snapshot doesn't hold (enemy archetypes, loaders). Events are muted and tile art is
+        off while replaying; both are restored on the returned game. In strict mode a
+        mismatch between the game's RNG and the recorded positions raises ReplayError,
+        otherwise the recorded positions win.
+        """
+        upto = len(self.entries) if upto is None else max(0, min(upto, len(self.entries)))
+        snap = self.nearest_snapshot(upto)
+        game = Game.from_dict(snap["state"])
+        if configure is not None:
+            configure(game)
+        muted, ascii_tiles = game.event_manager.muted, game.ascii_tiles
+        game.event_manager.muted = True
+        game.ascii_tiles = False
+        try:
+            for i in range(snap["n"], upto):
+                entry = self.entries[i]
+                if game.rng.positions() != entry["rng"]:
+                    if strict:
+                        raise ReplayError("Replay diverged before entry %d (%s)." % (i, entry["action"]))
+                    game.rng.set_positions(entry["rng"])
+                if entry["action"] in REPLAY_SKIP:
+                    continue
+                game.execute_action(entry["action"])
+        finally:
+            game.event_manager.muted = muted
+            game.ascii_tiles = ascii_tiles
+        return game
@@ -0,0 +1,159 @@
+# engine/game/pathfinding.py
+from .heap import heap_push, heap_pop
+from .world import World
+
+# Extra cost per point of tile danger; safe tiles cost nothing extra
+DANGER_WEIGHT = 10.0
+# Extra cost per point of weather movement penalty / encounter rate
+WEATHER_MOVE_WEIGHT = 2.0
+WEATHER_ENCOUNTER_WEIGHT = 4.0
+NEIGHBOURS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+INF = float("inf")
+
+
+def step_cost(world: World, x: int, y: int) -> float:
+    """Cost of stepping onto (x, y): one turn plus the risk of being stopped there."""
+    tile = world.get_tile(x, y)
+    cost = 1.0
+    if not tile.safe:
+        cost += DANGER_WEIGHT * tile.danger + WEATHER_ENCOUNTER_WEIGHT * world.weather.encounter_rate(x, y)
+    return cost + WEATHER_MOVE_WEIGHT * world.weather.movement_penalty(x, y)
+
+
+def cost_grid(world: World) -> list:
+    """step_cost for every tile as a flat list indexed by y * width + x."""
+    return [step_cost(world, x, y) for y in range(world.height) for x in range(world.width)]
+
+
+def find_path(world: World, start: tuple, goal: tuple, costs: list = None) -> list:
+    """
+    A* from start to goal over 4-connected tiles. Returns the tiles to step onto, in order
+    (start excluded), or None if the goal can't be reached.
+    """
+    w, h = world.width, world.height
+    costs = costs or cost_grid(world)
+    sx, sy = start
+    gx, gy = goal
+    start_i = sy * w + sx
+    goal_i = gy * w + gx
+    best = [INF] * (w * h)
+    came = [-1] * (w * h)
+    best[start_i] = 0.0
+    heap = [(abs(sx - gx) + abs(sy - gy), start_i)]
+    while heap:
+        _, i = heap_pop(heap)
+        if i == goal_i:
+            break
+        x, y = i % w, i // w
+        for dx, dy in NEIGHBOURS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < w and 0 <= ny < h:
+                j = ny * w + nx
+                g = best[i] + costs[j]
+                if g < best[j]:
+                    best[j] = g
+                    came[j] = i
+                    # Every step costs at least 1, so Manhattan distance is admissible
+                    heap_push(heap, (g + abs(nx - gx) + abs(ny - gy), j))
+    if best[goal_i] == INF:
+        return None
+    path = []
+    i = goal_i
+    while i != start_i:
+        path.append((i % w, i // w))
+        i = came[i]
+    path.reverse()
+    return path
+
+
+def distance_field(world: World, goals: list, costs: list = None) -> list:
+    """Dijkstra from every goal at once: cheapest cost from each tile to its nearest goal."""
+    w, h = world.width, world.height
+    costs = costs or cost_grid(world)
+    dist = [INF] * (w * h)
+    heap = []
+    for gx, gy in goals:
+        dist[gy * w + gx] = 0.0
+        heap_push(heap, (0.0, gy * w + gx))
+    while heap:
+        d, i = heap_pop(heap)
+        if d > dist[i]:
+            continue
+        x, y = i % w, i // w
+        # Walking i -> neighbour costs costs[i]; the field is read in reverse (towards the goal)
+        for dx, dy in NEIGHBOURS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < w and 0 <= ny < h:
+                j = ny * w + nx
+                nd = d + costs[i]
+                if nd < dist[j]:
+                    dist[j] = nd
+                    heap_push(heap, (nd, j))
+    return dist
+
+
+def follow_field(world: World, field: list, start: tuple, costs: list = None) -> list:
+    """
+    Walk a distance field from start to its goal, each time stepping onto the neighbour
+    with the cheapest step cost + remaining distance. Returns the tiles stepped onto.
+    """
+    w = world.width
+    costs = costs or cost_grid(world)
+    x, y = start
+    if field[y * w + x] == INF:
+        return None
+    path = []
+    while field[y * w + x] > 0:
+        best, best_total = None, INF
+        for dx, dy in NEIGHBOURS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < w and 0 <= ny < world.height:
+                j = ny * w + nx
+                total = costs[j] + field[j]
+                if total < best_total:
+                    best, best_total = (nx, ny), total
+        x, y = best
+        path.append(best)
+    return path
+
+
+class PathCache:
+    """
+    Distance fields to named targets (the village, known shops), reused until the
+    targets or the weather change. Weather only changes on the weather clock's
+    batch updates, so the cache key includes the update number.
+    """
+
+    def __init__(self, world: World):
+        self.world = world
+        self._fields = {}
+        self._cost_grid = None
+        self._cost_key = None
+
+    def field(self, name: str, goals: list) -> list:
+        ws = self.world.weather
+        key = (tuple(sorted(goals)), ws.clock // ws.update_every)
+        cached = self._fields.get(name)
+        if cached is None or cached[0] != key:
+            costs = self._costs(ws.clock // ws.update_every)
+            cached = (key, distance_field(self.world, goals, costs))
+            self._fields[name] = cached
+        return cached[1]
+
+    def _costs(self, update: int) -> list:
+        # One cost grid per weather update, shared by every field built during it
+        if self._cost_key != update:
+            self._cost_grid = cost_grid(self.world)
+            self._cost_key = update
+        return self._cost_grid
+
+    def path_to(self, name: str, goals: list, start: tuple) -> list:
+        if not goals:
+            return None
+        field = self.field(name, goals)
+        return follow_field(self.world, field, start, self._cost_grid)
+
+    def clear(self) -> None:
+        self._fields = {}
+        self._cost_grid = None
+        self._cost_key = None
@@ -0,0 +1,52 @@
+# engine/game/pool.py
+
+# Free objects kept per pool; anything released beyond this is left to the garbage collector
+POOL_LIMIT = 64
+
+
+class Poolable:
+    """
+    Mixin for objects handed out by an ObjectPool. Code that keeps a pooled object past
+    the point where the engine releases it (a UI holding on to the last event, say)
+    calls retain(), and the pool will never hand that object out again.
+    """
+    retained = False
+    pooled = False
+
+    def retain(self):
+        self.retained = True
+        return self
+
+
+class ObjectPool:
+    """
+    Freelist for short-lived objects. acquire(*args) pops a free object and calls its
+    reset(*args) (same signature as the constructor), or builds a new one when the list
+    is empty. release(obj) puts it back unless it was retained or is already free.
+    """
+
+    def __init__(self, factory, limit: int = POOL_LIMIT):
+        self.factory = factory
+        self.limit = limit
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.pooled = False
+            obj.reset(*args)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.factory(*args)
+
+    def release(self, obj) -> None:
+        if obj is None or obj.retained or obj.pooled or len(self.free) >= self.limit:
+            return
+        obj.pooled = True
+        self.free.append(obj)
+
+    def stats(self) -> dict:
+        return {"created": self.created, "reused": self.reused, "free": len(self.free)}
@@ -0,0 +1,167 @@
+# engine/game/result.py
+from .util import _hp_line
+from . import combat_state as cs
+
+# Result kinds besides the combat event kinds from combat_state.py
+MESSAGE = "message"  # pre-formatted text: {"text"}
+MOVE_ATTEMPT = "move_attempt"
+ARRIVED = "arrived"
+STUCK = "stuck"
+CHARACTER = "character"
+COMBAT = "combat"  # one combat action; its parts are the step's events and the status
+COMBAT_START = "combat_start"
+COMBAT_STATUS = "combat_status"
+REST_AGAIN = "rest_again"
+REST_VILLAGE = "rest_village"
+REST_WILD = "rest_wild"
+STATS = "stats"
+TRAVEL = "travel"
+ALREADY_THERE = "already_there"
+NO_ROUTE = "no_route"
+
+
+def _stats_text(d: dict) -> str:
+    weapon = d["weapon"]
+    armor = d["armor"]
+    weapon = f"Weapon(name={weapon['name']}, attack_bonus={weapon['attack_bonus']})" if weapon else "None"
+    armor = f"Armor(name={armor['name']}, defense_bonus={armor['defense_bonus']})" if armor else "None"
+    return (
+        f"Stats for {d['name']}:\n"
+        f"Lv {d['level']}\n"
+        f"XP: {d['xp']}/{d['next_xp']} | Gold: {d['gold']}\n"
+        f"HP: {d['hp']}/{d['max_hp']} | MP: {d['mp']}/{d['max_mp']} | ATK: {d['attack']} | DEF: {d['defense']} | Potions: {d['potions']} | Spells: {d['spells']}"
+        f"\nWeapon: {weapon}\nArmor: {armor}"
+        f"\nSpells Known: {', '.join(d['known_spells']) if d['known_spells'] else 'None'}"
+        f"\nLocation: ({d['x']},{d['y']}) - {d['tile']}"
+        f"\nState: {d['state']}"
+    )
+
+
+def _status_text(d: dict) -> str:
+    return "\n".join([
+        _hp_line("You", d["hp"], d["max_hp"]) + f" | MP {d['mp']}/{d['max_mp']}",
+        _hp_line(d["enemy"], d["enemy_hp"], d["enemy_max_hp"]),
+        f"\n{d['ascii']}\n",
+        f"[Enemy Stats] ATK: {d['attack']} | DEF: {d['defense']}",
+    ])
+
+
+def _arrived_text(d: dict) -> str:
+    text = f"{d['art']}\nYou arrive at {d['tile']}. {d['description']}"
+    if d["shop"]:
+        text += "\nYou see a merchant here (type shop to enter)."
+    return text
+
+
+def _character_text(d: dict) -> str:
+    text = f"You encounter a character!\n{d['text']}"
+    if d["ask"]:
+        text += f"\n{d['ask']} [y/N]"
+    return text
+
+
+def _travel_text(d: dict) -> str:
+    if d["arrived"]:
+        return f"You travel {d['steps']} step(s) and reach {d['label']}."
+    return f"You travel {d['steps']} step(s) towards {d['label']} before stopping."
+
+
+# kind -> function(data) returning that result's own line(s)
+FORMATTERS = {
+    MESSAGE: lambda d: d["text"],
+    MOVE_ATTEMPT: lambda d: f"Attempting to move from ({d['x']},{d['y']}) by delta ({d['dx']},{d['dy']})",
+    ARRIVED: _arrived_text,
+    STUCK: lambda d: f"{d['message']} and can't move this turn!",
+    CHARACTER: _character_text,
+    COMBAT_START: lambda d: f"A {d['enemy']} appears! Prepare for battle.",
+    COMBAT_STATUS: _status_text,
+    REST_AGAIN: lambda d: "You have already rested here. Try moving to another location.",
+    REST_VILLAGE: lambda d: f"You rest at the village and heal {d['healed']} HP." + (
+        " The healer gifts you a potion." if d["potion"] else ""),
+    REST_WILD: lambda d: f"You rest cautiously and heal {d['healed']} HP." + (
+        "\nYou are ambushed in your sleep!" if d["ambushed"] else ""),
+    STATS: _stats_text,
+    TRAVEL: _travel_text,
+    ALREADY_THERE: lambda d: f"You are already at {d['label']}.",
+    NO_ROUTE: lambda d: f"You can't find a way to {d['label']}.",
+    cs.HIT: lambda d: f"You strike the {d['enemy']} for {d['value']} damage.",
+    cs.SPELL_HIT: lambda d: f"You cast {d['spell']}! It hits {d['enemy']} for {d['value']} damage.",
+    cs.HEAL: lambda d: f"You cast Heal and restore {d['value']} HP.",
+    cs.REGEN_CAST: lambda d: f"You cast Regen. You'll recover {d['value']} HP for {cs.REGEN_TURNS} turns.",
+    cs.GUARD_BREAK: lambda d: "You cast Guard Break! The enemy's defenses falter.",
+    cs.OOM: lambda d: "Not enough MP!",
+    cs.POTION_USED: lambda d: f"You quaff a potion and recover {d['value']} HP.",
+    cs.POTION_FULL: lambda d: "You are already at full health, don't waste the potion!",
+    cs.NO_POTIONS: lambda d: "You have no potions.",
+    cs.DODGE: lambda d: "You use a potion quickly and avoid an attack this turn!",
+    cs.FLED: lambda d: "You successfully flee back to safety.",
+    cs.FLEE_FAILED: lambda d: "You fail to flee!",
+    cs.STUNNED: lambda d: f"{d['enemy']} is stunned and cannot act!",
+    cs.ENEMY_HIT: lambda d: f"{d['enemy']} strikes you for {d['value']} damage.",
+    cs.RECOVERED: lambda d: "The enemy's defenses recover.",
+    cs.REGEN: lambda d: f"Regen restores {d['value']} HP.",
+    cs.VICTORY: lambda d: f"You defeated {d['enemy']}! You loot {d['gold']} gold.",
+    cs.DEFEAT: lambda d: "You were defeated...",
+}
+
+
+class Result:
+    """
+    What an action did, as data: a kind, the numbers and names involved, and follow-on
+    results (an attack's enemy reply, the encounter after a move). Nothing is formatted
+    until text() or str() is called, so bots and JSON clients that only read `kind` and
+    `data` never build the sentences. Text is the own line from FORMATTERS followed by
+    each part's text, joined with `sep`; empty pieces are dropped.
+    """
+    __slots__ = ("kind", "data", "parts", "sep", "_text")
+
+    def __init__(self, kind: str, data: dict = None, parts: list = None, sep: str = "\n"):
+        self.kind = kind
+        self.data = data or {}
+        self.parts = parts or []
+        self.sep = sep
+        self._text = None
+
+    def add(self, part) -> "Result":
+        if part is not None:
+            self.parts.append(part)
+            self._text = None
+        return self
+
+    def find(self, kind: str):
+        """The first result of `kind` in this tree (depth first), or None."""
+        if self.kind == kind:
+            return self
+        for part in self.parts:
+            found = part.find(kind)
+            if found is not None:
+                return found
+        return None
+
+    def text(self) -> str:
+        if self._text is None:
+            fmt = FORMATTERS.get(self.kind)
+            lines = [fmt(self.data)] if fmt else []
+            lines.extend(part.text() for part in self.parts)
+            self._text = self.sep.join([line for line in lines if line])
+        return self._text
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "data": dict(self.data),
+            "parts": [part.to_dict() for part in self.parts],
+        }
+
+    def __str__(self):
+        return self.text()
+
+    def __repr__(self):
+        return f"<Result kind={self.kind} data={self.data} parts={len(self.parts)}>"
+
+
+def as_result(value) -> Result:
+    """Wrap plain text from actions that still return strings, so callers see one type."""
+    if isinstance(value, Result):
+        return value
+    return Result(MESSAGE, {"text": "" if value is None else str(value)})
@@ -0,0 +1,151 @@
+# engine/game/rng.py
+import random
+
+# L'Ecuyer combined LCG. Every product stays below 2**53 so the transpiled JS build
+# produces exactly the same numbers as CPython.
+_M1 = 2147483563
+_A1 = 40014
+_M2 = 2147483399
+_A2 = 40692
+_U32 = 4294967296
+_U16 = 65536
+
+STREAMS = ["world", "combat", "encounter", "loot", "weather"]
+
+
+def _name_hash(name: str) -> int:
+    h = 0
+    for ch in name:
+        h = (h * 31 + ord(ch)) % 1000003
+    return h
+
+
+# 32-bit integer helpers working on 16-bit halves: JS bitwise operators are signed 32-bit
+# and its products lose precision past 2**53, so this is the form both builds agree on.
+def _xor32(a: int, b: int) -> int:
+    return ((a // _U16) ^ (b // _U16)) * _U16 + ((a % _U16) ^ (b % _U16))
+
+
+def _mul32(a: int, b: int) -> int:
+    al, ah = a % _U16, a // _U16
+    bl, bh = b % _U16, b // _U16
+    return (al * bl + ((ah * bl + al * bh) % _U16) * _U16) % _U32
+
+
+def _mix32(h: int) -> int:
+    """murmur3's fmix32 finalizer: every input bit affects every output bit."""
+    h = _xor32(h, h // 65536)
+    h = _mul32(h, 0x85EBCA6B)
+    h = _xor32(h, h // 8192)
+    h = _mul32(h, 0xC2B2AE35)
+    return _xor32(h, h // 65536)
+
+
+class RngStream:
+    """
+    One independent random stream. Offers the subset of random.Random the engine uses
+    and a tiny state (two integers) that is cheap to save and restore.
+    """
+
+    def __init__(self, seed: int, name: str = ""):
+        self.name = name
+        seed = abs(int(seed))
+        # Mix (seed, stream name) so adjacent seeds start at unrelated states; a state
+        # linear in the seed would shift every draw of seed + 1 by the same amount
+        h = _mix32(_xor32(_mix32(seed % _U32), _mix32((seed // _U32 + _name_hash(name) * 2654435) % _U32)))
+        self.s1 = 1 + _mix32(h) % (_M1 - 1)
+        self.s2 = 1 + _mix32(_xor32(h, 0x9E3779B9)) % (_M2 - 1)
+
+    def _next(self) -> int:
+        self.s1 = (_A1 * self.s1) % _M1
+        self.s2 = (_A2 * self.s2) % _M2
+        z = self.s1 - self.s2
+        if z < 1:
+            z += _M1 - 1
+        return z
+
+    def random(self) -> float:
+        """Float in [0.0, 1.0)."""
+        return (self._next() - 1) / (_M1 - 1)
+
+    def randrange(self, start: int, stop: int = None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        if stop <= start:
+            raise ValueError("empty range for randrange()")
+        return start + int(self.random() * (stop - start))
+
+    def randint(self, a: int, b: int) -> int:
+        return self.randrange(a, b + 1)
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randrange(len(seq))]
+
+    def shuffle(self, lst: list) -> None:
+        for i in range(len(lst) - 1, 0, -1):
+            j = self.randrange(i + 1)
+            lst[i], lst[j] = lst[j], lst[i]
+
+    def getstate(self) -> list:
+        return [self.s1, self.s2]
+
+    def setstate(self, state) -> None:
+        self.s1 = int(state[0])
+        self.s2 = int(state[1])
+
+
+class RngService:
+    """
+    Per-game source of randomness. Each subsystem draws from its own named stream
+    (world, combat, encounter, loot, weather), so adding a draw in one subsystem doesn't
+    shift the numbers another one sees. The whole service round-trips through
+    to_dict/from_dict, which makes seeded games, simulations and replays reproducible.
+    """
+
+    def __init__(self, seed: int = None):
+        if seed is None:
+            seed = random.randrange(1, 10_000_000)
+        self.seed = seed
+        self.streams = {}
+        self.world = self.stream("world")
+        self.combat = self.stream("combat")
+        self.encounter = self.stream("encounter")
+        self.loot = self.stream("loot")
+        self.weather = self.stream("weather")
+
+    def stream(self, name: str) -> RngStream:
+        """The named stream, created on first use."""
+        s = self.streams.get(name)
+        if s is None:
+            s = RngStream(self.seed, name)
+            self.streams[name] = s
+        return s
+
+    def split(self, name: str) -> "RngService":
+        """A new, independent service derived from this one, e.g. for a plugin's own world."""
+        return RngService(self.stream("split:" + name).randrange(1, 2147483647))
+
+    def positions(self) -> dict:
+        """Current state of every stream, keyed by stream name."""
+        return {name: s.getstate() for name, s in self.streams.items()}
+
+    def set_positions(self, positions: dict) -> None:
+        for name, state in positions.items():
+            self.stream(name).setstate(state)
+
+    def to_dict(self) -> dict:
+        return {
+            "seed": self.seed,
+            "streams": self.positions(),
+        }
+
+    @staticmethod
+    def from_dict(d: dict) -> "RngService":
+        svc = RngService(d.get("seed"))
+        svc.set_positions(d.get("streams") or {})
+        return svc
@@ -13,12 +13,15 @@ armor = {a.name: a.defense_bonus * 20 for a in armor_items}
 potion_price = 5
 
 class Shop:
-    def __init__(self, player: Player, event_manager: EventManager):
+    def __init__(self, player: Player, event_manager: EventManager, rng=None):
         self.player = player
         self.event_manager = event_manager
         self.shop_items = None
+        self.rng = rng
 
     def _choice(self, items):
+        if self.rng is not None:
+            return self.rng.choice(items)
         # Simple pseudo-random choice using time
         t = int(time.time() * 1000)
         idx = t % len(items)
@@ -0,0 +1,192 @@
+# engine/game/spatial.py
+from .heap import heap_push, heap_pop
+from .weather import ENCOUNTER_RATE
+
+# Tile flags the index counts per node
+KINDS = ("safe", "shop", "rested")
+
+
+class SpatialIndex:
+    """
+    Region quadtree over a World's tiles. Every node covers a rectangle and stores the
+    maximum danger and the number of safe / shop / rested tiles inside it, so region
+    queries only descend into the nodes that can matter:
+
+    - max_danger / count over a rectangle visit O(log n) fully covered nodes,
+    - nearest(x, y, kind) is a best-first search that skips empty subtrees,
+    - within(x, y, radius, kind) only opens nodes that touch the radius.
+
+    Nodes live in parallel flat lists (bounds, parent, aggregates), leaves are single
+    tiles. update() refreshes one tile and its ancestors; World calls it on every tile
+    mutation it performs (set_tile, set_rested).
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        n = width * height
+        # Per-tile values, indexed y * width + x
+        self.danger = [0.0] * n
+        self.flags = {kind: [False] * n for kind in KINDS}
+        # Per-node values
+        self.x0, self.y0, self.x1, self.y1 = [], [], [], []
+        self.parent = []
+        self.children = []
+        self.tile_of = []
+        self.max_danger_of = []
+        self.counts = {kind: [] for kind in KINDS}
+        self.leaf = [0] * n
+        if n:
+            self._build(0, 0, width, height, -1)
+
+    def _build(self, x0: int, y0: int, x1: int, y1: int, parent: int) -> None:
+        node = len(self.parent)
+        self.x0.append(x0)
+        self.y0.append(y0)
+        self.x1.append(x1)
+        self.y1.append(y1)
+        self.parent.append(parent)
+        self.children.append([])
+        self.max_danger_of.append(0.0)
+        for kind in KINDS:
+            self.counts[kind].append(0)
+        if parent >= 0:
+            self.children[parent].append(node)
+        if x1 - x0 == 1 and y1 - y0 == 1:
+            i = y0 * self.width + x0
+            self.tile_of.append(i)
+            self.leaf[i] = node
+            return
+        self.tile_of.append(-1)
+        mx = (x0 + x1) // 2 if x1 - x0 > 1 else x1
+        my = (y0 + y1) // 2 if y1 - y0 > 1 else y1
+        for (cy0, cy1) in ((y0, my), (my, y1)):
+            for (cx0, cx1) in ((x0, mx), (mx, x1)):
+                if cx1 > cx0 and cy1 > cy0:
+                    self._build(cx0, cy0, cx1, cy1, node)
+
+    @staticmethod
+    def from_grid(width: int, height: int, grid: list) -> "SpatialIndex":
+        index = SpatialIndex(width, height)
+        for y in range(height):
+            for x in range(width):
+                index._set(x, y, grid[y][x])
+        # Children always come after their parent, so one backwards pass fills every node
+        for node in range(len(index.parent) - 1, -1, -1):
+            index._recompute(node)
+        return index
+
+    def _set(self, x: int, y: int, tile) -> None:
+        i = y * self.width + x
+        self.danger[i] = float(tile.danger)
+        self.flags["safe"][i] = bool(tile.safe)
+        self.flags["shop"][i] = bool(tile.shop)
+        self.flags["rested"][i] = bool(getattr(tile, "rested", False))
+
+    def _recompute(self, node: int) -> None:
+        i = self.tile_of[node]
+        if i >= 0:
+            self.max_danger_of[node] = self.danger[i]
+            for kind in KINDS:
+                self.counts[kind][node] = 1 if self.flags[kind][i] else 0
+            return
+        kids = self.children[node]
+        self.max_danger_of[node] = max(self.max_danger_of[c] for c in kids)
+        for kind in KINDS:
+            counts = self.counts[kind]
+            counts[node] = sum(counts[c] for c in kids)
+
+    def update(self, x: int, y: int, tile) -> None:
+        """Re-read one tile and refresh the aggregates on its path to the root."""
+        self._set(x, y, tile)
+        node = self.leaf[y * self.width + x]
+        while node >= 0:
+            self._recompute(node)
+            node = self.parent[node]
+
+    def _clamp_rect(self, x0: int, y0: int, x1: int, y1: int) -> tuple:
+        return max(0, x0), max(0, y0), min(self.width - 1, x1), min(self.height - 1, y1)
+
+    def _covering(self, x0: int, y0: int, x1: int, y1: int) -> list:
+        # Maximal nodes that tile the inclusive rectangle exactly
+        x0, y0, x1, y1 = self._clamp_rect(x0, y0, x1, y1)
+        found = []
+        if x0 > x1 or y0 > y1 or not self.parent:
+            return found
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            nx0, ny0, nx1, ny1 = self.x0[node], self.y0[node], self.x1[node], self.y1[node]
+            if nx1 <= x0 or nx0 > x1 or ny1 <= y0 or ny0 > y1:
+                continue
+            if x0 <= nx0 and nx1 - 1 <= x1 and y0 <= ny0 and ny1 - 1 <= y1:
+                found.append(node)
+            else:
+                stack.extend(self.children[node])
+        return found
+
+    def max_danger(self, x0: int, y0: int, x1: int, y1: int) -> float:
+        """Highest tile danger in the inclusive rectangle (0.0 if it is empty)."""
+        return max([self.max_danger_of[n] for n in self._covering(x0, y0, x1, y1)] or [0.0])
+
+    def count(self, kind: str, x0: int, y0: int, x1: int, y1: int) -> int:
+        """Number of `kind` tiles (see KINDS) in the inclusive rectangle."""
+        counts = self.counts[kind]
+        return sum(counts[n] for n in self._covering(x0, y0, x1, y1))
+
+    def _distance(self, node: int, x: int, y: int) -> int:
+        # Manhattan distance from (x, y) to the closest tile of the node's rectangle
+        dx = max(self.x0[node] - x, 0, x - (self.x1[node] - 1))
+        dy = max(self.y0[node] - y, 0, y - (self.y1[node] - 1))
+        return dx + dy
+
+    def nearest(self, x: int, y: int, kind: str = "safe") -> tuple:
+        """Closest `kind` tile to (x, y) by walking distance, ties broken row by row; None if there is none."""
+        counts = self.counts[kind]
+        if not self.parent or counts[0] == 0:
+            return None
+        n = float(self.width * self.height)
+        heap = [(self._distance(0, x, y), 0)]
+        while heap:
+            _, node = heap_pop(heap)
+            i = self.tile_of[node]
+            if i >= 0:
+                return (i % self.width, i // self.width)
+            for c in self.children[node]:
+                if counts[c]:
+                    d = self._distance(c, x, y)
+                    # A node's distance is a lower bound for its tiles; leaves add a sub-step row-major tie-break
+                    j = self.tile_of[c]
+                    heap_push(heap, (d + j / n if j >= 0 else d, c))
+        return None
+
+    def within(self, x: int, y: int, radius: int, kind: str = "shop") -> list:
+        """Every `kind` tile within `radius` steps of (x, y), nearest first."""
+        counts = self.counts[kind]
+        found = []
+        stack = [0] if self.parent else []
+        while stack:
+            node = stack.pop()
+            if not counts[node] or self._distance(node, x, y) > radius:
+                continue
+            i = self.tile_of[node]
+            if i >= 0:
+                found.append((self._distance(node, x, y), i // self.width, i % self.width))
+            else:
+                stack.extend(self.children[node])
+        found.sort()
+        return [(tx, ty) for (_, ty, tx) in found]
+
+    def heatmap(self, weather) -> list:
+        """Encounter chance of every tile (danger plus its region's weather), flat as y * width + x."""
+        safe = self.flags["safe"]
+        codes = weather.codes
+        size, cols = weather.region_size, weather.cols
+        heat = [0.0] * (self.width * self.height)
+        for y in range(self.height):
+            row = (y // size) * cols
+            for x in range(self.width):
+                i = y * self.width + x
+                if not safe[i]:
+                    heat[i] = self.danger[i] + ENCOUNTER_RATE[codes[row + x // size]]
+        return heat
@@ -0,0 +1,114 @@
+# engine/game/visibility.py
+from .world import World
+
+# Sight radius in clear weather; weather visibility scales it and terrain "sight" adds to it
+SIGHT_RADIUS = 3
+# Cached fields of view before the cache is dropped and rebuilt
+MAX_CACHED = 4096
+
+# Octant transforms (xx, xy, yx, yy) for recursive shadowcasting
+_OCTANTS = [
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1),
+]
+
+
+class Visibility:
+    """
+    Field of view for a World. Tiles with `opaque` set (dense woods, ruins, cliffs) block
+    sight but are themselves visible; everything past the map edge is opaque. The radius
+    at a tile is SIGHT_RADIUS scaled by the weather there plus the tile's `sight` bonus
+    (hills, towers).
+
+    Fields of view are computed with recursive shadowcasting, which touches each visible
+    tile about once, and cached per (x, y, radius). The cache is dropped when the world's
+    tiles change (World.version), so repeated visits and re-renders cost a dict lookup.
+    """
+
+    def __init__(self, world: World):
+        self.world = world
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+        self._version = None
+        self._opaque = None
+
+    def radius_at(self, x: int, y: int) -> int:
+        tile = self.world.get_tile(x, y)
+        base = int(SIGHT_RADIUS * self.world.weather.visibility(x, y) + 0.5)
+        return max(1, base) + int(tile.sight)
+
+    def visible(self, x: int, y: int, radius: int = None) -> list:
+        """Tiles visible from (x, y) as (x, y) pairs, the viewer's own tile included."""
+        if radius is None:
+            radius = self.radius_at(x, y)
+        if self._version != self.world.version:
+            self.clear()
+        key = (x, y, radius)
+        found = self._cache.get(key)
+        if found is not None:
+            self.hits += 1
+            return found
+        self.misses += 1
+        if len(self._cache) >= MAX_CACHED:
+            self._cache = {}
+        found = self.compute(x, y, radius)
+        self._cache[key] = found
+        return found
+
+    def clear(self) -> None:
+        self._cache = {}
+        self._version = self.world.version
+        w = self.world
+        self._opaque = [bool(w.get_tile(x, y).opaque) for y in range(w.height) for x in range(w.width)]
+
+    def compute(self, x: int, y: int, radius: int) -> list:
+        """Uncached field of view (see visible)."""
+        if self._opaque is None or self._version != self.world.version:
+            self.clear()
+        w = self.world.width
+        seen = {y * w + x}
+        for (xx, xy, yx, yy) in _OCTANTS:
+            self._cast(x, y, 1, 1.0, 0.0, radius, xx, xy, yx, yy, seen)
+        return [(i % w, i // w) for i in sorted(seen)]
+
+    def _cast(self, cx: int, cy: int, row: int, start: float, end: float, radius: int,
+              xx: int, xy: int, yx: int, yy: int, seen: set) -> None:
+        if start < end:
+            return
+        w, h = self.world.width, self.world.height
+        opaque = self._opaque
+        # radius + 0.5 squared gives rounder circles than radius squared
+        r2 = radius * radius + radius
+        new_start = 0.0
+        blocked = False
+        for j in range(row, radius + 1):
+            dx, dy = -j - 1, -j
+            blocked = False
+            while dx <= 0:
+                dx += 1
+                left = (dx - 0.5) / (dy + 0.5)
+                right = (dx + 0.5) / (dy - 0.5)
+                if start < right:
+                    continue
+                if end > left:
+                    break
+                mx = cx + dx * xx + dy * xy
+                my = cy + dx * yx + dy * yy
+                inside = 0 <= mx < w and 0 <= my < h
+                if inside and dx * dx + dy * dy <= r2:
+                    seen.add(my * w + mx)
+                wall = not inside or opaque[my * w + mx]
+                if blocked:
+                    if wall:
+                        new_start = right
+                        continue
+                    blocked = False
+                    start = new_start
+                elif wall and j < radius:
+                    # Scan the lit part of the next row before the wall's shadow
+                    blocked = True
+                    self._cast(cx, cy, j + 1, start, left, radius, xx, xy, yx, yy, seen)
+                    new_start = right
+            if blocked:
+                break
@@ -1,44 +1,294 @@
 # engine/game/weather.py
 import time
 
+# Weather codes index every table below
+SUNNY = 0
+RAINY = 1
+STORMY = 2
+FOGGY = 3
+SNOWY = 4
+TYPES = ["Sunny", "Rainy", "Stormy", "Foggy", "Snowy"]
+CODES = {name: code for code, name in enumerate(TYPES)}
+
+# Static effect tables. EFFECTS entries are shared between all callers; treat them as read-only.
+EFFECTS = [
+    {},
+    {"visibility": 0.2},
+    {"encounter_rate": +0.2},
+    {"visibility": 0.4},
+    {"movement_penalty": +1},
+]
+VISIBILITY = [e.get("visibility", 1.0) for e in EFFECTS]
+ENCOUNTER_RATE = [e.get("encounter_rate", 0.0) for e in EFFECTS]
+MOVEMENT_PENALTY = [e.get("movement_penalty", 0) for e in EFFECTS]
+DESCRIPTIONS = [
+    "The sun is shining brightly.",
+    "It's raining steadily.",
+    "A fierce storm is raging.",
+    "Thick fog reduces visibility.",
+    "Snow is falling gently.",
+]
+STUCK_MESSAGES = [
+    "The weather is unusual.",
+    "The weather is unusual.",
+    "The weather is unusual.",
+    "The weather is unusual.",
+    "Snowdrifts block your path ",
+]
+
+# Tiles per side of a weather region
+REGION_SIZE = 2
+# Simulation turns between batched weather updates
+UPDATE_EVERY = 3
+# Weather carried by fronts; regions outside every front are clear
+FRONT_TYPES = [RAINY, STORMY, FOGGY, SNOWY]
+# One front per this many regions (at least one)
+REGIONS_PER_FRONT = 10
+# Front radius and speed, in regions and regions per update
+FRONT_RADIUS = (0.8, 2.0)
+FRONT_SPEED = (0.3, 0.8)
+
+
 class Weather:
-    TYPES = ["Sunny", "Rainy", "Stormy", "Foggy", "Snowy"]
+    """Weather of a single standalone tile. Tiles inside a World use RegionWeather instead."""
+    TYPES = TYPES
 
-    def __init__(self):
-        self.current = self._choice(self.TYPES)
+    def __init__(self, rng=None):
+        self.code = self._choice(rng)
 
-    def _choice(self, items):
+    def _choice(self, rng=None):
+        if rng is not None:
+            return rng.randrange(len(TYPES))
         # Simple pseudo-random choice using time
         t = int(time.time() * 1000)
-        idx = t % len(items)
-        return items[idx]
+        return t % len(TYPES)
+
+    @property
+    def current(self) -> str:
+        return TYPES[self.code]
+
+    @current.setter
+    def current(self, name: str):
+        self.code = CODES[name]
 
-    def change(self):
-        self.current = self._choice(self.TYPES)
+    def change(self, rng=None):
+        self.code = self._choice(rng)
 
     def effect(self):
-        # Return a dict of effects based on current weather
-        effects = {
-            "Sunny": {},
-            "Rainy": {"visibility": 0.2},
-            "Stormy": {"encounter_rate": +0.2},
-            "Foggy": {"visibility": 0.4},
-            "Snowy": {"movement_penalty": +1},
-        }
-        return effects.get(self.current, {})
+        return EFFECTS[self.code]
+
+    def visibility(self) -> float:
+        return VISIBILITY[self.code]
 
     def stuck_message(self):
-        messages = {
-            "Snowy": "Snowdrifts block your path ",
-        }
-        return messages.get(self.current, "The weather is unusual.")
+        return STUCK_MESSAGES[self.code]
 
     def describe(self):
-        descriptions = {
-            "Sunny": "The sun is shining brightly.",
-            "Rainy": "It's raining steadily.",
-            "Stormy": "A fierce storm is raging.",
-            "Foggy": "Thick fog reduces visibility.",
-            "Snowy": "Snow is falling gently.",
+        return DESCRIPTIONS[self.code]
+
+
+class WeatherSystem:
+    """
+    World-level weather on a coarse grid: one weather code per region of REGION_SIZE x
+    REGION_SIZE tiles, kept in a flat list. Weather fronts (circles of rain, storm, fog or
+    snow) drift across the grid on the game's turn clock; every UPDATE_EVERY turns all
+    fronts are moved and the grid is re-rasterized in one batch. Neighbouring tiles
+    therefore share weather, and tile queries are index lookups into the static tables.
+    Fronts live in parallel lists (x, y, vx, vy, radius, code) so a batch is plain loops.
+    """
+
+    def __init__(self, width: int, height: int, region_size: int = REGION_SIZE, update_every: int = UPDATE_EVERY):
+        self.width = width
+        self.height = height
+        self.region_size = max(1, region_size)
+        self.cols = (width + self.region_size - 1) // self.region_size
+        self.rows = (height + self.region_size - 1) // self.region_size
+        self.codes = [SUNNY] * (self.cols * self.rows)
+        self.update_every = max(1, update_every)
+        self.clock = 0
+        self.front_x = []
+        self.front_y = []
+        self.front_vx = []
+        self.front_vy = []
+        self.front_radius = []
+        self.front_code = []
+
+    def region(self, x: int, y: int) -> int:
+        return (y // self.region_size) * self.cols + (x // self.region_size)
+
+    def code_at(self, x: int, y: int) -> int:
+        return self.codes[(y // self.region_size) * self.cols + (x // self.region_size)]
+
+    def set_code(self, x: int, y: int, code: int) -> None:
+        self.codes[self.region(x, y)] = code
+
+    def name_at(self, x: int, y: int) -> str:
+        return TYPES[self.code_at(x, y)]
+
+    def visibility(self, x: int, y: int) -> float:
+        return VISIBILITY[self.code_at(x, y)]
+
+    def encounter_rate(self, x: int, y: int) -> float:
+        return ENCOUNTER_RATE[self.code_at(x, y)]
+
+    def movement_penalty(self, x: int, y: int) -> int:
+        return MOVEMENT_PENALTY[self.code_at(x, y)]
+
+    @property
+    def front_count(self) -> int:
+        return len(self.front_code)
+
+    def randomize(self, rng) -> None:
+        """Scatter a fresh set of fronts over the grid and rasterize them."""
+        self.front_x, self.front_y, self.front_vx, self.front_vy = [], [], [], []
+        self.front_radius, self.front_code = [], []
+        for _ in range(max(1, len(self.codes) // REGIONS_PER_FRONT)):
+            self._add_front(rng, rng.uniform(0, self.cols), rng.uniform(0, self.rows))
+        self.rasterize()
+
+    def _add_front(self, rng, x: float, y: float) -> None:
+        # Head roughly towards the middle of the map so fronts cross it
+        dx = self.cols / 2.0 - x + rng.uniform(-1.0, 1.0)
+        dy = self.rows / 2.0 - y + rng.uniform(-1.0, 1.0)
+        norm = max(0.001, (dx * dx + dy * dy) ** 0.5)
+        speed = rng.uniform(FRONT_SPEED[0], FRONT_SPEED[1])
+        self.front_x.append(x)
+        self.front_y.append(y)
+        self.front_vx.append(dx / norm * speed)
+        self.front_vy.append(dy / norm * speed)
+        self.front_radius.append(rng.uniform(FRONT_RADIUS[0], FRONT_RADIUS[1]))
+        self.front_code.append(rng.choice(FRONT_TYPES))
+
+    def _respawn_front(self, rng, i: int) -> None:
+        # Enter from a random edge with new weather
+        side = rng.randrange(4)
+        if side == 0:
+            x, y = -self.front_radius[i], rng.uniform(0, self.rows)
+        elif side == 1:
+            x, y = self.cols + self.front_radius[i], rng.uniform(0, self.rows)
+        elif side == 2:
+            x, y = rng.uniform(0, self.cols), -self.front_radius[i]
+        else:
+            x, y = rng.uniform(0, self.cols), self.rows + self.front_radius[i]
+        for values in (self.front_x, self.front_y, self.front_vx, self.front_vy, self.front_radius, self.front_code):
+            values.pop(i)
+        self._add_front(rng, x, y)
+        # _add_front appends; move the new front back to slot i to keep the order stable
+        for values in (self.front_x, self.front_y, self.front_vx, self.front_vy, self.front_radius, self.front_code):
+            values.insert(i, values.pop())
+
+    def advance(self, rng, turns: int = 1) -> list:
+        """Move the clock forward; returns the region indexes whose weather changed."""
+        before = self.clock // self.update_every
+        self.clock += turns
+        updates = self.clock // self.update_every - before
+        if updates <= 0:
+            return []
+        old = self.codes
+        if not self.front_code:
+            # Saves from before fronts existed start a fresh set
+            self.randomize(rng)
+            return [i for i in range(len(old)) if old[i] != self.codes[i]]
+        fx, fy, vx, vy, fr = self.front_x, self.front_y, self.front_vx, self.front_vy, self.front_radius
+        for i in range(len(fx)):
+            fx[i] += vx[i] * updates
+            fy[i] += vy[i] * updates
+            r = fr[i]
+            if fx[i] < -r or fy[i] < -r or fx[i] > self.cols + r or fy[i] > self.rows + r:
+                self._respawn_front(rng, i)
+        self.rasterize()
+        return [i for i in range(len(old)) if old[i] != self.codes[i]]
+
+    def rasterize(self) -> None:
+        """Recompute every region's code: the front whose edge it lies deepest inside wins."""
+        cols = self.cols
+        codes = [SUNNY] * (cols * self.rows)
+        best = [1.0] * len(codes)
+        fx, fy, fr, fc = self.front_x, self.front_y, self.front_radius, self.front_code
+        for f in range(len(fc)):
+            r = fr[f]
+            inv_r2 = 1.0 / (r * r)
+            # Only the regions inside the front's bounding box can be covered
+            x0 = max(0, int(fx[f] - r))
+            x1 = min(cols - 1, int(fx[f] + r))
+            y0 = max(0, int(fy[f] - r))
+            y1 = min(self.rows - 1, int(fy[f] + r))
+            for ry in range(y0, y1 + 1):
+                dy = ry + 0.5 - fy[f]
+                for rx in range(x0, x1 + 1):
+                    dx = rx + 0.5 - fx[f]
+                    d = (dx * dx + dy * dy) * inv_r2
+                    i = ry * cols + rx
+                    if d < best[i]:
+                        best[i] = d
+                        codes[i] = fc[f]
+        self.codes = codes
+
+    def view(self, x: int, y: int) -> "RegionWeather":
+        return RegionWeather(self, x, y)
+
+    def to_dict(self) -> dict:
+        return {
+            "region_size": self.region_size,
+            "update_every": self.update_every,
+            "clock": self.clock,
+            "codes": list(self.codes),
+            "fronts": [
+                [self.front_x[i], self.front_y[i], self.front_vx[i], self.front_vy[i],
+                 self.front_radius[i], self.front_code[i]]
+                for i in range(self.front_count)
+            ],
         }
-        return descriptions.get(self.current, "The weather is indescribable.")
\ No newline at end of file
+
+    @staticmethod
+    def from_dict(d: dict, width: int, height: int) -> "WeatherSystem":
+        ws = WeatherSystem(width, height, int(d.get("region_size", REGION_SIZE)),
+                           int(d.get("update_every", UPDATE_EVERY)))
+        ws.clock = int(d.get("clock", 0))
+        codes = d.get("codes") or []
+        if len(codes) == len(ws.codes):
+            ws.codes = [int(c) % len(TYPES) for c in codes]
+        for f in d.get("fronts") or []:
+            ws.front_x.append(float(f[0]))
+            ws.front_y.append(float(f[1]))
+            ws.front_vx.append(float(f[2]))
+            ws.front_vy.append(float(f[3]))
+            ws.front_radius.append(float(f[4]))
+            ws.front_code.append(int(f[5]) % len(TYPES))
+        return ws
+
+
+class RegionWeather:
+    """A tile's window onto the WeatherSystem, with the same API as Weather."""
+    TYPES = TYPES
+
+    def __init__(self, system: WeatherSystem, x: int, y: int):
+        self.system = system
+        self.index = system.region(x, y)
+
+    @property
+    def code(self) -> int:
+        return self.system.codes[self.index]
+
+    @property
+    def current(self) -> str:
+        return TYPES[self.system.codes[self.index]]
+
+    @current.setter
+    def current(self, name: str):
+        self.system.codes[self.index] = CODES[name]
+
+    def change(self, rng=None):
+        self.system.codes[self.index] = Weather(rng).code
+
+    def effect(self):
+        return EFFECTS[self.system.codes[self.index]]
+
+    def visibility(self) -> float:
+        return VISIBILITY[self.system.codes[self.index]]
+
+    def stuck_message(self):
+        return STUCK_MESSAGES[self.system.codes[self.index]]
+
+    def describe(self):
+        return DESCRIPTIONS[self.system.codes[self.index]]
@@ -1,6 +1,8 @@
 import math
 import random
-from .weather import Weather
+from .weather import CODES, WeatherSystem
+from .rng import RngStream
+from .spatial import SpatialIndex
 
 class Tile:
     def __init__(
@@ -11,6 +13,8 @@ class Tile:
             safe: bool = False,
             ascii: str = None,
             shop: bool = False,
+            opaque: bool = False,
+            sight: int = 0,
     ):
         self.name = name
         self.description = description
@@ -18,7 +22,11 @@ class Tile:
         self.safe = safe
         self.ascii = ascii
         self.shop = shop
-        self.weather = Weather()
+        # Blocks line of sight / extra sight radius from this tile (see visibility.py)
+        self.opaque = opaque
+        self.sight = sight
+        # A view into the World's WeatherSystem, set when the tile is placed in a World
+        self.weather = None
 
     def to_dict(self) -> dict:
         return {
@@ -28,36 +36,102 @@ class Tile:
             "safe": self.safe,
             "ascii": self.ascii,
             "shop": self.shop,
+            "opaque": self.opaque,
+            "sight": self.sight,
+            "rested": bool(getattr(self, "rested", False)),
+            "weather": self.weather.current if self.weather is not None else None,
+            "shop_items": dict(self.shop_items) if getattr(self, "shop_items", None) else None,
         }
 
     @staticmethod
     def from_dict(d: dict) -> "Tile":
-        return Tile(
+        t = Tile(
             name=d["name"],
             description=d["description"],
             danger=float(d["danger"] if "danger" in d else 0.0),
             safe=bool(d["safe"] if "safe" in d else False),
             ascii=d["ascii"],
             shop=bool(d["shop"] if "shop" in d else False),
+            opaque=bool(d.get("opaque", False)),
+            sight=int(d.get("sight", 0)),
         )
+        # Runtime fields are only present in saves, not in tileset definitions
+        if d.get("rested"):
+            t.rested = True
+        if d.get("shop_items"):
+            t.shop_items = dict(d["shop_items"])
+        return t
 
 
 class World:
-    def __init__(self, width: int, height: int, grid: list, seed: int = None):
+    def __init__(self, width: int, height: int, grid: list, seed: int = None, weather: WeatherSystem = None):
         self.width = width
         self.height = height
         self.grid = grid
         self.seed = seed
         self.tileset = World._default_tileset()
+        self.village = World._find_village(width, height, grid)
+        if weather is None:
+            weather = WeatherSystem(width, height)
+        self.weather = weather
+        for y, row in enumerate(grid):
+            for x, t in enumerate(row):
+                t.weather = weather.view(x, y)
+        self.index = SpatialIndex.from_grid(width, height, grid)
+        # Bumped whenever tiles are replaced, so derived caches (visibility) know to rebuild
+        self.version = 0
 
     def get_tile(self, x: int, y: int) -> Tile:
         return self.grid[y][x]
 
+    def set_tile(self, x: int, y: int, tile: Tile) -> None:
+        """Replace a tile (e.g. turning it into a shop) and keep the spatial index current."""
+        tile.weather = self.weather.view(x, y)
+        self.grid[y][x] = tile
+        self.index.update(x, y, tile)
+        self.version += 1
+
+    def set_rested(self, x: int, y: int, rested: bool) -> None:
+        tile = self.grid[y][x]
+        tile.rested = rested
+        self.index.update(x, y, tile)
+
+    def refresh_index(self) -> None:
+        """Rebuild the spatial index after tiles were edited in place."""
+        self.index = SpatialIndex.from_grid(self.width, self.height, self.grid)
+        self.version += 1
+
+    def nearest(self, x: int, y: int, kind: str = "safe") -> tuple:
+        return self.index.nearest(x, y, kind)
+
+    def within(self, x: int, y: int, radius: int, kind: str = "shop") -> list:
+        return self.index.within(x, y, radius, kind)
+
+    def max_danger(self, x0: int, y0: int, x1: int, y1: int) -> float:
+        return self.index.max_danger(x0, y0, x1, y1)
+
+    def heatmap(self) -> list:
+        return self.index.heatmap(self.weather)
+
+    @staticmethod
+    def _find_village(width: int, height: int, grid: list) -> tuple:
+        # The village is generated at the centre, or at the west end of a flat world
+        for (x, y) in ((width // 2, height // 2), (0, 0)):
+            if y < len(grid) and x < len(grid[y]) and grid[y][x].safe:
+                return (x, y)
+        for y, row in enumerate(grid):
+            for x, t in enumerate(row):
+                if t.safe and not t.shop:
+                    return (x, y)
+        return (width // 2, height // 2)
+
     def to_dict(self) -> dict:
         return {
             "width": self.width,
             "height": self.height,
             "seed": self.seed,
+            "village": list(self.village),
+            "weather": self.weather.to_dict(),
             "grid": [[t.to_dict() for t in row] for row in self.grid],
         }
 
@@ -70,7 +144,19 @@ class World:
         height = int(d["height"])  # type: ignore
         seed = d.get("seed")
         grid = [[Tile.from_dict(td) for td in row] for row in d["grid"]]
-        return World(width=width, height=height, grid=grid, seed=seed)
+        if isinstance(d.get("weather"), dict):
+            weather = WeatherSystem.from_dict(d["weather"], width, height)
+        else:
+            # Older saves only carry each tile's weather name
+            weather = WeatherSystem(width, height)
+            for y, row in enumerate(d["grid"]):
+                for x, td in enumerate(row):
+                    if td.get("weather") in CODES:
+                        weather.set_code(x, y, CODES[td["weather"]])
+        world = World(width=width, height=height, grid=grid, seed=seed, weather=weather)
+        if isinstance(d.get("village"), (list, tuple)) and len(d["village"]) == 2:
+            world.village = (int(d["village"][0]), int(d["village"][1]))
+        return world
 
     @staticmethod
     def _default_tileset() -> dict:
@@ -81,14 +167,14 @@ class World:
                 {"name": "Western Farms", "description": "Abandoned fields overrun with weeds.", "danger": 0.2, "ascii": "F"},
                 {"name": "Shadowfen", "description": "Dark swamp with unseen dangers lurking.", "danger": 0.5, "ascii": "S"},
                 {"name": "Crystal Lake", "description": "A serene lake with crystal clear water.", "danger": 0.1, "ascii": "L"},
-                {"name": "Whispering Woods", "description": "Trees that seem to whisper as the wind blows.", "danger": 0.4, "ascii": "W"},
-                {"name": "Sunset Hill", "description": "A gentle hill bathed in golden light.", "danger": 0.15, "ascii": "H"},
-                {"name": "Old Watchtower", "description": "A crumbling tower watches the valleys.", "danger": 0.3, "ascii": "T"},
+                {"name": "Whispering Woods", "description": "Trees that seem to whisper as the wind blows.", "danger": 0.4, "ascii": "W", "opaque": True},
+                {"name": "Sunset Hill", "description": "A gentle hill bathed in golden light.", "danger": 0.15, "ascii": "H", "sight": 1},
+                {"name": "Old Watchtower", "description": "A crumbling tower watches the valleys.", "danger": 0.3, "ascii": "T", "sight": 2},
                 {"name": "Frost Creek", "description": "Icy water murmurs over smooth stones.", "danger": 0.35, "ascii": "C"},
                 {"name": "Mire Flats", "description": "Boggy ground that sucks at your boots.", "danger": 0.45, "ascii": "M"},
-                {"name": "Gloomwood", "description": "Dark trees crowd the path. Eyes watch.", "danger": 0.55, "ascii": "G"},
-                {"name": "Ruined Keep", "description": "Broken walls hide shadows and secrets.", "danger": 0.6, "ascii": "K"},
-                {"name": "Northern Ridge", "description": "Wind-swept ridge with sparse pines.", "danger": 0.35, "ascii": "R"},
+                {"name": "Gloomwood", "description": "Dark trees crowd the path. Eyes watch.", "danger": 0.55, "ascii": "G", "opaque": True},
+                {"name": "Ruined Keep", "description": "Broken walls hide shadows and secrets.", "danger": 0.6, "ascii": "K", "opaque": True},
+                {"name": "Northern Ridge", "description": "Wind-swept ridge with sparse pines.", "danger": 0.35, "ascii": "R", "sight": 1},
                 {"name": "Eastgate Road", "description": "A cobbled road lined with old mileposts.", "danger": 0.25, "ascii": "E"},
             ]
         }
@@ -105,17 +191,23 @@ class World:
         }
 
     @staticmethod
-    def generate_random(size: int, tileset: dict, seed: int = None, flat: bool = False) -> "World":
+    def generate_random(size: int, tileset: dict, seed: int = None, flat: bool = False, rng=None) -> "World":
         if tileset is None:
             tileset = World._default_tileset()
         # Create a world centered on a safe village, increasing danger with distance
+        if rng is not None:
+            seed = rng.seed
         if seed is None:
             seed = random.randrange(1, 10_000_000)
-        # For JS compatibility
-        rng = World._pseudoRandomSeed(seed)
-        #__pragma__('skip')
-        rng = random.Random(seed)
-        #__pragma__('noskip')
+        if rng is not None:
+            # Draw from the game's RNG service so layout and weather follow its seed
+            world_rng = rng.world
+        else:
+            # For JS compatibility
+            world_rng = World._pseudoRandomSeed(seed)
+            #__pragma__('skip')
+            world_rng = random.Random(seed)
+            #__pragma__('noskip')
         base_tiles = tileset["tiles"]
         village_def = tileset["village"]
 
@@ -135,20 +227,24 @@ class World:
                     row.append(Tile.from_dict(village_def))
                     continue
                 # choose a random base tile
-                td = rng.choice(base_tiles)
+                td = world_rng.choice(base_tiles)
                 # scale danger by Manhattan distance from center
                 dist = abs(x - cx) + abs(y - cy)
                 danger = float(td["danger"] if "danger" in td else 0.2)
                 scaled = min(0.8, max(0.0, danger + dist * 0.05))
-                row.append(Tile(name=td["name"], description=td["description"], danger=scaled, safe=False, ascii=td["ascii"]))
+                row.append(Tile(name=td["name"], description=td["description"], danger=scaled, safe=False, ascii=td["ascii"],
+                                opaque=bool(td.get("opaque", False)), sight=int(td.get("sight", 0))))
             grid.append(row)
 
         # Place a few random shops deterministically based on the seed
         # For JS compatibility
-        rng2 = World._pseudoRandomSeed(seed)
-        #__pragma__('skip')
-        rng2 = random.Random(seed + 1337)
-        #__pragma__('noskip')
+        if rng is not None:
+            rng2 = rng.world
+        else:
+            rng2 = World._pseudoRandomSeed(seed)
+            #__pragma__('skip')
+            rng2 = random.Random(seed + 1337)
+            #__pragma__('noskip')
         num_shops = max(1, size // 3)
         placed = 0
         positions = [(x, y) for y in range(height) for x in range(width) if not (x == cx and y == cy)]
@@ -169,9 +265,12 @@ class World:
                 safe=True,
                 ascii=t.ascii,  # keep any ascii if present; renderer will fallback otherwise
                 shop=True,
+                sight=t.sight,
             )
             placed += 1
 
         world = World(width=width, height=height, grid=grid, seed=seed)
+        world.village = (0, 0) if flat else (cx, cy)
+        world.weather.randomize(rng.weather if rng is not None else RngStream(seed, "weather"))
         world.tileset = tileset  # store tileset for reference
         return world
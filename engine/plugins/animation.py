@@ -0,0 +1,226 @@
+import sys
+import time
+
+# Frame kinds
+WRITE = 0  # write text; a `replace` frame is redrawn over by the next one (ends in "\r")
+CALL = 1  # call fn(); its return value is ignored
+UNTIL = 2  # call fn() every tick until it returns True
+WAIT_KEY = 3  # hold until AnimationScheduler.resume()
+
+
+class Timeline:
+    """
+    A scripted animation: frames at fixed offsets from the start, built up front by the
+    screen functions instead of writing and sleeping. write(text, hold) puts text on the
+    timeline and moves the cursor on by `hold` seconds, the same way the old blocking
+    code wrote and then slept.
+    """
+
+    def __init__(self):
+        self.frames = []  # (at, kind, value, replace)
+        self.duration = 0.0
+
+    def write(self, text: str, hold: float = 0.0, replace: bool = False) -> "Timeline":
+        self.frames.append((self.duration, WRITE, text, replace))
+        self.duration += max(0.0, hold)
+        return self
+
+    def tween(self, steps: int, hold: float, render) -> "Timeline":
+        """render(i) for i in range(steps), `hold` seconds apart, each drawn over the last."""
+        for i in range(steps):
+            self.write(render(i), hold, replace=True)
+        return self
+
+    def pause(self, seconds: float) -> "Timeline":
+        self.duration += max(0.0, seconds)
+        return self
+
+    def call(self, fn, hold: float = 0.0) -> "Timeline":
+        self.frames.append((self.duration, CALL, fn, False))
+        self.duration += max(0.0, hold)
+        return self
+
+    def until(self, fn) -> "Timeline":
+        """Hold the timeline, calling fn() each tick, until it returns True."""
+        self.frames.append((self.duration, UNTIL, fn, False))
+        return self
+
+    def wait_key(self) -> "Timeline":
+        self.frames.append((self.duration, WAIT_KEY, None, False))
+        return self
+
+    def extend(self, other: "Timeline") -> "Timeline":
+        for (at, kind, value, replace) in other.frames:
+            self.frames.append((self.duration + at, kind, value, replace))
+        self.duration += other.duration
+        return self
+
+
+class AnimationScheduler:
+    """
+    Plays queued Timelines without blocking: the UI loop calls tick() every pass and keeps
+    reading input in between. Each frame has a deadline (timeline start + its offset);
+    tick() emits every frame that is due in one write. When a loop pass comes late,
+    `replace` frames already overdrawn by a later due frame are dropped (counted in
+    `skipped`), so a slow terminal jumps ahead instead of falling behind. The next
+    timeline starts where the previous one's deadline ended, not when it was noticed.
+    """
+
+    def __init__(self, out=None, clock=time.monotonic):
+        self.out = out
+        self.clock = clock
+        self.queue = []
+        self.timeline = None
+        self.index = 0
+        self.start = 0.0
+        self.waiting = False
+        self._resumed = False
+        self._skip_to = 0  # frames before this index are due now (skip())
+        self.drawn = 0
+        self.skipped = 0
+
+    @property
+    def busy(self) -> bool:
+        return self.timeline is not None or bool(self.queue)
+
+    def play(self, timeline: Timeline) -> None:
+        self.queue.append(timeline)
+
+    def resume(self) -> None:
+        """Release a wait_key() hold (any key pressed)."""
+        if self.waiting:
+            self._resumed = True
+
+    def skip(self, now: float = None) -> None:
+        """Jump the current timeline ahead to its next key wait (or its end)."""
+        if self.timeline is None or self.waiting:
+            return
+        frames = self.timeline.frames
+        target = len(frames)
+        for i in range(self.index, len(frames)):
+            if frames[i][1] in (WAIT_KEY, UNTIL):
+                target = i
+                break
+        self._skip_to = max(self._skip_to, target)
+        if target == len(frames):
+            # Nothing left to hold on: end the timeline on the next tick
+            now = self.clock() if now is None else now
+            self.start = min(self.start, now - self.timeline.duration)
+
+    def clear(self) -> None:
+        self.queue.clear()
+        self.timeline = None
+        self.waiting = False
+        self._resumed = False
+        self._skip_to = 0
+
+    def until_next(self, now: float = None):
+        """
+        Seconds until the next frame is due (0 if overdue); None when idle, waiting for a
+        key or polling an until() frame, where the caller's own frame rate applies.
+        """
+        if self.timeline is None:
+            return 0.0 if self.queue else None
+        if self.waiting:
+            return None
+        now = self.clock() if now is None else now
+        frames = self.timeline.frames
+        if self.index < len(frames):
+            at, kind = frames[self.index][0], frames[self.index][1]
+            if kind == UNTIL and self.start + at <= now:
+                return None
+        else:
+            at = self.timeline.duration
+        return max(0.0, self.start + at - now)
+
+    def tick(self, now: float = None) -> bool:
+        """Emit everything due by `now`; True while there is still animation to play."""
+        now = self.clock() if now is None else now
+        out = []
+        while True:
+            if self.timeline is None:
+                if not self.queue:
+                    break
+                self.timeline = self.queue.pop(0)
+                self.index = 0
+                self.start = now
+            frames = self.timeline.frames
+            held = False
+            while self.index < len(frames):
+                at, kind, value, replace = frames[self.index]
+                if self.index < self._skip_to:
+                    pass
+                elif self._skip_to:
+                    # Skipped up to here: go on from this frame as if it were due now
+                    self.start = now - at
+                    self._skip_to = 0
+                elif self.start + at > now:
+                    break
+                if kind == WRITE:
+                    nxt = self.index + 1
+                    nxt_due = nxt < len(frames) and (nxt < self._skip_to or self.start + frames[nxt][0] <= now)
+                    if replace and nxt_due and frames[nxt][1] == WRITE:
+                        self.skipped += 1
+                    else:
+                        out.append(value)
+                        self.drawn += 1
+                elif kind == CALL:
+                    self._flush(out)
+                    value()
+                elif kind == UNTIL:
+                    self._flush(out)
+                    # Later frames keep their spacing from the moment this one finishes
+                    self.start = now - at
+                    if not value():
+                        held = True
+                        break
+                elif kind == WAIT_KEY:
+                    if not self._resumed:
+                        self.waiting = True
+                        held = True
+                        break
+                    self._resumed = False
+                    self.waiting = False
+                    self.start = now - at
+                self.index += 1
+            if held or self.index < len(frames) or self.start + self.timeline.duration > now:
+                break
+            # Chain the next timeline onto this one's end
+            end = self.start + self.timeline.duration
+            self.timeline = None
+            self._skip_to = 0
+            if self.queue:
+                self.timeline = self.queue.pop(0)
+                self.index = 0
+                self.start = end
+        self._flush(out)
+        return self.busy
+
+    def run(self, sleep=time.sleep, frame_time: float = 0.05) -> bool:
+        """
+        Play to the end (or to a key wait) blocking, for line-mode UIs and demos. Returns
+        True when stopped at a wait_key(); resume() and run() again to go on.
+        """
+        while self.tick():
+            if self.waiting:
+                return True
+            wait = self.until_next()
+            sleep(frame_time if wait is None else wait)
+        return False
+
+    def _flush(self, out: list) -> None:
+        if out:
+            stream = self.out if self.out is not None else sys.stdout
+            stream.write("".join(out))
+            stream.flush()
+            out.clear()
+
+
+def play(timeline: Timeline, scheduler: AnimationScheduler = None) -> None:
+    """Queue `timeline` on `scheduler`, or play it right away (blocking) without one."""
+    if scheduler is not None:
+        scheduler.play(timeline)
+        return
+    blocking = AnimationScheduler()
+    blocking.play(timeline)
+    blocking.run()
@@ -3,6 +3,7 @@ from typing import List, Any, Tuple
 import random
 
 from engine.game.event import GameEvent
+from engine.plugins.sprite_atlas import SpriteAtlas, ATLAS
 
 # --- Configuration Constants (Can be moved to a settings file if desired) ---
 # The user-requested dimensions (40x60)
@@ -38,6 +39,7 @@ PLAYER_DEATH_ANIMATION_STATE = "PLAYER_DEATH_MESSAGE" # NEW: State for death mes
 
 # Health bar character
 HP_BAR_FILL_CHAR = '█'
+HP_BAR_WIDTH = 15
 
 # NEW: ANSI Color Codes for Health Bar
 COLOR_GREEN = "\033[92m"    # Bright Green
@@ -46,6 +48,21 @@ COLOR_RED = "\033[91m"      # Bright Red
 COLOR_RESET = "\033[0m"
 
 
+def _build_hp_bars(hp_color: str):
+    """One bar per fill level 0..HP_BAR_WIDTH."""
+    return [f"[{hp_color}{HP_BAR_FILL_CHAR * fill}{'-' * (HP_BAR_WIDTH - fill)}{COLOR_RESET}]"
+            for fill in range(HP_BAR_WIDTH + 1)]
+
+
+def _build_enemy_rows(ascii_art: str, width: int):
+    rows = []
+    for enemy_line in ascii_art.split('\n'):
+        # Center the ASCII art in the remaining horizontal space
+        left = f"{' ' * ((width - len(enemy_line) - 2) // 2)}{enemy_line} "
+        rows.append((left, ' ' * (width - len(left) - 1)))
+    return rows
+
+
 class ASCIICombatRenderer:
     """
     A custom renderer for combat that uses ASCII text within a fixed frame.
@@ -53,12 +70,14 @@ class ASCIICombatRenderer:
     This class provides the 'combat_fn' to replace the room render when in
     Game.GameState.COMBAT. It also has an 'update' function to drive animations.
     """
-    def __init__(self, height: int = DEFAULT_HEIGHT, width: int = DEFAULT_WIDTH):
+    def __init__(self, height: int = DEFAULT_HEIGHT, width: int = DEFAULT_WIDTH, atlas: SpriteAtlas = ATLAS):
         """
         Initializes the combat renderer with configurable dimensions.
         """
         self.height = height
         self.width = width
+        # Enemy art and HP bars are built once per (sprite, width, color) and reused
+        self.atlas = atlas
 
         # State variables for animation context
         self.animation_state: str = ""
@@ -235,6 +254,28 @@ class ASCIICombatRenderer:
         else:
             return COLOR_RED
 
+    def _hp_bar(self, health_ratio: float) -> str:
+        """The colored HP bar for health_ratio, picked from the prebuilt bars for its color."""
+        hp_color = self._get_hp_color(health_ratio)
+        bars = self.atlas.frame("hp_bar", HP_BAR_WIDTH, hp_color, _build_hp_bars, hp_color)
+        return bars[max(0, min(HP_BAR_WIDTH, int(health_ratio * HP_BAR_WIDTH)))]
+
+    def _enemy_sprite(self, ascii_art: str) -> tuple:
+        """
+        Rows of the enemy art centered in the battle area, as (left, right) pairs: the row
+        is left + animation char + right, already padded to the renderer width.
+        """
+        return self.atlas.frame(ascii_art, self.width, "", _build_enemy_rows, ascii_art, self.width)
+
+    def preload(self, enemy_archetypes: list) -> None:
+        """Build the frames for every archetype's art (both facings) and all HP bars up front."""
+        for archetype in enemy_archetypes or []:
+            for key in ('ascii', 'ascii_left'):
+                if isinstance(archetype.get(key), str):
+                    self._enemy_sprite(archetype[key])
+        for ratio in (1.0, 0.5, 0.0):
+            self._hp_bar(ratio)
+
     def _get_animated_message_frame(self, message_list: List[str], state_attr: str) -> Tuple[str, bool]:
         """
         Animates a battle ending message (death or victory), typing it out.
@@ -292,7 +333,6 @@ class ASCIICombatRenderer:
 
     def _draw_player_info(self, player: Any) -> List[str]:
         """Renders the player's info block."""
-        hp_bar_width = 15
         current_hp = getattr(player, 'hp', 0)
 
         # Use smoothed display HP and tracked max HP for bar calculation
@@ -300,12 +340,7 @@ class ASCIICombatRenderer:
         max_hp_for_bar = self._player_max_hp
 
         health_ratio = interp_hp / max_hp_for_bar if max_hp_for_bar > 0 else 0
-        health_fill = int(health_ratio * hp_bar_width)
-
-        # Determine color and apply to the bar content
-        hp_color = self._get_hp_color(health_ratio)
-        hp_bar_content = f"{HP_BAR_FILL_CHAR * health_fill}{'-' * (hp_bar_width - health_fill)}"
-        hp_bar = f"[{hp_color}{hp_bar_content}{COLOR_RESET}]"
+        hp_bar = self._hp_bar(health_ratio)
 
         # Death animation if player is dead
         is_dead = current_hp <= 0
@@ -340,14 +375,8 @@ class ASCIICombatRenderer:
             interp_hp = self._enemy_display_hp
             max_hp_for_bar = self._enemy_max_hp
 
-            hp_bar_width = 15
             health_ratio = interp_hp / max_hp_for_bar if max_hp_for_bar > 0 else 0
-            health_fill = int(health_ratio * hp_bar_width)
-
-            # Determine color and apply to the bar content
-            hp_color = self._get_hp_color(health_ratio)
-            hp_bar_content = f"{HP_BAR_FILL_CHAR * health_fill}{'-' * (hp_bar_width - health_fill)}"
-            hp_bar = f"[{hp_color}{hp_bar_content}{COLOR_RESET}]"
+            hp_bar = self._hp_bar(health_ratio)
 
             lines.extend([
                 f" ENEMY: {getattr(enemy, 'name', 'Monster'):<{self.width - 12}}",
@@ -377,25 +406,21 @@ class ASCIICombatRenderer:
                     lines.append(' ' * self.width)
 
             else:
-                # Enemy Art
-                enemy_ascii_lines = getattr(enemy, 'ascii', " (?) ").split('\n')
+                # Enemy Art, centered in the battle area (prebuilt rows)
+                enemy_rows = self._enemy_sprite(getattr(enemy, 'ascii', " (?) "))
 
                 # The attack animation frame, placed next to the player/enemy
                 player_attack_frame = self._get_animation_frame(GameEvent.ATTACKED)
                 enemy_attack_frame = self._get_animation_frame(GameEvent.ENEMY_ATTACKED)
 
-                for i, enemy_line in enumerate(enemy_ascii_lines):
-                    # Add a small 'hit' animation on the first line when player attacks
-                    anim_char = player_attack_frame if i == 0 else ' '
-
-                    # Center the ASCII art in the remaining horizontal space
-                    padding_left = (self.width - len(enemy_line) - 2) // 2
-
-                    # Check for enemy attacking animation (e.g., for the 'mouth' or main body)
-                    if i == 1:
-                        anim_char = enemy_attack_frame
-
-                    lines.append(f"{' ' * padding_left}{enemy_line} {anim_char}")
+                # The art rows are already padded to the width; only the stats need it
+                lines = [l.ljust(self.width) for l in lines]
+                for i, (left, right) in enumerate(enemy_rows):
+                    # Add a small 'hit' animation on the first line when player attacks,
+                    # and the enemy attacking animation on the second (the 'mouth' or main body)
+                    anim_char = player_attack_frame if i == 0 else enemy_attack_frame if i == 1 else ' '
+                    lines.append(left + anim_char + right)
+                return lines
 
         # Fallback for when there is truly no enemy (and no victory animation)
         # We replace the removed [NO ENEMY] with blank space to maintain layout
@@ -2,9 +2,10 @@
 
 import random
 import time
+from array import array
 
 try:
-    from engine.game.enemy import Enemy as EnemyModel
+    from engine.game.enemy import Enemy as EnemyModel, ENEMY_POOL
     from engine.game.event import EventManager, GameEvent
 except ImportError:
     class EnemyModel:
@@ -15,6 +16,19 @@ except ImportError:
             return self.__dict__
 
 
+    class _NoPool:
+        def acquire(self, *args):
+            names = ["name", "ascii", "level", "max_hp", "hp", "attack", "defense", "xp_reward", "gold_reward",
+                     "direction", "ascii_left"]
+            return EnemyModel(**dict(zip(names, args)))
+
+        def release(self, obj):
+            pass
+
+
+    ENEMY_POOL = _NoPool()
+
+
     class GameEvent:
         def __init__(self, event_type, data=None):
             self.event_type = event_type
@@ -28,6 +42,9 @@ except ImportError:
         def emit(self, event: GameEvent):
             pass
 
+        def fire(self, event_type, payload=None):
+            pass
+
 # --- Global Input State Buffer ---
 # Not used in the tap-based model, but kept for clarity.
 LAST_MOVEMENT_ACTION = None
@@ -35,6 +52,61 @@ LAST_MOVEMENT_ACTION = None
 EVENT_ROOM_ENTERED = "room_entered"
 EVENT_ENTER_COMBAT = "enter_combat"
 
+# Simulation steps per second; gravity_pull, jump_velocity and enemy_speed_divider are tuned per step
+TICK_RATE = 20
+# Most steps one frame may run to catch up; a longer stall is dropped instead of replayed
+MAX_CATCH_UP_STEPS = 5
+# Rooms with fewer enemies patrol and collide one enemy object at a time; the batched
+# EnemyPatrol only pays for its bookkeeping in crowded rooms (see collision_bench.py)
+PATROL_MIN_ENEMIES = 16
+
+
+class FixedClock:
+    """
+    Fixed-timestep clock. Each frame feeds the real time into an accumulator and the
+    simulation runs in whole steps of `dt`, so physics speed no longer depends on how
+    often the terminal manages to redraw. A frame runs at most `max_steps` steps; time
+    beyond that (a stalled terminal, a combat screen) is dropped rather than replayed.
+    `alpha` is how far the leftover time reaches into the next step, for interpolation.
+    """
+
+    def __init__(self, rate=TICK_RATE, max_steps=MAX_CATCH_UP_STEPS):
+        self.dt = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.steps = 0
+        self.dropped = 0
+        self._last = None
+
+    def reset(self, now=None):
+        """Restart timing from `now`; the next tick() counts from there."""
+        self._last = now
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def tick(self, now=None):
+        """Feed the current time (seconds, monotonic) and return how many steps are due."""
+        if now is None:
+            now = time.monotonic()
+        if self._last is None:
+            self._last = now
+            return 0
+        self.accumulator += max(0.0, now - self._last)
+        self._last = now
+        steps = min(int(self.accumulator / self.dt), self.max_steps)
+        self.accumulator -= steps * self.dt
+        if self.accumulator >= self.dt:
+            self.dropped += int(self.accumulator / self.dt)
+            self.accumulator %= self.dt
+        self.steps += steps
+        self.alpha = self.accumulator / self.dt
+        return steps
+
+    def until_next(self):
+        """Seconds of real time left before the next step is due."""
+        return max(0.0, self.dt - self.accumulator)
+
 
 # --- Utility Function ---
 def is_passable(grid, x, y):
@@ -46,12 +118,172 @@ def is_passable(grid, x, y):
     return False
 
 
+# --- Collision ---
+
+# CollisionMap.ledge bits: walking that way from the cell would hit a wall, a solid cell or a drop
+LEDGE_LEFT = 1
+LEDGE_RIGHT = 2
+
+
+class CollisionMap:
+    """
+    Flat per-cell collision data for a Room2D, indexed as y * width + x:
+
+    - solid: 1 where a platform cell blocks movement.
+    - ground: 1 where the cell below is solid, i.e. something can stand here.
+    - ledge: LEDGE_LEFT / LEDGE_RIGHT bits where a patrol may not step that way (the next
+      cell is a side wall, solid, or has no ground under it).
+    - floor: the first solid row at or below each cell in its column (height if none),
+      so a fall from y to y_end lands iff floor[y + 1] is reached first.
+    - patrol: for a patrol state cell * 2 + (1 if heading right else 0), the state after
+      one step: turn at a ledge, then move on unless the new way is blocked too.
+
+    Physics and patrols then cost an index per check instead of building (x, y) tuples
+    and probing a set. Call rebuild() after changing `solid`.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.solid = bytearray(width * height)
+        self.ground = bytearray(width * height)
+        self.ledge = bytearray(width * height)
+        self.floor = array("H", [height]) * (width * height)
+        self.patrol = [0] * (2 * width * height)
+
+    @staticmethod
+    def from_cells(width, height, cells):
+        """A map whose solid cells are the in-bounds (x, y) pairs of `cells`."""
+        cmap = CollisionMap(width, height)
+        for (x, y) in cells:
+            if 0 <= x < width and 0 <= y < height:
+                cmap.solid[y * width + x] = 1
+        cmap.rebuild()
+        return cmap
+
+    def rebuild(self):
+        """Recompute ground, ledge and floor from solid."""
+        w, h = self.width, self.height
+        solid, ground, floor = self.solid, self.ground, self.floor
+        for x in range(w):
+            below = h
+            for y in range(h - 1, -1, -1):
+                i = y * w + x
+                if solid[i]:
+                    below = y
+                floor[i] = below
+                ground[i] = 1 if y + 1 < h and solid[i + w] else 0
+        ledge = self.ledge
+        for y in range(h):
+            row = y * w
+            for x in range(w):
+                bits = 0
+                if x - 1 <= 0 or solid[row + x - 1] or not ground[row + x - 1]:
+                    bits |= LEDGE_LEFT
+                if x + 1 >= w - 1 or solid[row + x + 1] or not ground[row + x + 1]:
+                    bits |= LEDGE_RIGHT
+                ledge[row + x] = bits
+        patrol = [0] * (2 * w * h)
+        for cell in range(w * h):
+            bits = ledge[cell]
+            for right in (0, 1):
+                d = 1 if right else -1
+                if bits & (LEDGE_RIGHT if d > 0 else LEDGE_LEFT):
+                    d = -d
+                nxt = cell if bits & (LEDGE_RIGHT if d > 0 else LEDGE_LEFT) else cell + d
+                patrol[cell * 2 + right] = nxt * 2 + (1 if d > 0 else 0)
+        self.patrol = patrol
+
+    def is_solid(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and self.solid[y * self.width + x] == 1
+
+    def has_ground(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and self.ground[y * self.width + x] == 1
+
+    def landing_row(self, x, y_from, y_to):
+        """The first solid row in column x within [y_from, y_to), or -1."""
+        if not 0 <= x < self.width:
+            return -1
+        y_from = max(0, y_from)
+        if y_from >= min(y_to, self.height):
+            return -1
+        row = self.floor[y_from * self.width + x]
+        return row if row < min(y_to, self.height) else -1
+
+
+class EnemyPatrol:
+    """
+    A room's enemies packed for the per-tick update. Each enemy is one int state,
+    cell * 2 + (1 if heading right else 0), so a patrol step for the whole room is a
+    single lookup per enemy in CollisionMap.patrol. `cells` is a spatial hash from cell
+    index (y * width + x) to the first enemy standing there, updated by step() in the
+    same pass, so the player collision check is one dict lookup instead of a scan.
+
+    Positions are written back to the enemy objects by sync(), which get_state, the
+    renderer and combat entry call before reading them. Enemies outside the room are
+    left out; they never move or collide.
+    """
+
+    def __init__(self, enemies, width, height):
+        self.width = width
+        self.height = height
+        self.size = len(enemies)
+        self.enemies = []
+        self.states = []
+        for e in enemies:
+            x, y = getattr(e, "x", -1), getattr(e, "y", -1)
+            if 0 <= x < width and 0 <= y < height:
+                self.enemies.append(e)
+                self.states.append((int(y) * width + int(x)) * 2 + (0 if getattr(e, "direction", 1) < 0 else 1))
+        self.dirty = False
+        self.cells = self._index(self.states)
+
+    def __len__(self):
+        return self.size
+
+    @staticmethod
+    def _index(states):
+        cells = {}
+        i = len(states)
+        # Walk backwards so the first enemy on a cell is the one that stays in the dict
+        for s in reversed(states):
+            i -= 1
+            cells[s >> 1] = i
+        return cells
+
+    def step(self, table):
+        """Advance every patrol one cell using a CollisionMap.patrol transition table."""
+        states = [table[s] for s in self.states]
+        self.states = states
+        self.cells = self._index(states)
+        self.dirty = True
+
+    def sync(self):
+        """Copy positions and directions back onto the enemy objects."""
+        if not self.dirty:
+            return
+        w = self.width
+        for e, s in zip(self.enemies, self.states):
+            e.x = (s >> 1) % w
+            e.direction = 1 if s & 1 else -1
+        self.dirty = False
+
+    def at(self, x, y):
+        """The enemy on cell (x, y), or None."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        i = self.cells.get(y * self.width + x)
+        return None if i is None else self.enemies[i]
+
+
 # --- Core Game Classes ---
 
 class Room2D:
     def __init__(self, room_id, width=15, height=8, has_door_up=False, has_door_down=False, has_door_left=True,
-                 has_door_right=True, enemies=None):
+                 has_door_right=True, enemies=None, rng=None):
         self.room_id = room_id
+        # Any object with randint/choice (a game's RNG stream); defaults to the global random
+        self.rng = rng or random
         self.width = width
         self.height = height
         # Doors now define connection points, not just top/bottom
@@ -61,9 +293,11 @@ class Room2D:
         self.has_door_right = has_door_right
 
         self.grid = [["." for _ in range(width)] for _ in range(height)]
-        self.platforms = set()  # Use a set for faster lookup
+        self.platforms = set()  # (x, y) of every platform cell; physics uses self.collision
+        self.collision = CollisionMap(width, height)
         self.doors = {}  # Store door type and position: {'up': (x, y), ...}
         self.enemies = enemies or []
+        self.patrol = None  # EnemyPatrol over self.enemies, rebuilt when they change
         self.player_start_x = 1
         self.player_start_y = height - 2  # Start just above the ground/platform
 
@@ -83,8 +317,8 @@ class Room2D:
         last_platform_x = self.width // 2
         last_platform_y = self.height - 1
 
-        for _ in range(random.randint(1, 3)):
-            x_offset = random.choice([random.randint(2, 4), random.randint(-4, -2)])
+        for _ in range(self.rng.randint(1, 3)):
+            x_offset = self.rng.choice([self.rng.randint(2, 4), self.rng.randint(-4, -2)])
             new_x_start = last_platform_x + x_offset
 
             max_y = min(last_platform_y - 1, self.height - 2)
@@ -93,10 +327,10 @@ class Room2D:
             if min_y > max_y:
                 break
 
-            new_y = random.randint(min_y, max_y)
+            new_y = self.rng.randint(min_y, max_y)
 
             new_x_start = max(1, min(new_x_start, self.width - 4))
-            length = random.randint(2, 4)
+            length = self.rng.randint(2, 4)
 
             for x in range(new_x_start, min(new_x_start + length, self.width - 1)):
                 if self.grid[new_y][x] == ".":
@@ -126,19 +360,27 @@ class Room2D:
             self.grid[self.height - 1][self.width // 2] = "D"
             self.doors['down'] = (self.width // 2, self.height - 1)
 
+        self.rebuild_collision()
+        # Prebuilt glyph lines for the static layer (see RoomRenderer)
+        self.renderer = RoomRenderer(self)
+
         # 4. Place enemies (Called after grid generation)
         self.place_enemies()
 
+    def rebuild_collision(self):
+        """Rebuild the collision map from self.platforms (after generating or editing them)."""
+        self.collision = CollisionMap.from_cells(self.width, self.height, self.platforms)
+
     def place_enemies(self):
         """Places enemies onto empty spots in the grid."""
         for enemy in self.enemies:
             # Find a random valid spawn spot
             tries = 0
             while tries < 100:
-                x = random.randint(1, self.width - 2)
-                y = random.randint(self.height - 4, self.height - 2)
+                x = self.rng.randint(1, self.width - 2)
+                y = self.rng.randint(self.height - 4, self.height - 2)
                 # Ensure spot is clear and has a platform/ground below it
-                if self.grid[y][x] == "." and (x, y + 1) in self.platforms:
+                if self.grid[y][x] == "." and self.collision.has_ground(x, y):
                     # Enemy symbol 'E' is drawn by render_room, not stored in grid
                     enemy.x = x
                     enemy.y = y
@@ -146,27 +388,98 @@ class Room2D:
                 tries += 1
             if tries == 100:
                 # Fallback placement if no good spot is found
-                enemy.x = random.randint(1, self.width - 2)
+                enemy.x = self.rng.randint(1, self.width - 2)
                 enemy.y = self.height - 2
+        self.patrol = None
+
+    def enemy_patrol(self):
+        """The EnemyPatrol for the current enemies (rebuilt if the list was changed directly)."""
+        if self.patrol is None or len(self.patrol) != len(self.enemies):
+            self.sync_enemies()
+            self.patrol = EnemyPatrol(self.enemies, self.width, self.height)
+        return self.patrol
+
+    def sync_enemies(self):
+        """Bring enemy x/direction up to date with the patrol before reading them."""
+        if self.patrol is not None:
+            self.patrol.sync()
+
+    def _batched_patrol(self):
+        # The EnemyPatrol for a crowded room; None below PATROL_MIN_ENEMIES, once any
+        # patrol left over from a bigger crowd has written its positions back
+        if len(self.enemies) < PATROL_MIN_ENEMIES:
+            if self.patrol is not None:
+                self.patrol.sync()
+                self.patrol = None
+            return None
+        return self.enemy_patrol()
+
+    def step_enemies(self):
+        """Move every enemy one cell along its patrol, turning at walls and drop-offs."""
+        if self.patrol is not None or len(self.enemies) >= PATROL_MIN_ENEMIES:
+            patrol = self._batched_patrol()
+            if patrol is not None:
+                patrol.step(self.collision.patrol)
+                return
+        ledge = self.collision.ledge
+        width, height = self.width, self.height
+        for enemy in self.enemies:
+            if hasattr(enemy, "x") and hasattr(enemy, "y") and hasattr(enemy, "direction"):
+                if not (0 <= enemy.x < width and 0 <= enemy.y < height):
+                    continue
+                bits = ledge[enemy.y * width + enemy.x]
+                # Turn at walls, solid cells and drop-offs; step on if the new way is clear
+                if bits & (LEDGE_LEFT if enemy.direction < 0 else LEDGE_RIGHT):
+                    enemy.direction *= -1
+                if not bits & (LEDGE_LEFT if enemy.direction < 0 else LEDGE_RIGHT):
+                    enemy.x += enemy.direction
+
+    def enemy_at(self, x, y):
+        """The first enemy on cell (x, y), or None; its position is synced for the caller."""
+        if self.patrol is not None or len(self.enemies) >= PATROL_MIN_ENEMIES:
+            patrol = self._batched_patrol()
+            if patrol is not None:
+                enemy = patrol.at(x, y)
+                if enemy is not None:
+                    patrol.sync()
+                return enemy
+        for enemy in self.enemies:
+            if x == enemy.x and y == enemy.y:
+                return enemy
+        return None
+
+    def remove_enemy(self, enemy):
+        if enemy in self.enemies:
+            self.sync_enemies()
+            self.enemies.remove(enemy)
+            self.patrol = None
+
+    def release_enemies(self):
+        """Return every enemy in the room to the pool and empty the room."""
+        for enemy in self.enemies:
+            ENEMY_POOL.release(enemy)
+        self.enemies = []
+        self.patrol = None
 
     def spawn_enemies(self, enemy_archetypes, player_level, max_enemies=2):
-        """Creates new enemies for the room."""
-        self.enemies = []
-        for _ in range(random.randint(1, max_enemies)):
-            enemy = random.choice(enemy_archetypes)
+        """Creates new enemies for the room, recycling the previous ones through the enemy pool."""
+        self.release_enemies()
+        for _ in range(self.rng.randint(1, max_enemies)):
+            enemy = self.rng.choice(enemy_archetypes)
+            hp = enemy.get("base_hp", 10) + player_level * 2
             self.enemies.append(
-                EnemyModel(
-                    name=enemy["name"],
-                    ascii=enemy.get("ascii", " _ \n( E)\n ~ \n / \\"),
-                    ascii_left=enemy.get("ascii_left", "(E )\n ~ \n / \\"),
-                    level=player_level,
-                    max_hp=enemy.get("base_hp", 10) + player_level * 2,
-                    hp=enemy.get("base_hp", 10)+ player_level * 2,
-                    attack=enemy.get("base_attack", 1) + player_level,
-                    defense=enemy.get("base_defense", 1) + player_level // 2,
-                    xp_reward=enemy.get("xp_reward", 10) * player_level // 2,
-                    gold_reward=enemy.get("gold_reward", 25) + player_level,
-                    direction=random.choice([-1, 1])  # Added direction for enemy movement
+                ENEMY_POOL.acquire(
+                    enemy["name"],
+                    enemy.get("ascii", " _ \n( E)\n ~ \n / \\"),
+                    player_level,
+                    hp,
+                    hp,
+                    enemy.get("base_attack", 1) + player_level,
+                    enemy.get("base_defense", 1) + player_level // 2,
+                    enemy.get("xp_reward", 10) * player_level // 2,
+                    enemy.get("gold_reward", 25) + player_level,
+                    self.rng.choice([-1, 1]),  # Added direction for enemy movement
+                    enemy.get("ascii_left", "(E )\n ~ \n / \\"),
                 )
             )
         self.place_enemies()  # Only place enemies, don't regenerate entire room
@@ -176,16 +489,30 @@ class Player2D:
     def __init__(self, x, y):
         self.x = float(x)  # Store as float for physics
         self.y = float(y)  # Store as float for physics
+        # Position before the last simulation step, for render interpolation
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.dx = 0.0  # Horizontal velocity (not used in tap-based model)
         self.dy = 0.0  # Vertical velocity
         self.speed = 1.0
         self.is_jumping = False
         self.direction = 1
 
+    def snap(self):
+        """Forget the previous position, so the next frame draws no in-between (doors, taps)."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def lerp(self, alpha):
+        """Position `alpha` of the way from the previous step's position to the current one."""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
 
 class Game2DPlugin:
     def __init__(self, num_rooms=3, room_width=15, room_height=8, enemy_archetypes=None, player_level=1,
-                 gravity_pull=0.20, terminal_velocity=3.0):
+                 gravity_pull=0.20, terminal_velocity=3.0, rng=None, tick_rate=TICK_RATE):
+        self.rng = rng
         self.rooms = []
         self.safe_rooms = [False] * num_rooms
         self.num_rooms = num_rooms
@@ -200,6 +527,8 @@ class Game2DPlugin:
         self.enemy_speed_divider = 7
         self.enemy_move_counter = 0
         self.ignore_combat = False
+        # Drives update() at a fixed rate from advance(), independent of the frame rate
+        self.clock = FixedClock(tick_rate)
         self._generate_rooms(num_rooms, room_width, room_height)
 
         # Player starts in the first room's designated start position
@@ -222,7 +551,8 @@ class Game2DPlugin:
                 has_door_left=has_door_left,
                 has_door_right=has_door_right,
                 has_door_up=False,
-                has_door_down=False
+                has_door_down=False,
+                rng=self.rng
             )
             room.spawn_enemies(self.enemy_archetypes, self.player_level)
             self.rooms.append(room)
@@ -231,17 +561,21 @@ class Game2DPlugin:
         """Removes all enemies from the specified room."""
         if 0 <= room_idx < self.num_rooms:
             self.safe_rooms[room_idx] = True
-            self.rooms[room_idx].enemies = []
+            self.rooms[room_idx].release_enemies()
 
     def remove_battle_enemy(self):
         """Removes the current combat enemy from the room after combat ends."""
         room = self.get_current_room()
         if self.combat_enemy in room.enemies:
-            room.enemies.remove(self.combat_enemy)
+            room.remove_enemy(self.combat_enemy)
+            ENEMY_POOL.release(self.combat_enemy)
         self.combat_enemy = None
 
     def explore(self):
         """Sets the game state back to exploring."""
+        if self.state != "exploring":
+            # Time spent in combat or a menu is not owed to the simulation
+            self.clock.reset()
         self.state = "exploring"
 
     def get_current_room(self):
@@ -256,7 +590,7 @@ class Game2DPlugin:
         # --- Handle Jumping ---
         if action == "jump":
             # Check if player is on a platform/ground before jumping
-            if (player_x_int_old, player_y_int + 1) in room.platforms:
+            if room.collision.has_ground(player_x_int_old, player_y_int):
                 self.player.dy = -self.jump_velocity  # Set upward velocity
                 self.player.is_jumping = True
                 return
@@ -274,7 +608,7 @@ class Game2DPlugin:
 
         # Check boundary and platform collision
         if 0 <= new_x_int < room.width:
-            if (new_x_int, player_y_int) not in room.platforms:
+            if not room.collision.is_solid(new_x_int, player_y_int):
                 self.player.x = new_x_float
 
         # --- Check for Room Transition (Doors) ---
@@ -286,7 +620,7 @@ class Game2DPlugin:
             if door_x_left is not None and player_x_int_for_door_check < door_x_left and self.current_room_idx > 0:
                 self.current_room_idx -= 1
                 new_room = self.get_current_room()
-                self.event_manager.emit(GameEvent(EVENT_ROOM_ENTERED, {"room_id": new_room.room_id, "index": self.current_room_idx}))
+                self.event_manager.fire(EVENT_ROOM_ENTERED, {"room_id": new_room.room_id, "index": self.current_room_idx})
                 # Set player start position in the new room at the entry door
                 self.player.x = float(new_room.width - 1)
                 self.on_player_enter_room(self.current_room_idx)
@@ -296,11 +630,14 @@ class Game2DPlugin:
             if door_x_right is not None and player_x_int_for_door_check > door_x_right and self.current_room_idx < self.num_rooms - 1:
                 self.current_room_idx += 1
                 new_room = self.get_current_room()
-                self.event_manager.emit(GameEvent(EVENT_ROOM_ENTERED, {"room_id": new_room.room_id, "index": self.current_room_idx}))
+                self.event_manager.fire(EVENT_ROOM_ENTERED, {"room_id": new_room.room_id, "index": self.current_room_idx})
                 # Set player start position in the new room at the entry door
                 self.player.x = 0.0
                 self.on_player_enter_room(self.current_room_idx)
 
+        # Taps and door transitions are instant; don't interpolate across them
+        self.player.snap()
+
     def on_player_enter_room(self, room_idx):
         """Event handler for when the player enters a new room."""
         if self.safe_rooms[room_idx]:
@@ -310,13 +647,40 @@ class Game2DPlugin:
             room = self.rooms[room_idx]
             room.spawn_enemies(self.enemy_archetypes, self.player_level)
 
+    def advance(self, now=None):
+        """
+        Per-frame entry point: runs one update() for every fixed step due on the clock since
+        the last frame (possibly none), stopping early if a step starts combat.
+        """
+        for _ in range(self.clock.tick(now)):
+            if self.state != "exploring":
+                break
+            self._step()
+        return self.get_state()
+
+    def fast_forward(self, steps):
+        """Run `steps` simulation steps immediately, e.g. for headless runs or tests."""
+        for _ in range(steps):
+            if self.state != "exploring":
+                break
+            self._step()
+        return self.get_state()
+
     def update(self, action=None):
-        """Main update loop handling movement, physics, and state transitions."""
+        """One fixed simulation step: physics, enemy patrols, and state transitions."""
+        self._step()
+        return self.get_state()
+
+    def _step(self):
+        # update() without building the state snapshot, for runs of many steps
         room = self.get_current_room()
         player_x_int = round(self.player.x)
 
         if self.state != "exploring":
-            return self.get_state()
+            return
+
+        self.player.prev_x = self.player.x
+        self.player.prev_y = self.player.y
 
         # If an action is present, the discrete movement (tap, jump) is handled by main() calling handle_input()
 
@@ -331,12 +695,8 @@ class Game2DPlugin:
         y_end = round(new_y)
 
         # 2. Check for Vertical Collision (Falling/Landing)
-        next_platform_y = -1
-        # Check all cells between current Y and new Y for platforms
-        for y_check in range(y_start + 1, min(y_end + 2, room.height)):
-            if (player_x_int, y_check) in room.platforms:
-                next_platform_y = y_check
-                break
+        # First platform in the cells between current Y and new Y, or -1
+        next_platform_y = room.collision.landing_row(player_x_int, y_start + 1, y_end + 2)
 
         if next_platform_y != -1:
             # Landed on a platform
@@ -356,32 +716,16 @@ class Game2DPlugin:
         self.enemy_move_counter = (self.enemy_move_counter + 1) % self.enemy_speed_divider
 
         if self.enemy_move_counter == 0:
-            for enemy in room.enemies:
-                if hasattr(enemy, "x") and hasattr(enemy, "y") and hasattr(enemy, "direction"):
-
-                    next_x = enemy.x + enemy.direction
-
-                    is_blocked = next_x <= 0 or next_x >= room.width - 1 or (next_x, enemy.y) in room.platforms
-                    is_dropoff = (next_x, enemy.y + 1) not in room.platforms
-
-                    if is_blocked or is_dropoff:
-                        enemy.direction *= -1
-
-                    next_x_after_check = enemy.x + enemy.direction
-                    if 0 < next_x_after_check < room.width - 1 and (next_x_after_check, enemy.y + 1) in room.platforms:
-                        enemy.x = next_x_after_check
+            room.step_enemies()
 
         # --- Combat Check ---
         if not self.ignore_combat:
-            for enemy in room.enemies:
-                # Collision detected: Player and enemy occupy the same space
-                if player_x_int == enemy.x and round(self.player.y) == enemy.y:
-                    self.state = "combat"
-                    self.combat_enemy = enemy
-                    self.event_manager.emit(GameEvent(EVENT_ENTER_COMBAT, {"enemy": enemy.to_dict()}))
-                    break
-
-        return self.get_state()
+            # Collision detected: Player and enemy occupy the same space
+            enemy = room.enemy_at(player_x_int, round(self.player.y))
+            if enemy is not None:
+                self.state = "combat"
+                self.combat_enemy = enemy
+                self.event_manager.fire(EVENT_ENTER_COMBAT, {"enemy": enemy.to_dict()})
 
     def handle_input(self, action):
         """Exposed function for user input."""
@@ -389,6 +733,7 @@ class Game2DPlugin:
 
     def get_state(self):
         room = self.get_current_room()
+        room.sync_enemies()
         return {
             "room_id": room.room_id,
             "player": {"x": round(self.player.x), "y": round(self.player.y)},
@@ -464,19 +809,136 @@ FALLBACK_MAP = [
 ]
 
 
-# Ascii rendering function
-def render_room(room, player):
+# Splitlines of enemy ascii art, keyed by the art string
+_ART_LINES = {}
+
+
+def _art_lines(art):
+    lines = _ART_LINES.get(art)
+    if lines is None:
+        lines = art.splitlines()
+        _ART_LINES[art] = lines
+    return lines
+
+
+def _enemy_art(enemy):
+    """The enemy's art lines for the way it faces (None if it has no usable art)."""
+    ascii_art = getattr(enemy, "ascii", None)
+    ascii_art_left = getattr(enemy, "ascii_left", None)
+    if hasattr(enemy, "direction") and enemy.direction < 0 and ascii_art_left:
+        ascii_art = ascii_art_left
+    if ascii_art and isinstance(ascii_art, str):
+        ascii_art = _art_lines(ascii_art)
+    if ascii_art and isinstance(ascii_art, list):
+        return ascii_art
+    return None
+
+
+def _fit(art_line, width):
+    """Center art_line in a cell `width` wide (cut to the width)."""
+    pad = max(0, width - len(art_line))
+    left_pad = pad // 2
+    return (" " * left_pad + art_line + " " * (pad - left_pad))[:width]
+
+
+class RoomRenderer:
+    """
+    Renders one Room2D with the same output as render_room_full. The static layer
+    (platforms, doors, empty space) is expanded into 4x4 glyph strings once, when the
+    room is generated. Each frame then only composites the grid rows that hold a sprite
+    (the player or an enemy) and reuses the cached lines for every other row.
+    """
+
+    def __init__(self, room):
+        self.room = room
+        self.static_rows = []
+        for row in room.grid:
+            glyphs = [CHAR_MAP.get(ch, FALLBACK_MAP) for ch in row]
+            self.static_rows.append(["".join(_fit(g[i], 4) for g in glyphs) for i in range(4)])
+
+    def render(self, player, alpha=None):
+        return "\n".join(self.lines(player, alpha))
+
+    def lines(self, player, alpha=None):
+        """The frame as a list of terminal lines."""
+        room = self.room
+        if hasattr(room, "sync_enemies"):
+            room.sync_enemies()
+        px, py = player.lerp(alpha) if alpha is not None else (player.x, player.y)
+        player_pos = (round(px), round(py))
+
+        # Sprites by grid row: {y: {x: art}} for enemies, later enemies on a cell win
+        enemy_rows = {}
+        for enemy in room.enemies:
+            x, y = round(enemy.x), round(enemy.y)
+            if 0 <= y < room.height and 0 <= x < room.width:
+                enemy_rows.setdefault(y, {})[x] = _enemy_art(enemy) or CHAR_MAP.get("E", FALLBACK_MAP)
+
+        out = []
+        for y in range(room.height):
+            if y == player_pos[1] or y in enemy_rows:
+                out.extend(self._composite_row(y, player, player_pos, enemy_rows.get(y, {})))
+            else:
+                out.extend(self.static_rows[y])
+        return out
+
+    def _composite_row(self, y, player, player_pos, enemies):
+        grid_row = self.room.grid[y]
+        widths = {x: max(4, max(len(line) for line in art)) if art else 4 for x, art in enemies.items()}
+        height = max([4] + [len(art) for art in enemies.values()])
+        player_map = CHAR_MAP.get("@L" if player.direction < 0 else "@", FALLBACK_MAP)
+        lines = []
+        for i in range(height):
+            parts = []
+            for x in range(len(grid_row)):
+                width = widths.get(x, 4)
+                if (x, y) == player_pos:
+                    parts.append(_fit(player_map[i] if i < len(player_map) else " " * 4, width))
+                    continue
+                art = enemies.get(x)
+                if art is None:
+                    art = CHAR_MAP.get(grid_row[x], FALLBACK_MAP)
+                # Everything but the player is aligned to the bottom of the row
+                index = i - (height - len(art))
+                parts.append(_fit(art[index], width) if 0 <= index < len(art) else " " * width)
+            lines.append("".join(parts))
+        return lines
+
+
+def room_renderer(room):
+    """The room's cached RoomRenderer, built on first use if the room has none."""
+    renderer = getattr(room, "renderer", None)
+    if renderer is None or renderer.room is not room:
+        renderer = RoomRenderer(room)
+        room.renderer = renderer
+    return renderer
+
+
+def render_room(room, player, alpha=None):
     """
     Render the room as high-resolution ASCII art using 4x4 blocks per grid cell.
     Enemies are rendered using their own ascii art, centered horizontally
-    and aligned to the bottom (floor) of their cell.
+    and aligned to the bottom (floor) of their cell. With `alpha` (FixedClock.alpha)
+    the player is drawn between its last two simulated positions. Uses the room's
+    cached static layer (see RoomRenderer).
+    """
+    return room_renderer(room).render(player, alpha)
+
+
+def render_room_full(room, player, alpha=None):
+    """
+    render_room without any caching: re-expands every cell each call. Kept as the
+    reference the cached renderer is checked and benchmarked against.
     """
     # 1. Create the base grid
     display_grid = [row[:] for row in room.grid]
+    if hasattr(room, "sync_enemies"):
+        room.sync_enemies()
 
     # Use rounded position for display
-    player_x = round(player.x)
-    player_y = round(player.y)
+    px, py = player.lerp(alpha) if alpha is not None else (player.x, player.y)
+    player_x = round(px)
+    player_y = round(py)
     player_pos = (player_x, player_y)
 
     # 2. Build a map of enemy positions, their ascii art, AND required cell width
@@ -623,14 +1085,22 @@ def render_room(room, player):
 
     return "\n".join(rendered_output)
 
-    return "\n".join(rendered_output)
+def details_lines(room, player, state):
+    return [
+        "-" * (room.width * 4),  # Separator line based on the rendered width
+        f"Room: {room.room_id} | Player @ ({player.x}, {player.y}) | State: {state}",
+    ]
+
 
 def print_details(room, player, state):
-    print("-" * (room.width * 4))  # Separator line based on the rendered width
-    print(f"Room: {room.room_id} | Player @ ({player.x}, {player.y}) | State: {state}")
+    print("\n".join(details_lines(room, player, state)))
 
 
 def print_minimap(plugin):
+    print(minimap_line(plugin))
+
+
+def minimap_line(plugin):
     """
     Renders a simple linear minimap of the rooms.
     """
@@ -646,12 +1116,13 @@ def print_minimap(plugin):
         else:
             map_parts.append("[ ]")
 
-    print(" " * padding + "Minimap: " + "".join(map_parts))
+    return " " * padding + "Minimap: " + "".join(map_parts)
 
 # --- Main function using tty/termios for non-blocking input ---
 def main():
     import os
     from terminal_input_handler import TerminalInputHandler
+    from screen_buffer import ScreenBuffer
     terminal_input = TerminalInputHandler()
 
     # 1. Initialize the game
@@ -661,6 +1132,7 @@ def main():
 
     print("--- 2D Platformer Game (Terminal Raw Mode) ---")
     terminal_input.print_controls()
+    screen = ScreenBuffer()
 
     try:
         while plugin.state not in ("game_over", "win"):
@@ -671,8 +1143,8 @@ def main():
             if action == 'quit':
                 break
 
-            # 2. Update Game State (Applies physics/gravity)
-            plugin.update()
+            # 2. Update Game State (Applies physics/gravity at the fixed tick rate)
+            plugin.advance()
 
             if plugin.state == "combat":
                 plugin.state = "exploring"
@@ -682,14 +1154,13 @@ def main():
                 # In tap-based input, we handle the movement directly here.
                 plugin.handle_input(action)
 
-            # 4. Render
-            os.system(clear_command)
+            # 4. Render: rewrite only the terminal lines that changed since the last frame
             current_state_data = plugin.get_state()
             current_room = plugin.get_current_room()
-
-            print(render_room(current_room, plugin.player))
-            print_details(current_room, plugin.player, current_state_data["state"])
-            print_minimap(plugin)
+            lines = room_renderer(current_room).lines(plugin.player, plugin.clock.alpha)
+            lines += details_lines(current_room, plugin.player, current_state_data["state"])
+            lines.append(minimap_line(plugin))
+            screen.render(lines)
 
             # 5. Control Frame Rate
             time.sleep(0.05)
@@ -0,0 +1,168 @@
+import math
+import time
+from collections import deque
+from typing import Dict, List
+
+# Percentiles shown by the HUD and reported by snapshot()
+PERCENTILES = (50, 95, 99)
+
+
+class Series:
+    """
+    One metric: a rolling window of its last `window` samples, for percentiles, plus
+    lifetime count, sum and max.
+    """
+
+    __slots__ = ("samples", "count", "total", "max")
+
+    def __init__(self, window: int = 120):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def last(self) -> float:
+        return self.samples[-1] if self.samples else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of the window, 0 when empty."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = min(len(ordered), max(1, math.ceil(p / 100.0 * len(ordered)))) - 1
+        return ordered[rank]
+
+    def summary(self) -> dict:
+        data = {"count": self.count, "last": self.last, "mean": self.total / self.count if self.count else 0.0,
+                "max": self.max}
+        for p in PERCENTILES:
+            data[f"p{p}"] = self.percentile(p)
+        return data
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics: "Metrics", name: str):
+        self.metrics = metrics
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = self.metrics.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.add(self.name, (self.metrics.clock() - self.start) * 1000.0)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    Frame metrics for the front ends. Code being measured adds to the current frame
+    (add(), or `with metrics.timer(name)` for milliseconds); end_frame() turns the frame's
+    totals into one sample per metric, so an event dispatched three times in a frame counts
+    once, summed, and a frame without any counts as 0. observe() records a sample directly,
+    for things that are not per frame (a request, a save). Nothing is measured while
+    `enabled` is False: timer() hands out a shared no-op and add()/end_frame() return at once.
+    """
+
+    def __init__(self, window: int = 120, clock=time.perf_counter):
+        self.enabled = False
+        self.window = window
+        self.clock = clock
+        self.series: Dict[str, Series] = {}
+        self.pending: Dict[str, float] = {}
+        self.per_frame = set()  # names fed through add()
+        self.frames = 0
+
+    def observe(self, name: str, value: float) -> None:
+        series = self.series.get(name)
+        if series is None:
+            series = self.series[name] = Series(self.window)
+        series.add(value)
+
+    def add(self, name: str, value: float) -> None:
+        if self.enabled:
+            self.pending[name] = self.pending.get(name, 0.0) + value
+            self.per_frame.add(name)
+
+    def timer(self, name: str):
+        """Context manager adding the elapsed milliseconds to `name` for this frame."""
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def end_frame(self) -> None:
+        if not self.enabled:
+            return
+        for name in self.per_frame:
+            self.observe(name, self.pending.get(name, 0.0))
+        self.pending.clear()
+        self.frames += 1
+
+    def instrument(self, event_manager, name: str = "dispatch") -> None:
+        """Time every emit() of `event_manager` (all its listeners) under `name`."""
+        emit = event_manager.emit
+
+        def timed_emit(event):
+            if not self.enabled:
+                return emit(event)
+            start = self.clock()
+            try:
+                return emit(event)
+            finally:
+                self.add(name, (self.clock() - start) * 1000.0)
+
+        event_manager.emit = timed_emit
+
+    def snapshot(self) -> dict:
+        """Summaries of every metric, JSON-ready (for the web servers)."""
+        return {name: series.summary() for name, series in self.series.items()}
+
+    def reset(self) -> None:
+        self.series.clear()
+        self.pending.clear()
+        self.per_frame.clear()
+        self.frames = 0
+
+
+def hud_lines(metrics: Metrics, names=("frame", "update", "dispatch", "render", "bytes"),
+              hotkey: str = "") -> List[str]:
+    """The profiling HUD: one line per metric with its last value and rolling percentiles."""
+    title = f" HUD | {metrics.frames} frames | last {metrics.window}"
+    lines = [title + (f" | {hotkey} to hide" if hotkey else "")]
+    for name in names:
+        series = metrics.series.get(name)
+        if series is None:
+            lines.append(f" {name:<9} -")
+            continue
+        unit, fmt = ("B ", "{:7.0f}") if name == "bytes" else ("ms", "{:7.2f}")
+        cells = [fmt.format(series.last) + unit]
+        cells += [f"p{p} " + fmt.format(series.percentile(p)) for p in PERCENTILES]
+        cells.append("max " + fmt.format(series.max))
+        lines.append(f" {name:<9}" + "  ".join(cells))
+    return lines
+
+
+# Shared by the terminal front ends and the web servers
+METRICS = Metrics()
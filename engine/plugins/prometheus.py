@@ -0,0 +1,261 @@
+import threading
+import weakref
+from typing import Callable, Dict, Tuple
+
+from .metrics import Metrics
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Latency buckets in seconds, and size buckets in bytes
+SECONDS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.lock = threading.Lock()
+
+    def header(self) -> list:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """A monotonically increasing count per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, help, labels)
+        self.values: Dict[tuple, float] = {}
+
+    def inc(self, *label_values, amount: float = 1.0) -> None:
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0.0) + amount
+
+    def get(self, *label_values) -> float:
+        return self.values.get(label_values, 0.0)
+
+    def lines(self) -> list:
+        with self.lock:
+            items = sorted(self.values.items())
+        return [f"{self.name}{_labels(self.labels, key)} {_number(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """
+    A value that goes up and down. With `fn` it is read at scrape time instead: a number,
+    or for a labelled gauge a {label values tuple: number} dict.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (), fn: Callable = None):
+        super().__init__(name, help, labels)
+        self.values: Dict[tuple, float] = {}
+        self.fn = fn
+
+    def set(self, value: float, *label_values) -> None:
+        with self.lock:
+            self.values[label_values] = value
+
+    def read(self) -> Dict[tuple, float]:
+        if self.fn is None:
+            with self.lock:
+                return dict(self.values)
+        value = self.fn()
+        return value if isinstance(value, dict) else {(): value}
+
+    def lines(self) -> list:
+        return [f"{self.name}{_labels(self.labels, key)} {_number(value)}"
+                for key, value in sorted(self.read().items())]
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label combination."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (), buckets: tuple = SECONDS_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+        self.values: Dict[tuple, list] = {}  # label values -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value: float, *label_values) -> None:
+        with self.lock:
+            data = self.values.get(label_values)
+            if data is None:
+                data = self.values[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[i] += 1
+                    break
+            else:
+                data[len(self.buckets)] += 1
+            data[-1] += value
+
+    def count(self, *label_values) -> int:
+        data = self.values.get(label_values)
+        return sum(data[:-1]) if data else 0
+
+    def lines(self) -> list:
+        with self.lock:
+            items = sorted((key, list(data)) for key, data in self.values.items())
+        out = []
+        for key, data in items:
+            seen = 0
+            for bound, n in zip(self.buckets + (float("inf"),), data[:-1]):
+                seen += n
+                le = 'le="' + _number(bound) + '"'
+                out.append(f"{self.name}_bucket{_labels(self.labels, key, le)} {seen}")
+            out.append(f"{self.name}_sum{_labels(self.labels, key)} {_number(data[-1])}")
+            out.append(f"{self.name}_count{_labels(self.labels, key)} {seen}")
+        return out
+
+
+class Registry:
+    """The metrics one /metrics endpoint exposes."""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labels: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Tuple[str, ...] = (), fn: Callable = None) -> Gauge:
+        return self.register(Gauge(name, help, labels, fn))
+
+    def histogram(self, name: str, help: str, labels: Tuple[str, ...] = (),
+                  buckets: tuple = SECONDS_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labels, buckets))
+
+    def expose(self) -> str:
+        """Every metric in the Prometheus text format."""
+        lines = []
+        for metric in self.metrics:
+            lines += metric.header()
+            lines += metric.lines()
+        return "\n".join(lines) + "\n"
+
+
+class ServerMetrics:
+    """
+    The game servers' metrics (web.py, react.py). Games are counted through the engine:
+    watch(game) wraps the instance's execute_action (actions by resolved id, batches
+    included) and its EventManager.fire (events by type). Routes report latency and status
+    through request(); saves and loads report size and time through saved()/loaded(); queue
+    depths are read at scrape time. With `engine` (a Metrics, normally METRICS) each watched
+    action is one engine frame, "update" plus "dispatch" when someone listens, and
+    engine.snapshot() is served as oakheart_engine{metric, stat}. Frames are only timed
+    while `engine.enabled`.
+
+    Events are counted without subscribing a listener, so EventManager.active stays False
+    for a session nobody streams and the move, rest and combat paths keep skipping their
+    payloads. The price is that the events those paths skip are not counted either: until
+    an SSE stream subscribes, oakheart_events_total only sees events fired unconditionally.
+    """
+
+    def __init__(self, sessions: dict, registry: Registry = None, engine: Metrics = None):
+        self.registry = registry if registry is not None else Registry()
+        self.engine = engine
+        r = self.registry
+        self.actions = r.counter("oakheart_actions_total", "Game actions executed, by action id.", ("action",))
+        self.events = r.counter("oakheart_events_total", "Game events fired, by type.", ("type",))
+        self.requests = r.counter("oakheart_http_requests_total", "HTTP requests, by route and status.",
+                                  ("route", "status"))
+        self.latency = r.histogram("oakheart_http_request_duration_seconds", "HTTP request latency, by route.",
+                                   ("route",))
+        r.gauge("oakheart_active_sessions", "Games in the session store.", fn=lambda: len(sessions))
+        self.queues: Dict[str, Callable[[], int]] = {}
+        r.gauge("oakheart_queue_depth", "Items waiting in event and save queues.", ("queue",),
+                fn=lambda: {(name,): depth() for name, depth in self.queues.items()})
+        self.save_bytes = r.histogram("oakheart_save_bytes", "Size of saved games, by kind.", ("kind",),
+                                      BYTES_BUCKETS)
+        self.save_seconds = r.histogram("oakheart_save_duration_seconds", "Time to save a game, by kind.",
+                                        ("kind",))
+        self.load_bytes = r.histogram("oakheart_load_bytes", "Size of loaded games, by kind.", ("kind",),
+                                      BYTES_BUCKETS)
+        self.load_seconds = r.histogram("oakheart_load_duration_seconds", "Time to load a game, by kind.",
+                                        ("kind",))
+        if engine is not None:
+            r.gauge("oakheart_engine", "Engine metrics (milliseconds, or bytes for \"bytes\"), by statistic.",
+                    ("metric", "stat"),
+                    fn=lambda: {(name, stat): value for name, summary in engine.snapshot().items()
+                                for stat, value in summary.items()})
+        self._watched = weakref.WeakSet()
+
+    def watch(self, game) -> None:
+        """Count game's actions and events; calling it again for the same game does nothing."""
+        if game in self._watched:
+            return
+        self._watched.add(game)
+        events = game.event_manager
+        fire = events.fire
+        execute_action = game.execute_action
+        actions = self.actions
+        engine = self.engine
+
+        def counted_fire(event_type: str, payload: dict = None) -> None:
+            self.events.inc(event_type)
+            fire(event_type, payload)
+
+        def counted(action_id_or_key: str) -> str:
+            aid = game.actions.resolve(action_id_or_key)
+            if engine is None or not engine.enabled:
+                out = execute_action(action_id_or_key)
+            else:
+                with engine.timer("update"):
+                    out = execute_action(action_id_or_key)
+                engine.end_frame()
+            actions.inc(aid if aid is not None else "unknown")
+            return out
+
+        events.fire = counted_fire
+        if engine is not None:
+            engine.instrument(events)
+        game.execute_action = counted
+
+    def watch_autosaver(self, autosaver) -> None:
+        """Report the AutoSaver's background writes and its queue of pending saves."""
+        autosaver.on_write = lambda path, size, seconds: self.saved("file", size, seconds)
+        self.queues["autosave"] = lambda: autosaver.queued
+
+    def request(self, route: str, status, seconds: float) -> None:
+        self.requests.inc(route, str(status))
+        self.latency.observe(seconds, route)
+
+    def saved(self, kind: str, size: int, seconds: float) -> None:
+        self.save_bytes.observe(size, kind)
+        self.save_seconds.observe(seconds, kind)
+
+    def loaded(self, kind: str, size: int, seconds: float) -> None:
+        self.load_bytes.observe(size, kind)
+        self.load_seconds.observe(seconds, kind)
+
+    def expose(self) -> str:
+        return self.registry.expose()
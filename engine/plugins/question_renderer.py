@@ -1,6 +1,8 @@
 import random
 from typing import List, Any
 
+from engine.plugins.sprite_atlas import SpriteAtlas, ATLAS
+
 # --- Configuration Constants (Copied from main renderer for consistency) ---
 DEFAULT_WIDTH = 30
 
@@ -38,19 +40,26 @@ class ASCIIQuestionRenderer:
     A renderer dedicated to generating the ASCII art header for player prompts.
     This art is intended to be displayed immediately before the question text.
     """
-    def __init__(self, question_type: str = "weapon_find", width: int = DEFAULT_WIDTH):
+    def __init__(self, question_type: str = "weapon_find", width: int = DEFAULT_WIDTH, atlas: SpriteAtlas = ATLAS):
         self.question_type = question_type
         self.width = width
+        # The finished art for each weapon is built once per (weapon, width) and reused
+        self.atlas = atlas
 
     def _draw_question_art(self) -> List[str]:
         """Renders random ASCII art for the question screen."""
+        # 1. Pick a random weapon for the left side
+        index = random.randrange(len(QUESTION_WEAPONS))
+        return list(self.atlas.frame(("question", self.question_type, index), self.width, "",
+                                     lambda: self._build_question_art(QUESTION_WEAPONS[index])))
+
+    def _build_question_art(self, weapon: List[str]) -> List[str]:
         lines: List[str] = ['=' * self.width]
 
         # QUESTION_BOX_HEIGHT lines of space or art elements
         art_lines = [' ' * self.width] * QUESTION_BOX_HEIGHT
 
-        # 1. Place a random weapon on the left
-        weapon = random.choice(QUESTION_WEAPONS)
+        # 1. Place the weapon on the left
         w_start = 2 # Start column for weapon
         w_line_start = 1 # Start line for weapon
 
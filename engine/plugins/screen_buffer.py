@@ -0,0 +1,133 @@
+import re
+import shutil
+import sys
+
+CLEAR = "\033[2J\033[H"  # clear + home
+ESC = "\033"
+# Rows kept free under the frame: the parked cursor, main.py's input("\n> ") prompt and
+# the line Enter moves to. A taller frame scrolls once the player answers.
+PROMPT_ROWS = 3
+_ANSI = re.compile(ESC + r"\[[0-9;?]*[A-Za-z]")
+
+
+def _move(row, col):
+    return f"{ESC}[{row + 1};{col + 1}H"
+
+
+def _too_wide(lines, columns, previous=()):
+    """
+    Whether any line is wider than the terminal once its color codes are stripped. Lines
+    equal to the same row of `previous`, a frame that fit, are not measured again.
+    """
+    for row, line in enumerate(lines):
+        if len(line) > columns and (row >= len(previous) or line != previous[row]) \
+                and len(_ANSI.sub("", line)) > columns:
+            return True
+    return False
+
+
+def _changed_span(old, new):
+    """
+    (start, end) of the part of `new` that differs from `old`, or None if they are equal.
+    Text past `end` is already on screen; a shorter `new` also needs the old tail erased.
+    """
+    if old == new:
+        return None
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end = len(new)
+    if len(old) == len(new):
+        while end > start and old[end - 1] == new[end - 1]:
+            end -= 1
+    return start, end
+
+
+class ScreenBuffer:
+    """
+    Double-buffered terminal output. Keeps the last frame it drew and, for the next one,
+    writes only what changed: a cursor move plus the changed span of each plain line, the
+    whole line for lines holding ANSI color codes (cutting those mid-sequence would break
+    the colors), and an erase for lines that got shorter or went away. Falls back to a
+    full clear + redraw for the first frame, after invalidate(), and whenever the frame
+    does not fit the terminal: a line wider than it wraps onto the next row, and a frame
+    taller than it (less PROMPT_ROWS) scrolls, and either moves every row after it.
+
+    After each frame the cursor is parked on the line below it, so input() prompts and
+    other prints land where they always did; call invalidate() (or clear()) after printing
+    anything that may have scrolled the screen.
+
+    `overlay`, when set, is called on every frame and its lines are drawn under the frame
+    (the profiling HUD).
+    """
+
+    def __init__(self, out=None, size_fn=shutil.get_terminal_size):
+        self.out = out
+        self.size_fn = size_fn
+        self.lines = None  # what is on screen, None when unknown
+        self.size = None
+        self.frames = 0
+        self.bytes_written = 0
+        self.last_bytes = 0
+        self.overlay = None
+
+    def invalidate(self):
+        """Forget what is on screen; the next frame is drawn in full."""
+        self.lines = None
+
+    def clear(self):
+        """Clear the terminal now, for callers that print their own text afterwards."""
+        self._write(CLEAR)
+        self.invalidate()
+
+    def diff(self, lines):
+        """The escape sequence that turns the previous frame into `lines`."""
+        size = self.size_fn() if self.size_fn is not None else None
+        previous = self.lines
+        checked = previous if previous is not None and size == self.size else ()
+        fits = size is None or (len(lines) + PROMPT_ROWS <= size[1] and not _too_wide(lines, size[0], checked))
+        if previous is None or size != self.size or not fits:
+            # A frame that did not fit left the rows shifted, so the next one is drawn in full too
+            self.size = size if fits else None
+            return CLEAR + "\n".join(lines) + "\n"
+        parts = []
+        for row, line in enumerate(lines):
+            old = previous[row] if row < len(previous) else ""
+            if ESC in line or ESC in old:
+                if line != old:
+                    parts.append(_move(row, 0) + line + f"{ESC}[K")
+                continue
+            span = _changed_span(old, line)
+            if span is None:
+                continue
+            start, end = span
+            parts.append(_move(row, start) + line[start:end])
+            if len(line) < len(old):
+                parts.append(f"{ESC}[K")
+        # Park below the frame and erase anything left there (old rows, echoed input)
+        parts.append(_move(len(lines), 0) + f"{ESC}[J")
+        return "".join(parts)
+
+    def render(self, frame):
+        """Draw `frame` (a string or a list of lines), writing only what changed."""
+        lines = frame.split("\n") if isinstance(frame, str) else list(frame)
+        if self.overlay is not None:
+            lines += self.overlay()
+        data = self.diff(lines)
+        self.lines = lines
+        self.frames += 1
+        self._write(data)
+        return data
+
+    def _write(self, data):
+        out = self.out if self.out is not None else sys.stdout
+        out.write(data)
+        out.flush()
+        size = len(data.encode("utf-8"))
+        self.last_bytes = size
+        self.bytes_written += size
+
+
+# Shared by the terminal front ends (main.py, main_event_ui.py, the 2D loop)
+SCREEN = ScreenBuffer()
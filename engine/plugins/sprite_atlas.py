@@ -0,0 +1,38 @@
+from typing import Callable, Dict, Tuple
+
+
+class SpriteAtlas:
+    """
+    Prebuilt frames for the terminal renderers. A frame is a tuple of rows already padded
+    and width-normalized for one (sprite, width, color) key, built once by the renderer
+    that owns the sprite and reused on every later frame, so drawing is just picking rows
+    and concatenating them. Sprites are keyed by their content (e.g. the ascii string),
+    which keeps every enemy facing, every HP bar fill and every question layout distinct.
+    """
+
+    def __init__(self):
+        self.frames: Dict[tuple, tuple] = {}
+        self.builds = 0
+
+    def frame(self, sprite, width: int, color: str, build: Callable[..., tuple], *args) -> tuple:
+        """The frame for (sprite, width, color), calling build(*args) only the first time."""
+        key = (sprite, width, color)
+        rows = self.frames.get(key)
+        if rows is None:
+            rows = tuple(build(*args))
+            self.frames[key] = rows
+            self.builds += 1
+        return rows
+
+    def __contains__(self, key: Tuple) -> bool:
+        return key in self.frames
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def clear(self) -> None:
+        self.frames.clear()
+
+
+# Shared by the combat and question renderers
+ATLAS = SpriteAtlas()
@@ -22,6 +22,8 @@ class TerminalInputHandler:
     def __init__(self):
         self.controls = default_controls
         self.control_modifiers = set()
+        # Keys that work under any controls (e.g. the profiling HUD toggle)
+        self.hotkeys = {}
         import termios
         import sys
         self.ORIGINAL_TERMIOS_SETTINGS = termios.tcgetattr(sys.stdin)
@@ -89,6 +91,9 @@ class TerminalInputHandler:
                 if key in modifier.mapping:
                     action = modifier.mapping[key]
 
+            if key in self.hotkeys:
+                action = self.hotkeys[key]
+
         return action
 
     def add_modifier(self, controls: Controls):
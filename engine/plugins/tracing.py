@@ -0,0 +1,256 @@
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+from typing import Dict
+
+
+def default_hot_paths() -> list:
+    """
+    (owner, attribute, span name) for every hot path Tracer.enable() wraps: actions, moves,
+    combat steps, world generation, (de)serialization and the renderers.
+    """
+    from engine.game.game import Game
+    from engine.game.world import World
+    from engine.plugins.combat_renderer_2d import ASCIICombatRenderer
+    from engine.plugins.game2d import RoomRenderer
+    from engine.plugins.question_renderer import ASCIIQuestionRenderer
+    from engine.plugins.screen_buffer import ScreenBuffer
+    return [
+        (Game, "execute_action", "game.execute_action"),
+        (Game, "_move", "game.move"),
+        (Game, "_rest", "game.rest"),
+        (Game, "_enter_combat", "combat.enter"),
+        (Game, "_combat_step", "combat.step"),
+        (Game, "_combat_result", "combat.result"),
+        (Game, "_end_combat", "combat.end"),
+        (Game, "to_dict", "game.to_dict"),
+        (Game, "from_dict", "game.from_dict"),
+        (World, "generate_random", "world.generate_random"),
+        (World, "to_dict", "world.to_dict"),
+        (World, "from_dict", "world.from_dict"),
+        (Game, "look", "render.look"),
+        (RoomRenderer, "lines", "render.room_2d"),
+        (ASCIICombatRenderer, "combat_fn", "render.combat"),
+        (ASCIIQuestionRenderer, "question_fn", "render.question"),
+        (ScreenBuffer, "render", "render.screen"),
+    ]
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = self.tracer.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.start, self.tracer.clock() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Spans around the engine's hot paths, sent to a pluggable sink. enable() wraps the
+    methods listed by default_hot_paths() in place and disable() puts the originals back,
+    so a disabled tracer costs nothing at all, and engine/game itself (which Transcrypt
+    compiles to JavaScript) carries no tracing code. span(name) times any other block.
+
+    A sink has record(name, start, duration), in seconds since enable(), and close().
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.sink = None
+        self.epoch = 0.0
+        self._patched = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.sink is not None
+
+    def enable(self, sink, hot_paths: list = None) -> None:
+        self.disable()
+        self.sink = sink
+        self.epoch = self.clock()
+        for (owner, attr, name) in (default_hot_paths() if hot_paths is None else hot_paths):
+            original = owner.__dict__[attr]
+            self._patched.append((owner, attr, original))
+            setattr(owner, attr, self._wrap(original, name))
+
+    def disable(self) -> None:
+        """Restore the original methods and close the sink."""
+        for (owner, attr, original) in reversed(self._patched):
+            setattr(owner, attr, original)
+        self._patched.clear()
+        sink, self.sink = self.sink, None
+        if sink is not None:
+            sink.close()
+
+    def span(self, name: str):
+        """Context manager recording the block as a span; a shared no-op when disabled."""
+        return _Span(self, name) if self.sink is not None else _NULL_SPAN
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        sink = self.sink
+        if sink is not None:
+            sink.record(name, start - self.epoch, duration)
+
+    def _wrap(self, original, name: str):
+        if isinstance(original, staticmethod):
+            return staticmethod(self._traced(original.__func__, name))
+        if isinstance(original, classmethod):
+            return classmethod(self._traced(original.__func__, name))
+        return self._traced(original, name)
+
+    def _traced(self, fn, name: str):
+        clock = self.clock
+        record = self.record
+
+        @functools.wraps(fn)
+        def traced(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, start, clock() - start)
+
+        return traced
+
+
+# Span duration buckets in microseconds (upper bounds); the last bucket is open ended
+BUCKETS_US = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, 1000000)
+
+
+class Histogram:
+    """Span durations bucketed by BUCKETS_US, with exact count, total and max."""
+
+    __slots__ = ("counts", "count", "total_us", "max_us")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_US) + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def add(self, us: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_US, us)] += 1
+        self.count += 1
+        self.total_us += us
+        if us > self.max_us:
+            self.max_us = us
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (max for the open bucket)."""
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(self.max_us, BUCKETS_US[i]) if i < len(BUCKETS_US) else self.max_us
+        return self.max_us
+
+
+class HistogramSink:
+    """Keeps a Histogram per span name in memory; summary() and report() read it back."""
+
+    def __init__(self):
+        self.spans: Dict[str, Histogram] = {}
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        histogram = self.spans.get(name)
+        if histogram is None:
+            histogram = self.spans[name] = Histogram()
+        histogram.add(duration * 1e6)
+
+    def close(self) -> None:
+        pass
+
+    def summary(self) -> dict:
+        return {name: {"count": h.count, "total_ms": h.total_us / 1000.0, "mean_us": h.total_us / h.count,
+                       "p50_us": h.percentile(50), "p95_us": h.percentile(95), "p99_us": h.percentile(99),
+                       "max_us": h.max_us}
+                for name, h in self.spans.items()}
+
+    def report(self) -> str:
+        """A table of the spans, most total time first."""
+        lines = [f"{'span':<22} {'count':>8} {'total ms':>10} {'mean us':>9} {'p50 us':>8} "
+                 f"{'p95 us':>8} {'p99 us':>8} {'max us':>9}"]
+        rows = sorted(self.summary().items(), key=lambda item: -item[1]["total_ms"])
+        for name, s in rows:
+            lines.append(f"{name:<22} {s['count']:>8} {s['total_ms']:>10.1f} {s['mean_us']:>9.1f} "
+                         f"{s['p50_us']:>8.0f} {s['p95_us']:>8.0f} {s['p99_us']:>8.0f} {s['max_us']:>9.1f}")
+        return "\n".join(lines)
+
+
+class JsonLinesSink:
+    """One JSON object per span: {"name", "start_us", "dur_us"}."""
+
+    def __init__(self, path: str):
+        self.file = open(path, "w", encoding="utf-8")
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        self.file.write(json.dumps({"name": name, "start_us": round(start * 1e6, 3),
+                                    "dur_us": round(duration * 1e6, 3)}) + "\n")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ChromeTraceSink:
+    """
+    Chrome trace-event JSON (array format, "X" complete events), streamed as spans end.
+    Load it in chrome://tracing, Perfetto or speedscope for a flame graph; nesting comes
+    from the timestamps.
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, "w", encoding="utf-8")
+        self.file.write("[")
+        self.events = 0
+        self.pid = os.getpid()
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        event = {"name": name, "cat": name.split(".", 1)[0], "ph": "X", "ts": round(start * 1e6, 3),
+                 "dur": round(duration * 1e6, 3), "pid": self.pid, "tid": threading.get_ident()}
+        self.file.write(("," if self.events else "") + "\n" + json.dumps(event))
+        self.events += 1
+
+    def close(self) -> None:
+        self.file.write("\n]\n")
+        self.file.close()
+
+
+def sink_for(spec: str):
+    """"hist" for a HistogramSink, a .jsonl path for JSON lines, any other path for a Chrome trace."""
+    if spec == "hist":
+        return HistogramSink()
+    if spec.endswith(".jsonl"):
+        return JsonLinesSink(spec)
+    return ChromeTraceSink(spec)
+
+
+# Shared tracer for the front ends and tools
+TRACER = Tracer()
@@ -12,20 +12,23 @@ from typing import List
 
 from engine.game import Game
 from json_loader import JsonLoader
-from persistence import load_game, save_game, SAVE_FILE
+from persistence import AutoSaver, SAVE_FILE
 from text_loader import TextLoader
+from engine.plugins.screen_buffer import SCREEN
+
+
+AUTOSAVER = AutoSaver()
 
 
 def clear_screen() -> None:
     """Clear the terminal screen using ANSI escape codes (cross-platform in most modern terminals)."""
-    # ANSI clear + move cursor home
-    print("\033[2J\033[H", end="")
+    # ANSI clear + move cursor home; the next ui_render redraws in full
+    SCREEN.clear()
 
 
 def ui_render(text: str) -> None:
-    """Clear the screen and render the provided text."""
-    clear_screen()
-    print(text)
+    """Render the provided text, writing only what changed since the last frame."""
+    SCREEN.render(text)
 
 
 def banner() -> str:
@@ -77,6 +80,8 @@ def game_loop(game: Game) -> None:
 
             # First, try the decoupled actions API so any interface can drive the game
             acted = game.execute_action(cmd)
+            if acted is not None:
+                AUTOSAVER.maybe_save(game)
             if game.ended:
                 break  # exit to outer loop on game end
             if acted is not None:
@@ -99,7 +104,8 @@ def game_loop(game: Game) -> None:
                 return
 
             if choice in ("l", "load"):
-                loaded = Game.from_dict(load_game(SAVE_FILE))
+                data = AUTOSAVER.load(SAVE_FILE)
+                loaded = Game.from_dict(data) if data else None
                 if loaded:
                     game.copy_from(loaded)
                     break  # resume outer loop with loaded game
@@ -128,7 +134,7 @@ def main(argv: List[str]) -> int:
         print("Goodbye.")
         return 0
     if choice == "load":
-        loaded = load_game(SAVE_FILE)
+        loaded = AUTOSAVER.load(SAVE_FILE)
         if not loaded:
             print("No save found or save file invalid.")
             return 1
@@ -144,8 +150,8 @@ def run_game(game: Game) -> int:
     game.ascii_loader = TextLoader("data/rooms")
     game.load_configurations("data/enemies.json")
     game.save_file = SAVE_FILE
-    game.save_fn = save_game
-    game.load_fn = load_game
+    game.save_fn = AUTOSAVER.save
+    game.load_fn = AUTOSAVER.load
     game_loop(game)
     return 0
 
@@ -12,8 +12,9 @@ from asciimatics.exceptions import ResizeScreenError
 
 from engine.game import Game
 from engine.game.event import GameEvent
+from engine.plugins.metrics import METRICS
 from json_loader import JsonLoader
-from persistence import load_game, save_game, SAVE_FILE
+from persistence import load_game, AutoSaver, SAVE_FILE
 from text_loader import TextLoader
 from asciimatics_renderers.game_view import GameView
 
@@ -106,10 +107,12 @@ def main_loop(screen: Screen, game: Game) -> None:
     game.ascii_tiles = False
     game.load_configurations("data/enemies.json")
     game.save_file = SAVE_FILE
-    game.save_fn = save_game
-    game.load_fn = load_game
+    autosaver = AutoSaver()
+    game.save_fn = autosaver.save
+    game.load_fn = autosaver.load
     # Subscribe to events, handling combat/messages in the UI layer
     game.event_manager.subscribe(on_event)
+    METRICS.instrument(game.event_manager)
 
     # Start the asciimatics rendering loop
     last_scene = None
@@ -9,27 +9,37 @@ Run: python3 main.py
 
 import sys
 import time
+from types import SimpleNamespace
 from typing import List
 
-from animated_combat_start import show_combat_start_event
-from animated_rest import show_rest_event
-from animated_screens import show_battle_result, wait_keypress
+from animated_combat_start import combat_start_timeline
+from animated_rest import rest_event_timeline
+from animated_screens import battle_result_timeline, keypress_prompt
 from engine.game import Game
 from engine.game.enemy import Enemy
 from engine.game.ascii_renderer import render_room
 from engine.game.event import GameEvent
 from engine.game.game_state import GameState
 from json_loader import JsonLoader
-from persistence import load_game, save_game, SAVE_FILE
+from persistence import AutoSaver, SAVE_FILE
 from text_loader import TextLoader
 from text_ui import print_game_ui
 from engine.plugins.game2d import (Game2DPlugin, render_room as render_room_2d, EVENT_ROOM_ENTERED, EVENT_ENTER_COMBAT)
 from engine.plugins.combat_renderer_2d import ASCIICombatRenderer
 from engine.plugins.question_renderer import ASCIIQuestionRenderer
+from engine.plugins.screen_buffer import ScreenBuffer, SCREEN
+from engine.plugins.animation import AnimationScheduler, Timeline
+from engine.plugins.metrics import METRICS, hud_lines
 from engine.plugins.terminal_input_handler import TerminalInputHandler, Controls, default_controls
 
+AUTOSAVER = AutoSaver()
 combat_renderer = ASCIICombatRenderer()
+# Full-screen animations (combat start, rest, battle result), ticked from the UI loops
+ANIMATIONS = AnimationScheduler()
 last_animatable_event: GameEvent = None
+# Profiling HUD: typed as a command in the text UI, a key (` or F2) in the 2D loop
+HUD_COMMAND = "hud"
+HUD_KEYS = {'`': HUD_COMMAND, '\x1bOQ': HUD_COMMAND}
 game_messages = []
 error_messages = ""
 combat_log = []
@@ -60,8 +70,8 @@ class RenderPlugin:
 
 def clear_screen() -> None:
     """Clear the terminal screen using ANSI escape codes (cross-platform in most modern terminals)."""
-    # ANSI clear + move cursor home
-    print("\033[2J\033[H", end="")
+    # ANSI clear + move cursor home; the next ui_render redraws in full
+    SCREEN.clear()
 
 
 def available_actions_str(game: Game) -> list:
@@ -73,15 +83,35 @@ def available_actions_str(game: Game) -> list:
     return lines
 
 
-def ui_render(game: Game, renderPlugin: RenderPlugin = None) -> None:
-    """Clear the screen and render the provided text."""
+def toggle_hud(hotkey: str) -> None:
+    """Show or hide the profiling HUD under the UI; metrics are only collected while it is on."""
+    METRICS.enabled = not METRICS.enabled
+    SCREEN.overlay = (lambda: hud_lines(METRICS, hotkey=hotkey)) if METRICS.enabled else None
+
+
+def read_action(terminal_input: TerminalInputHandler) -> str | None:
+    """terminal_input.get_input(), handling the HUD hotkey itself."""
+    action = terminal_input.get_input()
+    if action == HUD_COMMAND:
+        toggle_hud("` / F2")
+        return None
+    return action
+
+
+def ui_render(game: Game, renderPlugin: RenderPlugin = None, screen: ScreenBuffer = SCREEN) -> None:
+    """Render the game UI, writing only what changed since the last frame."""
+    with METRICS.timer("render"):
+        _ui_render(game, renderPlugin, screen)
+    METRICS.add("bytes", screen.last_bytes)
+
+
+def _ui_render(game: Game, renderPlugin: RenderPlugin, screen: ScreenBuffer) -> None:
     room_art = game.look() if game.state == GameState.SHOP else render_room(game.current_tile(), game.ascii_loader)
     actions = available_actions_str(game)
     if renderPlugin is not None:
         room_art, actions = renderPlugin.get_art(game.state)
     if len(error_messages) > 0:
         room_art = error_messages
-    clear_screen()
     print_game_ui(lambda: room_art,
                   game.player.to_dict(), {
                       'in_combat': game.state == GameState.COMBAT,
@@ -99,7 +129,7 @@ def ui_render(game: Game, renderPlugin: RenderPlugin = None) -> None:
                           'prompt': game.question,
                           'options': ["Yes", "No"]
                       } if game.state == GameState.ASKING_QUESTION else None
-                  }, 90, 40, True)
+                  }, 90, 40, True, screen=screen)
 
 
 banner_title = """
@@ -162,20 +192,55 @@ def prompt_map_size(options=("3", "5", "7", "9")) -> int:
         print("Invalid size. Choose " + ", ".join(options) + ".")
 
 def finish_combat_animations_2d() -> None:
-    # Finish combat screen before end animation
+    """
+    Queue the end of the combat screen (victory text, HP drain) ahead of the battle result.
+    The game clears the enemy right after EXITED_COMBAT, so this animates a snapshot of the fight.
+    """
     if last_animatable_event is not None and last_animatable_event.event_type == GameEvent.EXITED_COMBAT:
+        fight = SimpleNamespace(player=game_ref.player,
+                                enemy=Enemy.from_dict(game_ref.enemy.to_dict()) if game_ref.enemy else None)
         render_plugin = RenderPlugin(
-            render_fn=lambda: game_ref.look(),
+            render_fn=lambda: combat_renderer.combat_fn(fight, combat_log),
             actions_fn=lambda: "",
-            combat_fn=lambda: combat_renderer.combat_fn(game_ref, combat_log),
+            combat_fn=lambda: combat_renderer.combat_fn(fight, combat_log),
             shop_fn=lambda: "",
         )
-        ui_render(game_ref, render_plugin)
-        while combat_renderer.is_animating():
-            combat_renderer.update(game_ref)
+
+        def combat_frame() -> bool:
+            combat_renderer.update(fight)
             ui_render(game_ref, render_plugin)
-            time.sleep(0.05)
-        time.sleep(.5)
+            return not combat_renderer.is_animating()
+
+        ui_render(game_ref, render_plugin)
+        ANIMATIONS.play(Timeline().until(combat_frame).pause(.5))
+
+
+def tick_animations(terminal_input: TerminalInputHandler) -> bool:
+    """
+    Raw-mode loops: advance ANIMATIONS by one pass. Any key skips ahead, or answers the
+    "press any key" prompt. Returns True while animations own the screen.
+    """
+    if not ANIMATIONS.busy:
+        return False
+    if terminal_input.get_single_key() is not None:
+        if ANIMATIONS.waiting:
+            ANIMATIONS.resume()
+        else:
+            ANIMATIONS.skip()
+    ANIMATIONS.tick()
+    wait = ANIMATIONS.until_next()
+    time.sleep(0.05 if wait is None else min(wait, 0.05))
+    return True
+
+
+def play_animations() -> None:
+    """Line-mode loops: play the queued animations now, answering key waits with input()."""
+    while ANIMATIONS.run():
+        try:
+            input()
+        except KeyboardInterrupt:
+            pass
+        ANIMATIONS.resume()
 
 def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
     global game_messages
@@ -185,8 +250,9 @@ def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
 
     """Main interactive loop for 2D plugin."""
     terminal_input = TerminalInputHandler()
+    terminal_input.hotkeys = HUD_KEYS
     render_plugin = RenderPlugin(
-        render_fn=lambda: render_room_2d(game2d.get_current_room(), game2d.player),
+        render_fn=lambda: render_room_2d(game2d.get_current_room(), game2d.player, game2d.clock.alpha),
         actions_fn=lambda: [terminal_input.get_controls()],
         combat_fn=lambda: combat_renderer.combat_fn(game, combat_log),
         shop_fn=lambda: game.look(),
@@ -219,6 +285,10 @@ def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
     )
 
     while not game.ended:
+        # Animations play without blocking; input is still read to skip them
+        if tick_animations(terminal_input):
+            continue
+        frame_start = METRICS.clock()
         game2d.player_level = game.player.level
 
         if game.state == GameState.EXPLORING:
@@ -229,8 +299,9 @@ def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
                 terminal_input.add_modifier(enter_shop_modifier)
             if terminal_input.is_off():
                 terminal_input.turn_on()
-            game2d.update()
-            action = terminal_input.get_input()
+            with METRICS.timer("update"):
+                game2d.advance()
+            action = read_action(terminal_input)
             if action == 'quit':
                 game.ended = True
                 break
@@ -247,7 +318,7 @@ def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
             if not combat_renderer.is_animating():
                 terminal_input.controls = combat_controls
                 terminal_input.clear_modifiers()
-                action = terminal_input.get_input()
+                action = read_action(terminal_input)
                 if action == 'quit':
                     game.ended = True
                     break
@@ -255,6 +326,8 @@ def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
                     game_update(game, action)
             animated_events()
             combat_renderer.update(game)
+            if ANIMATIONS.busy:
+                continue
 
         if game.state == GameState.SHOP:
             actions = game.available_actions()
@@ -266,7 +339,7 @@ def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
             )
             terminal_input.controls = shop_controls
             terminal_input.clear_modifiers()
-            action = terminal_input.get_input()
+            action = read_action(terminal_input)
             if action == 'quit':
                 game.ended = True
                 break
@@ -284,7 +357,7 @@ def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
                 description="y (Yes), n (No)"
             )
             terminal_input.clear_modifiers()
-            action = terminal_input.get_input()
+            action = read_action(terminal_input)
             if action == 'quit':
                 game.ended = True
                 break
@@ -299,6 +372,8 @@ def game2d_loop(game: Game, game2d: Game2DPlugin) -> None:
 
         # 4. Render
         ui_render(game, render_plugin)
+        METRICS.add("frame", (METRICS.clock() - frame_start) * 1000.0)
+        METRICS.end_frame()
 
         # 5. Control Frame Rate
         time.sleep(0.05)
@@ -310,8 +385,16 @@ def game_loop(game: Game) -> None:
 
     while not game.ended and game.player.is_alive():
         cmd = get_user_input()
+        if cmd == HUD_COMMAND:
+            toggle_hud(f"type {HUD_COMMAND}")
+            ui_render(game)
+            continue
+        frame_start = METRICS.clock()
         game_update(game, cmd)
+        METRICS.add("frame", (METRICS.clock() - frame_start) * 1000.0)
+        METRICS.end_frame()
         animated_events()
+        play_animations()
         if game.ended:
             break
     if not game.player.is_alive():
@@ -336,7 +419,11 @@ def game_update(game: Game, cmd: str | None = None) -> None:
 
         # First, try the decoupled actions API so any interface can drive the game
         error_messages = ""
-        acted = game.execute_action(cmd)
+        # Event dispatch happens inside the action, so "update" includes "dispatch"
+        with METRICS.timer("update"):
+            acted = game.execute_action(cmd)
+        if acted is not None:
+            AUTOSAVER.maybe_save(game)
         if "failed" in (acted or "").lower() and "Traceback (most recent call last):" in (acted or ""):
             error_messages = acted  # capture traceback lines
             game_messages = ["An error occurred during that action."]
@@ -372,7 +459,8 @@ def game_over_options(game: Game) -> None:
             return
 
         if choice in ("l", "load"):
-            loaded = Game.from_dict(load_game(SAVE_FILE))
+            data = AUTOSAVER.load(SAVE_FILE)
+            loaded = Game.from_dict(data) if data else None
             if loaded:
                 game.copy_from(loaded)
                 game_messages = []
@@ -399,21 +487,23 @@ def game_over_options(game: Game) -> None:
 
 
 def animated_events() -> None:
+    """Queue the animation for the last animatable event on ANIMATIONS; the UI loops play it."""
     global last_animatable_event
     if last_animatable_event is not None:
+        timeline = None
         if last_animatable_event.event_type == GameEvent.EXITED_COMBAT:
             # Show animated end of combat summary
-            clear_screen()
-            show_battle_result(last_animatable_event.payload, game_ref.player.level)
-            wait_keypress("Press any key to continue...")
+            timeline = battle_result_timeline(last_animatable_event.payload, game_ref.player.level)
         if (last_animatable_event.event_type == GameEvent.RESTED or
                 last_animatable_event.event_type == GameEvent.REST_INTERRUPTED):
-            show_rest_event(last_animatable_event.payload, width=90)
-            wait_keypress("Press any key to continue...")
+            timeline = rest_event_timeline(last_animatable_event.payload, width=90)
         if last_animatable_event.event_type == GameEvent.ENTERED_COMBAT:
-            clear_screen()
-            show_combat_start_event(last_animatable_event.payload)
-            wait_keypress("Press any key to continue...")
+            timeline = combat_start_timeline(last_animatable_event.payload)
+        if timeline is not None:
+            keypress_prompt(timeline, "Press any key to continue...")
+            # The animations drew over the screen
+            timeline.call(SCREEN.invalidate)
+            ANIMATIONS.play(timeline)
 
     last_animatable_event = None  # reset after showing
 
@@ -424,7 +514,7 @@ def main(argv: List[str]) -> int:
         print("Goodbye.")
         return 0
     if choice == "load":
-        loaded = load_game(SAVE_FILE)
+        loaded = AUTOSAVER.load(SAVE_FILE)
         if not loaded:
             print("No save found or save file invalid.")
             return 1
@@ -438,7 +528,8 @@ def main(argv: List[str]) -> int:
         game_2d = Game2DPlugin(size, 10, 6,
                                gravity_pull=0.4,
                                terminal_velocity=1.2,
-                               enemy_archetypes=game.enemy_archetypes)
+                               enemy_archetypes=game.enemy_archetypes,
+                               rng=game.rng.world)
         game.warp_to_tile(0,0, "started")
         game_2d.make_room_safe(0)
         return run_game(game, game_2d)
@@ -459,15 +550,19 @@ def run_game(game: Game, game2d: Game2DPlugin = None) -> int:
     game.data_loader = JsonLoader()
     game.ascii_loader = TextLoader("data/rooms")
     game.load_configurations("data/enemies.json")
+    # Build the combat sprites (enemy art both ways, HP bars) before the first fight
+    combat_renderer.preload(game.enemy_archetypes)
     game.save_file = SAVE_FILE
-    game.save_fn = save_game
-    game.load_fn = load_game
+    game.save_fn = AUTOSAVER.save
+    game.load_fn = AUTOSAVER.load
     game.event_manager.subscribe(on_event)
+    METRICS.instrument(game.event_manager)
     game_ref = game
     game_ref_2d = game2d
     if game2d is not None:
         game2d.enemy_archetypes = game.enemy_archetypes
         game2d.event_manager.subscribe(on_2d_event)
+        METRICS.instrument(game2d.event_manager)
         game2d_loop(game, game2d)
     else:
         game_loop(game)
@@ -492,10 +587,11 @@ def on_event(event: GameEvent) -> None:
 
     event_type = event.event_type
     data = event.payload
-    last_animatable_event = event if event_type in {GameEvent.ENTERED_COMBAT,
-                                               GameEvent.EXITED_COMBAT,
-                                               GameEvent.RESTED,
-                                               GameEvent.REST_INTERRUPTED} else last_animatable_event
+    # Events are pooled; keep the ones we animate later out of the pool
+    last_animatable_event = event.retain() if event_type in {GameEvent.ENTERED_COMBAT,
+                                                       GameEvent.EXITED_COMBAT,
+                                                       GameEvent.RESTED,
+                                                       GameEvent.REST_INTERRUPTED} else last_animatable_event
     if event_type == GameEvent.INFO:
         requested_information = data.get('information')
         return
@@ -5,8 +5,10 @@ import * as worldModule from "../engine/game/__target__/world.js";
 
 import create from 'prompt-sync';
 import fs from 'fs';
+import {ScreenBuffer} from './screen_buffer.js';
 
 const prompt = create();
+const screen = new ScreenBuffer();
 
 // Initialize the game (assuming Game class exists)
 let game;
@@ -15,11 +17,12 @@ console.log("Game engine started.");
 
 function clearConsole() {
     process.stdout.write('\x1Bc');
+    screen.invalidate();
 }
 
 function uiRender(text) {
-    clearConsole();
-    console.log(text);
+    // Only what changed since the last frame is written
+    screen.render(text);
 }
 
 function banner() {
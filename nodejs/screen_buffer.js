@@ -0,0 +1,93 @@
+// Port of engine/plugins/screen_buffer.py: keeps the last frame on screen and writes
+// only the changed span of each line (whole lines when they hold color codes).
+const ESC = "\x1B";
+const CLEAR = ESC + "[2J" + ESC + "[H";
+// Rows kept free under the frame for the cursor, the prompt and the line Enter moves to
+const PROMPT_ROWS = 3;
+const ANSI = /\x1B\[[0-9;?]*[A-Za-z]/g;
+
+// Lines equal to the same row of `previous`, a frame that fit, are not measured again
+function tooWide(lines, columns, previous) {
+    return lines.some((line, row) => line.length > columns && line !== previous[row]
+        && line.replace(ANSI, "").length > columns);
+}
+
+function move(row, col) {
+    return ESC + "[" + (row + 1) + ";" + (col + 1) + "H";
+}
+
+export class ScreenBuffer {
+    constructor(out = process.stdout) {
+        this.out = out;
+        this.lines = null;
+        this.size = null;
+        this.bytesWritten = 0;
+        this.lastBytes = 0;
+    }
+
+    invalidate() {
+        this.lines = null;
+    }
+
+    clear() {
+        this.write(CLEAR);
+        this.invalidate();
+    }
+
+    diff(lines) {
+        const rows = this.out.rows || 0;
+        const columns = this.out.columns || 0;
+        const size = rows + "x" + columns;
+        const previous = this.lines;
+        const checked = previous !== null && size === this.size ? previous : [];
+        const fits = !(rows && lines.length + PROMPT_ROWS > rows) && !(columns && tooWide(lines, columns, checked));
+        if (previous === null || size !== this.size || !fits) {
+            // A frame that did not fit left the rows shifted, so the next one is drawn in full too
+            this.size = fits ? size : null;
+            return CLEAR + lines.join("\n") + "\n";
+        }
+        const parts = [];
+        lines.forEach((line, row) => {
+            const old = row < previous.length ? previous[row] : "";
+            if (line === old) {
+                return;
+            }
+            if (line.includes(ESC) || old.includes(ESC)) {
+                parts.push(move(row, 0) + line + ESC + "[K");
+                return;
+            }
+            const limit = Math.min(old.length, line.length);
+            let start = 0;
+            while (start < limit && old[start] === line[start]) {
+                start++;
+            }
+            let end = line.length;
+            if (old.length === line.length) {
+                while (end > start && old[end - 1] === line[end - 1]) {
+                    end--;
+                }
+            }
+            parts.push(move(row, start) + line.slice(start, end));
+            if (line.length < old.length) {
+                parts.push(ESC + "[K");
+            }
+        });
+        // Park below the frame and erase anything left there (old rows, echoed input)
+        parts.push(move(lines.length, 0) + ESC + "[J");
+        return parts.join("");
+    }
+
+    render(text) {
+        const lines = String(text).split("\n");
+        const data = this.diff(lines);
+        this.lines = lines;
+        this.write(data);
+        return data;
+    }
+
+    write(data) {
+        this.out.write(data);
+        this.lastBytes = Buffer.byteLength(data, "utf8");
+        this.bytesWritten += this.lastBytes;
+    }
+}
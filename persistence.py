@@ -1,14 +1,58 @@
+import atexit
 import json
 import os
+import threading
+import time
+import weakref
 from typing import Optional
 
+from engine.game.game_state import GameState
+
 SAVE_FILE = os.path.join(os.path.dirname(__file__), "save.json")
 
+# fsync policies for AutoSaver
+FSYNC_ALWAYS = "always"  # fsync every write (and the directory after the rename)
+FSYNC_INTERVAL = "interval"  # fsync at most once per fsync_interval seconds
+FSYNC_NEVER = "never"  # leave flushing to the OS
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_NEVER)
+
+# Actions between automatic saves
+AUTOSAVE_EVERY = 10
+# Never autosave a finished game or one waiting on a question (its pending callbacks aren't saved)
+AUTOSAVE_SKIP_STATES = (GameState.GAME_OVER, GameState.ASKING_QUESTION)
+
+
+def _atomic_write(path: str, data: bytes, fsync: bool = False) -> None:
+    """Write to a temp file next to path and rename it over path, so readers never see a partial save."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    if fsync:
+        # Make the rename itself durable; not possible on every platform
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
 
 def save_game(game: dict, path: str) -> str:
     data = game
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _atomic_write(path, json.dumps(data, indent=2).encode("utf-8"))
     return "Game saved to " + path
 
 
@@ -21,3 +65,121 @@ def load_game(path: str) -> Optional[dict]:
         return None
     except Exception:
         return None
+
+
+class AutoSaver:
+    """
+    Writes saves on a background thread so a save never blocks the game loop or a request.
+
+    save() takes the snapshot (Game.to_dict already builds fresh containers) and queues it.
+    Only the newest snapshot per path is kept, so saves that arrive while a write is in
+    progress are coalesced into one. Files are replaced atomically, and `fsync` chooses
+    durability versus speed (see FSYNC_POLICIES). save() and load() have the same
+    signatures as save_game and load_game, so they can be used as Game.save_fn / load_fn.
+
+    `on_write(path, size, seconds)`, when set, is called from the writer thread after each
+    save reaches the disk (the servers' /metrics).
+    """
+
+    def __init__(self, fsync: str = FSYNC_INTERVAL, fsync_interval: float = 5.0, every: int = AUTOSAVE_EVERY):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync}'. Choose from: {', '.join(FSYNC_POLICIES)}")
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.every = every
+        self.writes = 0
+        self.coalesced = 0
+        self.last_error = None
+        self.on_write = None
+        self._pending = {}
+        self._busy = False
+        self._closed = False
+        self._last_fsync = 0.0
+        self._actions = weakref.WeakKeyDictionary()
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def save(self, game: dict, path: str) -> str:
+        with self._cond:
+            if self._closed:
+                return save_game(game, path)
+            if path in self._pending:
+                self.coalesced += 1
+            self._pending[path] = game
+            self._cond.notify_all()
+        return "Game saved to " + path
+
+    @property
+    def queued(self) -> int:
+        """Saves waiting for the writer thread."""
+        return len(self._pending)
+
+    def load(self, path: str) -> Optional[dict]:
+        """load_game that first waits for queued saves, so it never reads a stale file."""
+        self.flush()
+        return load_game(path)
+
+    def maybe_save(self, game, path: str = None) -> bool:
+        """Count one executed action for game; queue a save once `every` actions have passed."""
+        path = path or game.save_file
+        if not path or game.state in AUTOSAVE_SKIP_STATES:
+            return False
+        count = self._actions.get(game, 0) + 1
+        if count < self.every:
+            self._actions[game] = count
+            return False
+        self._actions[game] = 0
+        self.save(game.to_dict(), path)
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until every queued save is on disk. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                batch = self._pending
+                self._pending = {}
+                self._busy = True
+            for path, game in batch.items():
+                self._write(path, game)
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def _write(self, path: str, game: dict) -> None:
+        now = time.monotonic()
+        fsync = self.fsync == FSYNC_ALWAYS or (
+            self.fsync == FSYNC_INTERVAL and now - self._last_fsync >= self.fsync_interval)
+        try:
+            data = json.dumps(game, indent=2).encode("utf-8")
+            _atomic_write(path, data, fsync)
+            self.writes += 1
+            if fsync:
+                self._last_fsync = now
+            if self.on_write is not None:
+                self.on_write(path, len(data), time.monotonic() - now)
+        except Exception as e:
+            self.last_error = e
@@ -1,7 +1,7 @@
 # react.py
 import json
 
-from flask import Flask, send_from_directory, request, jsonify
+from flask import Flask, send_from_directory, request, jsonify, g
 import os
 from json_loader import JsonLoader
 from text_loader import TextLoader
@@ -9,11 +9,25 @@ import secrets
 import time
 
 from main import Game  # Adjust import if needed
+from engine.game.result import as_result
+from engine.plugins.metrics import METRICS
+from engine.plugins.prometheus import ServerMetrics, CONTENT_TYPE
+from persistence import AutoSaver
 
 app = Flask(__name__, static_folder="react-ui/build", static_url_path="")
 
 # Simple in-memory session store
 SESSIONS = {}
+# Served at /metrics
+SERVER_METRICS = ServerMetrics(SESSIONS, engine=METRICS)
+# No HUD here: every watched action is an engine frame, scraped through /metrics
+METRICS.enabled = True
+# Autosaves games that have a save_file; browser sessions keep their saves client side (/api/game_state)
+AUTOSAVER = AutoSaver()
+SERVER_METRICS.watch_autosaver(AUTOSAVER)
+# Pending messages of the open /api/events streams
+SSE_QUEUES = {}
+SERVER_METRICS.queues["sse"] = lambda: sum(len(q) for q in list(SSE_QUEUES.values()))
 
 
 def create_game():
@@ -32,9 +46,27 @@ def get_game(sid):
     # Create new game if not found
     game = create_game()
     SESSIONS[sid] = game
+    SERVER_METRICS.watch(game)
     return game
 
 
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def record_request(response):
+    route = request.url_rule.rule if request.url_rule is not None else "other"
+    SERVER_METRICS.request(route, response.status_code, time.perf_counter() - g.request_start)
+    return response
+
+
+@app.route("/metrics")
+def metrics():
+    return app.response_class(SERVER_METRICS.expose(), content_type=CONTENT_TYPE)
+
+
 @app.route("/api/state")
 def api_state():
     sid = request.args.get("sid") or secrets.token_hex(8)
@@ -58,7 +90,10 @@ def api_game_state():
     if not sid:
         return jsonify({"error": "Missing session ID"}), 400
     game = get_game(sid)
-    return jsonify(game.to_dict())
+    start = time.perf_counter()
+    data = json.dumps(game.to_dict())
+    SERVER_METRICS.saved("browser", len(data), time.perf_counter() - start)
+    return app.response_class(data, mimetype="application/json")
 
 
 @app.route("/api/load", methods=["POST"])
@@ -66,11 +101,14 @@ def api_load():
     data = request.get_json()
     sid = data.get("sid") or secrets.token_hex(8)
     # Recreate game from saved state (assumes Game.from_json exists)
+    start = time.perf_counter()
     loaded = Game.from_dict(data)
     game = create_game()
     game.ascii_tiles = False
     game.copy_from(loaded)
+    SERVER_METRICS.loaded("browser", request.content_length or 0, time.perf_counter() - start)
     SESSIONS[sid] = game
+    SERVER_METRICS.watch(game)
     output = game.look()
     actions = game.available_actions()
     # Add any extra fields you need (player, enemy, tile, etc.)
@@ -92,18 +130,59 @@ def api_play():
     if not sid:
         return jsonify({"error": "Missing session ID"}), 400
     game = get_game(sid)
-    output = game.execute_action(cmd) or "Unknown action."
-    actions = game.available_actions()
-    return jsonify({
-        "output": output,
-        "actions": actions,
+    # format=result returns the structured record instead of rendered text
+    structured = request.args.get("format") == "result"
+    game.text_results = not structured
+    try:
+        output = game.execute_action(cmd)
+    finally:
+        game.text_results = True
+    if output is not None:
+        AUTOSAVER.maybe_save(game)
+    resp = {
+        "actions": game.available_actions(),
         "sid": sid,
         "state": game.state,
         "player": game.player.to_dict(),
         "enemy": game.enemy.to_dict() if game.enemy else None,
         "tile": game.current_tile().to_dict() if game.current_tile() else None,
         "ended": game.ended
+    }
+    if structured:
+        resp["result"] = as_result(output).to_dict() if output is not None else None
+    else:
+        resp["output"] = output or "Unknown action."
+    return jsonify(resp)
+
+
+# Upper bound on commands per batch request so one request can't monopolise the server.
+MAX_BATCH_COMMANDS = 200
+
+
+@app.route("/api/play_batch", methods=["POST"])
+def api_play_batch():
+    data = request.get_json(silent=True) or {}
+    sid = data.get("sid") or request.args.get("sid")
+    if not sid:
+        return jsonify({"error": "Missing session ID"}), 400
+    cmds = data.get("cmds")
+    if not isinstance(cmds, list):
+        return jsonify({"error": "Expected a list of commands in 'cmds'"}), 400
+    game = get_game(sid)
+    batch = game.execute_batch([str(c) for c in cmds[:MAX_BATCH_COMMANDS]])
+    # Each executed command counts toward the autosave policy, as a single /api/play does
+    for result in batch["results"]:
+        if result["known"]:
+            AUTOSAVER.maybe_save(game)
+    batch.update({
+        "sid": sid,
+        "actions": game.available_actions(),
+        "player": game.player.to_dict(),
+        "enemy": game.enemy.to_dict() if game.enemy else None,
+        "tile": game.current_tile().to_dict() if game.current_tile() else None,
+        "ended": game.ended
     })
+    return jsonify(batch)
 
 
 @app.route("/api/new_game", methods=["POST"])
@@ -113,6 +192,7 @@ def api_new_game():
     game = create_game()
     game.ascii_tiles = False
     SESSIONS[sid] = game
+    SERVER_METRICS.watch(game)
     output = game.look()
     actions = game.available_actions()
     return jsonify({
@@ -151,6 +231,7 @@ def sse_events():
             return
         game = SESSIONS[sid]
         q = []
+        SSE_QUEUES[id(q)] = q
 
         def handle_event(event):
             data = {"type": event.event_type, "payload": event.payload}
@@ -163,15 +244,19 @@ def sse_events():
         heartbeat_interval = 10
         last_heartbeat = time.time()
 
-        while True:
-            # Send queued events
-            while q:
-                yield q.pop(0)
-            # Send heartbeat to keep connection alive
-            if time.time() - last_heartbeat > heartbeat_interval:
-                yield ": heartbeat\n\n"
-                last_heartbeat = time.time()
-            time.sleep(1)
+        try:
+            while True:
+                # Send queued events
+                while q:
+                    yield q.pop(0)
+                # Send heartbeat to keep connection alive
+                if time.time() - last_heartbeat > heartbeat_interval:
+                    yield ": heartbeat\n\n"
+                    last_heartbeat = time.time()
+                time.sleep(1)
+        finally:
+            # The client went away
+            SSE_QUEUES.pop(id(q), None)
 
     return app.response_class(event_stream(), mimetype="text/event-stream")
 
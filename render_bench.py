@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Frame rendering benchmark for the 2D mode.
+
+Plays seeded Game2DPlugin runs in rooms from 15x8 up to 128x32 (the player walking and
+jumping at random, enemies patrolling) and times one frame of render_room two ways:
+render_room_full, which expands every cell into its 4x4 glyphs each call as the renderer
+used to, and the room's cached RoomRenderer, which reuses the prebuilt static lines and
+only composites the rows holding a sprite. Both must produce the same frame.
+
+It also reports what reaches the terminal per frame: a full redraw (clear screen and
+print every line) against writing only the lines diff_lines reports as changed, each
+behind a cursor move.
+
+Run: python3 render_bench.py --frames 300
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import List
+
+from engine.plugins.game2d import Game2DPlugin, render_room_full, room_renderer
+
+SIZES = ((15, 8), (32, 12), (64, 16), (128, 32))
+CLEAR = "\x1b[2J\x1b[H"
+
+
+def diff_lines(previous, lines):
+    """
+    (index, line) for every line of `lines` that differs from `previous`, plus blank
+    lines where the previous frame was longer; what a terminal has to rewrite.
+    """
+    changes = [(i, line) for i, line in enumerate(lines) if i >= len(previous) or previous[i] != line]
+    changes.extend((i, "") for i in range(len(lines), len(previous)))
+    return changes
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Compare full and cached 2D room rendering.")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv[1:])
+
+    for (width, height) in SIZES:
+        plugin = Game2DPlugin(num_rooms=1, room_width=width, room_height=height, rng=random.Random(args.seed))
+        plugin.ignore_combat = True
+        rng = random.Random(args.seed)
+        room = plugin.get_current_room()
+        renderer = room_renderer(room)
+        full_time = cached_time = 0.0
+        full_bytes = diff_bytes = changed = 0
+        previous = []
+        for _ in range(args.frames):
+            if rng.random() < 0.3:
+                plugin.move_player(rng.choice((-1, 1)))
+            if rng.random() < 0.05 and plugin.player.dy == 0:
+                plugin.player.dy = -plugin.jump_velocity
+            plugin.update()
+
+            start = time.perf_counter()
+            frame = render_room_full(room, plugin.player)
+            full_time += time.perf_counter() - start
+            start = time.perf_counter()
+            lines = renderer.lines(plugin.player)
+            cached_time += time.perf_counter() - start
+            if "\n".join(lines) != frame:
+                print(f"{width}x{height}: cached frame differs", file=sys.stderr)
+                return 1
+
+            full_bytes += len((CLEAR + frame + "\n").encode("utf-8"))
+            changes = diff_lines(previous, lines)
+            changed += len(changes)
+            diff_bytes += sum(len(f"\x1b[{row + 1};1H{line}\x1b[K".encode("utf-8")) for row, line in changes)
+            previous = lines
+        n = args.frames
+        print(f"{width:>3}x{height:<2}: full {full_time * 1e6 / n:8.1f} us/frame | "
+              f"cached {cached_time * 1e6 / n:7.1f} us/frame | x{full_time / max(1e-9, cached_time):.1f} | "
+              f"lines {changed / n:5.1f}/{len(previous)} | bytes {full_bytes // n:6d} -> {diff_bytes // n:6d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Terminal output benchmark for the ANSI front ends.
+
+Plays a seeded game with random available actions and counts the bytes one frame puts
+on the wire in each terminal UI: main.py's text output, main_event_ui.py's 90x40 panel
+UI and the 2D room view. Each frame is sent two ways: a full clear + reprint, as the UIs
+used to, and through a ScreenBuffer that writes only cursor moves and changed spans.
+
+Run: python3 screen_bench.py --frames 200
+"""
+
+import argparse
+import io
+import random
+import sys
+import time
+from typing import List
+
+from engine.game import Game
+from engine.game.game_state import GameState
+from engine.plugins.game2d import Game2DPlugin, room_renderer, details_lines, minimap_line
+from engine.plugins.screen_buffer import ScreenBuffer, CLEAR
+from json_loader import JsonLoader
+from text_loader import TextLoader
+import main_event_ui
+
+# log prints the whole, ever growing game log
+SKIP = {"save", "load", "quit", "help", "log"}
+
+
+def full_bytes(frame: str) -> int:
+    return len((CLEAR + frame + "\n").encode("utf-8"))
+
+
+def new_game(seed: int) -> Game:
+    game = Game.new_random(size=7, tileset=JsonLoader().load("data/tileset.json"), seed=seed)
+    game.data_loader = JsonLoader()
+    game.ascii_loader = TextLoader("data/rooms")
+    game.load_configurations("data/enemies.json")
+    return game
+
+
+def play(game: Game, rng: random.Random) -> str:
+    """Run one random available action and return its text."""
+    if not game.player.is_alive():
+        game.player.hp = game.player.max_hp
+        game.state = GameState.EXPLORING
+    actions = [a["id"] for a in game.available_actions() if a["enabled"] and a["id"] not in SKIP]
+    return game.execute_action(rng.choice(actions)) or game.look()
+
+
+class Recorder:
+    """A ScreenBuffer writing into memory, plus the full-redraw byte count of the same frames."""
+
+    def __init__(self, rows: int = 60):
+        self.out = io.StringIO()
+        self.screen = ScreenBuffer(self.out, size_fn=lambda: (120, rows))
+        self.full = 0
+        self.seconds = 0.0
+
+    def render(self, frame):
+        lines = frame.split("\n") if isinstance(frame, str) else list(frame)
+        self.full += full_bytes("\n".join(lines))
+        start = time.perf_counter()
+        self.screen.render(lines)
+        self.seconds += time.perf_counter() - start
+        self.out.seek(0)
+        self.out.truncate()
+
+    @property
+    def last_bytes(self) -> int:
+        return self.screen.last_bytes
+
+    def report(self, name: str, frames: int):
+        diff = self.screen.bytes_written
+        print(f"{name:<10}: full {self.full // frames:6d} B/frame | buffered {diff // frames:6d} B/frame | "
+              f"x{self.full / max(1, diff):.1f} less | diff {self.seconds * 1e6 / frames:6.1f} us/frame")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Count terminal bytes per frame, full redraw vs ScreenBuffer.")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv[1:])
+
+    # main.py: ui_render(text of the last action)
+    rng = random.Random(args.seed)
+    game = new_game(args.seed)
+    text = Recorder()
+    for _ in range(args.frames):
+        text.render(play(game, rng))
+    text.report("text", args.frames)
+
+    # main_event_ui.py: the colored 90x40 panel layout
+    rng = random.Random(args.seed)
+    game = new_game(args.seed)
+    panels = Recorder()
+    for _ in range(args.frames):
+        play(game, rng)
+        main_event_ui.ui_render(game, screen=panels)
+    panels.report("event ui", args.frames)
+
+    # 2D loop: room view, details and minimap, one frame per physics step
+    rng = random.Random(args.seed)
+    plugin = Game2DPlugin(num_rooms=3, room_width=15, room_height=8, rng=random.Random(args.seed))
+    plugin.ignore_combat = True
+    view = Recorder()
+    for _ in range(args.frames):
+        if rng.random() < 0.3:
+            plugin.move_player(rng.choice((-1, 1)))
+        plugin.update()
+        room = plugin.get_current_room()
+        lines = room_renderer(room).lines(plugin.player)
+        lines += details_lines(room, plugin.player, plugin.state)
+        lines.append(minimap_line(plugin))
+        view.render(lines)
+    view.report("2d", args.frames)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
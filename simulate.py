@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Headless simulation runner for Oakheart Tales.
+
+Plays many games without any UI, straight against Game.execute_action, using a
+pluggable policy to pick each action. Ascii art and event emission are turned off,
+games are spread across a process pool, and a summary report is printed.
+
+Run: python3 simulate.py --games 500 --policy greedy --workers 4
+Trace the engine's hot paths: python3 simulate.py --games 50 --trace hist (or --trace out.json)
+"""
+
+import argparse
+import random
+import sys
+import time
+from multiprocessing import Pool
+from typing import List, Optional
+
+from engine.game import Game, GameState
+from engine.plugins.tracing import TRACER, HistogramSink, sink_for
+from json_loader import JsonLoader
+
+# A game counts as won once the hero reaches this level
+DEFAULT_TARGET_LEVEL = 5
+DEFAULT_MAX_TURNS = 2000
+
+
+# --- Policies ---
+class Policy:
+    """Picks the next action id for a game. Policies may keep per-game state."""
+
+    def reset(self) -> None:
+        pass
+
+    def choose(self, game: Game) -> str:
+        raise NotImplementedError
+
+
+class RandomPolicy(Policy):
+    """Uniformly random choice among enabled, non-system actions."""
+
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng or random.Random()
+
+    def choose(self, game: Game) -> str:
+        actions = [a["id"] for a in game.available_actions()
+                   if a.get("enabled", True) and a.get("category") != "system"]
+        return self.rng.choice(actions) if actions else "look"
+
+
+class GreedyPolicy(Policy):
+    """
+    Simple hand-tuned play: heal when hurt, fight with the best affordable spell,
+    flee when badly losing, and explore towards unvisited tiles.
+    """
+
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng or random.Random()
+        self._shopped_at = None
+        self._declined = set()
+
+    def reset(self) -> None:
+        self._shopped_at = None
+        self._declined = set()
+
+    def choose(self, game: Game) -> str:
+        if game.state == GameState.COMBAT:
+            return self._combat(game)
+        if game.state == GameState.ASKING_QUESTION:
+            return self._answer(game)
+        if game.state == GameState.SHOP:
+            p = game.player
+            if p.potions < 3 and p.gold >= 5 and game.shop_items and "Potion" in game.shop_items:
+                return "shop_buy::potion"
+            return "shop_exit"
+        return self._explore(game)
+
+    def _combat(self, game: Game) -> str:
+        p = game.player
+        ratio = p.hp / max(1, p.max_hp)
+        if ratio < 0.35 and p.potions > 0:
+            return "combat_potion"
+        if ratio < 0.2 and game.enemy and game.enemy.hp > p.hp:
+            return "combat_flee"
+        best = None
+        for a in game.available_actions():
+            if a["id"].startswith("cast::") and a.get("enabled", True) and a["id"] not in ("cast::heal", "cast::regen",
+                                                                                         "cast::guard break"):
+                best = a["id"]
+        return best or "combat_attack"
+
+    def _answer(self, game: Game) -> str:
+        p = game.player
+        if game.pending_move:
+            if p.hp / max(1, p.max_hp) > 0.6:
+                return "answer_yes"
+            # Remember the refusal so exploration picks another way next turn
+            self._declined.add(tuple(game.pending_move))
+            return "answer_no"
+        if game.pending_weapon:
+            cur = p.weapon.attack_bonus if p.weapon else 0
+            return "answer_yes" if game.pending_weapon.attack_bonus > cur else "answer_no"
+        return "answer_yes"
+
+    def _explore(self, game: Game) -> str:
+        p = game.player
+        tile = game.current_tile()
+        ratio = p.hp / max(1, p.max_hp)
+        if ratio < 0.3 and p.potions > 0:
+            return "potion"
+        if ratio < 0.6 and not getattr(tile, "rested", False) and tile.safe:
+            return "rest"
+        if tile.shop and self._shopped_at != (game.x, game.y) and p.gold >= 5:
+            self._shopped_at = (game.x, game.y)
+            return "shop"
+        moves = [a for a in game.available_actions() if a["id"].startswith("move_") and a.get("enabled", True)]
+        if not moves:
+            return "look"
+        deltas = {"move_n": (0, -1), "move_s": (0, 1), "move_w": (-1, 0), "move_e": (1, 0)}
+        targets = {a["id"]: (game.x + deltas[a["id"]][0], game.y + deltas[a["id"]][1]) for a in moves}
+        allowed = [aid for aid, pos in targets.items() if pos not in self._declined]
+        if not allowed:
+            # Every way out was refused; heal up where we stand before trying again
+            self._declined.clear()
+            return "rest" if not getattr(tile, "rested", False) else self.rng.choice(list(targets))
+        fresh = [aid for aid in allowed if targets[aid] not in game.explored]
+        return self.rng.choice(fresh or allowed)
+
+
+class ScriptedPolicy(Policy):
+    """
+    Replays a fixed list of commands in a loop. When the next scripted command is not
+    available in the current state (e.g. a move during combat) the fallback decides.
+    """
+
+    def __init__(self, script: List[str], fallback: Policy = None):
+        self.script = [c.strip().lower() for c in script if c.strip()] or ["look"]
+        self.fallback = fallback or GreedyPolicy()
+        self._index = 0
+
+    def reset(self) -> None:
+        self._index = 0
+        self.fallback.reset()
+
+    def choose(self, game: Game) -> str:
+        cmd = self.script[self._index % len(self.script)]
+        for a in game.available_actions():
+            if a.get("enabled", True) and (a["id"] == cmd or cmd in [k.lower() for k in a["hotkeys"]]):
+                self._index += 1
+                return a["id"]
+        return self.fallback.choose(game)
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+    "scripted": ScriptedPolicy,
+}
+
+
+def make_policy(name: str, script: Optional[List[str]] = None, rng: random.Random = None) -> Policy:
+    if name == "scripted":
+        return ScriptedPolicy(script or [], fallback=GreedyPolicy(rng))
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy '{name}'. Choose from: {', '.join(sorted(POLICIES))}")
+    return POLICIES[name](rng)
+
+
+# --- Running games ---
+def new_headless_game(size: int, tileset: dict, enemy_archetypes: list, seed: int = None) -> Game:
+    """A Game with no art rendering and muted events, ready to be driven by a policy."""
+    game = Game.new_random(size=size, tileset=tileset, seed=seed)
+    game.ascii_tiles = False
+    game.enemy_archetypes = enemy_archetypes
+    game.event_manager.muted = True
+    game.text_results = False
+    return game
+
+
+def play_game(game: Game, policy: Policy, max_turns: int = DEFAULT_MAX_TURNS,
+              target_level: int = DEFAULT_TARGET_LEVEL) -> dict:
+    """Drive one game with the policy until death, victory (target level) or the turn cap."""
+    policy.reset()
+    turns = 0
+    while turns < max_turns and not game.ended:
+        if game.state == GameState.GAME_OVER or game.player.level >= target_level:
+            break
+        game.execute_action(policy.choose(game))
+        turns += 1
+    return {
+        "won": game.player.level >= target_level,
+        "dead": game.state == GameState.GAME_OVER,
+        "level": game.player.level,
+        "turns": turns,
+    }
+
+
+# Per-process configuration set by the pool initializer so it's pickled once per worker
+_WORKER = {}
+
+
+def _init_worker(config: dict) -> None:
+    _WORKER.clear()
+    _WORKER.update(config)
+
+
+def _play_seed(seed: int) -> dict:
+    c = _WORKER
+    # Every game draws from its own RNG service, so the seed alone reproduces it
+    game = new_headless_game(c["size"], c["tileset"], c["enemy_archetypes"], seed=seed)
+    policy = make_policy(c["policy"], c.get("script"), random.Random(seed))
+    result = play_game(game, policy, c["max_turns"], c["target_level"])
+    result["seed"] = seed
+    return result
+
+
+def run_simulation(games: int, policy: str = "greedy", workers: int = 1, size: int = 5,
+                   seed: int = 1, max_turns: int = DEFAULT_MAX_TURNS, target_level: int = DEFAULT_TARGET_LEVEL,
+                   script: Optional[List[str]] = None, tileset: dict = None, enemy_archetypes: list = None) -> dict:
+    """Play `games` games and return aggregated statistics."""
+    loader = JsonLoader()
+    config = {
+        "size": size,
+        "tileset": tileset if tileset is not None else loader.load("data/tileset.json"),
+        "enemy_archetypes": enemy_archetypes if enemy_archetypes is not None else loader.load("data/enemies.json"),
+        "policy": policy,
+        "script": script,
+        "max_turns": max_turns,
+        "target_level": target_level,
+    }
+    make_policy(policy, script)  # validate before spinning up workers
+    seeds = [seed + i for i in range(games)]
+
+    start = time.perf_counter()
+    if workers <= 1:
+        _init_worker(config)
+        results = [_play_seed(s) for s in seeds]
+    else:
+        chunksize = max(1, games // (workers * 8))
+        with Pool(workers, initializer=_init_worker, initargs=(config,)) as pool:
+            results = list(pool.imap_unordered(_play_seed, seeds, chunksize))
+    elapsed = time.perf_counter() - start
+    return summarize(results, elapsed)
+
+
+def _percentile(sorted_vals: list, pct: float):
+    if not sorted_vals:
+        return 0
+    idx = min(len(sorted_vals) - 1, int(round(pct / 100.0 * (len(sorted_vals) - 1))))
+    return sorted_vals[idx]
+
+
+def summarize(results: list, elapsed: float) -> dict:
+    n = len(results)
+    turns = sorted(r["turns"] for r in results)
+    levels = {}
+    for r in results:
+        levels[r["level"]] = levels.get(r["level"], 0) + 1
+    return {
+        "games": n,
+        "elapsed": elapsed,
+        "games_per_sec": n / elapsed if elapsed > 0 else float("inf"),
+        "turns_per_sec": sum(turns) / elapsed if elapsed > 0 else float("inf"),
+        "win_rate": (sum(1 for r in results if r["won"]) / n) if n else 0.0,
+        "death_rate": (sum(1 for r in results if r["dead"]) / n) if n else 0.0,
+        "levels": dict(sorted(levels.items())),
+        "turns": {
+            "mean": (sum(turns) / n) if n else 0.0,
+            "p50": _percentile(turns, 50),
+            "p90": _percentile(turns, 90),
+            "max": turns[-1] if turns else 0,
+        },
+    }
+
+
+def format_report(summary: dict) -> str:
+    t = summary["turns"]
+    lines = [
+        f"Games: {summary['games']} in {summary['elapsed']:.2f}s "
+        f"({summary['games_per_sec']:.1f} games/sec, {summary['turns_per_sec']:.0f} turns/sec)",
+        f"Win rate: {summary['win_rate'] * 100:.1f}% | Death rate: {summary['death_rate'] * 100:.1f}%",
+        f"Turns: mean {t['mean']:.1f} | p50 {t['p50']} | p90 {t['p90']} | max {t['max']}",
+        "Final level distribution:",
+    ]
+    total = max(1, summary["games"])
+    for level, count in summary["levels"].items():
+        bar = "#" * max(1, int(40 * count / total))
+        lines.append(f"  Lv {level:>2}: {count:>6} {bar}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Run headless Oakheart Tales simulations.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--script", default="", help="Comma separated commands for the scripted policy")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--size", type=int, default=5, help="World size")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the first game; game i uses seed + i")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--target-level", type=int, default=DEFAULT_TARGET_LEVEL)
+    parser.add_argument("--trace", default="",
+                        help="Trace engine hot paths: 'hist' prints a span histogram, a .jsonl path writes "
+                             "JSON lines, any other path a Chrome trace-event file")
+    args = parser.parse_args(argv[1:])
+    if args.trace and args.workers > 1:
+        parser.error("--trace runs in this process; use --workers 1")
+
+    sink = sink_for(args.trace) if args.trace else None
+    if sink is not None:
+        TRACER.enable(sink)
+    try:
+        summary = run_simulation(
+            games=args.games,
+            policy=args.policy,
+            workers=args.workers,
+            size=args.size,
+            seed=args.seed,
+            max_turns=args.max_turns,
+            target_level=args.target_level,
+            script=args.script.split(",") if args.script else None,
+        )
+    finally:
+        TRACER.disable()
+    print(format_report(summary))
+    if isinstance(sink, HistogramSink):
+        print()
+        print(sink.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
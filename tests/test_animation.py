@@ -0,0 +1,100 @@
+import io
+import unittest
+
+from engine.plugins.animation import AnimationScheduler, Timeline
+
+
+def make_scheduler():
+    out = io.StringIO()
+    return AnimationScheduler(out, clock=lambda: 0.0), out
+
+
+class TestAnimationScheduler(unittest.TestCase):
+    def test_frames_are_written_at_their_deadlines(self):
+        scheduler, out = make_scheduler()
+        scheduler.play(Timeline().write("a", 0.1).write("b", 0.1).write("c"))
+        scheduler.tick(0.0)
+        self.assertEqual(out.getvalue(), "a")
+        self.assertAlmostEqual(scheduler.until_next(0.05), 0.05)
+        scheduler.tick(0.1)
+        self.assertEqual(out.getvalue(), "ab")
+        self.assertFalse(scheduler.tick(0.2))
+        self.assertEqual(out.getvalue(), "abc")
+        self.assertFalse(scheduler.busy)
+
+    def test_late_tick_drops_overdrawn_frames(self):
+        scheduler, out = make_scheduler()
+        timeline = Timeline().tween(5, 0.1, lambda i: f"{i}\r").write("done\n")
+        scheduler.play(timeline)
+        scheduler.tick(0.0)
+        # A slow pass: frames 1-4 are all due; only the last of them is still visible
+        scheduler.tick(0.45)
+        self.assertEqual(out.getvalue(), "0\r4\r")
+        self.assertEqual(scheduler.skipped, 3)
+        # Typed (non-replace) frames that come due together go out in one write
+        scheduler.play(Timeline().write("x", 0.02).write("y", 0.02).write("z"))
+        scheduler.tick(1.0)
+        self.assertEqual(out.getvalue(), "0\r4\rdone\nxyz")
+
+    def test_wait_key_holds_until_resumed(self):
+        scheduler, out = make_scheduler()
+        scheduler.play(Timeline().write("prompt").wait_key().write("after", 0.1))
+        scheduler.tick(0.0)
+        self.assertTrue(scheduler.waiting)
+        self.assertIsNone(scheduler.until_next(5.0))
+        scheduler.tick(5.0)
+        self.assertEqual(out.getvalue(), "prompt")
+        scheduler.resume()
+        self.assertTrue(scheduler.tick(6.0))
+        self.assertEqual(out.getvalue(), "promptafter")
+        # The hold is timed from the key press
+        self.assertTrue(scheduler.tick(6.05))
+        self.assertFalse(scheduler.tick(6.1))
+
+    def test_until_polls_then_chains_the_next_timeline(self):
+        scheduler, out = make_scheduler()
+        polls = []
+        scheduler.play(Timeline().until(lambda: polls.append(1) or len(polls) == 3).pause(0.5))
+        scheduler.play(Timeline().write("next"))
+        for now in (0.0, 0.1, 0.2):
+            scheduler.tick(now)
+        self.assertEqual(len(polls), 3)
+        scheduler.tick(0.6)
+        self.assertEqual(out.getvalue(), "")
+        # Starts at the first timeline's end (0.7), not at the tick that noticed it
+        scheduler.tick(0.75)
+        self.assertEqual(out.getvalue(), "next")
+        self.assertFalse(scheduler.busy)
+
+    def test_skip_jumps_to_the_next_key_wait(self):
+        scheduler, out = make_scheduler()
+        scheduler.play(Timeline().tween(10, 0.2, lambda i: f"{i}\r").write("end").wait_key().write("more"))
+        scheduler.tick(0.0)
+        scheduler.skip(0.1)
+        scheduler.tick(0.1)
+        # Everything up to the prompt is drawn at once; the tween frames under "end" are dropped
+        self.assertEqual(out.getvalue(), "0\rend")
+        self.assertTrue(scheduler.waiting)
+        scheduler.resume()
+        scheduler.tick(0.2)
+        self.assertEqual(out.getvalue(), "0\rendmore")
+
+    def test_run_blocks_until_a_key_wait(self):
+        scheduler, out = make_scheduler()
+        clock = [0.0]
+        scheduler.clock = lambda: clock[0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        scheduler.play(Timeline().write("a", 0.3).write("b").wait_key().write("c", 0.2))
+        self.assertTrue(scheduler.run(sleep))
+        self.assertEqual(out.getvalue(), "ab")
+        scheduler.resume()
+        self.assertFalse(scheduler.run(sleep))
+        self.assertEqual(out.getvalue(), "abc")
+        self.assertAlmostEqual(clock[0], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
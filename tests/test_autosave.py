@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from engine.game import Game, GameState
+from persistence import AutoSaver, load_game, save_game, FSYNC_ALWAYS
+
+tiles = {
+    "village": {"name": "Test Village", "description": "A test village.", "danger": 0.0, "safe": True, "ascii": "."},
+    "tiles": [
+        {"name": "Plains", "description": "Open plains.", "danger": 0.1, "safe": False, "ascii": "."},
+    ],
+}
+
+
+class TestAutoSave(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "save.json")
+        self.saver = AutoSaver(fsync=FSYNC_ALWAYS, every=3)
+
+    def tearDown(self):
+        self.saver.close()
+        self.dir.cleanup()
+
+    def test_background_save_and_load(self):
+        msg = self.saver.save({"n": 1}, self.path)
+        self.assertIn(self.path, msg)
+        self.assertEqual(self.saver.load(self.path), {"n": 1})
+        self.assertEqual(os.listdir(self.dir.name), ["save.json"])  # no temp files left behind
+
+    def test_latest_save_wins(self):
+        for n in range(50):
+            self.saver.save({"n": n}, self.path)
+        self.assertTrue(self.saver.flush(timeout=5))
+        self.assertEqual(load_game(self.path), {"n": 49})
+        self.assertEqual(self.saver.writes + self.saver.coalesced, 50)
+
+    def test_maybe_save_every_n_actions(self):
+        game = Game.new_random(size=3, tileset=tiles, seed=1)
+        game.ascii_tiles = False
+        game.save_file = self.path
+        self.assertFalse(self.saver.maybe_save(game))
+        self.assertFalse(self.saver.maybe_save(game))
+        self.assertTrue(self.saver.maybe_save(game))
+        self.saver.flush()
+        self.assertEqual(Game.from_dict(load_game(self.path)).player.name, game.player.name)
+        game.state = GameState.GAME_OVER
+        for _ in range(5):
+            self.assertFalse(self.saver.maybe_save(game))
+
+    def test_save_after_close_is_synchronous(self):
+        self.saver.close()
+        self.saver.save({"n": 2}, self.path)
+        self.assertEqual(load_game(self.path), {"n": 2})
+
+    def test_rejects_unknown_fsync_policy(self):
+        with self.assertRaises(ValueError):
+            AutoSaver(fsync="sometimes")
+
+    def test_save_game_is_atomic(self):
+        save_game({"a": 1}, self.path)
+        self.assertEqual(load_game(self.path), {"a": 1})
+        self.assertEqual(os.listdir(self.dir.name), ["save.json"])
+
+    def test_batched_commands_count_toward_autosave(self):
+        import io
+        import json
+        import web
+        game = Game.new_random(size=5, tileset=tiles, seed=3)
+        body = json.dumps({"cmds": ["look", "xyzzy"] + ["stats"] * (web.AUTOSAVER.every - 1)}).encode("utf-8")
+        web.SESSIONS["autosave-test"] = game
+        game.save_file = self.path
+        environ = {"PATH_INFO": "/play_batch", "QUERY_STRING": "", "HTTP_COOKIE": "sid=autosave-test",
+                   "REQUEST_METHOD": "POST", "CONTENT_LENGTH": str(len(body)), "wsgi.input": io.BytesIO(body)}
+        try:
+            b"".join(web.route(environ, lambda status, headers, exc_info=None: None))
+            web.AUTOSAVER.flush()
+        finally:
+            web.SESSIONS.pop("autosave-test", None)
+        # `every` known commands in one request: one autosave, as that many /play calls would
+        self.assertEqual(load_game(self.path)["player"], game.to_dict()["player"])
+
+
+if __name__ == "__main__":
+    unittest.main()
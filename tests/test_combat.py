@@ -1,7 +1,7 @@
 import unittest
 import random
 
-from engine.game.combat import calc_damage, generate_enemy, depth_from_pos
+from engine.game.combat import calc_damage, generate_enemy, depth_from_pos, EnemyTable
 
 
 class TestCombat(unittest.TestCase):
@@ -37,6 +37,39 @@ class TestCombat(unittest.TestCase):
         self.assertGreater(e.xp_reward, 0)
         self.assertGreater(e.gold_reward, 0)
 
+    def test_enemy_table_matches_formulas(self):
+        arch_types = [
+            {"name": "Goblin", "ascii": "g", "base_hp": 10, "base_attack": 3, "base_defense": 1, "xp_reward": 15, "gold_reward": 5},
+            {"name": "Orc", "ascii": "o", "base_hp": 15, "base_attack": 5, "base_defense": 2, "xp_reward": 25, "gold_reward": 10},
+            {"name": "Troll", "ascii": "T", "base_hp": 20, "base_attack": 7, "base_defense": 3, "xp_reward": 35, "gold_reward": 15},
+            {"name": "Wyrm", "ascii": "W", "base_hp": 40, "base_attack": 9, "base_defense": 5, "xp_reward": 80, "gold_reward": 40},
+        ]
+        table = EnemyTable(arch_types).precompute(6)
+        for depth in range(0, 12):
+            for pl in range(1, 7):
+                outcomes = table.outcomes(depth, pl)
+                self.assertEqual(len(outcomes), 4 * min(3 + depth, len(arch_types)))
+                for st in outcomes:
+                    expected = max(1, min(pl + 3, pl + depth // 2 - 1))
+                    self.assertGreaterEqual(st.level, expected)
+                    self.assertLessEqual(st.level, pl + 3)
+        # Depths past the saturation point share the deepest bucket
+        self.assertIs(table.outcomes(50, 3), table.outcomes(table.max_depth, 3))
+
+        random.seed(5)
+        for _ in range(200):
+            e = table.roll(3, 4)
+            arch = next(a for a in arch_types if e.name.startswith(a["name"]))
+            self.assertEqual(e.defense, arch["base_defense"] + e.level // 3)
+            self.assertIn(e.max_hp - (arch["base_hp"] + e.level * 3), range(0, 4))
+            self.assertIn(e.attack - (arch["base_attack"] + e.level), range(0, 3))
+            self.assertIn(e.xp_reward - (arch["xp_reward"] + e.level * 10), range(0, 11))
+            self.assertIn(e.gold_reward - (arch["gold_reward"] + e.level * 3), range(0, 7))
+
+        probs = sum(row["probability"] for row in table.summary(4, 3))
+        self.assertAlmostEqual(probs, 1.0)
+        self.assertGreater(table.expected_threat(4, 3)["hp"], table.expected_threat(0, 3)["hp"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,57 @@
+import io
+import unittest
+
+from combat_balance import CombatBalancer, player_at_level, parse_range, parse_loadout, write_csv
+
+arch_types = [
+    {"name": "Goblin", "ascii": "g", "base_hp": 10, "base_attack": 3, "base_defense": 1, "xp_reward": 15, "gold_reward": 5},
+    {"name": "Orc", "ascii": "o", "base_hp": 15, "base_attack": 5, "base_defense": 2, "xp_reward": 25, "gold_reward": 10},
+    {"name": "Troll", "ascii": "T", "base_hp": 20, "base_attack": 7, "base_defense": 3, "xp_reward": 35, "gold_reward": 15},
+]
+
+
+class TestCombatBalance(unittest.TestCase):
+    def test_player_at_level(self):
+        p = player_at_level(4)
+        self.assertEqual(p.level, 4)
+        self.assertEqual(p.hp, p.max_hp)
+        self.assertGreater(p.max_hp, 20)
+
+    def test_higher_level_wins_more(self):
+        b = CombatBalancer(arch_types, seed=3)
+        weak = b.fight_batch(player_at_level(1), [], arch_types[2], depth=4, fights=500)
+        strong = b.fight_batch(player_at_level(6), [], arch_types[2], depth=4, fights=500)
+        self.assertLess(weak["win_prob"], 0.1)
+        self.assertGreater(strong["win_prob"], 0.9)
+        self.assertGreater(strong["mean_hp_left"], weak["mean_hp_left"])
+        self.assertLess(strong["expected_turns_win"], weak["expected_turns_win"])
+
+    def test_regen_heals_after_a_lethal_hit(self):
+        b = CombatBalancer(arch_types, seed=1)
+        b._dmg_roll = b._spell_roll = b._coin = b._lvl_offset = b._hp_jitter = b._atk_jitter = lambda: 0
+        brute = {"name": "Brute", "ascii": "B", "base_hp": 25, "base_attack": 17, "base_defense": 0}
+        # Every hit takes 15 HP; from turn 3 on each one leaves 0 HP before Regen's 3 come back,
+        # as in the game, so the player lasts until the enemy's 28 HP are gone
+        res = b.fight_batch(player_at_level(1), ["Regen"], brute, depth=0, fights=1)
+        self.assertEqual(res["win_prob"], 1.0)
+        self.assertEqual(res["expected_turns"], 7)
+        self.assertEqual(res["mean_hp_left"], 3)
+
+    def test_table_rows_and_csv(self):
+        b = CombatBalancer(arch_types, seed=1)
+        rows = b.table([1, 2], [0], ["", "Firebolt"], fights=50)
+        # 3 archetypes + 1 mixed row for each of 2 levels x 2 loadouts
+        self.assertEqual(len(rows), 16)
+        out = io.StringIO()
+        write_csv(rows, out)
+        self.assertTrue(out.getvalue().startswith("player_level,depth,loadout"))
+
+    def test_parsers(self):
+        self.assertEqual(parse_range("1-3,5"), [1, 2, 3, 5])
+        self.assertEqual(parse_loadout("Firebolt+Heal"), ["Firebolt", "Heal"])
+        with self.assertRaises(ValueError):
+            parse_loadout("Meteor")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from engine.game import Game, GameState
+from engine.game.combat_state import (CombatState, step, run_fight, ATTACK, CAST, POTION, FLEE, HIT, OOM,
+                                      GUARD_BREAK, ONGOING, WON, LOST, ESCAPED)
+from engine.game.enemy import Enemy
+from engine.game.rng import RngStream
+
+
+def fresh_state() -> CombatState:
+    return CombatState(player_hp=30, player_max_hp=30, player_mp=10, player_attack=7, player_defense=3,
+                       player_level=2, potions=1, enemy_hp=20, enemy_max_hp=20, enemy_attack=5, enemy_defense=2,
+                       enemy_level=2)
+
+
+class TestCombatState(unittest.TestCase):
+    def test_step_leaves_input_untouched(self):
+        st = fresh_state()
+        before = st.to_dict()
+        new, events = step(st, ATTACK, RngStream(1, "combat"))
+        self.assertEqual(st.to_dict(), before)
+        self.assertEqual(events[0][0], HIT)
+        self.assertEqual(new.enemy_hp, 20 - events[0][1])
+        self.assertEqual(new.turn, 1)
+
+    def test_cast_effects_and_oom(self):
+        st = fresh_state()
+        new, events = step(st, CAST, RngStream(1, "combat"), "Guard Break")
+        self.assertEqual(events[0][0], GUARD_BREAK)
+        self.assertEqual(new.player_mp, 10 - 4)
+        self.assertEqual(new.def_turns, 1)  # one turn already decayed by the enemy's reply
+        st.player_mp = 0
+        new, events = step(st, CAST, RngStream(1, "combat"), "Firebolt")
+        self.assertEqual(events, [(OOM, 4)])
+        self.assertEqual(new.to_dict(), st.to_dict())
+
+    def test_fights_run_without_a_game(self):
+        rng = RngStream(5, "combat")
+        outcomes = set()
+        for enemy_attack in (5, 14):
+            for _ in range(100):
+                start = fresh_state()
+                start.enemy_attack = enemy_attack
+                st, turns = run_fight(start, lambda s: (POTION, None) if s.player_hp < 8 else (ATTACK, None), rng)
+                self.assertIn(st.outcome, (WON, LOST))
+                self.assertGreater(turns, 0)
+                outcomes.add(st.outcome)
+        self.assertEqual(outcomes, {WON, LOST})
+        st, _ = step(fresh_state(), FLEE, RngStream(2, "combat"))
+        self.assertIn(st.outcome, (ONGOING, ESCAPED))
+
+    def test_game_combat_matches_pure_steps(self):
+        game = Game.new_random(size=5, tileset=None, seed=11)
+        game.ascii_tiles = False
+        enemy = Enemy("Wolf", "w", 2, 40, 40, 4, 1, 5, 5)
+        game.enter_combat(enemy)
+        st = CombatState.from_entities(game.player, enemy)
+        rng = RngStream(0, "combat")
+        rng.setstate(game.rng.combat.getstate())
+        while game.state == GameState.COMBAT:
+            game.combat_attack()
+            st, _ = step(st, ATTACK, rng)
+            self.assertEqual(game.player.hp, st.player_hp)
+            self.assertEqual(enemy.hp, st.enemy_hp)
+        self.assertIn(st.outcome, (WON, LOST))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -49,6 +49,9 @@ class DummyGame:
         self.start_load_game = MagicMock(return_value="start_load")
         self.start_quit = MagicMock(return_value="start_quit")
         self.execute_question = MagicMock(return_value="answered")
+        self.use_potion = MagicMock(return_value="use_potion")
+        self.travel_village = MagicMock(return_value="travel_village")
+        self.travel_shop = MagicMock(return_value="travel_shop")
 
 class TestAction(unittest.TestCase):
     def test_to_dict(self):
@@ -92,6 +95,25 @@ class TestActions(unittest.TestCase):
         self.assertIn("move_n", ids)
         self.assertIn("look", ids)
         self.assertIn("inventory", ids)
+        self.assertIn("travel_village", ids)
+        self.assertIn("travel_shop", ids)
+
+    def test_travel_actions(self):
+        self.g.state = None
+        enabled = {a["id"]: a["enabled"] for a in self.actions.available()}
+        # No village on the dummy world and no merchant found yet
+        self.assertFalse(enabled["travel_village"])
+        self.assertFalse(enabled["travel_shop"])
+        self.g.world.village = (0, 0)
+        self.g.shops = {(4, 4)}
+        enabled = {a["id"]: a["enabled"] for a in self.actions.available()}
+        self.assertTrue(enabled["travel_village"])
+        self.assertTrue(enabled["travel_shop"])
+        self.assertEqual(self.actions.execute("home"), "travel_village")
+        self.assertEqual(self.actions.execute("merchant"), "travel_shop")
+        self.g.x, self.g.y = 0, 0
+        enabled = {a["id"]: a["enabled"] for a in self.actions.available()}
+        self.assertFalse(enabled["travel_village"])
 
     def test_execute_by_id(self):
         self.g.state = GameState.COMBAT
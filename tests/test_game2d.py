@@ -0,0 +1,177 @@
+import random
+import unittest
+
+from engine.plugins.game2d import (Game2DPlugin, FixedClock, CollisionMap, EnemyPatrol, LEDGE_LEFT, LEDGE_RIGHT,
+                                   PATROL_MIN_ENEMIES, render_room, render_room_full)
+
+
+def make_plugin(seed: int = 3) -> Game2DPlugin:
+    # 16 steps/s keeps every time below exact in binary floating point
+    plugin = Game2DPlugin(num_rooms=2, room_width=15, room_height=8, rng=random.Random(seed), tick_rate=16)
+    plugin.ignore_combat = True
+    return plugin
+
+
+class TestFixedClock(unittest.TestCase):
+    def test_steps_follow_elapsed_time_not_frames(self):
+        clock = FixedClock(rate=16, max_steps=5)
+        self.assertEqual(clock.tick(10.0), 0)
+        # Eight fast frames of 1/64s make two 1/16s steps in total
+        steps = sum(clock.tick(10.0 + i / 64.0) for i in range(1, 9))
+        self.assertEqual(steps, 2)
+        self.assertEqual(clock.alpha, 0.0)
+        self.assertEqual(clock.tick(10.0 + 10 / 64.0), 0)
+        self.assertEqual(clock.alpha, 0.5)
+
+    def test_stalls_are_capped(self):
+        clock = FixedClock(rate=16, max_steps=5)
+        clock.tick(0.0)
+        self.assertEqual(clock.tick(3.0), 5)
+        self.assertEqual(clock.dropped, 43)
+        self.assertLess(clock.accumulator, clock.dt)
+
+
+class TestGame2DTimestep(unittest.TestCase):
+    def test_same_physics_at_any_frame_rate(self):
+        slow, fast = make_plugin(), make_plugin()
+        for plugin in (slow, fast):
+            plugin.player.dy = -plugin.jump_velocity
+            plugin.advance(0.0)
+        for i in range(1, 5):
+            slow.advance(i * 0.25)
+        for i in range(1, 65):
+            fast.advance(i / 64.0)
+        self.assertEqual(slow.clock.steps, 16)
+        self.assertEqual(fast.clock.steps, 16)
+        self.assertEqual((slow.player.x, slow.player.y), (fast.player.x, fast.player.y))
+
+    def test_fast_forward_matches_updates(self):
+        a, b = make_plugin(), make_plugin()
+        a.fast_forward(40)
+        for _ in range(40):
+            b.update()
+        self.assertEqual(a.get_state(), b.get_state())
+        x, y = a.player.lerp(0.5)
+        self.assertEqual(x, (a.player.prev_x + a.player.x) / 2)
+
+
+class TestCollisionMap(unittest.TestCase):
+    def test_masks_match_platform_cells(self):
+        # Ground row plus a floating platform at x 3..5, y 2
+        cells = {(x, 5) for x in range(8)} | {(3, 2), (4, 2), (5, 2)}
+        cmap = CollisionMap.from_cells(8, 6, cells)
+        self.assertTrue(cmap.is_solid(4, 2))
+        self.assertFalse(cmap.is_solid(4, 1))
+        self.assertFalse(cmap.is_solid(-1, 5))
+        self.assertTrue(cmap.has_ground(4, 1))
+        self.assertTrue(cmap.has_ground(1, 4))
+        self.assertFalse(cmap.has_ground(1, 1))
+        self.assertEqual(cmap.landing_row(4, 0, 4), 2)
+        self.assertEqual(cmap.landing_row(4, 3, 9), 5)
+        self.assertEqual(cmap.landing_row(1, 0, 3), -1)
+        self.assertEqual(cmap.landing_row(1, -3, 2), -1)
+        # Ends of the floating platform are drop-offs, the middle is not
+        self.assertEqual(cmap.ledge[1 * 8 + 3], LEDGE_LEFT)
+        self.assertEqual(cmap.ledge[1 * 8 + 4], 0)
+        self.assertEqual(cmap.ledge[1 * 8 + 5], LEDGE_RIGHT)
+        # Side walls count as blocked
+        self.assertTrue(cmap.ledge[4 * 8 + 1] & LEDGE_LEFT)
+        self.assertTrue(cmap.ledge[4 * 8 + 6] & LEDGE_RIGHT)
+
+    def test_rooms_keep_the_map_in_sync(self):
+        plugin = make_plugin()
+        for room in plugin.rooms:
+            for y in range(room.height):
+                for x in range(room.width):
+                    self.assertEqual(room.collision.is_solid(x, y), (x, y) in room.platforms)
+
+
+class Walker:
+    name = "Walker"
+    hp = 1
+
+    def __init__(self, x, y, direction):
+        self.x, self.y, self.direction = x, y, direction
+
+    def to_dict(self):
+        return {"name": self.name, "x": self.x, "y": self.y}
+
+
+class TestEnemyPatrol(unittest.TestCase):
+    def test_patrols_turn_at_ledges_and_hash_cells(self):
+        cells = {(x, 5) for x in range(8)} | {(3, 2), (4, 2), (5, 2)}
+        cmap = CollisionMap.from_cells(8, 6, cells)
+        a, b, c = Walker(4, 1, 1), Walker(5, 1, -1), Walker(-3, 4, 1)
+        patrol = EnemyPatrol([a, b, c], 8, 6)
+        self.assertEqual(len(patrol), 3)
+        self.assertIs(patrol.at(4, 1), a)
+        patrol.step(cmap.patrol)
+        # a walks right onto 5, b walks left onto 4; nothing is written back until sync()
+        self.assertIs(patrol.at(5, 1), a)
+        self.assertIs(patrol.at(4, 1), b)
+        self.assertEqual(a.x, 4)
+        patrol.sync()
+        self.assertEqual((a.x, a.direction, b.x, b.direction), (5, 1, 4, -1))
+        patrol.step(cmap.patrol)
+        patrol.sync()
+        # a faces the drop-off past 5 and turns back to 4; b walks on to the platform's end
+        self.assertEqual((a.x, a.direction, b.x, b.direction), (4, -1, 3, -1))
+        self.assertEqual(c.x, -3)
+        self.assertIsNone(patrol.at(0, 0))
+        # Two enemies on one cell, heading opposite ways: the first in the list is found
+        d, e = Walker(2, 1, 1), Walker(2, 1, -1)
+        self.assertIs(EnemyPatrol([d, e], 8, 6).at(2, 1), d)
+        self.assertIs(EnemyPatrol([e, d], 8, 6).at(2, 1), e)
+
+    def test_crowded_room_collides_through_the_hash(self):
+        plugin = make_plugin()
+        plugin.ignore_combat = False
+        room = plugin.get_current_room()
+        room.spawn_enemies(plugin.enemy_archetypes, 1, max_enemies=1)
+        for _ in range(300):
+            room.enemies.append(Walker(1, room.height - 2, 1))
+        room.enemies[0].x, room.enemies[0].y = 3, room.height - 2
+        plugin.player.x, plugin.player.y = 3.0, float(room.height - 2)
+        plugin.fast_forward(1)
+        self.assertEqual(plugin.state, "combat")
+        self.assertIs(plugin.combat_enemy, room.enemies[0])
+        plugin.remove_battle_enemy()
+        self.assertEqual(len(room.enemy_patrol()), 300)
+
+    def test_small_rooms_patrol_one_enemy_at_a_time(self):
+        plugin = make_plugin()
+        room = plugin.get_current_room()
+        walkers = [Walker(1 + i % 12, room.height - 2, 1) for i in range(PATROL_MIN_ENEMIES)]
+        room.enemies = list(walkers)
+        start = [(w.x, w.direction) for w in walkers]
+        room.step_enemies()
+        self.assertIsNotNone(room.patrol)
+        # Dropping below the threshold writes the batched positions back before the loop takes over
+        room.remove_enemy(walkers[-1])
+        batched = [(w.x, w.direction) for w in walkers]
+        self.assertNotEqual(batched, start)
+        room.step_enemies()
+        self.assertIsNone(room.patrol)
+        self.assertNotEqual([(w.x, w.direction) for w in walkers[:-1]], batched[:-1])
+        first = walkers[0]
+        self.assertIs(room.enemy_at(first.x, first.y), first)
+        self.assertIsNone(room.enemy_at(0, 0))
+
+
+class TestRoomRenderer(unittest.TestCase):
+    def test_cached_frames_match_the_full_render(self):
+        plugin = make_plugin()
+        rng = random.Random(5)
+        room = plugin.get_current_room()
+        room.spawn_enemies([{"name": "Big", "ascii": "  /^^^^\\  \n (  o o )\n  \\ -- /\n  /|  |\\\n  d    b"}], 1,
+                           max_enemies=2)
+        self.assertIs(room.renderer.room, room)
+        for step in range(60):
+            plugin.move_player(rng.choice((-1, 1)))
+            plugin.fast_forward(1)
+            alpha = (step % 4) / 4.0
+            self.assertEqual(render_room(room, plugin.player, alpha), render_room_full(room, plugin.player, alpha))
+
+
+if __name__ == "__main__":
+    unittest.main()
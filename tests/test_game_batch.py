@@ -0,0 +1,49 @@
+import unittest
+
+from engine.game import Game, GameState
+from engine.game.enemy import Enemy
+
+tiles = {
+    "village": {"name": "Test Village", "description": "A test village.", "danger": 0.0, "safe": True, "ascii": "."},
+    "tiles": [
+        {"name": "Plains", "description": "Open plains.", "danger": 0.1, "safe": False, "ascii": "."},
+        {"name": "Forest", "description": "Dense forest.", "danger": 0.3, "safe": False, "ascii": "."},
+    ],
+}
+
+
+class TestGameBatch(unittest.TestCase):
+    def setUp(self):
+        self.game = Game.new_random(size=5, tileset=tiles, seed=7)
+        self.game.ascii_tiles = False
+
+    def test_runs_all_commands(self):
+        batch = self.game.execute_batch(["look", "stats", "map"])
+        self.assertEqual(batch["executed"], 3)
+        self.assertIsNone(batch["stopped"])
+        self.assertEqual(batch["state"], GameState.EXPLORING)
+        self.assertTrue(all(r["known"] for r in batch["results"]))
+
+    def test_unknown_command_does_not_stop(self):
+        batch = self.game.execute_batch(["dance", "look"])
+        self.assertEqual(batch["executed"], 2)
+        self.assertFalse(batch["results"][0]["known"])
+        self.assertIsNone(batch["results"][0]["output"])
+
+    def test_stays_in_combat_without_stopping(self):
+        self.game.enter_combat(Enemy("Dummy", "d", 1, 999, 999, 0, 0, 1, 1))
+        batch = self.game.execute_batch(["look", "stats"])
+        self.assertEqual(batch["executed"], 2)
+        self.assertIsNone(batch["stopped"])
+        self.assertEqual(batch["state"], GameState.COMBAT)
+
+    def test_stops_on_game_over(self):
+        self.game.player.hp = 1
+        self.game.enter_combat(Enemy("Brute", "B", 9, 999, 999, 99, 99, 1, 1))
+        batch = self.game.execute_batch(["attack", "attack", "attack"])
+        self.assertEqual(batch["executed"], 1)
+        self.assertEqual(batch["stopped"], GameState.GAME_OVER)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+from engine.game import Game
+from engine.game.journal import CommandJournal, ReplayError
+
+tiles = {
+    "village": {"name": "Test Village", "description": "A test village.", "danger": 0.0, "safe": True, "ascii": "."},
+    "tiles": [
+        {"name": "Plains", "description": "Open plains.", "danger": 0.4, "safe": False, "ascii": "."},
+        {"name": "Forest", "description": "Dense forest.", "danger": 0.5, "safe": False, "ascii": "."},
+    ],
+}
+archetypes = [
+    {"name": "Goblin", "ascii": "g", "base_hp": 10, "base_attack": 3, "base_defense": 1, "xp_reward": 15, "gold_reward": 5},
+    {"name": "Orc", "ascii": "o", "base_hp": 15, "base_attack": 5, "base_defense": 2, "xp_reward": 25, "gold_reward": 10},
+]
+commands = ["e", "attack", "attack", "attack", "n", "attack", "attack", "w", "rest", "s", "s", "attack", "attack",
+            "e", "attack", "attack", "potion", "n", "look", "stats", "w", "w", "attack", "attack", "attack"]
+
+
+def configure(game: Game) -> None:
+    game.ascii_tiles = False
+    game.enemy_archetypes = archetypes
+    game.event_manager.muted = True
+
+
+def fingerprint(game: Game) -> dict:
+    d = game.to_dict()
+    return {k: d[k] for k in ("player", "pos", "explored", "state", "rng", "combat")}
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.game = Game.new_random(size=5, tileset=tiles, seed=21)
+        configure(self.game)
+        # Strong enough to survive the script, so it keeps exploring between fights
+        self.game.player.attack = 40
+        self.game.player.max_hp = self.game.player.hp = 500
+
+    def test_replay_reconstructs_every_point(self):
+        journal = CommandJournal(snapshot_every=4).attach(self.game)
+        prints = {0: fingerprint(self.game)}
+        for cmd in commands:
+            self.game.execute_action(cmd)
+            prints[len(journal.entries)] = fingerprint(self.game)
+        self.assertGreater(len(journal.snapshots), 1)
+        for n, expected in prints.items():
+            self.assertEqual(fingerprint(journal.replay(n, configure)), expected)
+
+    def test_unknown_commands_are_not_recorded(self):
+        journal = CommandJournal().attach(self.game)
+        self.game.execute_action("dance")
+        self.game.execute_action("l")
+        self.assertEqual([e["action"] for e in journal.entries], ["look"])
+
+    def test_divergence_is_detected(self):
+        journal = CommandJournal().attach(self.game)
+        for cmd in commands[:6]:
+            self.game.execute_action(cmd)
+        journal.entries[-1]["rng"]["combat"] = [1, 1]
+        with self.assertRaises(ReplayError):
+            journal.replay(configure=configure)
+        journal.replay(configure=configure, strict=False)
+
+    def test_jsonl_file_recovery(self):
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        os.remove(path)
+        try:
+            journal = CommandJournal(snapshot_every=3, path=path).attach(self.game)
+            for cmd in commands:
+                self.game.execute_action(cmd)
+            journal.close()
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('{"action": "lo')  # torn write from a crash
+            recovered = CommandJournal.load(path)
+            self.assertEqual(len(recovered.entries), len(journal.entries))
+            game = recovered.replay(configure=configure)
+            self.assertEqual(fingerprint(game), fingerprint(self.game))
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import io
+import unittest
+
+from engine.game.event import EventManager
+from engine.plugins.metrics import Metrics, Series, hud_lines
+from engine.plugins.screen_buffer import ScreenBuffer
+
+
+def make_metrics():
+    clock = [0.0]
+    metrics = Metrics(window=10, clock=lambda: clock[0])
+    metrics.enabled = True
+    return metrics, clock
+
+
+class TestMetrics(unittest.TestCase):
+    def test_series_keeps_a_rolling_window(self):
+        series = Series(window=4)
+        for value in (100, 1, 2, 3, 4):
+            series.add(value)
+        self.assertEqual(list(series.samples), [1, 2, 3, 4])
+        self.assertEqual(series.percentile(50), 2)
+        self.assertEqual(series.percentile(99), 4)
+        self.assertEqual((series.count, series.max, series.last), (5, 100, 4))
+
+    def test_frame_totals_become_one_sample(self):
+        metrics, clock = make_metrics()
+        with metrics.timer("render"):
+            clock[0] += 0.002
+        metrics.add("dispatch", 1.0)
+        metrics.add("dispatch", 0.5)
+        metrics.end_frame()
+        # No dispatch in this frame: it still counts, as 0
+        metrics.add("render", 3.0)
+        metrics.end_frame()
+        snapshot = metrics.snapshot()
+        self.assertAlmostEqual(snapshot["render"]["p50"], 2.0)
+        self.assertEqual(list(metrics.series["dispatch"].samples), [1.5, 0.0])
+        self.assertEqual(metrics.frames, 2)
+
+    def test_nothing_is_recorded_while_disabled(self):
+        metrics, clock = make_metrics()
+        metrics.enabled = False
+        with metrics.timer("render"):
+            clock[0] += 1
+        metrics.add("bytes", 10)
+        metrics.end_frame()
+        self.assertEqual((metrics.snapshot(), metrics.frames), ({}, 0))
+
+    def test_instrumented_events_are_timed(self):
+        metrics, clock = make_metrics()
+        events = EventManager()
+        events.subscribe(lambda event: clock.__setitem__(0, clock[0] + 0.001))
+        metrics.instrument(events)
+        events.fire("moved")
+        events.fire("moved")
+        metrics.end_frame()
+        self.assertAlmostEqual(metrics.series["dispatch"].last, 2.0)
+
+    def test_hud_is_drawn_under_the_frame(self):
+        metrics, _ = make_metrics()
+        metrics.observe("render", 1.25)
+        screen = ScreenBuffer(io.StringIO(), size_fn=lambda: (100, 40))
+        screen.overlay = lambda: hud_lines(metrics, ("render", "bytes"))
+        screen.render(["room"])
+        self.assertEqual(screen.lines[0], "room")
+        self.assertIn("1.25ms", screen.lines[2])
+        self.assertEqual(screen.lines[3], " bytes     -")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from engine.game import Game, GameState
+from engine.game.pathfinding import find_path, distance_field, follow_field, cost_grid, step_cost
+from engine.game.world import World, Tile
+
+calm = {
+    "village": {"name": "Test Village", "description": "A test village.", "danger": 0.0, "safe": True, "ascii": "."},
+    "tiles": [
+        {"name": "Meadow", "description": "Quiet meadow.", "danger": 0.0, "safe": False, "ascii": "."},
+    ],
+}
+
+
+def flat_world(size: int) -> World:
+    grid = [[Tile("Meadow", "Quiet meadow.", 0.0) for _ in range(size)] for _ in range(size)]
+    world = World(size, size, grid, seed=1)
+    world.weather.codes = [0] * len(world.weather.codes)
+    return world
+
+
+def path_cost(world: World, path: list) -> float:
+    return sum(step_cost(world, x, y) for x, y in path)
+
+
+class TestPathfinding(unittest.TestCase):
+    def test_path_goes_around_danger(self):
+        world = flat_world(5)
+        for y in range(4):
+            world.get_tile(2, y).danger = 0.8
+        path = find_path(world, (0, 1), (4, 1))
+        self.assertEqual(path[-1], (4, 1))
+        self.assertIn((2, 4), path)  # the only calm crossing
+        for (ax, ay), (bx, by) in zip([(0, 1)] + path, path):
+            self.assertEqual(abs(ax - bx) + abs(ay - by), 1)
+
+    def test_distance_field_agrees_with_astar(self):
+        world = World.generate_random(size=9, seed=4, tileset=None)
+        costs = cost_grid(world)
+        field = distance_field(world, [world.village], costs)
+        for start in ((0, 0), (8, 3), (2, 7)):
+            astar = find_path(world, start, world.village, costs)
+            downhill = follow_field(world, field, start, costs)
+            self.assertAlmostEqual(path_cost(world, astar), field[start[1] * world.width + start[0]])
+            self.assertAlmostEqual(path_cost(world, downhill), path_cost(world, astar))
+
+    def test_travel_to_village(self):
+        game = Game.new_random(size=7, tileset=calm, seed=2)
+        game.ascii_tiles = False
+        for row in game.world.grid:
+            for t in row:
+                t.danger = 0.0
+        weather = game.world.weather
+        weather.codes = [0] * len(weather.codes)
+        weather.update_every = 10 ** 6  # keep the fronts away
+        game.warp_to_tile(0, 0)
+        out = game.execute_action("home")
+        for _ in range(5):
+            # A weapon found on the way stops travel with a question; decline and carry on
+            if game.state != GameState.ASKING_QUESTION:
+                break
+            game.execute_action("n")
+            out = game.execute_action("home")
+        self.assertEqual((game.x, game.y), game.world.village)
+        self.assertIn("the village", out)
+        ids = {a["id"]: a for a in game.available_actions()}
+        self.assertFalse(ids["travel_village"]["enabled"])
+
+    def test_travel_stops_at_encounter(self):
+        game = Game.new_random(size=7, tileset=calm, seed=2)
+        game.ascii_tiles = False
+        game.enemy_archetypes = [{"name": "Rat", "ascii": "r", "base_hp": 3, "base_attack": 1, "base_defense": 0,
+                                  "xp_reward": 1, "gold_reward": 1}]
+        for row in game.world.grid:
+            for t in row:
+                if not t.safe:
+                    t.danger = 0.59  # below the warning threshold, but an encounter is likely
+        game.world.weather.codes = [0] * len(game.world.weather.codes)
+        game.x, game.y = 0, 0
+        game.travel_village()
+        self.assertNotEqual((game.x, game.y), game.world.village)
+        self.assertIn(game.state, (GameState.COMBAT, GameState.ASKING_QUESTION, GameState.EXPLORING))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from engine.game.enemy import Enemy, ENEMY_POOL
+from engine.game.event import EventManager, GameEvent, EVENT_POOL
+from engine.game.pool import ObjectPool
+from engine.plugins.game2d import Room2D
+from engine.game.rng import RngStream
+
+
+class TestObjectPool(unittest.TestCase):
+    def test_acquire_reuses_released_objects(self):
+        pool = ObjectPool(Enemy)
+        a = pool.acquire("Rat", "r", 1, 5, 5, 2, 0, 1, 1)
+        pool.release(a)
+        pool.release(a)  # double release is ignored
+        b = pool.acquire("Wolf", "w", 3, 12, 9, 4, 1, 6, 3)
+        self.assertIs(a, b)
+        self.assertEqual((b.name, b.level, b.max_hp, b.hp, b.direction), ("Wolf", 3, 12, 9, 0))
+        self.assertEqual(pool.stats(), {"created": 1, "reused": 1, "free": 0})
+        c = pool.acquire("Bat", "b", 1, 3, 3, 1, 0, 1, 1)
+        self.assertIsNot(c, b)
+
+    def test_retained_objects_stay_out_of_the_pool(self):
+        pool = ObjectPool(Enemy)
+        a = pool.acquire("Rat", "r", 1, 5, 5, 2, 0, 1, 1).retain()
+        pool.release(a)
+        self.assertEqual(pool.free, [])
+
+    def test_fire_recycles_events_unless_retained(self):
+        em = EventManager()
+        kept = []
+        em.subscribe(lambda e: kept.append(e.retain()) if e.event_type == GameEvent.LEVEL_UP else None)
+        em.fire(GameEvent.INFO, {"information": "a"})
+        before = EVENT_POOL.reused
+        em.fire(GameEvent.LEVEL_UP, {"level": 2})
+        self.assertEqual(EVENT_POOL.reused, before + 1)
+        em.fire(GameEvent.INFO, {"information": "b"})
+        self.assertEqual(kept[0].payload, {"level": 2})
+        self.assertEqual(kept[0].event_type, GameEvent.LEVEL_UP)
+
+    def test_muted_fire_allocates_nothing(self):
+        em = EventManager()
+        em.subscribe(lambda e: None)
+        em.muted = True
+        created, reused = EVENT_POOL.created, EVENT_POOL.reused
+        em.fire(GameEvent.INFO, {})
+        self.assertEqual((EVENT_POOL.created, EVENT_POOL.reused), (created, reused))
+
+    def test_room_respawn_recycles_enemies(self):
+        room = Room2D(0, rng=RngStream(3, "rooms"))
+        archetypes = [{"name": "Goblin"}]
+        room.spawn_enemies(archetypes, 2, max_enemies=3)
+        old = list(room.enemies)
+        room.spawn_enemies(archetypes, 2, max_enemies=3)
+        reused = [e for e in room.enemies if any(e is o for o in old)]
+        self.assertTrue(reused)
+        for e in room.enemies:
+            self.assertEqual(e.max_hp, 14)
+            self.assertIn(e.direction, (-1, 1))
+        room.release_enemies()
+        self.assertEqual(room.enemies, [])
+        self.assertGreaterEqual(len(ENEMY_POOL.free), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import io
+import json
+import unittest
+
+from engine.game import Game
+from engine.plugins.metrics import Metrics
+from engine.plugins.prometheus import Registry, ServerMetrics
+from json_loader import JsonLoader
+
+
+class TestRegistry(unittest.TestCase):
+    def test_text_exposition(self):
+        registry = Registry()
+        counter = registry.counter("hits_total", "Hits.", ("route",))
+        counter.inc("/a")
+        counter.inc('/"b"', amount=2)
+        registry.gauge("sessions", "Sessions.", fn=lambda: 3)
+        histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(7)
+        self.assertEqual(registry.expose().splitlines(), [
+            "# HELP hits_total Hits.",
+            "# TYPE hits_total counter",
+            'hits_total{route="/\\"b\\""} 2',
+            'hits_total{route="/a"} 1',
+            "# HELP sessions Sessions.",
+            "# TYPE sessions gauge",
+            "sessions 3",
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 2',
+            'latency_seconds_bucket{le="+Inf"} 3',
+            "latency_seconds_sum 7.55",
+            "latency_seconds_count 3",
+        ])
+
+
+class TestServerMetrics(unittest.TestCase):
+    def test_watched_games_count_actions_and_events(self):
+        sessions = {}
+        engine = Metrics()
+        engine.enabled = True
+        metrics = ServerMetrics(sessions, engine=engine)
+        game = Game.new_random(size=5, tileset=JsonLoader().load("data/tileset.json"), seed=3)
+        sessions["a"] = game
+        metrics.watch(game)
+        metrics.watch(game)
+        # Watching registers no listener, so unobserved games keep skipping event payloads
+        self.assertFalse(game.event_manager.active)
+        game.execute_batch(["look", "xyzzy", "stats"])
+        game.execute_action("north")
+        # Counted by action id, whatever key was typed
+        self.assertEqual(metrics.actions.get("look"), 1)
+        self.assertEqual(metrics.actions.get("stats"), 1)
+        self.assertEqual(metrics.actions.get("move_n"), 1)
+        self.assertEqual(metrics.actions.get("unknown"), 1)
+        self.assertEqual(metrics.events.get("attempt_move"), 0)
+        # Once someone listens, every event that reaches it is counted
+        seen = []
+        game.event_manager.subscribe(lambda event: seen.append(event.event_type))
+        game.execute_action("y")  # confirms the move into the dangerous tile north
+        self.assertIn("moved", seen)
+        self.assertEqual(sum(metrics.events.values.values()), len(seen))
+        text = metrics.expose()
+        self.assertIn("oakheart_active_sessions 1", text)
+        self.assertIn('oakheart_engine{metric="update",stat="count"} 5', text)
+        self.assertIn('oakheart_engine{metric="dispatch",stat="count"} 1', text)
+
+    def test_web_metrics_endpoint(self):
+        import web
+        game = Game.new_random(size=5, tileset=JsonLoader().load("data/tileset.json"), seed=3)
+        body = json.dumps(game.to_dict()).encode("utf-8")
+
+        def call(path, query="", data=b""):
+            statuses = []
+            environ = {"PATH_INFO": path, "QUERY_STRING": query, "HTTP_COOKIE": "sid=metrics-test",
+                       "REQUEST_METHOD": "POST" if data else "GET", "CONTENT_LENGTH": str(len(data)),
+                       "wsgi.input": io.BytesIO(data)}
+            out = b"".join(web.app(environ, lambda status, headers, exc_info=None: statuses.append(status)))
+            return statuses[0], out.decode("utf-8")
+
+        try:
+            self.assertEqual(call("/load_state", data=body)[0], "200 OK")
+            call("/play_batch", "cmds=look,stats")
+            status, text = call("/metrics")
+        finally:
+            web.SESSIONS.pop("metrics-test", None)
+        self.assertEqual(status, "200 OK")
+        self.assertIn('oakheart_actions_total{action="look"} 1', text)
+        self.assertIn('oakheart_http_requests_total{route="/play_batch",status="200"} 1', text)
+        self.assertIn('oakheart_load_bytes_count{kind="browser"} 1', text)
+        self.assertIn('oakheart_queue_depth{queue="autosave"} 0', text)
+        self.assertIn('oakheart_engine{metric="update",stat="p95"}', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
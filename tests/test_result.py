@@ -0,0 +1,74 @@
+import unittest
+
+from engine.game import Game, GameState
+from engine.game import combat_state as cs
+from engine.game.enemy import Enemy
+from engine.game.result import Result, as_result, COMBAT, COMBAT_START, COMBAT_STATUS, MESSAGE, STATS, FORMATTERS
+
+
+class TestResult(unittest.TestCase):
+    def test_text_is_built_on_demand_and_cached(self):
+        calls = []
+        FORMATTERS["test_kind"] = lambda d: calls.append(d) or f"value {d['n']}"
+        try:
+            r = Result("test_kind", {"n": 3}).add(Result(MESSAGE, {"text": "more"})).add(None)
+            self.assertEqual(calls, [])
+            self.assertEqual(r.text(), "value 3\nmore")
+            self.assertEqual(str(r), "value 3\nmore")
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(r.to_dict(), {"kind": "test_kind", "data": {"n": 3},
+                                           "parts": [{"kind": MESSAGE, "data": {"text": "more"}, "parts": []}]})
+        finally:
+            del FORMATTERS["test_kind"]
+        self.assertEqual(Result(COMBAT, sep="\n\n").add(Result(MESSAGE, {"text": "a"})).add(
+            Result(MESSAGE, {"text": ""})).add(Result(MESSAGE, {"text": "b"})).text(), "a\n\nb")
+        self.assertIs(as_result(r), r)
+        self.assertEqual(as_result("plain").to_dict()["data"], {"text": "plain"})
+
+    def test_game_returns_records_when_text_is_off(self):
+        game = Game.new_random(size=5, tileset=None, seed=11)
+        game.ascii_tiles = False
+        game.text_results = False
+        stats = game.stats()
+        self.assertEqual(stats.kind, STATS)
+        self.assertEqual(stats.data["hp"], game.player.hp)
+        start = game.enter_combat(Enemy("Wolf", "w", 2, 40, 40, 4, 1, 5, 5))
+        self.assertEqual(start.kind, COMBAT_START)
+        self.assertEqual(start.find(COMBAT_STATUS).data["enemy_hp"], 40)
+        out = game.combat_attack()
+        self.assertEqual(out.kind, COMBAT)
+        hit = out.find(cs.HIT)
+        self.assertEqual(hit.data["enemy"], "Wolf")
+        self.assertEqual(game.enemy.hp, 40 - hit.data["value"])
+        self.assertIn(f"You strike the Wolf for {hit.data['value']} damage.", out.text())
+
+    def test_unobserved_game_fires_nothing(self):
+        game = Game.new_random(size=5, tileset=None, seed=11)
+        game.ascii_tiles = False
+        fired = []
+        game.event_manager.fire = lambda event_type, payload=None: fired.append(event_type)
+        # Resting twice, walking into the world's edge and a danger prompt, fleeing and winning a fight
+        for cmd in ["rest", "rest"] + ["n"] * 6 + ["w"]:
+            game.execute_action(cmd)
+        game.change_state(GameState.EXPLORING)
+        game.enter_combat(Enemy("Wolf", "w", 2, 40, 40, 4, 1, 5, 5))
+        for _ in range(3):
+            game.combat_flee()
+        game.enter_combat(Enemy("Rat", "r", 1, 1, 1, 1, 0, 5, 5))
+        game.combat_attack()
+        self.assertEqual(fired, [])
+
+    def test_text_mode_output_is_unchanged(self):
+        game = Game.new_random(size=5, tileset=None, seed=11)
+        game.ascii_tiles = False
+        game.enter_combat(Enemy("Wolf", "w", 2, 40, 40, 4, 1, 5, 5))
+        out = game.combat_attack()
+        self.assertIsInstance(out, str)
+        self.assertEqual(game.state, GameState.COMBAT)
+        self.assertTrue(out.startswith("You strike the Wolf for "))
+        self.assertIn("You: ", out)
+        self.assertIn("[Enemy Stats] ATK: 4 | DEF: 1", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import io
+import unittest
+
+from engine.plugins.screen_buffer import ScreenBuffer, CLEAR
+
+
+def make_screen(rows: int = 40, columns: int = 100):
+    out = io.StringIO()
+    return ScreenBuffer(out, size_fn=lambda: (columns, rows)), out
+
+
+class TestScreenBuffer(unittest.TestCase):
+    def test_first_frame_is_a_full_redraw(self):
+        screen, out = make_screen()
+        screen.render("one\ntwo")
+        self.assertEqual(out.getvalue(), CLEAR + "one\ntwo\n")
+        self.assertEqual(screen.last_bytes, len(CLEAR) + 8)
+
+    def test_only_changed_spans_are_written(self):
+        screen, out = make_screen()
+        screen.render(["HP 10/10 | MP 5", "same", "gone"])
+        data = screen.render(["HP  9/10 | MP 5", "same"])
+        # Row 1 from column 3: just the changed digits; row 3 erased; cursor parked below
+        self.assertEqual(data, "\033[1;4H 9\033[3;1H\033[J")
+        self.assertEqual(screen.render(["HP  9/10 | MP 5", "same"]), "\033[3;1H\033[J")
+        self.assertEqual(screen.render(["HP 9", "same"]), "\033[1;4H9\033[K\033[3;1H\033[J")
+
+    def test_colored_lines_are_rewritten_whole(self):
+        screen, _ = make_screen()
+        screen.render(["\033[31mred\033[0m"])
+        self.assertEqual(screen.render(["\033[32mred\033[0m"]),
+                         "\033[1;1H\033[32mred\033[0m\033[K\033[2;1H\033[J")
+
+    def test_full_redraw_when_invalidated_or_too_tall(self):
+        screen, _ = make_screen(rows=5)
+        screen.render(["a"])
+        screen.invalidate()
+        self.assertTrue(screen.render(["a"]).startswith(CLEAR))
+        # Two rows plus the prompt rows fit; a third would scroll when the player hits Enter
+        self.assertFalse(screen.render(["a", "b"]).startswith(CLEAR))
+        self.assertTrue(screen.render(["a", "b", "c"]).startswith(CLEAR))
+        screen.clear()
+        self.assertTrue(screen.render(["a"]).startswith(CLEAR))
+        self.assertEqual(screen.frames, 5)
+
+    def test_full_redraw_when_a_line_would_wrap(self):
+        screen, _ = make_screen(columns=10)
+        screen.render(["a"])
+        # Color codes do not take up columns
+        self.assertFalse(screen.render(["\033[31m" + "x" * 10 + "\033[0m"]).startswith(CLEAR))
+        self.assertTrue(screen.render(["x" * 11]).startswith(CLEAR))
+        # The wrapped frame shifted the rows under it, so the next frame is drawn in full too
+        self.assertTrue(screen.render(["a"]).startswith(CLEAR))
+        self.assertFalse(screen.render(["b"]).startswith(CLEAR))
+
+
+if __name__ == "__main__":
+    unittest.main()
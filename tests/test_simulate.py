@@ -0,0 +1,28 @@
+import unittest
+
+from simulate import run_simulation, make_policy, ScriptedPolicy
+
+
+class TestSimulate(unittest.TestCase):
+    def test_run_simulation_summary(self):
+        summary = run_simulation(games=4, policy="greedy", workers=1, max_turns=60)
+        self.assertEqual(summary["games"], 4)
+        self.assertEqual(sum(summary["levels"].values()), 4)
+        self.assertLessEqual(summary["turns"]["max"], 60)
+        self.assertGreaterEqual(summary["win_rate"], 0.0)
+        self.assertLessEqual(summary["win_rate"], 1.0)
+
+    def test_same_seed_is_reproducible(self):
+        first = run_simulation(games=3, policy="random", workers=1, seed=11, max_turns=80)
+        second = run_simulation(games=3, policy="random", workers=1, seed=11, max_turns=80)
+        for key in ("levels", "turns", "win_rate", "death_rate"):
+            self.assertEqual(first[key], second[key])
+
+    def test_make_policy(self):
+        self.assertIsInstance(make_policy("scripted", ["n", "e"]), ScriptedPolicy)
+        with self.assertRaises(ValueError):
+            make_policy("nope")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import random
+import unittest
+
+from engine.game.enemy import Enemy
+from engine.plugins.combat_renderer_2d import ASCIICombatRenderer, COLOR_GREEN, COLOR_RED, HP_BAR_WIDTH
+from engine.plugins.question_renderer import ASCIIQuestionRenderer, QUESTION_WEAPONS
+from engine.plugins.sprite_atlas import SpriteAtlas
+
+
+class TestSpriteAtlas(unittest.TestCase):
+    def test_frames_are_built_once_per_key(self):
+        atlas = SpriteAtlas()
+        calls = []
+        build = lambda: calls.append(1) or ["ab", "cd"]
+        self.assertEqual(atlas.frame("s", 2, "", build), ("ab", "cd"))
+        self.assertEqual(atlas.frame("s", 2, "", build), ("ab", "cd"))
+        atlas.frame("s", 3, "", build)
+        self.assertEqual((len(calls), len(atlas), atlas.builds), (2, 2, 2))
+        self.assertIn(("s", 2, ""), atlas)
+
+    def test_combat_renderer_reuses_padded_rows(self):
+        atlas = SpriteAtlas()
+        renderer = ASCIICombatRenderer(width=30, atlas=atlas)
+        renderer.preload([{"name": "Imp", "ascii": " o\n/|\\", "ascii_left": "o \n/|\\"}])
+        # Both facings plus the three HP bar colors
+        self.assertEqual(len(atlas), 5)
+        enemy = Enemy("Imp", " o\n/|\\", 1, 10, 10, 3, 1, 5, 5)
+        renderer._enemy_display_hp = renderer._enemy_max_hp = 10
+        lines = renderer._draw_enemy_info(enemy)
+        self.assertEqual(len(atlas), 5)
+        self.assertEqual(lines[5], " " * 13 + " o" + "  " + " " * 13)
+        self.assertTrue(all(len(line) == 30 for line in lines[5:]))
+        self.assertEqual(renderer._hp_bar(1.0), f"[{COLOR_GREEN}{'█' * HP_BAR_WIDTH}{chr(27)}[0m]")
+        self.assertEqual(renderer._hp_bar(0.1), f"[{COLOR_RED}█{'-' * (HP_BAR_WIDTH - 1)}{chr(27)}[0m]")
+
+    def test_question_art_is_cached_per_weapon(self):
+        atlas = SpriteAtlas()
+        renderer = ASCIIQuestionRenderer("generic", 30, atlas=atlas)
+        random.seed(2)
+        frames = {renderer.question_fn() for _ in range(20)}
+        self.assertEqual(len(frames), len(QUESTION_WEAPONS))
+        self.assertEqual(len(atlas), len(QUESTION_WEAPONS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+import unittest
+
+from engine.game import Game
+from engine.game.world import World
+from engine.plugins.tracing import Tracer, HistogramSink, ChromeTraceSink, JsonLinesSink, Histogram
+from json_loader import JsonLoader
+
+
+class ListSink:
+    def __init__(self):
+        self.spans = []
+        self.closed = False
+
+    def record(self, name, start, duration):
+        self.spans.append(name)
+
+    def close(self):
+        self.closed = True
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tileset = JsonLoader().load("data/tileset.json")
+        self.tracer = Tracer()
+
+    def tearDown(self):
+        self.tracer.disable()
+
+    def test_disable_restores_the_original_methods(self):
+        execute_action = Game.__dict__["execute_action"]
+        generate_random = World.__dict__["generate_random"]
+        sink = ListSink()
+        self.tracer.enable(sink)
+        self.assertIsNot(Game.__dict__["execute_action"], execute_action)
+        self.tracer.disable()
+        self.assertIs(Game.__dict__["execute_action"], execute_action)
+        self.assertIs(World.__dict__["generate_random"], generate_random)
+        self.assertTrue(sink.closed)
+
+    def test_hot_paths_record_nested_spans(self):
+        sink = ListSink()
+        self.tracer.enable(sink)
+        game = Game.new_random(size=5, tileset=self.tileset, seed=3)
+        game.execute_action("north")
+        Game.from_dict(game.to_dict())
+        with self.tracer.span("custom"):
+            pass
+        self.assertIn("world.generate_random", sink.spans)
+        # The move ends (and is recorded) before the action that wraps it
+        self.assertLess(sink.spans.index("game.move"), sink.spans.index("game.execute_action"))
+        for name in ("game.to_dict", "world.to_dict", "game.from_dict", "custom"):
+            self.assertIn(name, sink.spans)
+
+    def test_histogram_buckets(self):
+        histogram = Histogram()
+        for us in (3, 4, 4, 40, 3000):
+            histogram.add(us)
+        self.assertEqual(histogram.percentile(50), 5)
+        self.assertEqual(histogram.percentile(80), 50)
+        self.assertEqual(histogram.percentile(100), 3000)
+        sink = HistogramSink()
+        sink.record("a", 0.0, 0.000004)
+        self.assertEqual(sink.summary()["a"]["count"], 1)
+        self.assertIn("a", sink.report())
+
+    def test_file_sinks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            trace = os.path.join(tmp, "trace.json")
+            lines = os.path.join(tmp, "trace.jsonl")
+            for sink in (ChromeTraceSink(trace), JsonLinesSink(lines)):
+                sink.record("game.move", 0.001, 0.0005)
+                sink.record("game.execute_action", 0.0009, 0.001)
+                sink.close()
+            with open(trace) as f:
+                events = json.load(f)
+            self.assertEqual([e["name"] for e in events], ["game.move", "game.execute_action"])
+            self.assertEqual((events[0]["ph"], events[0]["ts"], events[0]["dur"]), ("X", 1000.0, 500.0))
+            with open(lines) as f:
+                self.assertEqual(json.loads(f.readline()), {"name": "game.move", "start_us": 1000.0, "dur_us": 500.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
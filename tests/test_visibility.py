@@ -0,0 +1,66 @@
+import unittest
+
+from engine.game import Game
+from engine.game.visibility import Visibility, SIGHT_RADIUS
+from engine.game.weather import FOGGY
+from engine.game.world import World, Tile
+
+
+def open_world(size: int) -> World:
+    grid = [[Tile("Meadow", "Quiet meadow.", 0.0) for _ in range(size)] for _ in range(size)]
+    world = World(size, size, grid, seed=1)
+    world.weather.codes = [0] * len(world.weather.codes)
+    return world
+
+
+class TestVisibility(unittest.TestCase):
+    def test_open_field_is_a_disc(self):
+        world = open_world(15)
+        vis = Visibility(world)
+        seen = set(vis.visible(7, 7))
+        r = SIGHT_RADIUS
+        expected = {(x, y) for y in range(15) for x in range(15)
+                    if (x - 7) ** 2 + (y - 7) ** 2 <= r * r + r}
+        self.assertEqual(seen, expected)
+
+    def test_opaque_tiles_cast_shadows(self):
+        world = open_world(15)
+        world.set_tile(8, 7, Tile("Keep", "Walls.", 0.0, opaque=True))
+        vis = Visibility(world)
+        seen = set(vis.visible(7, 7))
+        self.assertIn((8, 7), seen)  # the wall itself is visible
+        self.assertNotIn((9, 7), seen)
+        self.assertNotIn((10, 7), seen)
+        self.assertIn((9, 5), seen)
+
+    def test_weather_and_terrain_change_radius(self):
+        world = open_world(15)
+        vis = Visibility(world)
+        self.assertEqual(vis.radius_at(7, 7), SIGHT_RADIUS)
+        world.weather.set_code(7, 7, FOGGY)
+        self.assertLess(vis.radius_at(7, 7), SIGHT_RADIUS)
+        world.set_tile(2, 2, Tile("Tower", "High up.", 0.0, sight=2))
+        self.assertEqual(vis.radius_at(2, 2), SIGHT_RADIUS + 2)
+
+    def test_cache_reused_until_tiles_change(self):
+        world = open_world(9)
+        vis = Visibility(world)
+        first = vis.visible(4, 4)
+        self.assertIs(vis.visible(4, 4), first)
+        self.assertEqual((vis.hits, vis.misses), (1, 1))
+        world.set_tile(5, 4, Tile("Keep", "Walls.", 0.0, opaque=True))
+        self.assertNotIn((6, 4), vis.visible(4, 4))
+        self.assertEqual(vis.misses, 2)
+
+    def test_game_map_and_save_track_seen_tiles(self):
+        game = Game.new_random(size=9, tileset=None, seed=3)
+        game.ascii_tiles = False
+        self.assertTrue(game.explored <= game.seen)
+        self.assertGreater(len(game.seen), len(game.explored))
+        self.assertIn(",", game.map())
+        restored = Game.from_dict(game.to_dict())
+        self.assertEqual(restored.seen, game.seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 
-from engine.game.world import World
+from engine.game.world import World, Tile
+from engine.game.rng import RngStream
+from engine.game.weather import WeatherSystem, TYPES, VISIBILITY, MOVEMENT_PENALTY, SNOWY
 tiles = {
     "village": {"name": "Test Village", "description": "A test village.", "danger": 0.0, "safe": True, "ascii": "."},
     "tiles": [
@@ -53,6 +55,83 @@ class TestWorld(unittest.TestCase):
         self.assertTrue(len(d1) > 0 and len(d2) > 0)
         self.assertGreaterEqual(sum(d2) / len(d2), sum(d1) / len(d1))
 
+    def test_weather_regions_and_tile_views(self):
+        w = World.generate_random(size=5, seed=3, tileset=tiles)
+        ws = w.weather
+        self.assertEqual(len(ws.codes), ws.cols * ws.rows)
+        # Tiles in the same region share weather; the tile view reads the system's table
+        ws.set_code(0, 0, SNOWY)
+        self.assertEqual(w.get_tile(1, 1).weather.current, "Snowy")
+        self.assertEqual(w.get_tile(0, 1).weather.effect(), {"movement_penalty": 1})
+        self.assertEqual(ws.movement_penalty(1, 0), MOVEMENT_PENALTY[SNOWY])
+        self.assertEqual(w.get_tile(0, 0).weather.visibility(), VISIBILITY[SNOWY])
+        w.get_tile(4, 4).weather.current = "Foggy"
+        self.assertEqual(ws.name_at(4, 4), "Foggy")
+
+    def test_weather_advances_in_batches(self):
+        ws = WeatherSystem(10, 10, region_size=2, update_every=3)
+        rng = RngStream(9, "weather")
+        self.assertEqual(ws.advance(rng, 2), [])  # no update before the clock reaches update_every
+        changed = ws.advance(rng, 30)
+        self.assertTrue(changed)
+        self.assertTrue(all(0 <= c < len(TYPES) for c in ws.codes))
+        restored = WeatherSystem.from_dict(ws.to_dict(), 10, 10)
+        self.assertEqual(restored.codes, ws.codes)
+        self.assertEqual(restored.clock, ws.clock)
+        w = World.generate_random(size=5, seed=3, tileset=tiles)
+        self.assertEqual(World.from_dict(w.to_dict()).weather.codes, w.weather.codes)
+
+    def test_old_saves_restore_weather_from_tiles(self):
+        w = World.generate_random(size=5, seed=3, tileset=tiles)
+        w.weather.set_code(4, 4, SNOWY)
+        d = w.to_dict()
+        del d["weather"]
+        restored = World.from_dict(d)
+        self.assertEqual(restored.weather.codes, w.weather.codes)
+        self.assertEqual(restored.get_tile(4, 4).weather.current, "Snowy")
+
+    def test_weather_fronts_drift(self):
+        ws = WeatherSystem(40, 40, region_size=2, update_every=1)
+        rng = RngStream(4, "weather")
+        ws.randomize(rng)
+        self.assertEqual(ws.front_count, len(ws.codes) // 10)
+        start = list(ws.front_x)
+        ws.advance(rng, 1)
+        self.assertEqual(ws.front_count, len(start))
+        self.assertNotEqual(ws.front_x, start)
+        # A front covers the region under its centre with its own weather
+        i = next(i for i in range(ws.front_count)
+                 if 0 <= ws.front_x[i] < ws.cols and 0 <= ws.front_y[i] < ws.rows)
+        self.assertNotEqual(ws.codes[int(ws.front_y[i]) * ws.cols + int(ws.front_x[i])], 0)
+        # Fronts that leave the map come back from an edge, so the count stays stable
+        for _ in range(200):
+            ws.advance(rng, 1)
+        self.assertEqual(ws.front_count, len(start))
+        restored = WeatherSystem.from_dict(ws.to_dict(), 40, 40)
+        self.assertEqual(restored.to_dict(), ws.to_dict())
+
+    def test_spatial_index_matches_brute_force(self):
+        w = World.generate_random(size=11, seed=7, tileset=tiles)
+        w.set_rested(3, 4, True)
+        w.set_tile(9, 1, Tile("Camp", "A quiet camp.", 0.0, safe=True, shop=True))
+        cells = [(x, y) for y in range(w.height) for x in range(w.width)]
+        for (px, py) in ((0, 0), (5, 5), (10, 3), (9, 1)):
+            for kind in ("safe", "shop", "rested"):
+                hits = [(abs(x - px) + abs(y - py), y, x) for (x, y) in cells
+                        if (getattr(w.get_tile(x, y), kind, False) if kind != "shop" else w.get_tile(x, y).shop)]
+                expected = (min(hits)[2], min(hits)[1]) if hits else None
+                self.assertEqual(w.nearest(px, py, kind), expected)
+                self.assertEqual(w.within(px, py, 4, kind), [(x, y) for (d, y, x) in sorted(hits) if d <= 4])
+        self.assertEqual(w.max_danger(2, 1, 7, 6),
+                         max(w.get_tile(x, y).danger for x in range(2, 8) for y in range(1, 7)))
+        self.assertEqual(w.max_danger(0, 0, 10, 10), max(t.danger for row in w.grid for t in row))
+        self.assertEqual(w.index.count("rested", 0, 0, 10, 10), 1)
+        w.set_rested(3, 4, False)
+        self.assertIsNone(w.nearest(0, 0, "rested"))
+        heat = w.heatmap()
+        t = w.get_tile(0, 0)
+        self.assertAlmostEqual(heat[0], t.danger + w.weather.encounter_rate(0, 0))
+        self.assertEqual(heat[5 * w.width + 5], 0.0)  # the village is safe
 
 if __name__ == "__main__":
     unittest.main()
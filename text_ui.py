@@ -59,7 +59,8 @@ def print_game_ui(
         state,
         width=90,
         height=40,
-        use_color=False
+        use_color=False,
+        screen=None
 ):
     """
     Render a text-based game UI to the terminal.
@@ -108,6 +109,9 @@ def print_game_ui(
         Total terminal height to target (lines).
     use_color : bool
         If True, uses ANSI colors. If False, plain text.
+    screen : ScreenBuffer, optional
+        Draw through this buffer (engine/plugins/screen_buffer.py) instead of clearing
+        the terminal and printing every line.
 
     Notes
     -----
@@ -370,6 +374,11 @@ def print_game_ui(
     elif len(all_lines) < height:
         all_lines.extend([" " * width] * (height - len(all_lines)))
 
+    if screen is not None:
+        # Only the changed parts of the frame reach the terminal
+        screen.render(all_lines)
+        return
+
     # Optional clear screen (simple)
     print("\033[2J\033[H", end="")  # clear + home (most terminals)
 
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Field-of-view benchmark for Oakheart Tales.
+
+Generates a large world from the default tileset and walks a seeded random route over
+it. For every step it computes what the player can see: first without the cache
+(Visibility.compute) as the baseline, then with the cache (Visibility.visible), which is
+what Game uses. Walks revisit tiles, so the cached run mostly costs dict lookups.
+
+Run: python3 visibility_bench.py --size 256 --steps 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import List
+
+from engine.game.rng import RngService
+from engine.game.visibility import Visibility
+from engine.game.world import World
+
+
+def walk(size: int, steps: int, seed: int) -> List[tuple]:
+    """A seeded random walk that starts in the middle and stays inside the map."""
+    rng = random.Random(seed)
+    x = y = size // 2
+    route = []
+    for _ in range(steps):
+        dx, dy = rng.choice(((0, -1), (0, 1), (-1, 0), (1, 0)))
+        x = min(size - 1, max(0, x + dx))
+        y = min(size - 1, max(0, y + dy))
+        route.append((x, y))
+    return route
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark shadowcasting field of view with and without caching.")
+    parser.add_argument("--size", type=int, default=256, help="World width and height")
+    parser.add_argument("--steps", type=int, default=20000, help="Steps in the random walk")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv[1:])
+
+    start = time.perf_counter()
+    world = World.generate_random(size=args.size, tileset=None, rng=RngService(args.seed))
+    route = walk(args.size, args.steps, args.seed)
+    print(f"World {args.size}x{args.size} generated in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+    vis = Visibility(world)
+    start = time.perf_counter()
+    tiles = 0
+    for (x, y) in route:
+        tiles += len(vis.compute(x, y, vis.radius_at(x, y)))
+    uncached = time.perf_counter() - start
+
+    vis = Visibility(world)
+    start = time.perf_counter()
+    for (x, y) in route:
+        vis.visible(x, y)
+    cached = time.perf_counter() - start
+
+    per_step = 1e6 / max(1, len(route))
+    print(f"{len(route)} steps, {tiles / max(1, len(route)):.1f} visible tiles per step")
+    print(f"uncached: {uncached:.3f}s ({uncached * per_step:.1f} us/step)")
+    print(f"cached:   {cached:.3f}s ({cached * per_step:.1f} us/step, "
+          f"{vis.hits} hits / {vis.misses} misses)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
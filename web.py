@@ -4,24 +4,38 @@ Simple web interface for Oakheart Tales (text MUD).
 
 Run: python3 web.py
 Then open http://127.0.0.1:8000/ in your browser.
+Prometheus metrics are served at http://127.0.0.1:8000/metrics
 
 No external dependencies; uses Python's built-in wsgi server.
 """
 
 from wsgiref.simple_server import make_server
 from urllib.parse import parse_qs
+import os
 import secrets
 import html
+import time
 from typing import Dict, Tuple, Callable, Optional, List
 
 from engine.game import Game
+from engine.plugins.metrics import METRICS
+from engine.plugins.prometheus import ServerMetrics, CONTENT_TYPE
 
 from json_loader import JsonLoader
 from text_loader import TextLoader
-from persistence import save_game, load_game, SAVE_FILE
+from persistence import AutoSaver, SAVE_FILE
 
 # Very small in-memory session store. Not for production use.
 SESSIONS: Dict[str, Game] = {}
+# Saves are written off the request thread
+AUTOSAVER = AutoSaver()
+# Served at /metrics
+SERVER_METRICS = ServerMetrics(SESSIONS, engine=METRICS)
+# No HUD here: every watched action is an engine frame, scraped through /metrics
+METRICS.enabled = True
+SERVER_METRICS.watch_autosaver(AUTOSAVER)
+# Latency is reported per known route; anything else is "other"
+ROUTES = {"/", "/new", "/save_state", "/load_state", "/load", "/play", "/play_batch", "/metrics"}
 
 
 def get_or_create_sid(environ) -> str:
@@ -44,6 +58,11 @@ def response(status: str, body: str, headers: Optional[list] = None):
     return status, hdrs, body.encode("utf-8")
 
 
+def json_response(status: str, data) -> Tuple[str, list, bytes]:
+    from json import dumps
+    return status, [("Content-Type", "application/json")], dumps(data).encode("utf-8")
+
+
 def layout(title: str, content: str) -> str:
     return f"""
 <!DOCTYPE html>
@@ -213,23 +232,62 @@ def handle_play(game: Game, cmd: str) -> str:
     cmd = (cmd or "").strip().lower()
     # Interface-level commands
     if cmd in ("__save", "save"):
-        save_game(game.to_dict(), game.save_file)
+        AUTOSAVER.save(game.to_dict(), game.save_file)
         return f"Game saved to {game.save_file}."
     if cmd in ("__load", "load"):
-        loaded = load_game(game.save_file)
+        start = time.perf_counter()
+        loaded = AUTOSAVER.load(game.save_file)
         if loaded:
             game.copy_from(Game.from_dict(loaded))
+            SERVER_METRICS.loaded("file", os.path.getsize(game.save_file), time.perf_counter() - start)
             return "Game loaded.\n\n" + game.look()
         return "No save found or save file invalid."
 
     # Delegate to game actions API
     out = game.execute_action(cmd)
     if out is not None:
+        AUTOSAVER.maybe_save(game)
         return out
     return f"Unknown command: {cmd}"
 
 
+# Upper bound on commands per batch request so one request can't monopolise the server.
+MAX_BATCH_COMMANDS = 200
+
+
+def batch_commands(environ, qs) -> List[str]:
+    """Read commands from a JSON body ({"cmds": [...]}) or from ?cmds=n,n,e / repeated ?cmd=."""
+    cmds: List[str] = []
+    if environ.get("REQUEST_METHOD", "GET") == "POST":
+        from json import loads
+        length = int(environ.get("CONTENT_LENGTH") or "0")
+        raw_body = environ["wsgi.input"].read(length) if length > 0 else b""
+        data = loads(raw_body) if raw_body else {}
+        cmds = [str(c) for c in (data.get("cmds") or [])]
+    else:
+        for part in qs.get("cmds", []):
+            cmds.extend(c for c in part.split(",") if c.strip())
+        cmds.extend(qs.get("cmd", []))
+    return cmds[:MAX_BATCH_COMMANDS]
+
+
 def app(environ, start_response):
+    """WSGI entry point: routes the request and records its latency and status."""
+    start = time.perf_counter()
+    status = ["500"]
+
+    def recording_start_response(status_line, headers, exc_info=None):
+        status[0] = status_line.split(" ", 1)[0]
+        return start_response(status_line, headers, exc_info)
+
+    try:
+        return route(environ, recording_start_response)
+    finally:
+        path = environ.get("PATH_INFO", "/")
+        SERVER_METRICS.request(path if path in ROUTES else "other", status[0], time.perf_counter() - start)
+
+
+def route(environ, start_response):
     path = environ.get("PATH_INFO", "/")
     qs = parse_qs(environ.get("QUERY_STRING", ""))
 
@@ -246,6 +304,10 @@ def app(environ, start_response):
     if path == "/":
         return finish(response("200 OK", start_page(sid)))
 
+    if path == "/metrics":
+        start_response("200 OK", [("Content-Type", CONTENT_TYPE)])
+        return [SERVER_METRICS.expose().encode("utf-8")]
+
     if path == "/new":
         size = 5
         try:
@@ -258,13 +320,14 @@ def app(environ, start_response):
         data_loader = JsonLoader()
         tiles = data_loader.load("data/tileset.json")
         game = Game.new_random(size=size, tiles=tiles)
-        game.save_fn = save_game
-        game.load_fn = load_game
+        game.save_fn = AUTOSAVER.save
+        game.load_fn = AUTOSAVER.load
         game.data_loader = data_loader
         game.ascii_loader = TextLoader("data/rooms")
         game.load_configurations("data/enemies.json")
         game.save_file = f"{sid}_{environ.get('REMOTE_ADDR', 'unknown')}.sav"
         SESSIONS[sid] = game
+        SERVER_METRICS.watch(game)
         body = game_view(sid, game, game.look())
         return finish(response("200 OK", body))
 
@@ -273,34 +336,43 @@ def app(environ, start_response):
         if not game:
             return finish(response("200 OK", ""))
         from json import dumps
-        return finish(response("200 OK", dumps(game.to_dict())))
+        start = time.perf_counter()
+        data = dumps(game.to_dict())
+        SERVER_METRICS.saved("browser", len(data), time.perf_counter() - start)
+        return finish(response("200 OK", data))
 
     if path == "/load_state":
         try:
             from json import loads
             length = int(environ.get("CONTENT_LENGTH", "0"))
             raw_body = environ["wsgi.input"].read(length)
+            start = time.perf_counter()
             data = loads(raw_body)
             game = Game.from_dict(data)
+            SERVER_METRICS.loaded("browser", len(raw_body), time.perf_counter() - start)
             SESSIONS[sid] = game
+            SERVER_METRICS.watch(game)
             body = game_view(sid, game, "Loaded game!\n" + game.look())
             return finish(response("200 OK", body))
         except Exception:
             return finish(response("400 Bad Request", "Invalid save data."))
 
     if path == "/load":
-        loaded = load_game(SAVE_FILE)
+        start = time.perf_counter()
+        loaded = AUTOSAVER.load(SAVE_FILE)
         if not loaded:
             return finish(response("200 OK", layout("Load",
                                                     "<div class=panel><p>No save found or save file invalid.</p><p><a href='/'>Back</a></p></div>")))
         game = Game.from_dict(loaded)
-        game.save_fn = save_game
-        game.load_fn = load_game
+        game.save_fn = AUTOSAVER.save
+        game.load_fn = AUTOSAVER.load
         game.data_loader = JsonLoader()
         game.ascii_loader = TextLoader("data/rooms")
         game.load_configurations("data/enemies.json")
         game.save_file = f"{sid}_{environ.get('REMOTE_ADDR', 'unknown')}.sav"
+        SERVER_METRICS.loaded("file", os.path.getsize(SAVE_FILE), time.perf_counter() - start)
         SESSIONS[sid] = Game.from_dict(loaded)
+        SERVER_METRICS.watch(SESSIONS[sid])
         body = game_view(sid, game, game.look())
         return finish(response("200 OK", body))
 
@@ -318,6 +390,30 @@ def app(environ, start_response):
             body = "Game ended. <script>window.location.href='/'</script>"
         return finish(response("200 OK", body))
 
+    if path == "/play_batch":
+        game = SESSIONS.get(sid)
+        if not game:
+            return finish(json_response("404 Not Found", {"error": "No active game for this session."}))
+        try:
+            cmds = batch_commands(environ, qs)
+        except Exception:
+            return finish(json_response("400 Bad Request", {"error": "Invalid batch body."}))
+        batch = game.execute_batch(cmds)
+        # Each executed command counts toward the autosave policy, as a single /play does
+        for result in batch["results"]:
+            if result["known"]:
+                AUTOSAVER.maybe_save(game)
+        batch.update({
+            "player": game.player.to_dict(),
+            "enemy": game.enemy.to_dict() if game.enemy else None,
+            "pos": {"x": game.x, "y": game.y},
+            "actions": game.available_actions(),
+            "ended": game.ended,
+        })
+        if game.ended:
+            SESSIONS.pop(sid, None)
+        return finish(json_response("200 OK", batch))
+
     return finish(response("404 Not Found", layout("Not found",
                                                    "<div class=panel><p>Not found</p><p><a href='/'>&larr; Home</a></p></div>")))
 